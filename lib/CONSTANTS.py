@@ -1,29 +1,4126 @@
 # This file is autogenerated by utils/constants-generator.py
 # You shouldn't edit this file directly.
 
-from Xlib import XK
-from . import KEYSYMDEF
-_keysyms = [name for name in dir(KEYSYMDEF)]
-for keysym in _keysyms:
-	XK.__dict__[keysym] = KEYSYMDEF.__dict__[keysym]
-del KEYSYMDEF
+import types
 
-XK.load_keysym_group('miscellany')
-XK.load_keysym_group('latin1')
-XK.load_keysym_group('latin2')
-XK.load_keysym_group('latin3')
-XK.load_keysym_group('latin4')
-XK.load_keysym_group('arabic')
-XK.load_keysym_group('cyrillic')
-XK.load_keysym_group('greek')
-XK.load_keysym_group('hebrew')
-XK.load_keysym_group('katakana')
-XK.load_keysym_group('korean')
-XK.load_keysym_group('publishing')
-XK.load_keysym_group('thai')
-XK.load_keysym_group('xkb')
-XK.load_keysym_group('technical')
+KEYSYMS = {
+	'XK_0' : 0x0030,
+	'XK_1' : 0x0031,
+	'XK_2' : 0x0032,
+	'XK_3' : 0x0033,
+	'XK_3270_AltCursor' : 0xfd10,
+	'XK_3270_Attn' : 0xfd0e,
+	'XK_3270_BackTab' : 0xfd05,
+	'XK_3270_ChangeScreen' : 0xfd19,
+	'XK_3270_Copy' : 0xfd15,
+	'XK_3270_CursorBlink' : 0xfd0f,
+	'XK_3270_CursorSelect' : 0xfd1c,
+	'XK_3270_DeleteWord' : 0xfd1a,
+	'XK_3270_Duplicate' : 0xfd01,
+	'XK_3270_Enter' : 0xfd1e,
+	'XK_3270_EraseEOF' : 0xfd06,
+	'XK_3270_EraseInput' : 0xfd07,
+	'XK_3270_ExSelect' : 0xfd1b,
+	'XK_3270_FieldMark' : 0xfd02,
+	'XK_3270_Ident' : 0xfd13,
+	'XK_3270_Jump' : 0xfd12,
+	'XK_3270_KeyClick' : 0xfd11,
+	'XK_3270_Left2' : 0xfd04,
+	'XK_3270_PA1' : 0xfd0a,
+	'XK_3270_PA2' : 0xfd0b,
+	'XK_3270_PA3' : 0xfd0c,
+	'XK_3270_Play' : 0xfd16,
+	'XK_3270_PrintScreen' : 0xfd1d,
+	'XK_3270_Quit' : 0xfd09,
+	'XK_3270_Record' : 0xfd18,
+	'XK_3270_Reset' : 0xfd08,
+	'XK_3270_Right2' : 0xfd03,
+	'XK_3270_Rule' : 0xfd14,
+	'XK_3270_Setup' : 0xfd17,
+	'XK_3270_Test' : 0xfd0d,
+	'XK_4' : 0x0034,
+	'XK_5' : 0x0035,
+	'XK_6' : 0x0036,
+	'XK_7' : 0x0037,
+	'XK_8' : 0x0038,
+	'XK_9' : 0x0039,
+	'XK_A' : 0x0041,
+	'XK_AE' : 0x00c6,
+	'XK_Aacute' : 0x00c1,
+	'XK_Abelowdot' : 0x1001ea0,
+	'XK_Abreve' : 0x01c3,
+	'XK_Abreveacute' : 0x1001eae,
+	'XK_Abrevebelowdot' : 0x1001eb6,
+	'XK_Abrevegrave' : 0x1001eb0,
+	'XK_Abrevehook' : 0x1001eb2,
+	'XK_Abrevetilde' : 0x1001eb4,
+	'XK_AccessX_Enable' : 0xfe70,
+	'XK_AccessX_Feedback_Enable' : 0xfe71,
+	'XK_Acircumflex' : 0x00c2,
+	'XK_Acircumflexacute' : 0x1001ea4,
+	'XK_Acircumflexbelowdot' : 0x1001eac,
+	'XK_Acircumflexgrave' : 0x1001ea6,
+	'XK_Acircumflexhook' : 0x1001ea8,
+	'XK_Acircumflextilde' : 0x1001eaa,
+	'XK_Adiaeresis' : 0x00c4,
+	'XK_Agrave' : 0x00c0,
+	'XK_Ahook' : 0x1001ea2,
+	'XK_Alt_L' : 0xffe9,
+	'XK_Alt_R' : 0xffea,
+	'XK_Amacron' : 0x03c0,
+	'XK_Aogonek' : 0x01a1,
+	'XK_Arabic_0' : 0x1000660,
+	'XK_Arabic_1' : 0x1000661,
+	'XK_Arabic_2' : 0x1000662,
+	'XK_Arabic_3' : 0x1000663,
+	'XK_Arabic_4' : 0x1000664,
+	'XK_Arabic_5' : 0x1000665,
+	'XK_Arabic_6' : 0x1000666,
+	'XK_Arabic_7' : 0x1000667,
+	'XK_Arabic_8' : 0x1000668,
+	'XK_Arabic_9' : 0x1000669,
+	'XK_Arabic_ain' : 0x05d9,
+	'XK_Arabic_alef' : 0x05c7,
+	'XK_Arabic_alefmaksura' : 0x05e9,
+	'XK_Arabic_beh' : 0x05c8,
+	'XK_Arabic_comma' : 0x05ac,
+	'XK_Arabic_dad' : 0x05d6,
+	'XK_Arabic_dal' : 0x05cf,
+	'XK_Arabic_damma' : 0x05ef,
+	'XK_Arabic_dammatan' : 0x05ec,
+	'XK_Arabic_ddal' : 0x1000688,
+	'XK_Arabic_farsi_yeh' : 0x10006cc,
+	'XK_Arabic_fatha' : 0x05ee,
+	'XK_Arabic_fathatan' : 0x05eb,
+	'XK_Arabic_feh' : 0x05e1,
+	'XK_Arabic_fullstop' : 0x10006d4,
+	'XK_Arabic_gaf' : 0x10006af,
+	'XK_Arabic_ghain' : 0x05da,
+	'XK_Arabic_ha' : 0x05e7,
+	'XK_Arabic_hah' : 0x05cd,
+	'XK_Arabic_hamza' : 0x05c1,
+	'XK_Arabic_hamza_above' : 0x1000654,
+	'XK_Arabic_hamza_below' : 0x1000655,
+	'XK_Arabic_hamzaonalef' : 0x05c3,
+	'XK_Arabic_hamzaonwaw' : 0x05c4,
+	'XK_Arabic_hamzaonyeh' : 0x05c6,
+	'XK_Arabic_hamzaunderalef' : 0x05c5,
+	'XK_Arabic_heh' : 0x05e7,
+	'XK_Arabic_heh_doachashmee' : 0x10006be,
+	'XK_Arabic_heh_goal' : 0x10006c1,
+	'XK_Arabic_jeem' : 0x05cc,
+	'XK_Arabic_jeh' : 0x1000698,
+	'XK_Arabic_kaf' : 0x05e3,
+	'XK_Arabic_kasra' : 0x05f0,
+	'XK_Arabic_kasratan' : 0x05ed,
+	'XK_Arabic_keheh' : 0x10006a9,
+	'XK_Arabic_khah' : 0x05ce,
+	'XK_Arabic_lam' : 0x05e4,
+	'XK_Arabic_madda_above' : 0x1000653,
+	'XK_Arabic_maddaonalef' : 0x05c2,
+	'XK_Arabic_meem' : 0x05e5,
+	'XK_Arabic_noon' : 0x05e6,
+	'XK_Arabic_noon_ghunna' : 0x10006ba,
+	'XK_Arabic_peh' : 0x100067e,
+	'XK_Arabic_percent' : 0x100066a,
+	'XK_Arabic_qaf' : 0x05e2,
+	'XK_Arabic_question_mark' : 0x05bf,
+	'XK_Arabic_ra' : 0x05d1,
+	'XK_Arabic_rreh' : 0x1000691,
+	'XK_Arabic_sad' : 0x05d5,
+	'XK_Arabic_seen' : 0x05d3,
+	'XK_Arabic_semicolon' : 0x05bb,
+	'XK_Arabic_shadda' : 0x05f1,
+	'XK_Arabic_sheen' : 0x05d4,
+	'XK_Arabic_sukun' : 0x05f2,
+	'XK_Arabic_superscript_alef' : 0x1000670,
+	'XK_Arabic_switch' : 0xff7e,
+	'XK_Arabic_tah' : 0x05d7,
+	'XK_Arabic_tatweel' : 0x05e0,
+	'XK_Arabic_tcheh' : 0x1000686,
+	'XK_Arabic_teh' : 0x05ca,
+	'XK_Arabic_tehmarbuta' : 0x05c9,
+	'XK_Arabic_thal' : 0x05d0,
+	'XK_Arabic_theh' : 0x05cb,
+	'XK_Arabic_tteh' : 0x1000679,
+	'XK_Arabic_veh' : 0x10006a4,
+	'XK_Arabic_waw' : 0x05e8,
+	'XK_Arabic_yeh' : 0x05ea,
+	'XK_Arabic_yeh_baree' : 0x10006d2,
+	'XK_Arabic_zah' : 0x05d8,
+	'XK_Arabic_zain' : 0x05d2,
+	'XK_Aring' : 0x00c5,
+	'XK_Armenian_AT' : 0x1000538,
+	'XK_Armenian_AYB' : 0x1000531,
+	'XK_Armenian_BEN' : 0x1000532,
+	'XK_Armenian_CHA' : 0x1000549,
+	'XK_Armenian_DA' : 0x1000534,
+	'XK_Armenian_DZA' : 0x1000541,
+	'XK_Armenian_E' : 0x1000537,
+	'XK_Armenian_FE' : 0x1000556,
+	'XK_Armenian_GHAT' : 0x1000542,
+	'XK_Armenian_GIM' : 0x1000533,
+	'XK_Armenian_HI' : 0x1000545,
+	'XK_Armenian_HO' : 0x1000540,
+	'XK_Armenian_INI' : 0x100053b,
+	'XK_Armenian_JE' : 0x100054b,
+	'XK_Armenian_KE' : 0x1000554,
+	'XK_Armenian_KEN' : 0x100053f,
+	'XK_Armenian_KHE' : 0x100053d,
+	'XK_Armenian_LYUN' : 0x100053c,
+	'XK_Armenian_MEN' : 0x1000544,
+	'XK_Armenian_NU' : 0x1000546,
+	'XK_Armenian_O' : 0x1000555,
+	'XK_Armenian_PE' : 0x100054a,
+	'XK_Armenian_PYUR' : 0x1000553,
+	'XK_Armenian_RA' : 0x100054c,
+	'XK_Armenian_RE' : 0x1000550,
+	'XK_Armenian_SE' : 0x100054d,
+	'XK_Armenian_SHA' : 0x1000547,
+	'XK_Armenian_TCHE' : 0x1000543,
+	'XK_Armenian_TO' : 0x1000539,
+	'XK_Armenian_TSA' : 0x100053e,
+	'XK_Armenian_TSO' : 0x1000551,
+	'XK_Armenian_TYUN' : 0x100054f,
+	'XK_Armenian_VEV' : 0x100054e,
+	'XK_Armenian_VO' : 0x1000548,
+	'XK_Armenian_VYUN' : 0x1000552,
+	'XK_Armenian_YECH' : 0x1000535,
+	'XK_Armenian_ZA' : 0x1000536,
+	'XK_Armenian_ZHE' : 0x100053a,
+	'XK_Armenian_accent' : 0x100055b,
+	'XK_Armenian_amanak' : 0x100055c,
+	'XK_Armenian_apostrophe' : 0x100055a,
+	'XK_Armenian_at' : 0x1000568,
+	'XK_Armenian_ayb' : 0x1000561,
+	'XK_Armenian_ben' : 0x1000562,
+	'XK_Armenian_but' : 0x100055d,
+	'XK_Armenian_cha' : 0x1000579,
+	'XK_Armenian_da' : 0x1000564,
+	'XK_Armenian_dza' : 0x1000571,
+	'XK_Armenian_e' : 0x1000567,
+	'XK_Armenian_exclam' : 0x100055c,
+	'XK_Armenian_fe' : 0x1000586,
+	'XK_Armenian_full_stop' : 0x1000589,
+	'XK_Armenian_ghat' : 0x1000572,
+	'XK_Armenian_gim' : 0x1000563,
+	'XK_Armenian_hi' : 0x1000575,
+	'XK_Armenian_ho' : 0x1000570,
+	'XK_Armenian_hyphen' : 0x100058a,
+	'XK_Armenian_ini' : 0x100056b,
+	'XK_Armenian_je' : 0x100057b,
+	'XK_Armenian_ke' : 0x1000584,
+	'XK_Armenian_ken' : 0x100056f,
+	'XK_Armenian_khe' : 0x100056d,
+	'XK_Armenian_ligature_ew' : 0x1000587,
+	'XK_Armenian_lyun' : 0x100056c,
+	'XK_Armenian_men' : 0x1000574,
+	'XK_Armenian_nu' : 0x1000576,
+	'XK_Armenian_o' : 0x1000585,
+	'XK_Armenian_paruyk' : 0x100055e,
+	'XK_Armenian_pe' : 0x100057a,
+	'XK_Armenian_pyur' : 0x1000583,
+	'XK_Armenian_question' : 0x100055e,
+	'XK_Armenian_ra' : 0x100057c,
+	'XK_Armenian_re' : 0x1000580,
+	'XK_Armenian_se' : 0x100057d,
+	'XK_Armenian_separation_mark' : 0x100055d,
+	'XK_Armenian_sha' : 0x1000577,
+	'XK_Armenian_shesht' : 0x100055b,
+	'XK_Armenian_tche' : 0x1000573,
+	'XK_Armenian_to' : 0x1000569,
+	'XK_Armenian_tsa' : 0x100056e,
+	'XK_Armenian_tso' : 0x1000581,
+	'XK_Armenian_tyun' : 0x100057f,
+	'XK_Armenian_verjaket' : 0x1000589,
+	'XK_Armenian_vev' : 0x100057e,
+	'XK_Armenian_vo' : 0x1000578,
+	'XK_Armenian_vyun' : 0x1000582,
+	'XK_Armenian_yech' : 0x1000565,
+	'XK_Armenian_yentamna' : 0x100058a,
+	'XK_Armenian_za' : 0x1000566,
+	'XK_Armenian_zhe' : 0x100056a,
+	'XK_Atilde' : 0x00c3,
+	'XK_AudibleBell_Enable' : 0xfe7a,
+	'XK_B' : 0x0042,
+	'XK_Babovedot' : 0x1001e02,
+	'XK_BackSpace' : 0xff08,
+	'XK_Begin' : 0xff58,
+	'XK_BounceKeys_Enable' : 0xfe74,
+	'XK_Break' : 0xff6b,
+	'XK_Byelorussian_SHORTU' : 0x06be,
+	'XK_Byelorussian_shortu' : 0x06ae,
+	'XK_C' : 0x0043,
+	'XK_CH' : 0xfea2,
+	'XK_C_H' : 0xfea5,
+	'XK_C_h' : 0xfea4,
+	'XK_Cabovedot' : 0x02c5,
+	'XK_Cacute' : 0x01c6,
+	'XK_Cancel' : 0xff69,
+	'XK_Caps_Lock' : 0xffe5,
+	'XK_Ccaron' : 0x01c8,
+	'XK_Ccedilla' : 0x00c7,
+	'XK_Ccircumflex' : 0x02c6,
+	'XK_Ch' : 0xfea1,
+	'XK_Clear' : 0xff0b,
+	'XK_Codeinput' : 0xff37,
+	'XK_ColonSign' : 0x10020a1,
+	'XK_Control_L' : 0xffe3,
+	'XK_Control_R' : 0xffe4,
+	'XK_CruzeiroSign' : 0x10020a2,
+	'XK_Cyrillic_A' : 0x06e1,
+	'XK_Cyrillic_BE' : 0x06e2,
+	'XK_Cyrillic_CHE' : 0x06fe,
+	'XK_Cyrillic_CHE_descender' : 0x10004b6,
+	'XK_Cyrillic_CHE_vertstroke' : 0x10004b8,
+	'XK_Cyrillic_DE' : 0x06e4,
+	'XK_Cyrillic_DZHE' : 0x06bf,
+	'XK_Cyrillic_E' : 0x06fc,
+	'XK_Cyrillic_EF' : 0x06e6,
+	'XK_Cyrillic_EL' : 0x06ec,
+	'XK_Cyrillic_EM' : 0x06ed,
+	'XK_Cyrillic_EN' : 0x06ee,
+	'XK_Cyrillic_EN_descender' : 0x10004a2,
+	'XK_Cyrillic_ER' : 0x06f2,
+	'XK_Cyrillic_ES' : 0x06f3,
+	'XK_Cyrillic_GHE' : 0x06e7,
+	'XK_Cyrillic_GHE_bar' : 0x1000492,
+	'XK_Cyrillic_HA' : 0x06e8,
+	'XK_Cyrillic_HARDSIGN' : 0x06ff,
+	'XK_Cyrillic_HA_descender' : 0x10004b2,
+	'XK_Cyrillic_I' : 0x06e9,
+	'XK_Cyrillic_IE' : 0x06e5,
+	'XK_Cyrillic_IO' : 0x06b3,
+	'XK_Cyrillic_I_macron' : 0x10004e2,
+	'XK_Cyrillic_JE' : 0x06b8,
+	'XK_Cyrillic_KA' : 0x06eb,
+	'XK_Cyrillic_KA_descender' : 0x100049a,
+	'XK_Cyrillic_KA_vertstroke' : 0x100049c,
+	'XK_Cyrillic_LJE' : 0x06b9,
+	'XK_Cyrillic_NJE' : 0x06ba,
+	'XK_Cyrillic_O' : 0x06ef,
+	'XK_Cyrillic_O_bar' : 0x10004e8,
+	'XK_Cyrillic_PE' : 0x06f0,
+	'XK_Cyrillic_SCHWA' : 0x10004d8,
+	'XK_Cyrillic_SHA' : 0x06fb,
+	'XK_Cyrillic_SHCHA' : 0x06fd,
+	'XK_Cyrillic_SHHA' : 0x10004ba,
+	'XK_Cyrillic_SHORTI' : 0x06ea,
+	'XK_Cyrillic_SOFTSIGN' : 0x06f8,
+	'XK_Cyrillic_TE' : 0x06f4,
+	'XK_Cyrillic_TSE' : 0x06e3,
+	'XK_Cyrillic_U' : 0x06f5,
+	'XK_Cyrillic_U_macron' : 0x10004ee,
+	'XK_Cyrillic_U_straight' : 0x10004ae,
+	'XK_Cyrillic_U_straight_bar' : 0x10004b0,
+	'XK_Cyrillic_VE' : 0x06f7,
+	'XK_Cyrillic_YA' : 0x06f1,
+	'XK_Cyrillic_YERU' : 0x06f9,
+	'XK_Cyrillic_YU' : 0x06e0,
+	'XK_Cyrillic_ZE' : 0x06fa,
+	'XK_Cyrillic_ZHE' : 0x06f6,
+	'XK_Cyrillic_ZHE_descender' : 0x1000496,
+	'XK_Cyrillic_a' : 0x06c1,
+	'XK_Cyrillic_be' : 0x06c2,
+	'XK_Cyrillic_che' : 0x06de,
+	'XK_Cyrillic_che_descender' : 0x10004b7,
+	'XK_Cyrillic_che_vertstroke' : 0x10004b9,
+	'XK_Cyrillic_de' : 0x06c4,
+	'XK_Cyrillic_dzhe' : 0x06af,
+	'XK_Cyrillic_e' : 0x06dc,
+	'XK_Cyrillic_ef' : 0x06c6,
+	'XK_Cyrillic_el' : 0x06cc,
+	'XK_Cyrillic_em' : 0x06cd,
+	'XK_Cyrillic_en' : 0x06ce,
+	'XK_Cyrillic_en_descender' : 0x10004a3,
+	'XK_Cyrillic_er' : 0x06d2,
+	'XK_Cyrillic_es' : 0x06d3,
+	'XK_Cyrillic_ghe' : 0x06c7,
+	'XK_Cyrillic_ghe_bar' : 0x1000493,
+	'XK_Cyrillic_ha' : 0x06c8,
+	'XK_Cyrillic_ha_descender' : 0x10004b3,
+	'XK_Cyrillic_hardsign' : 0x06df,
+	'XK_Cyrillic_i' : 0x06c9,
+	'XK_Cyrillic_i_macron' : 0x10004e3,
+	'XK_Cyrillic_ie' : 0x06c5,
+	'XK_Cyrillic_io' : 0x06a3,
+	'XK_Cyrillic_je' : 0x06a8,
+	'XK_Cyrillic_ka' : 0x06cb,
+	'XK_Cyrillic_ka_descender' : 0x100049b,
+	'XK_Cyrillic_ka_vertstroke' : 0x100049d,
+	'XK_Cyrillic_lje' : 0x06a9,
+	'XK_Cyrillic_nje' : 0x06aa,
+	'XK_Cyrillic_o' : 0x06cf,
+	'XK_Cyrillic_o_bar' : 0x10004e9,
+	'XK_Cyrillic_pe' : 0x06d0,
+	'XK_Cyrillic_schwa' : 0x10004d9,
+	'XK_Cyrillic_sha' : 0x06db,
+	'XK_Cyrillic_shcha' : 0x06dd,
+	'XK_Cyrillic_shha' : 0x10004bb,
+	'XK_Cyrillic_shorti' : 0x06ca,
+	'XK_Cyrillic_softsign' : 0x06d8,
+	'XK_Cyrillic_te' : 0x06d4,
+	'XK_Cyrillic_tse' : 0x06c3,
+	'XK_Cyrillic_u' : 0x06d5,
+	'XK_Cyrillic_u_macron' : 0x10004ef,
+	'XK_Cyrillic_u_straight' : 0x10004af,
+	'XK_Cyrillic_u_straight_bar' : 0x10004b1,
+	'XK_Cyrillic_ve' : 0x06d7,
+	'XK_Cyrillic_ya' : 0x06d1,
+	'XK_Cyrillic_yeru' : 0x06d9,
+	'XK_Cyrillic_yu' : 0x06c0,
+	'XK_Cyrillic_ze' : 0x06da,
+	'XK_Cyrillic_zhe' : 0x06d6,
+	'XK_Cyrillic_zhe_descender' : 0x1000497,
+	'XK_D' : 0x0044,
+	'XK_Dabovedot' : 0x1001e0a,
+	'XK_Dcaron' : 0x01cf,
+	'XK_Delete' : 0xffff,
+	'XK_DongSign' : 0x10020ab,
+	'XK_Down' : 0xff54,
+	'XK_Dstroke' : 0x01d0,
+	'XK_E' : 0x0045,
+	'XK_ENG' : 0x03bd,
+	'XK_ETH' : 0x00d0,
+	'XK_EZH' : 0x10001b7,
+	'XK_Eabovedot' : 0x03cc,
+	'XK_Eacute' : 0x00c9,
+	'XK_Ebelowdot' : 0x1001eb8,
+	'XK_Ecaron' : 0x01cc,
+	'XK_Ecircumflex' : 0x00ca,
+	'XK_Ecircumflexacute' : 0x1001ebe,
+	'XK_Ecircumflexbelowdot' : 0x1001ec6,
+	'XK_Ecircumflexgrave' : 0x1001ec0,
+	'XK_Ecircumflexhook' : 0x1001ec2,
+	'XK_Ecircumflextilde' : 0x1001ec4,
+	'XK_EcuSign' : 0x10020a0,
+	'XK_Ediaeresis' : 0x00cb,
+	'XK_Egrave' : 0x00c8,
+	'XK_Ehook' : 0x1001eba,
+	'XK_Eisu_Shift' : 0xff2f,
+	'XK_Eisu_toggle' : 0xff30,
+	'XK_Emacron' : 0x03aa,
+	'XK_End' : 0xff57,
+	'XK_Eogonek' : 0x01ca,
+	'XK_Escape' : 0xff1b,
+	'XK_Eth' : 0x00d0,
+	'XK_Etilde' : 0x1001ebc,
+	'XK_EuroSign' : 0x20ac,
+	'XK_Execute' : 0xff62,
+	'XK_F' : 0x0046,
+	'XK_F1' : 0xffbe,
+	'XK_F10' : 0xffc7,
+	'XK_F11' : 0xffc8,
+	'XK_F12' : 0xffc9,
+	'XK_F13' : 0xffca,
+	'XK_F14' : 0xffcb,
+	'XK_F15' : 0xffcc,
+	'XK_F16' : 0xffcd,
+	'XK_F17' : 0xffce,
+	'XK_F18' : 0xffcf,
+	'XK_F19' : 0xffd0,
+	'XK_F2' : 0xffbf,
+	'XK_F20' : 0xffd1,
+	'XK_F21' : 0xffd2,
+	'XK_F22' : 0xffd3,
+	'XK_F23' : 0xffd4,
+	'XK_F24' : 0xffd5,
+	'XK_F25' : 0xffd6,
+	'XK_F26' : 0xffd7,
+	'XK_F27' : 0xffd8,
+	'XK_F28' : 0xffd9,
+	'XK_F29' : 0xffda,
+	'XK_F3' : 0xffc0,
+	'XK_F30' : 0xffdb,
+	'XK_F31' : 0xffdc,
+	'XK_F32' : 0xffdd,
+	'XK_F33' : 0xffde,
+	'XK_F34' : 0xffdf,
+	'XK_F35' : 0xffe0,
+	'XK_F4' : 0xffc1,
+	'XK_F5' : 0xffc2,
+	'XK_F6' : 0xffc3,
+	'XK_F7' : 0xffc4,
+	'XK_F8' : 0xffc5,
+	'XK_F9' : 0xffc6,
+	'XK_FFrancSign' : 0x10020a3,
+	'XK_Fabovedot' : 0x1001e1e,
+	'XK_Farsi_0' : 0x10006f0,
+	'XK_Farsi_1' : 0x10006f1,
+	'XK_Farsi_2' : 0x10006f2,
+	'XK_Farsi_3' : 0x10006f3,
+	'XK_Farsi_4' : 0x10006f4,
+	'XK_Farsi_5' : 0x10006f5,
+	'XK_Farsi_6' : 0x10006f6,
+	'XK_Farsi_7' : 0x10006f7,
+	'XK_Farsi_8' : 0x10006f8,
+	'XK_Farsi_9' : 0x10006f9,
+	'XK_Farsi_yeh' : 0x10006cc,
+	'XK_Find' : 0xff68,
+	'XK_First_Virtual_Screen' : 0xfed0,
+	'XK_G' : 0x0047,
+	'XK_Gabovedot' : 0x02d5,
+	'XK_Gbreve' : 0x02ab,
+	'XK_Gcaron' : 0x10001e6,
+	'XK_Gcedilla' : 0x03ab,
+	'XK_Gcircumflex' : 0x02d8,
+	'XK_Georgian_an' : 0x10010d0,
+	'XK_Georgian_ban' : 0x10010d1,
+	'XK_Georgian_can' : 0x10010ea,
+	'XK_Georgian_char' : 0x10010ed,
+	'XK_Georgian_chin' : 0x10010e9,
+	'XK_Georgian_cil' : 0x10010ec,
+	'XK_Georgian_don' : 0x10010d3,
+	'XK_Georgian_en' : 0x10010d4,
+	'XK_Georgian_fi' : 0x10010f6,
+	'XK_Georgian_gan' : 0x10010d2,
+	'XK_Georgian_ghan' : 0x10010e6,
+	'XK_Georgian_hae' : 0x10010f0,
+	'XK_Georgian_har' : 0x10010f4,
+	'XK_Georgian_he' : 0x10010f1,
+	'XK_Georgian_hie' : 0x10010f2,
+	'XK_Georgian_hoe' : 0x10010f5,
+	'XK_Georgian_in' : 0x10010d8,
+	'XK_Georgian_jhan' : 0x10010ef,
+	'XK_Georgian_jil' : 0x10010eb,
+	'XK_Georgian_kan' : 0x10010d9,
+	'XK_Georgian_khar' : 0x10010e5,
+	'XK_Georgian_las' : 0x10010da,
+	'XK_Georgian_man' : 0x10010db,
+	'XK_Georgian_nar' : 0x10010dc,
+	'XK_Georgian_on' : 0x10010dd,
+	'XK_Georgian_par' : 0x10010de,
+	'XK_Georgian_phar' : 0x10010e4,
+	'XK_Georgian_qar' : 0x10010e7,
+	'XK_Georgian_rae' : 0x10010e0,
+	'XK_Georgian_san' : 0x10010e1,
+	'XK_Georgian_shin' : 0x10010e8,
+	'XK_Georgian_tan' : 0x10010d7,
+	'XK_Georgian_tar' : 0x10010e2,
+	'XK_Georgian_un' : 0x10010e3,
+	'XK_Georgian_vin' : 0x10010d5,
+	'XK_Georgian_we' : 0x10010f3,
+	'XK_Georgian_xan' : 0x10010ee,
+	'XK_Georgian_zen' : 0x10010d6,
+	'XK_Georgian_zhar' : 0x10010df,
+	'XK_Greek_ALPHA' : 0x07c1,
+	'XK_Greek_ALPHAaccent' : 0x07a1,
+	'XK_Greek_BETA' : 0x07c2,
+	'XK_Greek_CHI' : 0x07d7,
+	'XK_Greek_DELTA' : 0x07c4,
+	'XK_Greek_EPSILON' : 0x07c5,
+	'XK_Greek_EPSILONaccent' : 0x07a2,
+	'XK_Greek_ETA' : 0x07c7,
+	'XK_Greek_ETAaccent' : 0x07a3,
+	'XK_Greek_GAMMA' : 0x07c3,
+	'XK_Greek_IOTA' : 0x07c9,
+	'XK_Greek_IOTAaccent' : 0x07a4,
+	'XK_Greek_IOTAdiaeresis' : 0x07a5,
+	'XK_Greek_IOTAdieresis' : 0x07a5,
+	'XK_Greek_KAPPA' : 0x07ca,
+	'XK_Greek_LAMBDA' : 0x07cb,
+	'XK_Greek_LAMDA' : 0x07cb,
+	'XK_Greek_MU' : 0x07cc,
+	'XK_Greek_NU' : 0x07cd,
+	'XK_Greek_OMEGA' : 0x07d9,
+	'XK_Greek_OMEGAaccent' : 0x07ab,
+	'XK_Greek_OMICRON' : 0x07cf,
+	'XK_Greek_OMICRONaccent' : 0x07a7,
+	'XK_Greek_PHI' : 0x07d6,
+	'XK_Greek_PI' : 0x07d0,
+	'XK_Greek_PSI' : 0x07d8,
+	'XK_Greek_RHO' : 0x07d1,
+	'XK_Greek_SIGMA' : 0x07d2,
+	'XK_Greek_TAU' : 0x07d4,
+	'XK_Greek_THETA' : 0x07c8,
+	'XK_Greek_UPSILON' : 0x07d5,
+	'XK_Greek_UPSILONaccent' : 0x07a8,
+	'XK_Greek_UPSILONdieresis' : 0x07a9,
+	'XK_Greek_XI' : 0x07ce,
+	'XK_Greek_ZETA' : 0x07c6,
+	'XK_Greek_accentdieresis' : 0x07ae,
+	'XK_Greek_alpha' : 0x07e1,
+	'XK_Greek_alphaaccent' : 0x07b1,
+	'XK_Greek_beta' : 0x07e2,
+	'XK_Greek_chi' : 0x07f7,
+	'XK_Greek_delta' : 0x07e4,
+	'XK_Greek_epsilon' : 0x07e5,
+	'XK_Greek_epsilonaccent' : 0x07b2,
+	'XK_Greek_eta' : 0x07e7,
+	'XK_Greek_etaaccent' : 0x07b3,
+	'XK_Greek_finalsmallsigma' : 0x07f3,
+	'XK_Greek_gamma' : 0x07e3,
+	'XK_Greek_horizbar' : 0x07af,
+	'XK_Greek_iota' : 0x07e9,
+	'XK_Greek_iotaaccent' : 0x07b4,
+	'XK_Greek_iotaaccentdieresis' : 0x07b6,
+	'XK_Greek_iotadieresis' : 0x07b5,
+	'XK_Greek_kappa' : 0x07ea,
+	'XK_Greek_lambda' : 0x07eb,
+	'XK_Greek_lamda' : 0x07eb,
+	'XK_Greek_mu' : 0x07ec,
+	'XK_Greek_nu' : 0x07ed,
+	'XK_Greek_omega' : 0x07f9,
+	'XK_Greek_omegaaccent' : 0x07bb,
+	'XK_Greek_omicron' : 0x07ef,
+	'XK_Greek_omicronaccent' : 0x07b7,
+	'XK_Greek_phi' : 0x07f6,
+	'XK_Greek_pi' : 0x07f0,
+	'XK_Greek_psi' : 0x07f8,
+	'XK_Greek_rho' : 0x07f1,
+	'XK_Greek_sigma' : 0x07f2,
+	'XK_Greek_switch' : 0xff7e,
+	'XK_Greek_tau' : 0x07f4,
+	'XK_Greek_theta' : 0x07e8,
+	'XK_Greek_upsilon' : 0x07f5,
+	'XK_Greek_upsilonaccent' : 0x07b8,
+	'XK_Greek_upsilonaccentdieresis' : 0x07ba,
+	'XK_Greek_upsilondieresis' : 0x07b9,
+	'XK_Greek_xi' : 0x07ee,
+	'XK_Greek_zeta' : 0x07e6,
+	'XK_H' : 0x0048,
+	'XK_Hangul' : 0xff31,
+	'XK_Hangul_A' : 0x0ebf,
+	'XK_Hangul_AE' : 0x0ec0,
+	'XK_Hangul_AraeA' : 0x0ef6,
+	'XK_Hangul_AraeAE' : 0x0ef7,
+	'XK_Hangul_Banja' : 0xff39,
+	'XK_Hangul_Cieuc' : 0x0eba,
+	'XK_Hangul_Codeinput' : 0xff37,
+	'XK_Hangul_Dikeud' : 0x0ea7,
+	'XK_Hangul_E' : 0x0ec4,
+	'XK_Hangul_EO' : 0x0ec3,
+	'XK_Hangul_EU' : 0x0ed1,
+	'XK_Hangul_End' : 0xff33,
+	'XK_Hangul_Hanja' : 0xff34,
+	'XK_Hangul_Hieuh' : 0x0ebe,
+	'XK_Hangul_I' : 0x0ed3,
+	'XK_Hangul_Ieung' : 0x0eb7,
+	'XK_Hangul_J_Cieuc' : 0x0eea,
+	'XK_Hangul_J_Dikeud' : 0x0eda,
+	'XK_Hangul_J_Hieuh' : 0x0eee,
+	'XK_Hangul_J_Ieung' : 0x0ee8,
+	'XK_Hangul_J_Jieuj' : 0x0ee9,
+	'XK_Hangul_J_Khieuq' : 0x0eeb,
+	'XK_Hangul_J_Kiyeog' : 0x0ed4,
+	'XK_Hangul_J_KiyeogSios' : 0x0ed6,
+	'XK_Hangul_J_KkogjiDalrinIeung' : 0x0ef9,
+	'XK_Hangul_J_Mieum' : 0x0ee3,
+	'XK_Hangul_J_Nieun' : 0x0ed7,
+	'XK_Hangul_J_NieunHieuh' : 0x0ed9,
+	'XK_Hangul_J_NieunJieuj' : 0x0ed8,
+	'XK_Hangul_J_PanSios' : 0x0ef8,
+	'XK_Hangul_J_Phieuf' : 0x0eed,
+	'XK_Hangul_J_Pieub' : 0x0ee4,
+	'XK_Hangul_J_PieubSios' : 0x0ee5,
+	'XK_Hangul_J_Rieul' : 0x0edb,
+	'XK_Hangul_J_RieulHieuh' : 0x0ee2,
+	'XK_Hangul_J_RieulKiyeog' : 0x0edc,
+	'XK_Hangul_J_RieulMieum' : 0x0edd,
+	'XK_Hangul_J_RieulPhieuf' : 0x0ee1,
+	'XK_Hangul_J_RieulPieub' : 0x0ede,
+	'XK_Hangul_J_RieulSios' : 0x0edf,
+	'XK_Hangul_J_RieulTieut' : 0x0ee0,
+	'XK_Hangul_J_Sios' : 0x0ee6,
+	'XK_Hangul_J_SsangKiyeog' : 0x0ed5,
+	'XK_Hangul_J_SsangSios' : 0x0ee7,
+	'XK_Hangul_J_Tieut' : 0x0eec,
+	'XK_Hangul_J_YeorinHieuh' : 0x0efa,
+	'XK_Hangul_Jamo' : 0xff35,
+	'XK_Hangul_Jeonja' : 0xff38,
+	'XK_Hangul_Jieuj' : 0x0eb8,
+	'XK_Hangul_Khieuq' : 0x0ebb,
+	'XK_Hangul_Kiyeog' : 0x0ea1,
+	'XK_Hangul_KiyeogSios' : 0x0ea3,
+	'XK_Hangul_KkogjiDalrinIeung' : 0x0ef3,
+	'XK_Hangul_Mieum' : 0x0eb1,
+	'XK_Hangul_MultipleCandidate' : 0xff3d,
+	'XK_Hangul_Nieun' : 0x0ea4,
+	'XK_Hangul_NieunHieuh' : 0x0ea6,
+	'XK_Hangul_NieunJieuj' : 0x0ea5,
+	'XK_Hangul_O' : 0x0ec7,
+	'XK_Hangul_OE' : 0x0eca,
+	'XK_Hangul_PanSios' : 0x0ef2,
+	'XK_Hangul_Phieuf' : 0x0ebd,
+	'XK_Hangul_Pieub' : 0x0eb2,
+	'XK_Hangul_PieubSios' : 0x0eb4,
+	'XK_Hangul_PostHanja' : 0xff3b,
+	'XK_Hangul_PreHanja' : 0xff3a,
+	'XK_Hangul_PreviousCandidate' : 0xff3e,
+	'XK_Hangul_Rieul' : 0x0ea9,
+	'XK_Hangul_RieulHieuh' : 0x0eb0,
+	'XK_Hangul_RieulKiyeog' : 0x0eaa,
+	'XK_Hangul_RieulMieum' : 0x0eab,
+	'XK_Hangul_RieulPhieuf' : 0x0eaf,
+	'XK_Hangul_RieulPieub' : 0x0eac,
+	'XK_Hangul_RieulSios' : 0x0ead,
+	'XK_Hangul_RieulTieut' : 0x0eae,
+	'XK_Hangul_RieulYeorinHieuh' : 0x0eef,
+	'XK_Hangul_Romaja' : 0xff36,
+	'XK_Hangul_SingleCandidate' : 0xff3c,
+	'XK_Hangul_Sios' : 0x0eb5,
+	'XK_Hangul_Special' : 0xff3f,
+	'XK_Hangul_SsangDikeud' : 0x0ea8,
+	'XK_Hangul_SsangJieuj' : 0x0eb9,
+	'XK_Hangul_SsangKiyeog' : 0x0ea2,
+	'XK_Hangul_SsangPieub' : 0x0eb3,
+	'XK_Hangul_SsangSios' : 0x0eb6,
+	'XK_Hangul_Start' : 0xff32,
+	'XK_Hangul_SunkyeongeumMieum' : 0x0ef0,
+	'XK_Hangul_SunkyeongeumPhieuf' : 0x0ef4,
+	'XK_Hangul_SunkyeongeumPieub' : 0x0ef1,
+	'XK_Hangul_Tieut' : 0x0ebc,
+	'XK_Hangul_U' : 0x0ecc,
+	'XK_Hangul_WA' : 0x0ec8,
+	'XK_Hangul_WAE' : 0x0ec9,
+	'XK_Hangul_WE' : 0x0ece,
+	'XK_Hangul_WEO' : 0x0ecd,
+	'XK_Hangul_WI' : 0x0ecf,
+	'XK_Hangul_YA' : 0x0ec1,
+	'XK_Hangul_YAE' : 0x0ec2,
+	'XK_Hangul_YE' : 0x0ec6,
+	'XK_Hangul_YEO' : 0x0ec5,
+	'XK_Hangul_YI' : 0x0ed2,
+	'XK_Hangul_YO' : 0x0ecb,
+	'XK_Hangul_YU' : 0x0ed0,
+	'XK_Hangul_YeorinHieuh' : 0x0ef5,
+	'XK_Hangul_switch' : 0xff7e,
+	'XK_Hankaku' : 0xff29,
+	'XK_Hcircumflex' : 0x02a6,
+	'XK_Hebrew_switch' : 0xff7e,
+	'XK_Help' : 0xff6a,
+	'XK_Henkan' : 0xff23,
+	'XK_Henkan_Mode' : 0xff23,
+	'XK_Hiragana' : 0xff25,
+	'XK_Hiragana_Katakana' : 0xff27,
+	'XK_Home' : 0xff50,
+	'XK_Hstroke' : 0x02a1,
+	'XK_Hyper_L' : 0xffed,
+	'XK_Hyper_R' : 0xffee,
+	'XK_I' : 0x0049,
+	'XK_ISO_Center_Object' : 0xfe33,
+	'XK_ISO_Continuous_Underline' : 0xfe30,
+	'XK_ISO_Discontinuous_Underline' : 0xfe31,
+	'XK_ISO_Emphasize' : 0xfe32,
+	'XK_ISO_Enter' : 0xfe34,
+	'XK_ISO_Fast_Cursor_Down' : 0xfe2f,
+	'XK_ISO_Fast_Cursor_Left' : 0xfe2c,
+	'XK_ISO_Fast_Cursor_Right' : 0xfe2d,
+	'XK_ISO_Fast_Cursor_Up' : 0xfe2e,
+	'XK_ISO_First_Group' : 0xfe0c,
+	'XK_ISO_First_Group_Lock' : 0xfe0d,
+	'XK_ISO_Group_Latch' : 0xfe06,
+	'XK_ISO_Group_Lock' : 0xfe07,
+	'XK_ISO_Group_Shift' : 0xff7e,
+	'XK_ISO_Last_Group' : 0xfe0e,
+	'XK_ISO_Last_Group_Lock' : 0xfe0f,
+	'XK_ISO_Left_Tab' : 0xfe20,
+	'XK_ISO_Level2_Latch' : 0xfe02,
+	'XK_ISO_Level3_Latch' : 0xfe04,
+	'XK_ISO_Level3_Lock' : 0xfe05,
+	'XK_ISO_Level3_Shift' : 0xfe03,
+	'XK_ISO_Level5_Latch' : 0xfe12,
+	'XK_ISO_Level5_Lock' : 0xfe13,
+	'XK_ISO_Level5_Shift' : 0xfe11,
+	'XK_ISO_Lock' : 0xfe01,
+	'XK_ISO_Move_Line_Down' : 0xfe22,
+	'XK_ISO_Move_Line_Up' : 0xfe21,
+	'XK_ISO_Next_Group' : 0xfe08,
+	'XK_ISO_Next_Group_Lock' : 0xfe09,
+	'XK_ISO_Partial_Line_Down' : 0xfe24,
+	'XK_ISO_Partial_Line_Up' : 0xfe23,
+	'XK_ISO_Partial_Space_Left' : 0xfe25,
+	'XK_ISO_Partial_Space_Right' : 0xfe26,
+	'XK_ISO_Prev_Group' : 0xfe0a,
+	'XK_ISO_Prev_Group_Lock' : 0xfe0b,
+	'XK_ISO_Release_Both_Margins' : 0xfe2b,
+	'XK_ISO_Release_Margin_Left' : 0xfe29,
+	'XK_ISO_Release_Margin_Right' : 0xfe2a,
+	'XK_ISO_Set_Margin_Left' : 0xfe27,
+	'XK_ISO_Set_Margin_Right' : 0xfe28,
+	'XK_Iabovedot' : 0x02a9,
+	'XK_Iacute' : 0x00cd,
+	'XK_Ibelowdot' : 0x1001eca,
+	'XK_Ibreve' : 0x100012c,
+	'XK_Icircumflex' : 0x00ce,
+	'XK_Idiaeresis' : 0x00cf,
+	'XK_Igrave' : 0x00cc,
+	'XK_Ihook' : 0x1001ec8,
+	'XK_Imacron' : 0x03cf,
+	'XK_Insert' : 0xff63,
+	'XK_Iogonek' : 0x03c7,
+	'XK_Itilde' : 0x03a5,
+	'XK_J' : 0x004a,
+	'XK_Jcircumflex' : 0x02ac,
+	'XK_K' : 0x004b,
+	'XK_KP_0' : 0xffb0,
+	'XK_KP_1' : 0xffb1,
+	'XK_KP_2' : 0xffb2,
+	'XK_KP_3' : 0xffb3,
+	'XK_KP_4' : 0xffb4,
+	'XK_KP_5' : 0xffb5,
+	'XK_KP_6' : 0xffb6,
+	'XK_KP_7' : 0xffb7,
+	'XK_KP_8' : 0xffb8,
+	'XK_KP_9' : 0xffb9,
+	'XK_KP_Add' : 0xffab,
+	'XK_KP_Begin' : 0xff9d,
+	'XK_KP_Decimal' : 0xffae,
+	'XK_KP_Delete' : 0xff9f,
+	'XK_KP_Divide' : 0xffaf,
+	'XK_KP_Down' : 0xff99,
+	'XK_KP_End' : 0xff9c,
+	'XK_KP_Enter' : 0xff8d,
+	'XK_KP_Equal' : 0xffbd,
+	'XK_KP_F1' : 0xff91,
+	'XK_KP_F2' : 0xff92,
+	'XK_KP_F3' : 0xff93,
+	'XK_KP_F4' : 0xff94,
+	'XK_KP_Home' : 0xff95,
+	'XK_KP_Insert' : 0xff9e,
+	'XK_KP_Left' : 0xff96,
+	'XK_KP_Multiply' : 0xffaa,
+	'XK_KP_Next' : 0xff9b,
+	'XK_KP_Page_Down' : 0xff9b,
+	'XK_KP_Page_Up' : 0xff9a,
+	'XK_KP_Prior' : 0xff9a,
+	'XK_KP_Right' : 0xff98,
+	'XK_KP_Separator' : 0xffac,
+	'XK_KP_Space' : 0xff80,
+	'XK_KP_Subtract' : 0xffad,
+	'XK_KP_Tab' : 0xff89,
+	'XK_KP_Up' : 0xff97,
+	'XK_Kana_Lock' : 0xff2d,
+	'XK_Kana_Shift' : 0xff2e,
+	'XK_Kanji' : 0xff21,
+	'XK_Kanji_Bangou' : 0xff37,
+	'XK_Katakana' : 0xff26,
+	'XK_Kcedilla' : 0x03d3,
+	'XK_Korean_Won' : 0x0eff,
+	'XK_L' : 0x004c,
+	'XK_L1' : 0xffc8,
+	'XK_L10' : 0xffd1,
+	'XK_L2' : 0xffc9,
+	'XK_L3' : 0xffca,
+	'XK_L4' : 0xffcb,
+	'XK_L5' : 0xffcc,
+	'XK_L6' : 0xffcd,
+	'XK_L7' : 0xffce,
+	'XK_L8' : 0xffcf,
+	'XK_L9' : 0xffd0,
+	'XK_Lacute' : 0x01c5,
+	'XK_Last_Virtual_Screen' : 0xfed4,
+	'XK_Lbelowdot' : 0x1001e36,
+	'XK_Lcaron' : 0x01a5,
+	'XK_Lcedilla' : 0x03a6,
+	'XK_Left' : 0xff51,
+	'XK_Linefeed' : 0xff0a,
+	'XK_LiraSign' : 0x10020a4,
+	'XK_Lstroke' : 0x01a3,
+	'XK_M' : 0x004d,
+	'XK_Mabovedot' : 0x1001e40,
+	'XK_Macedonia_DSE' : 0x06b5,
+	'XK_Macedonia_GJE' : 0x06b2,
+	'XK_Macedonia_KJE' : 0x06bc,
+	'XK_Macedonia_dse' : 0x06a5,
+	'XK_Macedonia_gje' : 0x06a2,
+	'XK_Macedonia_kje' : 0x06ac,
+	'XK_Mae_Koho' : 0xff3e,
+	'XK_Massyo' : 0xff2c,
+	'XK_Menu' : 0xff67,
+	'XK_Meta_L' : 0xffe7,
+	'XK_Meta_R' : 0xffe8,
+	'XK_MillSign' : 0x10020a5,
+	'XK_Mode_switch' : 0xff7e,
+	'XK_MouseKeys_Accel_Enable' : 0xfe77,
+	'XK_MouseKeys_Enable' : 0xfe76,
+	'XK_Muhenkan' : 0xff22,
+	'XK_Multi_key' : 0xff20,
+	'XK_MultipleCandidate' : 0xff3d,
+	'XK_N' : 0x004e,
+	'XK_Nacute' : 0x01d1,
+	'XK_NairaSign' : 0x10020a6,
+	'XK_Ncaron' : 0x01d2,
+	'XK_Ncedilla' : 0x03d1,
+	'XK_NewSheqelSign' : 0x10020aa,
+	'XK_Next' : 0xff56,
+	'XK_Next_Virtual_Screen' : 0xfed2,
+	'XK_Ntilde' : 0x00d1,
+	'XK_Num_Lock' : 0xff7f,
+	'XK_O' : 0x004f,
+	'XK_OE' : 0x13bc,
+	'XK_Oacute' : 0x00d3,
+	'XK_Obarred' : 0x100019f,
+	'XK_Obelowdot' : 0x1001ecc,
+	'XK_Ocaron' : 0x10001d1,
+	'XK_Ocircumflex' : 0x00d4,
+	'XK_Ocircumflexacute' : 0x1001ed0,
+	'XK_Ocircumflexbelowdot' : 0x1001ed8,
+	'XK_Ocircumflexgrave' : 0x1001ed2,
+	'XK_Ocircumflexhook' : 0x1001ed4,
+	'XK_Ocircumflextilde' : 0x1001ed6,
+	'XK_Odiaeresis' : 0x00d6,
+	'XK_Odoubleacute' : 0x01d5,
+	'XK_Ograve' : 0x00d2,
+	'XK_Ohook' : 0x1001ece,
+	'XK_Ohorn' : 0x10001a0,
+	'XK_Ohornacute' : 0x1001eda,
+	'XK_Ohornbelowdot' : 0x1001ee2,
+	'XK_Ohorngrave' : 0x1001edc,
+	'XK_Ohornhook' : 0x1001ede,
+	'XK_Ohorntilde' : 0x1001ee0,
+	'XK_Omacron' : 0x03d2,
+	'XK_Ooblique' : 0x00d8,
+	'XK_Oslash' : 0x00d8,
+	'XK_Otilde' : 0x00d5,
+	'XK_Overlay1_Enable' : 0xfe78,
+	'XK_Overlay2_Enable' : 0xfe79,
+	'XK_P' : 0x0050,
+	'XK_Pabovedot' : 0x1001e56,
+	'XK_Page_Down' : 0xff56,
+	'XK_Page_Up' : 0xff55,
+	'XK_Pause' : 0xff13,
+	'XK_PesetaSign' : 0x10020a7,
+	'XK_Pointer_Accelerate' : 0xfefa,
+	'XK_Pointer_Button1' : 0xfee9,
+	'XK_Pointer_Button2' : 0xfeea,
+	'XK_Pointer_Button3' : 0xfeeb,
+	'XK_Pointer_Button4' : 0xfeec,
+	'XK_Pointer_Button5' : 0xfeed,
+	'XK_Pointer_Button_Dflt' : 0xfee8,
+	'XK_Pointer_DblClick1' : 0xfeef,
+	'XK_Pointer_DblClick2' : 0xfef0,
+	'XK_Pointer_DblClick3' : 0xfef1,
+	'XK_Pointer_DblClick4' : 0xfef2,
+	'XK_Pointer_DblClick5' : 0xfef3,
+	'XK_Pointer_DblClick_Dflt' : 0xfeee,
+	'XK_Pointer_DfltBtnNext' : 0xfefb,
+	'XK_Pointer_DfltBtnPrev' : 0xfefc,
+	'XK_Pointer_Down' : 0xfee3,
+	'XK_Pointer_DownLeft' : 0xfee6,
+	'XK_Pointer_DownRight' : 0xfee7,
+	'XK_Pointer_Drag1' : 0xfef5,
+	'XK_Pointer_Drag2' : 0xfef6,
+	'XK_Pointer_Drag3' : 0xfef7,
+	'XK_Pointer_Drag4' : 0xfef8,
+	'XK_Pointer_Drag5' : 0xfefd,
+	'XK_Pointer_Drag_Dflt' : 0xfef4,
+	'XK_Pointer_EnableKeys' : 0xfef9,
+	'XK_Pointer_Left' : 0xfee0,
+	'XK_Pointer_Right' : 0xfee1,
+	'XK_Pointer_Up' : 0xfee2,
+	'XK_Pointer_UpLeft' : 0xfee4,
+	'XK_Pointer_UpRight' : 0xfee5,
+	'XK_Prev_Virtual_Screen' : 0xfed1,
+	'XK_PreviousCandidate' : 0xff3e,
+	'XK_Print' : 0xff61,
+	'XK_Prior' : 0xff55,
+	'XK_Q' : 0x0051,
+	'XK_R' : 0x0052,
+	'XK_R1' : 0xffd2,
+	'XK_R10' : 0xffdb,
+	'XK_R11' : 0xffdc,
+	'XK_R12' : 0xffdd,
+	'XK_R13' : 0xffde,
+	'XK_R14' : 0xffdf,
+	'XK_R15' : 0xffe0,
+	'XK_R2' : 0xffd3,
+	'XK_R3' : 0xffd4,
+	'XK_R4' : 0xffd5,
+	'XK_R5' : 0xffd6,
+	'XK_R6' : 0xffd7,
+	'XK_R7' : 0xffd8,
+	'XK_R8' : 0xffd9,
+	'XK_R9' : 0xffda,
+	'XK_Racute' : 0x01c0,
+	'XK_Rcaron' : 0x01d8,
+	'XK_Rcedilla' : 0x03a3,
+	'XK_Redo' : 0xff66,
+	'XK_RepeatKeys_Enable' : 0xfe72,
+	'XK_Return' : 0xff0d,
+	'XK_Right' : 0xff53,
+	'XK_Romaji' : 0xff24,
+	'XK_RupeeSign' : 0x10020a8,
+	'XK_S' : 0x0053,
+	'XK_SCHWA' : 0x100018f,
+	'XK_Sabovedot' : 0x1001e60,
+	'XK_Sacute' : 0x01a6,
+	'XK_Scaron' : 0x01a9,
+	'XK_Scedilla' : 0x01aa,
+	'XK_Scircumflex' : 0x02de,
+	'XK_Scroll_Lock' : 0xff14,
+	'XK_Select' : 0xff60,
+	'XK_Serbian_DJE' : 0x06b1,
+	'XK_Serbian_DZE' : 0x06bf,
+	'XK_Serbian_JE' : 0x06b8,
+	'XK_Serbian_LJE' : 0x06b9,
+	'XK_Serbian_NJE' : 0x06ba,
+	'XK_Serbian_TSHE' : 0x06bb,
+	'XK_Serbian_dje' : 0x06a1,
+	'XK_Serbian_dze' : 0x06af,
+	'XK_Serbian_je' : 0x06a8,
+	'XK_Serbian_lje' : 0x06a9,
+	'XK_Serbian_nje' : 0x06aa,
+	'XK_Serbian_tshe' : 0x06ab,
+	'XK_Shift_L' : 0xffe1,
+	'XK_Shift_Lock' : 0xffe6,
+	'XK_Shift_R' : 0xffe2,
+	'XK_SingleCandidate' : 0xff3c,
+	'XK_Sinh_a' : 0x1000d85,
+	'XK_Sinh_aa' : 0x1000d86,
+	'XK_Sinh_aa2' : 0x1000dcf,
+	'XK_Sinh_ae' : 0x1000d87,
+	'XK_Sinh_ae2' : 0x1000dd0,
+	'XK_Sinh_aee' : 0x1000d88,
+	'XK_Sinh_aee2' : 0x1000dd1,
+	'XK_Sinh_ai' : 0x1000d93,
+	'XK_Sinh_ai2' : 0x1000ddb,
+	'XK_Sinh_al' : 0x1000dca,
+	'XK_Sinh_au' : 0x1000d96,
+	'XK_Sinh_au2' : 0x1000dde,
+	'XK_Sinh_ba' : 0x1000db6,
+	'XK_Sinh_bha' : 0x1000db7,
+	'XK_Sinh_ca' : 0x1000da0,
+	'XK_Sinh_cha' : 0x1000da1,
+	'XK_Sinh_dda' : 0x1000da9,
+	'XK_Sinh_ddha' : 0x1000daa,
+	'XK_Sinh_dha' : 0x1000daf,
+	'XK_Sinh_dhha' : 0x1000db0,
+	'XK_Sinh_e' : 0x1000d91,
+	'XK_Sinh_e2' : 0x1000dd9,
+	'XK_Sinh_ee' : 0x1000d92,
+	'XK_Sinh_ee2' : 0x1000dda,
+	'XK_Sinh_fa' : 0x1000dc6,
+	'XK_Sinh_ga' : 0x1000d9c,
+	'XK_Sinh_gha' : 0x1000d9d,
+	'XK_Sinh_h2' : 0x1000d83,
+	'XK_Sinh_ha' : 0x1000dc4,
+	'XK_Sinh_i' : 0x1000d89,
+	'XK_Sinh_i2' : 0x1000dd2,
+	'XK_Sinh_ii' : 0x1000d8a,
+	'XK_Sinh_ii2' : 0x1000dd3,
+	'XK_Sinh_ja' : 0x1000da2,
+	'XK_Sinh_jha' : 0x1000da3,
+	'XK_Sinh_jnya' : 0x1000da5,
+	'XK_Sinh_ka' : 0x1000d9a,
+	'XK_Sinh_kha' : 0x1000d9b,
+	'XK_Sinh_kunddaliya' : 0x1000df4,
+	'XK_Sinh_la' : 0x1000dbd,
+	'XK_Sinh_lla' : 0x1000dc5,
+	'XK_Sinh_lu' : 0x1000d8f,
+	'XK_Sinh_lu2' : 0x1000ddf,
+	'XK_Sinh_luu' : 0x1000d90,
+	'XK_Sinh_luu2' : 0x1000df3,
+	'XK_Sinh_ma' : 0x1000db8,
+	'XK_Sinh_mba' : 0x1000db9,
+	'XK_Sinh_na' : 0x1000db1,
+	'XK_Sinh_ndda' : 0x1000dac,
+	'XK_Sinh_ndha' : 0x1000db3,
+	'XK_Sinh_ng' : 0x1000d82,
+	'XK_Sinh_ng2' : 0x1000d9e,
+	'XK_Sinh_nga' : 0x1000d9f,
+	'XK_Sinh_nja' : 0x1000da6,
+	'XK_Sinh_nna' : 0x1000dab,
+	'XK_Sinh_nya' : 0x1000da4,
+	'XK_Sinh_o' : 0x1000d94,
+	'XK_Sinh_o2' : 0x1000ddc,
+	'XK_Sinh_oo' : 0x1000d95,
+	'XK_Sinh_oo2' : 0x1000ddd,
+	'XK_Sinh_pa' : 0x1000db4,
+	'XK_Sinh_pha' : 0x1000db5,
+	'XK_Sinh_ra' : 0x1000dbb,
+	'XK_Sinh_ri' : 0x1000d8d,
+	'XK_Sinh_rii' : 0x1000d8e,
+	'XK_Sinh_ru2' : 0x1000dd8,
+	'XK_Sinh_ruu2' : 0x1000df2,
+	'XK_Sinh_sa' : 0x1000dc3,
+	'XK_Sinh_sha' : 0x1000dc1,
+	'XK_Sinh_ssha' : 0x1000dc2,
+	'XK_Sinh_tha' : 0x1000dad,
+	'XK_Sinh_thha' : 0x1000dae,
+	'XK_Sinh_tta' : 0x1000da7,
+	'XK_Sinh_ttha' : 0x1000da8,
+	'XK_Sinh_u' : 0x1000d8b,
+	'XK_Sinh_u2' : 0x1000dd4,
+	'XK_Sinh_uu' : 0x1000d8c,
+	'XK_Sinh_uu2' : 0x1000dd6,
+	'XK_Sinh_va' : 0x1000dc0,
+	'XK_Sinh_ya' : 0x1000dba,
+	'XK_SlowKeys_Enable' : 0xfe73,
+	'XK_StickyKeys_Enable' : 0xfe75,
+	'XK_Super_L' : 0xffeb,
+	'XK_Super_R' : 0xffec,
+	'XK_Sys_Req' : 0xff15,
+	'XK_T' : 0x0054,
+	'XK_THORN' : 0x00de,
+	'XK_Tab' : 0xff09,
+	'XK_Tabovedot' : 0x1001e6a,
+	'XK_Tcaron' : 0x01ab,
+	'XK_Tcedilla' : 0x01de,
+	'XK_Terminate_Server' : 0xfed5,
+	'XK_Thai_baht' : 0x0ddf,
+	'XK_Thai_bobaimai' : 0x0dba,
+	'XK_Thai_chochan' : 0x0da8,
+	'XK_Thai_chochang' : 0x0daa,
+	'XK_Thai_choching' : 0x0da9,
+	'XK_Thai_chochoe' : 0x0dac,
+	'XK_Thai_dochada' : 0x0dae,
+	'XK_Thai_dodek' : 0x0db4,
+	'XK_Thai_fofa' : 0x0dbd,
+	'XK_Thai_fofan' : 0x0dbf,
+	'XK_Thai_hohip' : 0x0dcb,
+	'XK_Thai_honokhuk' : 0x0dce,
+	'XK_Thai_khokhai' : 0x0da2,
+	'XK_Thai_khokhon' : 0x0da5,
+	'XK_Thai_khokhuat' : 0x0da3,
+	'XK_Thai_khokhwai' : 0x0da4,
+	'XK_Thai_khorakhang' : 0x0da6,
+	'XK_Thai_kokai' : 0x0da1,
+	'XK_Thai_lakkhangyao' : 0x0de5,
+	'XK_Thai_lekchet' : 0x0df7,
+	'XK_Thai_lekha' : 0x0df5,
+	'XK_Thai_lekhok' : 0x0df6,
+	'XK_Thai_lekkao' : 0x0df9,
+	'XK_Thai_leknung' : 0x0df1,
+	'XK_Thai_lekpaet' : 0x0df8,
+	'XK_Thai_leksam' : 0x0df3,
+	'XK_Thai_leksi' : 0x0df4,
+	'XK_Thai_leksong' : 0x0df2,
+	'XK_Thai_leksun' : 0x0df0,
+	'XK_Thai_lochula' : 0x0dcc,
+	'XK_Thai_loling' : 0x0dc5,
+	'XK_Thai_lu' : 0x0dc6,
+	'XK_Thai_maichattawa' : 0x0deb,
+	'XK_Thai_maiek' : 0x0de8,
+	'XK_Thai_maihanakat' : 0x0dd1,
+	'XK_Thai_maihanakat_maitho' : 0x0dde,
+	'XK_Thai_maitaikhu' : 0x0de7,
+	'XK_Thai_maitho' : 0x0de9,
+	'XK_Thai_maitri' : 0x0dea,
+	'XK_Thai_maiyamok' : 0x0de6,
+	'XK_Thai_moma' : 0x0dc1,
+	'XK_Thai_ngongu' : 0x0da7,
+	'XK_Thai_nikhahit' : 0x0ded,
+	'XK_Thai_nonen' : 0x0db3,
+	'XK_Thai_nonu' : 0x0db9,
+	'XK_Thai_oang' : 0x0dcd,
+	'XK_Thai_paiyannoi' : 0x0dcf,
+	'XK_Thai_phinthu' : 0x0dda,
+	'XK_Thai_phophan' : 0x0dbe,
+	'XK_Thai_phophung' : 0x0dbc,
+	'XK_Thai_phosamphao' : 0x0dc0,
+	'XK_Thai_popla' : 0x0dbb,
+	'XK_Thai_rorua' : 0x0dc3,
+	'XK_Thai_ru' : 0x0dc4,
+	'XK_Thai_saraa' : 0x0dd0,
+	'XK_Thai_saraaa' : 0x0dd2,
+	'XK_Thai_saraae' : 0x0de1,
+	'XK_Thai_saraaimaimalai' : 0x0de4,
+	'XK_Thai_saraaimaimuan' : 0x0de3,
+	'XK_Thai_saraam' : 0x0dd3,
+	'XK_Thai_sarae' : 0x0de0,
+	'XK_Thai_sarai' : 0x0dd4,
+	'XK_Thai_saraii' : 0x0dd5,
+	'XK_Thai_sarao' : 0x0de2,
+	'XK_Thai_sarau' : 0x0dd8,
+	'XK_Thai_saraue' : 0x0dd6,
+	'XK_Thai_sarauee' : 0x0dd7,
+	'XK_Thai_sarauu' : 0x0dd9,
+	'XK_Thai_sorusi' : 0x0dc9,
+	'XK_Thai_sosala' : 0x0dc8,
+	'XK_Thai_soso' : 0x0dab,
+	'XK_Thai_sosua' : 0x0dca,
+	'XK_Thai_thanthakhat' : 0x0dec,
+	'XK_Thai_thonangmontho' : 0x0db1,
+	'XK_Thai_thophuthao' : 0x0db2,
+	'XK_Thai_thothahan' : 0x0db7,
+	'XK_Thai_thothan' : 0x0db0,
+	'XK_Thai_thothong' : 0x0db8,
+	'XK_Thai_thothung' : 0x0db6,
+	'XK_Thai_topatak' : 0x0daf,
+	'XK_Thai_totao' : 0x0db5,
+	'XK_Thai_wowaen' : 0x0dc7,
+	'XK_Thai_yoyak' : 0x0dc2,
+	'XK_Thai_yoying' : 0x0dad,
+	'XK_Thorn' : 0x00de,
+	'XK_Touroku' : 0xff2b,
+	'XK_Tslash' : 0x03ac,
+	'XK_U' : 0x0055,
+	'XK_Uacute' : 0x00da,
+	'XK_Ubelowdot' : 0x1001ee4,
+	'XK_Ubreve' : 0x02dd,
+	'XK_Ucircumflex' : 0x00db,
+	'XK_Udiaeresis' : 0x00dc,
+	'XK_Udoubleacute' : 0x01db,
+	'XK_Ugrave' : 0x00d9,
+	'XK_Uhook' : 0x1001ee6,
+	'XK_Uhorn' : 0x10001af,
+	'XK_Uhornacute' : 0x1001ee8,
+	'XK_Uhornbelowdot' : 0x1001ef0,
+	'XK_Uhorngrave' : 0x1001eea,
+	'XK_Uhornhook' : 0x1001eec,
+	'XK_Uhorntilde' : 0x1001eee,
+	'XK_Ukrainian_GHE_WITH_UPTURN' : 0x06bd,
+	'XK_Ukrainian_I' : 0x06b6,
+	'XK_Ukrainian_IE' : 0x06b4,
+	'XK_Ukrainian_YI' : 0x06b7,
+	'XK_Ukrainian_ghe_with_upturn' : 0x06ad,
+	'XK_Ukrainian_i' : 0x06a6,
+	'XK_Ukrainian_ie' : 0x06a4,
+	'XK_Ukrainian_yi' : 0x06a7,
+	'XK_Ukranian_I' : 0x06b6,
+	'XK_Ukranian_JE' : 0x06b4,
+	'XK_Ukranian_YI' : 0x06b7,
+	'XK_Ukranian_i' : 0x06a6,
+	'XK_Ukranian_je' : 0x06a4,
+	'XK_Ukranian_yi' : 0x06a7,
+	'XK_Umacron' : 0x03de,
+	'XK_Undo' : 0xff65,
+	'XK_Uogonek' : 0x03d9,
+	'XK_Up' : 0xff52,
+	'XK_Uring' : 0x01d9,
+	'XK_Utilde' : 0x03dd,
+	'XK_V' : 0x0056,
+	'XK_VoidSymbol' : 0xffffff,
+	'XK_W' : 0x0057,
+	'XK_Wacute' : 0x1001e82,
+	'XK_Wcircumflex' : 0x1000174,
+	'XK_Wdiaeresis' : 0x1001e84,
+	'XK_Wgrave' : 0x1001e80,
+	'XK_WonSign' : 0x10020a9,
+	'XK_X' : 0x0058,
+	'XK_Xabovedot' : 0x1001e8a,
+	'XK_Y' : 0x0059,
+	'XK_Yacute' : 0x00dd,
+	'XK_Ybelowdot' : 0x1001ef4,
+	'XK_Ycircumflex' : 0x1000176,
+	'XK_Ydiaeresis' : 0x13be,
+	'XK_Ygrave' : 0x1001ef2,
+	'XK_Yhook' : 0x1001ef6,
+	'XK_Ytilde' : 0x1001ef8,
+	'XK_Z' : 0x005a,
+	'XK_Zabovedot' : 0x01af,
+	'XK_Zacute' : 0x01ac,
+	'XK_Zcaron' : 0x01ae,
+	'XK_Zen_Koho' : 0xff3d,
+	'XK_Zenkaku' : 0xff28,
+	'XK_Zenkaku_Hankaku' : 0xff2a,
+	'XK_Zstroke' : 0x10001b5,
+	'XK_a' : 0x0061,
+	'XK_aacute' : 0x00e1,
+	'XK_abelowdot' : 0x1001ea1,
+	'XK_abovedot' : 0x01ff,
+	'XK_abreve' : 0x01e3,
+	'XK_abreveacute' : 0x1001eaf,
+	'XK_abrevebelowdot' : 0x1001eb7,
+	'XK_abrevegrave' : 0x1001eb1,
+	'XK_abrevehook' : 0x1001eb3,
+	'XK_abrevetilde' : 0x1001eb5,
+	'XK_acircumflex' : 0x00e2,
+	'XK_acircumflexacute' : 0x1001ea5,
+	'XK_acircumflexbelowdot' : 0x1001ead,
+	'XK_acircumflexgrave' : 0x1001ea7,
+	'XK_acircumflexhook' : 0x1001ea9,
+	'XK_acircumflextilde' : 0x1001eab,
+	'XK_acute' : 0x00b4,
+	'XK_adiaeresis' : 0x00e4,
+	'XK_ae' : 0x00e6,
+	'XK_agrave' : 0x00e0,
+	'XK_ahook' : 0x1001ea3,
+	'XK_amacron' : 0x03e0,
+	'XK_ampersand' : 0x0026,
+	'XK_aogonek' : 0x01b1,
+	'XK_apostrophe' : 0x0027,
+	'XK_approxeq' : 0x1002248,
+	'XK_approximate' : 0x08c8,
+	'XK_aring' : 0x00e5,
+	'XK_asciicircum' : 0x005e,
+	'XK_asciitilde' : 0x007e,
+	'XK_asterisk' : 0x002a,
+	'XK_at' : 0x0040,
+	'XK_atilde' : 0x00e3,
+	'XK_b' : 0x0062,
+	'XK_babovedot' : 0x1001e03,
+	'XK_backslash' : 0x005c,
+	'XK_ballotcross' : 0x0af4,
+	'XK_bar' : 0x007c,
+	'XK_because' : 0x1002235,
+	'XK_blank' : 0x09df,
+	'XK_botintegral' : 0x08a5,
+	'XK_botleftparens' : 0x08ac,
+	'XK_botleftsqbracket' : 0x08a8,
+	'XK_botleftsummation' : 0x08b2,
+	'XK_botrightparens' : 0x08ae,
+	'XK_botrightsqbracket' : 0x08aa,
+	'XK_botrightsummation' : 0x08b6,
+	'XK_bott' : 0x09f6,
+	'XK_botvertsummationconnector' : 0x08b4,
+	'XK_braceleft' : 0x007b,
+	'XK_braceright' : 0x007d,
+	'XK_bracketleft' : 0x005b,
+	'XK_bracketright' : 0x005d,
+	'XK_braille_blank' : 0x1002800,
+	'XK_braille_dot_1' : 0xfff1,
+	'XK_braille_dot_10' : 0xfffa,
+	'XK_braille_dot_2' : 0xfff2,
+	'XK_braille_dot_3' : 0xfff3,
+	'XK_braille_dot_4' : 0xfff4,
+	'XK_braille_dot_5' : 0xfff5,
+	'XK_braille_dot_6' : 0xfff6,
+	'XK_braille_dot_7' : 0xfff7,
+	'XK_braille_dot_8' : 0xfff8,
+	'XK_braille_dot_9' : 0xfff9,
+	'XK_braille_dots_1' : 0x1002801,
+	'XK_braille_dots_12' : 0x1002803,
+	'XK_braille_dots_123' : 0x1002807,
+	'XK_braille_dots_1234' : 0x100280f,
+	'XK_braille_dots_12345' : 0x100281f,
+	'XK_braille_dots_123456' : 0x100283f,
+	'XK_braille_dots_1234567' : 0x100287f,
+	'XK_braille_dots_12345678' : 0x10028ff,
+	'XK_braille_dots_1234568' : 0x10028bf,
+	'XK_braille_dots_123457' : 0x100285f,
+	'XK_braille_dots_1234578' : 0x10028df,
+	'XK_braille_dots_123458' : 0x100289f,
+	'XK_braille_dots_12346' : 0x100282f,
+	'XK_braille_dots_123467' : 0x100286f,
+	'XK_braille_dots_1234678' : 0x10028ef,
+	'XK_braille_dots_123468' : 0x10028af,
+	'XK_braille_dots_12347' : 0x100284f,
+	'XK_braille_dots_123478' : 0x10028cf,
+	'XK_braille_dots_12348' : 0x100288f,
+	'XK_braille_dots_1235' : 0x1002817,
+	'XK_braille_dots_12356' : 0x1002837,
+	'XK_braille_dots_123567' : 0x1002877,
+	'XK_braille_dots_1235678' : 0x10028f7,
+	'XK_braille_dots_123568' : 0x10028b7,
+	'XK_braille_dots_12357' : 0x1002857,
+	'XK_braille_dots_123578' : 0x10028d7,
+	'XK_braille_dots_12358' : 0x1002897,
+	'XK_braille_dots_1236' : 0x1002827,
+	'XK_braille_dots_12367' : 0x1002867,
+	'XK_braille_dots_123678' : 0x10028e7,
+	'XK_braille_dots_12368' : 0x10028a7,
+	'XK_braille_dots_1237' : 0x1002847,
+	'XK_braille_dots_12378' : 0x10028c7,
+	'XK_braille_dots_1238' : 0x1002887,
+	'XK_braille_dots_124' : 0x100280b,
+	'XK_braille_dots_1245' : 0x100281b,
+	'XK_braille_dots_12456' : 0x100283b,
+	'XK_braille_dots_124567' : 0x100287b,
+	'XK_braille_dots_1245678' : 0x10028fb,
+	'XK_braille_dots_124568' : 0x10028bb,
+	'XK_braille_dots_12457' : 0x100285b,
+	'XK_braille_dots_124578' : 0x10028db,
+	'XK_braille_dots_12458' : 0x100289b,
+	'XK_braille_dots_1246' : 0x100282b,
+	'XK_braille_dots_12467' : 0x100286b,
+	'XK_braille_dots_124678' : 0x10028eb,
+	'XK_braille_dots_12468' : 0x10028ab,
+	'XK_braille_dots_1247' : 0x100284b,
+	'XK_braille_dots_12478' : 0x10028cb,
+	'XK_braille_dots_1248' : 0x100288b,
+	'XK_braille_dots_125' : 0x1002813,
+	'XK_braille_dots_1256' : 0x1002833,
+	'XK_braille_dots_12567' : 0x1002873,
+	'XK_braille_dots_125678' : 0x10028f3,
+	'XK_braille_dots_12568' : 0x10028b3,
+	'XK_braille_dots_1257' : 0x1002853,
+	'XK_braille_dots_12578' : 0x10028d3,
+	'XK_braille_dots_1258' : 0x1002893,
+	'XK_braille_dots_126' : 0x1002823,
+	'XK_braille_dots_1267' : 0x1002863,
+	'XK_braille_dots_12678' : 0x10028e3,
+	'XK_braille_dots_1268' : 0x10028a3,
+	'XK_braille_dots_127' : 0x1002843,
+	'XK_braille_dots_1278' : 0x10028c3,
+	'XK_braille_dots_128' : 0x1002883,
+	'XK_braille_dots_13' : 0x1002805,
+	'XK_braille_dots_134' : 0x100280d,
+	'XK_braille_dots_1345' : 0x100281d,
+	'XK_braille_dots_13456' : 0x100283d,
+	'XK_braille_dots_134567' : 0x100287d,
+	'XK_braille_dots_1345678' : 0x10028fd,
+	'XK_braille_dots_134568' : 0x10028bd,
+	'XK_braille_dots_13457' : 0x100285d,
+	'XK_braille_dots_134578' : 0x10028dd,
+	'XK_braille_dots_13458' : 0x100289d,
+	'XK_braille_dots_1346' : 0x100282d,
+	'XK_braille_dots_13467' : 0x100286d,
+	'XK_braille_dots_134678' : 0x10028ed,
+	'XK_braille_dots_13468' : 0x10028ad,
+	'XK_braille_dots_1347' : 0x100284d,
+	'XK_braille_dots_13478' : 0x10028cd,
+	'XK_braille_dots_1348' : 0x100288d,
+	'XK_braille_dots_135' : 0x1002815,
+	'XK_braille_dots_1356' : 0x1002835,
+	'XK_braille_dots_13567' : 0x1002875,
+	'XK_braille_dots_135678' : 0x10028f5,
+	'XK_braille_dots_13568' : 0x10028b5,
+	'XK_braille_dots_1357' : 0x1002855,
+	'XK_braille_dots_13578' : 0x10028d5,
+	'XK_braille_dots_1358' : 0x1002895,
+	'XK_braille_dots_136' : 0x1002825,
+	'XK_braille_dots_1367' : 0x1002865,
+	'XK_braille_dots_13678' : 0x10028e5,
+	'XK_braille_dots_1368' : 0x10028a5,
+	'XK_braille_dots_137' : 0x1002845,
+	'XK_braille_dots_1378' : 0x10028c5,
+	'XK_braille_dots_138' : 0x1002885,
+	'XK_braille_dots_14' : 0x1002809,
+	'XK_braille_dots_145' : 0x1002819,
+	'XK_braille_dots_1456' : 0x1002839,
+	'XK_braille_dots_14567' : 0x1002879,
+	'XK_braille_dots_145678' : 0x10028f9,
+	'XK_braille_dots_14568' : 0x10028b9,
+	'XK_braille_dots_1457' : 0x1002859,
+	'XK_braille_dots_14578' : 0x10028d9,
+	'XK_braille_dots_1458' : 0x1002899,
+	'XK_braille_dots_146' : 0x1002829,
+	'XK_braille_dots_1467' : 0x1002869,
+	'XK_braille_dots_14678' : 0x10028e9,
+	'XK_braille_dots_1468' : 0x10028a9,
+	'XK_braille_dots_147' : 0x1002849,
+	'XK_braille_dots_1478' : 0x10028c9,
+	'XK_braille_dots_148' : 0x1002889,
+	'XK_braille_dots_15' : 0x1002811,
+	'XK_braille_dots_156' : 0x1002831,
+	'XK_braille_dots_1567' : 0x1002871,
+	'XK_braille_dots_15678' : 0x10028f1,
+	'XK_braille_dots_1568' : 0x10028b1,
+	'XK_braille_dots_157' : 0x1002851,
+	'XK_braille_dots_1578' : 0x10028d1,
+	'XK_braille_dots_158' : 0x1002891,
+	'XK_braille_dots_16' : 0x1002821,
+	'XK_braille_dots_167' : 0x1002861,
+	'XK_braille_dots_1678' : 0x10028e1,
+	'XK_braille_dots_168' : 0x10028a1,
+	'XK_braille_dots_17' : 0x1002841,
+	'XK_braille_dots_178' : 0x10028c1,
+	'XK_braille_dots_18' : 0x1002881,
+	'XK_braille_dots_2' : 0x1002802,
+	'XK_braille_dots_23' : 0x1002806,
+	'XK_braille_dots_234' : 0x100280e,
+	'XK_braille_dots_2345' : 0x100281e,
+	'XK_braille_dots_23456' : 0x100283e,
+	'XK_braille_dots_234567' : 0x100287e,
+	'XK_braille_dots_2345678' : 0x10028fe,
+	'XK_braille_dots_234568' : 0x10028be,
+	'XK_braille_dots_23457' : 0x100285e,
+	'XK_braille_dots_234578' : 0x10028de,
+	'XK_braille_dots_23458' : 0x100289e,
+	'XK_braille_dots_2346' : 0x100282e,
+	'XK_braille_dots_23467' : 0x100286e,
+	'XK_braille_dots_234678' : 0x10028ee,
+	'XK_braille_dots_23468' : 0x10028ae,
+	'XK_braille_dots_2347' : 0x100284e,
+	'XK_braille_dots_23478' : 0x10028ce,
+	'XK_braille_dots_2348' : 0x100288e,
+	'XK_braille_dots_235' : 0x1002816,
+	'XK_braille_dots_2356' : 0x1002836,
+	'XK_braille_dots_23567' : 0x1002876,
+	'XK_braille_dots_235678' : 0x10028f6,
+	'XK_braille_dots_23568' : 0x10028b6,
+	'XK_braille_dots_2357' : 0x1002856,
+	'XK_braille_dots_23578' : 0x10028d6,
+	'XK_braille_dots_2358' : 0x1002896,
+	'XK_braille_dots_236' : 0x1002826,
+	'XK_braille_dots_2367' : 0x1002866,
+	'XK_braille_dots_23678' : 0x10028e6,
+	'XK_braille_dots_2368' : 0x10028a6,
+	'XK_braille_dots_237' : 0x1002846,
+	'XK_braille_dots_2378' : 0x10028c6,
+	'XK_braille_dots_238' : 0x1002886,
+	'XK_braille_dots_24' : 0x100280a,
+	'XK_braille_dots_245' : 0x100281a,
+	'XK_braille_dots_2456' : 0x100283a,
+	'XK_braille_dots_24567' : 0x100287a,
+	'XK_braille_dots_245678' : 0x10028fa,
+	'XK_braille_dots_24568' : 0x10028ba,
+	'XK_braille_dots_2457' : 0x100285a,
+	'XK_braille_dots_24578' : 0x10028da,
+	'XK_braille_dots_2458' : 0x100289a,
+	'XK_braille_dots_246' : 0x100282a,
+	'XK_braille_dots_2467' : 0x100286a,
+	'XK_braille_dots_24678' : 0x10028ea,
+	'XK_braille_dots_2468' : 0x10028aa,
+	'XK_braille_dots_247' : 0x100284a,
+	'XK_braille_dots_2478' : 0x10028ca,
+	'XK_braille_dots_248' : 0x100288a,
+	'XK_braille_dots_25' : 0x1002812,
+	'XK_braille_dots_256' : 0x1002832,
+	'XK_braille_dots_2567' : 0x1002872,
+	'XK_braille_dots_25678' : 0x10028f2,
+	'XK_braille_dots_2568' : 0x10028b2,
+	'XK_braille_dots_257' : 0x1002852,
+	'XK_braille_dots_2578' : 0x10028d2,
+	'XK_braille_dots_258' : 0x1002892,
+	'XK_braille_dots_26' : 0x1002822,
+	'XK_braille_dots_267' : 0x1002862,
+	'XK_braille_dots_2678' : 0x10028e2,
+	'XK_braille_dots_268' : 0x10028a2,
+	'XK_braille_dots_27' : 0x1002842,
+	'XK_braille_dots_278' : 0x10028c2,
+	'XK_braille_dots_28' : 0x1002882,
+	'XK_braille_dots_3' : 0x1002804,
+	'XK_braille_dots_34' : 0x100280c,
+	'XK_braille_dots_345' : 0x100281c,
+	'XK_braille_dots_3456' : 0x100283c,
+	'XK_braille_dots_34567' : 0x100287c,
+	'XK_braille_dots_345678' : 0x10028fc,
+	'XK_braille_dots_34568' : 0x10028bc,
+	'XK_braille_dots_3457' : 0x100285c,
+	'XK_braille_dots_34578' : 0x10028dc,
+	'XK_braille_dots_3458' : 0x100289c,
+	'XK_braille_dots_346' : 0x100282c,
+	'XK_braille_dots_3467' : 0x100286c,
+	'XK_braille_dots_34678' : 0x10028ec,
+	'XK_braille_dots_3468' : 0x10028ac,
+	'XK_braille_dots_347' : 0x100284c,
+	'XK_braille_dots_3478' : 0x10028cc,
+	'XK_braille_dots_348' : 0x100288c,
+	'XK_braille_dots_35' : 0x1002814,
+	'XK_braille_dots_356' : 0x1002834,
+	'XK_braille_dots_3567' : 0x1002874,
+	'XK_braille_dots_35678' : 0x10028f4,
+	'XK_braille_dots_3568' : 0x10028b4,
+	'XK_braille_dots_357' : 0x1002854,
+	'XK_braille_dots_3578' : 0x10028d4,
+	'XK_braille_dots_358' : 0x1002894,
+	'XK_braille_dots_36' : 0x1002824,
+	'XK_braille_dots_367' : 0x1002864,
+	'XK_braille_dots_3678' : 0x10028e4,
+	'XK_braille_dots_368' : 0x10028a4,
+	'XK_braille_dots_37' : 0x1002844,
+	'XK_braille_dots_378' : 0x10028c4,
+	'XK_braille_dots_38' : 0x1002884,
+	'XK_braille_dots_4' : 0x1002808,
+	'XK_braille_dots_45' : 0x1002818,
+	'XK_braille_dots_456' : 0x1002838,
+	'XK_braille_dots_4567' : 0x1002878,
+	'XK_braille_dots_45678' : 0x10028f8,
+	'XK_braille_dots_4568' : 0x10028b8,
+	'XK_braille_dots_457' : 0x1002858,
+	'XK_braille_dots_4578' : 0x10028d8,
+	'XK_braille_dots_458' : 0x1002898,
+	'XK_braille_dots_46' : 0x1002828,
+	'XK_braille_dots_467' : 0x1002868,
+	'XK_braille_dots_4678' : 0x10028e8,
+	'XK_braille_dots_468' : 0x10028a8,
+	'XK_braille_dots_47' : 0x1002848,
+	'XK_braille_dots_478' : 0x10028c8,
+	'XK_braille_dots_48' : 0x1002888,
+	'XK_braille_dots_5' : 0x1002810,
+	'XK_braille_dots_56' : 0x1002830,
+	'XK_braille_dots_567' : 0x1002870,
+	'XK_braille_dots_5678' : 0x10028f0,
+	'XK_braille_dots_568' : 0x10028b0,
+	'XK_braille_dots_57' : 0x1002850,
+	'XK_braille_dots_578' : 0x10028d0,
+	'XK_braille_dots_58' : 0x1002890,
+	'XK_braille_dots_6' : 0x1002820,
+	'XK_braille_dots_67' : 0x1002860,
+	'XK_braille_dots_678' : 0x10028e0,
+	'XK_braille_dots_68' : 0x10028a0,
+	'XK_braille_dots_7' : 0x1002840,
+	'XK_braille_dots_78' : 0x10028c0,
+	'XK_braille_dots_8' : 0x1002880,
+	'XK_breve' : 0x01a2,
+	'XK_brokenbar' : 0x00a6,
+	'XK_c' : 0x0063,
+	'XK_c_h' : 0xfea3,
+	'XK_cabovedot' : 0x02e5,
+	'XK_cacute' : 0x01e6,
+	'XK_careof' : 0x0ab8,
+	'XK_caret' : 0x0afc,
+	'XK_caron' : 0x01b7,
+	'XK_ccaron' : 0x01e8,
+	'XK_ccedilla' : 0x00e7,
+	'XK_ccircumflex' : 0x02e6,
+	'XK_cedilla' : 0x00b8,
+	'XK_cent' : 0x00a2,
+	'XK_ch' : 0xfea0,
+	'XK_checkerboard' : 0x09e1,
+	'XK_checkmark' : 0x0af3,
+	'XK_circle' : 0x0bcf,
+	'XK_club' : 0x0aec,
+	'XK_colon' : 0x003a,
+	'XK_combining_acute' : 0x1000301,
+	'XK_combining_belowdot' : 0x1000323,
+	'XK_combining_grave' : 0x1000300,
+	'XK_combining_hook' : 0x1000309,
+	'XK_combining_tilde' : 0x1000303,
+	'XK_comma' : 0x002c,
+	'XK_containsas' : 0x100220B,
+	'XK_copyright' : 0x00a9,
+	'XK_cr' : 0x09e4,
+	'XK_crossinglines' : 0x09ee,
+	'XK_cuberoot' : 0x100221B,
+	'XK_currency' : 0x00a4,
+	'XK_cursor' : 0x0aff,
+	'XK_d' : 0x0064,
+	'XK_dabovedot' : 0x1001e0b,
+	'XK_dagger' : 0x0af1,
+	'XK_dcaron' : 0x01ef,
+	'XK_dead_A' : 0xfe81,
+	'XK_dead_E' : 0xfe83,
+	'XK_dead_I' : 0xfe85,
+	'XK_dead_O' : 0xfe87,
+	'XK_dead_U' : 0xfe89,
+	'XK_dead_a' : 0xfe80,
+	'XK_dead_abovecomma' : 0xfe64,
+	'XK_dead_abovedot' : 0xfe56,
+	'XK_dead_abovereversedcomma' : 0xfe65,
+	'XK_dead_abovering' : 0xfe58,
+	'XK_dead_aboveverticalline' : 0xfe91,
+	'XK_dead_acute' : 0xfe51,
+	'XK_dead_belowbreve' : 0xfe6b,
+	'XK_dead_belowcircumflex' : 0xfe69,
+	'XK_dead_belowcomma' : 0xfe6e,
+	'XK_dead_belowdiaeresis' : 0xfe6c,
+	'XK_dead_belowdot' : 0xfe60,
+	'XK_dead_belowmacron' : 0xfe68,
+	'XK_dead_belowring' : 0xfe67,
+	'XK_dead_belowtilde' : 0xfe6a,
+	'XK_dead_belowverticalline' : 0xfe92,
+	'XK_dead_breve' : 0xfe55,
+	'XK_dead_capital_schwa' : 0xfe8b,
+	'XK_dead_caron' : 0xfe5a,
+	'XK_dead_cedilla' : 0xfe5b,
+	'XK_dead_circumflex' : 0xfe52,
+	'XK_dead_currency' : 0xfe6f,
+	'XK_dead_dasia' : 0xfe65,
+	'XK_dead_diaeresis' : 0xfe57,
+	'XK_dead_doubleacute' : 0xfe59,
+	'XK_dead_doublegrave' : 0xfe66,
+	'XK_dead_e' : 0xfe82,
+	'XK_dead_grave' : 0xfe50,
+	'XK_dead_greek' : 0xfe8c,
+	'XK_dead_hook' : 0xfe61,
+	'XK_dead_horn' : 0xfe62,
+	'XK_dead_i' : 0xfe84,
+	'XK_dead_invertedbreve' : 0xfe6d,
+	'XK_dead_iota' : 0xfe5d,
+	'XK_dead_longsolidusoverlay' : 0xfe93,
+	'XK_dead_lowline' : 0xfe90,
+	'XK_dead_macron' : 0xfe54,
+	'XK_dead_o' : 0xfe86,
+	'XK_dead_ogonek' : 0xfe5c,
+	'XK_dead_perispomeni' : 0xfe53,
+	'XK_dead_psili' : 0xfe64,
+	'XK_dead_semivoiced_sound' : 0xfe5f,
+	'XK_dead_small_schwa' : 0xfe8a,
+	'XK_dead_stroke' : 0xfe63,
+	'XK_dead_tilde' : 0xfe53,
+	'XK_dead_u' : 0xfe88,
+	'XK_dead_voiced_sound' : 0xfe5e,
+	'XK_decimalpoint' : 0x0abd,
+	'XK_degree' : 0x00b0,
+	'XK_diaeresis' : 0x00a8,
+	'XK_diamond' : 0x0aed,
+	'XK_digitspace' : 0x0aa5,
+	'XK_dintegral' : 0x100222C,
+	'XK_division' : 0x00f7,
+	'XK_dollar' : 0x0024,
+	'XK_doubbaselinedot' : 0x0aaf,
+	'XK_doubleacute' : 0x01bd,
+	'XK_doubledagger' : 0x0af2,
+	'XK_doublelowquotemark' : 0x0afe,
+	'XK_downarrow' : 0x08fe,
+	'XK_downcaret' : 0x0ba8,
+	'XK_downshoe' : 0x0bd6,
+	'XK_downstile' : 0x0bc4,
+	'XK_downtack' : 0x0bc2,
+	'XK_dstroke' : 0x01f0,
+	'XK_e' : 0x0065,
+	'XK_eabovedot' : 0x03ec,
+	'XK_eacute' : 0x00e9,
+	'XK_ebelowdot' : 0x1001eb9,
+	'XK_ecaron' : 0x01ec,
+	'XK_ecircumflex' : 0x00ea,
+	'XK_ecircumflexacute' : 0x1001ebf,
+	'XK_ecircumflexbelowdot' : 0x1001ec7,
+	'XK_ecircumflexgrave' : 0x1001ec1,
+	'XK_ecircumflexhook' : 0x1001ec3,
+	'XK_ecircumflextilde' : 0x1001ec5,
+	'XK_ediaeresis' : 0x00eb,
+	'XK_egrave' : 0x00e8,
+	'XK_ehook' : 0x1001ebb,
+	'XK_eightsubscript' : 0x1002088,
+	'XK_eightsuperior' : 0x1002078,
+	'XK_elementof' : 0x1002208,
+	'XK_ellipsis' : 0x0aae,
+	'XK_em3space' : 0x0aa3,
+	'XK_em4space' : 0x0aa4,
+	'XK_emacron' : 0x03ba,
+	'XK_emdash' : 0x0aa9,
+	'XK_emfilledcircle' : 0x0ade,
+	'XK_emfilledrect' : 0x0adf,
+	'XK_emopencircle' : 0x0ace,
+	'XK_emopenrectangle' : 0x0acf,
+	'XK_emptyset' : 0x1002205,
+	'XK_emspace' : 0x0aa1,
+	'XK_endash' : 0x0aaa,
+	'XK_enfilledcircbullet' : 0x0ae6,
+	'XK_enfilledsqbullet' : 0x0ae7,
+	'XK_eng' : 0x03bf,
+	'XK_enopencircbullet' : 0x0ae0,
+	'XK_enopensquarebullet' : 0x0ae1,
+	'XK_enspace' : 0x0aa2,
+	'XK_eogonek' : 0x01ea,
+	'XK_equal' : 0x003d,
+	'XK_eth' : 0x00f0,
+	'XK_etilde' : 0x1001ebd,
+	'XK_exclam' : 0x0021,
+	'XK_exclamdown' : 0x00a1,
+	'XK_ezh' : 0x1000292,
+	'XK_f' : 0x0066,
+	'XK_fabovedot' : 0x1001e1f,
+	'XK_femalesymbol' : 0x0af8,
+	'XK_ff' : 0x09e3,
+	'XK_figdash' : 0x0abb,
+	'XK_filledlefttribullet' : 0x0adc,
+	'XK_filledrectbullet' : 0x0adb,
+	'XK_filledrighttribullet' : 0x0add,
+	'XK_filledtribulletdown' : 0x0ae9,
+	'XK_filledtribulletup' : 0x0ae8,
+	'XK_fiveeighths' : 0x0ac5,
+	'XK_fivesixths' : 0x0ab7,
+	'XK_fivesubscript' : 0x1002085,
+	'XK_fivesuperior' : 0x1002075,
+	'XK_fourfifths' : 0x0ab5,
+	'XK_foursubscript' : 0x1002084,
+	'XK_foursuperior' : 0x1002074,
+	'XK_fourthroot' : 0x100221C,
+	'XK_function' : 0x08f6,
+	'XK_g' : 0x0067,
+	'XK_gabovedot' : 0x02f5,
+	'XK_gbreve' : 0x02bb,
+	'XK_gcaron' : 0x10001e7,
+	'XK_gcedilla' : 0x03bb,
+	'XK_gcircumflex' : 0x02f8,
+	'XK_grave' : 0x0060,
+	'XK_greater' : 0x003e,
+	'XK_greaterthanequal' : 0x08be,
+	'XK_guillemotleft' : 0x00ab,
+	'XK_guillemotright' : 0x00bb,
+	'XK_h' : 0x0068,
+	'XK_hairspace' : 0x0aa8,
+	'XK_hcircumflex' : 0x02b6,
+	'XK_heart' : 0x0aee,
+	'XK_hebrew_aleph' : 0x0ce0,
+	'XK_hebrew_ayin' : 0x0cf2,
+	'XK_hebrew_bet' : 0x0ce1,
+	'XK_hebrew_beth' : 0x0ce1,
+	'XK_hebrew_chet' : 0x0ce7,
+	'XK_hebrew_dalet' : 0x0ce3,
+	'XK_hebrew_daleth' : 0x0ce3,
+	'XK_hebrew_doublelowline' : 0x0cdf,
+	'XK_hebrew_finalkaph' : 0x0cea,
+	'XK_hebrew_finalmem' : 0x0ced,
+	'XK_hebrew_finalnun' : 0x0cef,
+	'XK_hebrew_finalpe' : 0x0cf3,
+	'XK_hebrew_finalzade' : 0x0cf5,
+	'XK_hebrew_finalzadi' : 0x0cf5,
+	'XK_hebrew_gimel' : 0x0ce2,
+	'XK_hebrew_gimmel' : 0x0ce2,
+	'XK_hebrew_he' : 0x0ce4,
+	'XK_hebrew_het' : 0x0ce7,
+	'XK_hebrew_kaph' : 0x0ceb,
+	'XK_hebrew_kuf' : 0x0cf7,
+	'XK_hebrew_lamed' : 0x0cec,
+	'XK_hebrew_mem' : 0x0cee,
+	'XK_hebrew_nun' : 0x0cf0,
+	'XK_hebrew_pe' : 0x0cf4,
+	'XK_hebrew_qoph' : 0x0cf7,
+	'XK_hebrew_resh' : 0x0cf8,
+	'XK_hebrew_samech' : 0x0cf1,
+	'XK_hebrew_samekh' : 0x0cf1,
+	'XK_hebrew_shin' : 0x0cf9,
+	'XK_hebrew_taf' : 0x0cfa,
+	'XK_hebrew_taw' : 0x0cfa,
+	'XK_hebrew_tet' : 0x0ce8,
+	'XK_hebrew_teth' : 0x0ce8,
+	'XK_hebrew_waw' : 0x0ce5,
+	'XK_hebrew_yod' : 0x0ce9,
+	'XK_hebrew_zade' : 0x0cf6,
+	'XK_hebrew_zadi' : 0x0cf6,
+	'XK_hebrew_zain' : 0x0ce6,
+	'XK_hebrew_zayin' : 0x0ce6,
+	'XK_hexagram' : 0x0ada,
+	'XK_horizconnector' : 0x08a3,
+	'XK_horizlinescan1' : 0x09ef,
+	'XK_horizlinescan3' : 0x09f0,
+	'XK_horizlinescan5' : 0x09f1,
+	'XK_horizlinescan7' : 0x09f2,
+	'XK_horizlinescan9' : 0x09f3,
+	'XK_hstroke' : 0x02b1,
+	'XK_ht' : 0x09e2,
+	'XK_hyphen' : 0x00ad,
+	'XK_i' : 0x0069,
+	'XK_iacute' : 0x00ed,
+	'XK_ibelowdot' : 0x1001ecb,
+	'XK_ibreve' : 0x100012d,
+	'XK_icircumflex' : 0x00ee,
+	'XK_identical' : 0x08cf,
+	'XK_idiaeresis' : 0x00ef,
+	'XK_idotless' : 0x02b9,
+	'XK_ifonlyif' : 0x08cd,
+	'XK_igrave' : 0x00ec,
+	'XK_ihook' : 0x1001ec9,
+	'XK_imacron' : 0x03ef,
+	'XK_implies' : 0x08ce,
+	'XK_includedin' : 0x08da,
+	'XK_includes' : 0x08db,
+	'XK_infinity' : 0x08c2,
+	'XK_integral' : 0x08bf,
+	'XK_intersection' : 0x08dc,
+	'XK_iogonek' : 0x03e7,
+	'XK_itilde' : 0x03b5,
+	'XK_j' : 0x006a,
+	'XK_jcircumflex' : 0x02bc,
+	'XK_jot' : 0x0bca,
+	'XK_k' : 0x006b,
+	'XK_kana_A' : 0x04b1,
+	'XK_kana_CHI' : 0x04c1,
+	'XK_kana_E' : 0x04b4,
+	'XK_kana_FU' : 0x04cc,
+	'XK_kana_HA' : 0x04ca,
+	'XK_kana_HE' : 0x04cd,
+	'XK_kana_HI' : 0x04cb,
+	'XK_kana_HO' : 0x04ce,
+	'XK_kana_HU' : 0x04cc,
+	'XK_kana_I' : 0x04b2,
+	'XK_kana_KA' : 0x04b6,
+	'XK_kana_KE' : 0x04b9,
+	'XK_kana_KI' : 0x04b7,
+	'XK_kana_KO' : 0x04ba,
+	'XK_kana_KU' : 0x04b8,
+	'XK_kana_MA' : 0x04cf,
+	'XK_kana_ME' : 0x04d2,
+	'XK_kana_MI' : 0x04d0,
+	'XK_kana_MO' : 0x04d3,
+	'XK_kana_MU' : 0x04d1,
+	'XK_kana_N' : 0x04dd,
+	'XK_kana_NA' : 0x04c5,
+	'XK_kana_NE' : 0x04c8,
+	'XK_kana_NI' : 0x04c6,
+	'XK_kana_NO' : 0x04c9,
+	'XK_kana_NU' : 0x04c7,
+	'XK_kana_O' : 0x04b5,
+	'XK_kana_RA' : 0x04d7,
+	'XK_kana_RE' : 0x04da,
+	'XK_kana_RI' : 0x04d8,
+	'XK_kana_RO' : 0x04db,
+	'XK_kana_RU' : 0x04d9,
+	'XK_kana_SA' : 0x04bb,
+	'XK_kana_SE' : 0x04be,
+	'XK_kana_SHI' : 0x04bc,
+	'XK_kana_SO' : 0x04bf,
+	'XK_kana_SU' : 0x04bd,
+	'XK_kana_TA' : 0x04c0,
+	'XK_kana_TE' : 0x04c3,
+	'XK_kana_TI' : 0x04c1,
+	'XK_kana_TO' : 0x04c4,
+	'XK_kana_TSU' : 0x04c2,
+	'XK_kana_TU' : 0x04c2,
+	'XK_kana_U' : 0x04b3,
+	'XK_kana_WA' : 0x04dc,
+	'XK_kana_WO' : 0x04a6,
+	'XK_kana_YA' : 0x04d4,
+	'XK_kana_YO' : 0x04d6,
+	'XK_kana_YU' : 0x04d5,
+	'XK_kana_a' : 0x04a7,
+	'XK_kana_closingbracket' : 0x04a3,
+	'XK_kana_comma' : 0x04a4,
+	'XK_kana_conjunctive' : 0x04a5,
+	'XK_kana_e' : 0x04aa,
+	'XK_kana_fullstop' : 0x04a1,
+	'XK_kana_i' : 0x04a8,
+	'XK_kana_middledot' : 0x04a5,
+	'XK_kana_o' : 0x04ab,
+	'XK_kana_openingbracket' : 0x04a2,
+	'XK_kana_switch' : 0xff7e,
+	'XK_kana_tsu' : 0x04af,
+	'XK_kana_tu' : 0x04af,
+	'XK_kana_u' : 0x04a9,
+	'XK_kana_ya' : 0x04ac,
+	'XK_kana_yo' : 0x04ae,
+	'XK_kana_yu' : 0x04ad,
+	'XK_kappa' : 0x03a2,
+	'XK_kcedilla' : 0x03f3,
+	'XK_kra' : 0x03a2,
+	'XK_l' : 0x006c,
+	'XK_lacute' : 0x01e5,
+	'XK_latincross' : 0x0ad9,
+	'XK_lbelowdot' : 0x1001e37,
+	'XK_lcaron' : 0x01b5,
+	'XK_lcedilla' : 0x03b6,
+	'XK_leftanglebracket' : 0x0abc,
+	'XK_leftarrow' : 0x08fb,
+	'XK_leftcaret' : 0x0ba3,
+	'XK_leftdoublequotemark' : 0x0ad2,
+	'XK_leftmiddlecurlybrace' : 0x08af,
+	'XK_leftopentriangle' : 0x0acc,
+	'XK_leftpointer' : 0x0aea,
+	'XK_leftradical' : 0x08a1,
+	'XK_leftshoe' : 0x0bda,
+	'XK_leftsinglequotemark' : 0x0ad0,
+	'XK_leftt' : 0x09f4,
+	'XK_lefttack' : 0x0bdc,
+	'XK_less' : 0x003c,
+	'XK_lessthanequal' : 0x08bc,
+	'XK_lf' : 0x09e5,
+	'XK_logicaland' : 0x08de,
+	'XK_logicalor' : 0x08df,
+	'XK_lowleftcorner' : 0x09ed,
+	'XK_lowrightcorner' : 0x09ea,
+	'XK_lstroke' : 0x01b3,
+	'XK_m' : 0x006d,
+	'XK_mabovedot' : 0x1001e41,
+	'XK_macron' : 0x00af,
+	'XK_malesymbol' : 0x0af7,
+	'XK_maltesecross' : 0x0af0,
+	'XK_marker' : 0x0abf,
+	'XK_masculine' : 0x00ba,
+	'XK_minus' : 0x002d,
+	'XK_minutes' : 0x0ad6,
+	'XK_mu' : 0x00b5,
+	'XK_multiply' : 0x00d7,
+	'XK_musicalflat' : 0x0af6,
+	'XK_musicalsharp' : 0x0af5,
+	'XK_n' : 0x006e,
+	'XK_nabla' : 0x08c5,
+	'XK_nacute' : 0x01f1,
+	'XK_ncaron' : 0x01f2,
+	'XK_ncedilla' : 0x03f1,
+	'XK_ninesubscript' : 0x1002089,
+	'XK_ninesuperior' : 0x1002079,
+	'XK_nl' : 0x09e8,
+	'XK_nobreakspace' : 0x00a0,
+	'XK_notapproxeq' : 0x1002247,
+	'XK_notelementof' : 0x1002209,
+	'XK_notequal' : 0x08bd,
+	'XK_notidentical' : 0x1002262,
+	'XK_notsign' : 0x00ac,
+	'XK_ntilde' : 0x00f1,
+	'XK_numbersign' : 0x0023,
+	'XK_numerosign' : 0x06b0,
+	'XK_o' : 0x006f,
+	'XK_oacute' : 0x00f3,
+	'XK_obarred' : 0x1000275,
+	'XK_obelowdot' : 0x1001ecd,
+	'XK_ocaron' : 0x10001d2,
+	'XK_ocircumflex' : 0x00f4,
+	'XK_ocircumflexacute' : 0x1001ed1,
+	'XK_ocircumflexbelowdot' : 0x1001ed9,
+	'XK_ocircumflexgrave' : 0x1001ed3,
+	'XK_ocircumflexhook' : 0x1001ed5,
+	'XK_ocircumflextilde' : 0x1001ed7,
+	'XK_odiaeresis' : 0x00f6,
+	'XK_odoubleacute' : 0x01f5,
+	'XK_oe' : 0x13bd,
+	'XK_ogonek' : 0x01b2,
+	'XK_ograve' : 0x00f2,
+	'XK_ohook' : 0x1001ecf,
+	'XK_ohorn' : 0x10001a1,
+	'XK_ohornacute' : 0x1001edb,
+	'XK_ohornbelowdot' : 0x1001ee3,
+	'XK_ohorngrave' : 0x1001edd,
+	'XK_ohornhook' : 0x1001edf,
+	'XK_ohorntilde' : 0x1001ee1,
+	'XK_omacron' : 0x03f2,
+	'XK_oneeighth' : 0x0ac3,
+	'XK_onefifth' : 0x0ab2,
+	'XK_onehalf' : 0x00bd,
+	'XK_onequarter' : 0x00bc,
+	'XK_onesixth' : 0x0ab6,
+	'XK_onesubscript' : 0x1002081,
+	'XK_onesuperior' : 0x00b9,
+	'XK_onethird' : 0x0ab0,
+	'XK_ooblique' : 0x00f8,
+	'XK_openrectbullet' : 0x0ae2,
+	'XK_openstar' : 0x0ae5,
+	'XK_opentribulletdown' : 0x0ae4,
+	'XK_opentribulletup' : 0x0ae3,
+	'XK_ordfeminine' : 0x00aa,
+	'XK_oslash' : 0x00f8,
+	'XK_otilde' : 0x00f5,
+	'XK_overbar' : 0x0bc0,
+	'XK_overline' : 0x047e,
+	'XK_p' : 0x0070,
+	'XK_pabovedot' : 0x1001e57,
+	'XK_paragraph' : 0x00b6,
+	'XK_parenleft' : 0x0028,
+	'XK_parenright' : 0x0029,
+	'XK_partdifferential' : 0x1002202,
+	'XK_partialderivative' : 0x08ef,
+	'XK_percent' : 0x0025,
+	'XK_period' : 0x002e,
+	'XK_periodcentered' : 0x00b7,
+	'XK_permille' : 0x0ad5,
+	'XK_phonographcopyright' : 0x0afb,
+	'XK_plus' : 0x002b,
+	'XK_plusminus' : 0x00b1,
+	'XK_prescription' : 0x0ad4,
+	'XK_prolongedsound' : 0x04b0,
+	'XK_punctspace' : 0x0aa6,
+	'XK_q' : 0x0071,
+	'XK_quad' : 0x0bcc,
+	'XK_question' : 0x003f,
+	'XK_questiondown' : 0x00bf,
+	'XK_quotedbl' : 0x0022,
+	'XK_quoteleft' : 0x0060,
+	'XK_quoteright' : 0x0027,
+	'XK_r' : 0x0072,
+	'XK_racute' : 0x01e0,
+	'XK_radical' : 0x08d6,
+	'XK_rcaron' : 0x01f8,
+	'XK_rcedilla' : 0x03b3,
+	'XK_registered' : 0x00ae,
+	'XK_rightanglebracket' : 0x0abe,
+	'XK_rightarrow' : 0x08fd,
+	'XK_rightcaret' : 0x0ba6,
+	'XK_rightdoublequotemark' : 0x0ad3,
+	'XK_rightmiddlecurlybrace' : 0x08b0,
+	'XK_rightmiddlesummation' : 0x08b7,
+	'XK_rightopentriangle' : 0x0acd,
+	'XK_rightpointer' : 0x0aeb,
+	'XK_rightshoe' : 0x0bd8,
+	'XK_rightsinglequotemark' : 0x0ad1,
+	'XK_rightt' : 0x09f5,
+	'XK_righttack' : 0x0bfc,
+	'XK_s' : 0x0073,
+	'XK_sabovedot' : 0x1001e61,
+	'XK_sacute' : 0x01b6,
+	'XK_scaron' : 0x01b9,
+	'XK_scedilla' : 0x01ba,
+	'XK_schwa' : 0x1000259,
+	'XK_scircumflex' : 0x02fe,
+	'XK_script_switch' : 0xff7e,
+	'XK_seconds' : 0x0ad7,
+	'XK_section' : 0x00a7,
+	'XK_semicolon' : 0x003b,
+	'XK_semivoicedsound' : 0x04df,
+	'XK_seveneighths' : 0x0ac6,
+	'XK_sevensubscript' : 0x1002087,
+	'XK_sevensuperior' : 0x1002077,
+	'XK_signaturemark' : 0x0aca,
+	'XK_signifblank' : 0x0aac,
+	'XK_similarequal' : 0x08c9,
+	'XK_singlelowquotemark' : 0x0afd,
+	'XK_sixsubscript' : 0x1002086,
+	'XK_sixsuperior' : 0x1002076,
+	'XK_slash' : 0x002f,
+	'XK_soliddiamond' : 0x09e0,
+	'XK_space' : 0x0020,
+	'XK_squareroot' : 0x100221A,
+	'XK_ssharp' : 0x00df,
+	'XK_sterling' : 0x00a3,
+	'XK_stricteq' : 0x1002263,
+	'XK_t' : 0x0074,
+	'XK_tabovedot' : 0x1001e6b,
+	'XK_tcaron' : 0x01bb,
+	'XK_tcedilla' : 0x01fe,
+	'XK_telephone' : 0x0af9,
+	'XK_telephonerecorder' : 0x0afa,
+	'XK_therefore' : 0x08c0,
+	'XK_thinspace' : 0x0aa7,
+	'XK_thorn' : 0x00fe,
+	'XK_threeeighths' : 0x0ac4,
+	'XK_threefifths' : 0x0ab4,
+	'XK_threequarters' : 0x00be,
+	'XK_threesubscript' : 0x1002083,
+	'XK_threesuperior' : 0x00b3,
+	'XK_tintegral' : 0x100222D,
+	'XK_topintegral' : 0x08a4,
+	'XK_topleftparens' : 0x08ab,
+	'XK_topleftradical' : 0x08a2,
+	'XK_topleftsqbracket' : 0x08a7,
+	'XK_topleftsummation' : 0x08b1,
+	'XK_toprightparens' : 0x08ad,
+	'XK_toprightsqbracket' : 0x08a9,
+	'XK_toprightsummation' : 0x08b5,
+	'XK_topt' : 0x09f7,
+	'XK_topvertsummationconnector' : 0x08b3,
+	'XK_trademark' : 0x0ac9,
+	'XK_trademarkincircle' : 0x0acb,
+	'XK_tslash' : 0x03bc,
+	'XK_twofifths' : 0x0ab3,
+	'XK_twosubscript' : 0x1002082,
+	'XK_twosuperior' : 0x00b2,
+	'XK_twothirds' : 0x0ab1,
+	'XK_u' : 0x0075,
+	'XK_uacute' : 0x00fa,
+	'XK_ubelowdot' : 0x1001ee5,
+	'XK_ubreve' : 0x02fd,
+	'XK_ucircumflex' : 0x00fb,
+	'XK_udiaeresis' : 0x00fc,
+	'XK_udoubleacute' : 0x01fb,
+	'XK_ugrave' : 0x00f9,
+	'XK_uhook' : 0x1001ee7,
+	'XK_uhorn' : 0x10001b0,
+	'XK_uhornacute' : 0x1001ee9,
+	'XK_uhornbelowdot' : 0x1001ef1,
+	'XK_uhorngrave' : 0x1001eeb,
+	'XK_uhornhook' : 0x1001eed,
+	'XK_uhorntilde' : 0x1001eef,
+	'XK_umacron' : 0x03fe,
+	'XK_underbar' : 0x0bc6,
+	'XK_underscore' : 0x005f,
+	'XK_union' : 0x08dd,
+	'XK_uogonek' : 0x03f9,
+	'XK_uparrow' : 0x08fc,
+	'XK_upcaret' : 0x0ba9,
+	'XK_upleftcorner' : 0x09ec,
+	'XK_uprightcorner' : 0x09eb,
+	'XK_upshoe' : 0x0bc3,
+	'XK_upstile' : 0x0bd3,
+	'XK_uptack' : 0x0bce,
+	'XK_uring' : 0x01f9,
+	'XK_utilde' : 0x03fd,
+	'XK_v' : 0x0076,
+	'XK_variation' : 0x08c1,
+	'XK_vertbar' : 0x09f8,
+	'XK_vertconnector' : 0x08a6,
+	'XK_voicedsound' : 0x04de,
+	'XK_vt' : 0x09e9,
+	'XK_w' : 0x0077,
+	'XK_wacute' : 0x1001e83,
+	'XK_wcircumflex' : 0x1000175,
+	'XK_wdiaeresis' : 0x1001e85,
+	'XK_wgrave' : 0x1001e81,
+	'XK_x' : 0x0078,
+	'XK_xabovedot' : 0x1001e8b,
+	'XK_y' : 0x0079,
+	'XK_yacute' : 0x00fd,
+	'XK_ybelowdot' : 0x1001ef5,
+	'XK_ycircumflex' : 0x1000177,
+	'XK_ydiaeresis' : 0x00ff,
+	'XK_yen' : 0x00a5,
+	'XK_ygrave' : 0x1001ef3,
+	'XK_yhook' : 0x1001ef7,
+	'XK_ytilde' : 0x1001ef9,
+	'XK_z' : 0x007a,
+	'XK_zabovedot' : 0x01bf,
+	'XK_zacute' : 0x01bc,
+	'XK_zcaron' : 0x01be,
+	'XK_zerosubscript' : 0x1002080,
+	'XK_zerosuperior' : 0x1002070,
+	'XK_zstroke' : 0x10001b6,}
 
+XK = types.SimpleNamespace(**KEYSYMS)
+
+KEYSYM_NAMES = {
+	0x0020 : 'XK_space',
+	0x0021 : 'XK_exclam',
+	0x0022 : 'XK_quotedbl',
+	0x0023 : 'XK_numbersign',
+	0x0024 : 'XK_dollar',
+	0x0025 : 'XK_percent',
+	0x0026 : 'XK_ampersand',
+	0x0027 : 'XK_apostrophe',
+	0x0028 : 'XK_parenleft',
+	0x0029 : 'XK_parenright',
+	0x002a : 'XK_asterisk',
+	0x002b : 'XK_plus',
+	0x002c : 'XK_comma',
+	0x002d : 'XK_minus',
+	0x002e : 'XK_period',
+	0x002f : 'XK_slash',
+	0x0030 : 'XK_0',
+	0x0031 : 'XK_1',
+	0x0032 : 'XK_2',
+	0x0033 : 'XK_3',
+	0x0034 : 'XK_4',
+	0x0035 : 'XK_5',
+	0x0036 : 'XK_6',
+	0x0037 : 'XK_7',
+	0x0038 : 'XK_8',
+	0x0039 : 'XK_9',
+	0x003a : 'XK_colon',
+	0x003b : 'XK_semicolon',
+	0x003c : 'XK_less',
+	0x003d : 'XK_equal',
+	0x003e : 'XK_greater',
+	0x003f : 'XK_question',
+	0x0040 : 'XK_at',
+	0x0041 : 'XK_A',
+	0x0042 : 'XK_B',
+	0x0043 : 'XK_C',
+	0x0044 : 'XK_D',
+	0x0045 : 'XK_E',
+	0x0046 : 'XK_F',
+	0x0047 : 'XK_G',
+	0x0048 : 'XK_H',
+	0x0049 : 'XK_I',
+	0x004a : 'XK_J',
+	0x004b : 'XK_K',
+	0x004c : 'XK_L',
+	0x004d : 'XK_M',
+	0x004e : 'XK_N',
+	0x004f : 'XK_O',
+	0x0050 : 'XK_P',
+	0x0051 : 'XK_Q',
+	0x0052 : 'XK_R',
+	0x0053 : 'XK_S',
+	0x0054 : 'XK_T',
+	0x0055 : 'XK_U',
+	0x0056 : 'XK_V',
+	0x0057 : 'XK_W',
+	0x0058 : 'XK_X',
+	0x0059 : 'XK_Y',
+	0x005a : 'XK_Z',
+	0x005b : 'XK_bracketleft',
+	0x005c : 'XK_backslash',
+	0x005d : 'XK_bracketright',
+	0x005e : 'XK_asciicircum',
+	0x005f : 'XK_underscore',
+	0x0060 : 'XK_grave',
+	0x0061 : 'XK_a',
+	0x0062 : 'XK_b',
+	0x0063 : 'XK_c',
+	0x0064 : 'XK_d',
+	0x0065 : 'XK_e',
+	0x0066 : 'XK_f',
+	0x0067 : 'XK_g',
+	0x0068 : 'XK_h',
+	0x0069 : 'XK_i',
+	0x006a : 'XK_j',
+	0x006b : 'XK_k',
+	0x006c : 'XK_l',
+	0x006d : 'XK_m',
+	0x006e : 'XK_n',
+	0x006f : 'XK_o',
+	0x0070 : 'XK_p',
+	0x0071 : 'XK_q',
+	0x0072 : 'XK_r',
+	0x0073 : 'XK_s',
+	0x0074 : 'XK_t',
+	0x0075 : 'XK_u',
+	0x0076 : 'XK_v',
+	0x0077 : 'XK_w',
+	0x0078 : 'XK_x',
+	0x0079 : 'XK_y',
+	0x007a : 'XK_z',
+	0x007b : 'XK_braceleft',
+	0x007c : 'XK_bar',
+	0x007d : 'XK_braceright',
+	0x007e : 'XK_asciitilde',
+	0x00a0 : 'XK_nobreakspace',
+	0x00a1 : 'XK_exclamdown',
+	0x00a2 : 'XK_cent',
+	0x00a3 : 'XK_sterling',
+	0x00a4 : 'XK_currency',
+	0x00a5 : 'XK_yen',
+	0x00a6 : 'XK_brokenbar',
+	0x00a7 : 'XK_section',
+	0x00a8 : 'XK_diaeresis',
+	0x00a9 : 'XK_copyright',
+	0x00aa : 'XK_ordfeminine',
+	0x00ab : 'XK_guillemotleft',
+	0x00ac : 'XK_notsign',
+	0x00ad : 'XK_hyphen',
+	0x00ae : 'XK_registered',
+	0x00af : 'XK_macron',
+	0x00b0 : 'XK_degree',
+	0x00b1 : 'XK_plusminus',
+	0x00b2 : 'XK_twosuperior',
+	0x00b3 : 'XK_threesuperior',
+	0x00b4 : 'XK_acute',
+	0x00b5 : 'XK_mu',
+	0x00b6 : 'XK_paragraph',
+	0x00b7 : 'XK_periodcentered',
+	0x00b8 : 'XK_cedilla',
+	0x00b9 : 'XK_onesuperior',
+	0x00ba : 'XK_masculine',
+	0x00bb : 'XK_guillemotright',
+	0x00bc : 'XK_onequarter',
+	0x00bd : 'XK_onehalf',
+	0x00be : 'XK_threequarters',
+	0x00bf : 'XK_questiondown',
+	0x00c0 : 'XK_Agrave',
+	0x00c1 : 'XK_Aacute',
+	0x00c2 : 'XK_Acircumflex',
+	0x00c3 : 'XK_Atilde',
+	0x00c4 : 'XK_Adiaeresis',
+	0x00c5 : 'XK_Aring',
+	0x00c6 : 'XK_AE',
+	0x00c7 : 'XK_Ccedilla',
+	0x00c8 : 'XK_Egrave',
+	0x00c9 : 'XK_Eacute',
+	0x00ca : 'XK_Ecircumflex',
+	0x00cb : 'XK_Ediaeresis',
+	0x00cc : 'XK_Igrave',
+	0x00cd : 'XK_Iacute',
+	0x00ce : 'XK_Icircumflex',
+	0x00cf : 'XK_Idiaeresis',
+	0x00d0 : 'XK_ETH',
+	0x00d1 : 'XK_Ntilde',
+	0x00d2 : 'XK_Ograve',
+	0x00d3 : 'XK_Oacute',
+	0x00d4 : 'XK_Ocircumflex',
+	0x00d5 : 'XK_Otilde',
+	0x00d6 : 'XK_Odiaeresis',
+	0x00d7 : 'XK_multiply',
+	0x00d8 : 'XK_Ooblique',
+	0x00d9 : 'XK_Ugrave',
+	0x00da : 'XK_Uacute',
+	0x00db : 'XK_Ucircumflex',
+	0x00dc : 'XK_Udiaeresis',
+	0x00dd : 'XK_Yacute',
+	0x00de : 'XK_THORN',
+	0x00df : 'XK_ssharp',
+	0x00e0 : 'XK_agrave',
+	0x00e1 : 'XK_aacute',
+	0x00e2 : 'XK_acircumflex',
+	0x00e3 : 'XK_atilde',
+	0x00e4 : 'XK_adiaeresis',
+	0x00e5 : 'XK_aring',
+	0x00e6 : 'XK_ae',
+	0x00e7 : 'XK_ccedilla',
+	0x00e8 : 'XK_egrave',
+	0x00e9 : 'XK_eacute',
+	0x00ea : 'XK_ecircumflex',
+	0x00eb : 'XK_ediaeresis',
+	0x00ec : 'XK_igrave',
+	0x00ed : 'XK_iacute',
+	0x00ee : 'XK_icircumflex',
+	0x00ef : 'XK_idiaeresis',
+	0x00f0 : 'XK_eth',
+	0x00f1 : 'XK_ntilde',
+	0x00f2 : 'XK_ograve',
+	0x00f3 : 'XK_oacute',
+	0x00f4 : 'XK_ocircumflex',
+	0x00f5 : 'XK_otilde',
+	0x00f6 : 'XK_odiaeresis',
+	0x00f7 : 'XK_division',
+	0x00f8 : 'XK_ooblique',
+	0x00f9 : 'XK_ugrave',
+	0x00fa : 'XK_uacute',
+	0x00fb : 'XK_ucircumflex',
+	0x00fc : 'XK_udiaeresis',
+	0x00fd : 'XK_yacute',
+	0x00fe : 'XK_thorn',
+	0x00ff : 'XK_ydiaeresis',
+	0x01a1 : 'XK_Aogonek',
+	0x01a2 : 'XK_breve',
+	0x01a3 : 'XK_Lstroke',
+	0x01a5 : 'XK_Lcaron',
+	0x01a6 : 'XK_Sacute',
+	0x01a9 : 'XK_Scaron',
+	0x01aa : 'XK_Scedilla',
+	0x01ab : 'XK_Tcaron',
+	0x01ac : 'XK_Zacute',
+	0x01ae : 'XK_Zcaron',
+	0x01af : 'XK_Zabovedot',
+	0x01b1 : 'XK_aogonek',
+	0x01b2 : 'XK_ogonek',
+	0x01b3 : 'XK_lstroke',
+	0x01b5 : 'XK_lcaron',
+	0x01b6 : 'XK_sacute',
+	0x01b7 : 'XK_caron',
+	0x01b9 : 'XK_scaron',
+	0x01ba : 'XK_scedilla',
+	0x01bb : 'XK_tcaron',
+	0x01bc : 'XK_zacute',
+	0x01bd : 'XK_doubleacute',
+	0x01be : 'XK_zcaron',
+	0x01bf : 'XK_zabovedot',
+	0x01c0 : 'XK_Racute',
+	0x01c3 : 'XK_Abreve',
+	0x01c5 : 'XK_Lacute',
+	0x01c6 : 'XK_Cacute',
+	0x01c8 : 'XK_Ccaron',
+	0x01ca : 'XK_Eogonek',
+	0x01cc : 'XK_Ecaron',
+	0x01cf : 'XK_Dcaron',
+	0x01d0 : 'XK_Dstroke',
+	0x01d1 : 'XK_Nacute',
+	0x01d2 : 'XK_Ncaron',
+	0x01d5 : 'XK_Odoubleacute',
+	0x01d8 : 'XK_Rcaron',
+	0x01d9 : 'XK_Uring',
+	0x01db : 'XK_Udoubleacute',
+	0x01de : 'XK_Tcedilla',
+	0x01e0 : 'XK_racute',
+	0x01e3 : 'XK_abreve',
+	0x01e5 : 'XK_lacute',
+	0x01e6 : 'XK_cacute',
+	0x01e8 : 'XK_ccaron',
+	0x01ea : 'XK_eogonek',
+	0x01ec : 'XK_ecaron',
+	0x01ef : 'XK_dcaron',
+	0x01f0 : 'XK_dstroke',
+	0x01f1 : 'XK_nacute',
+	0x01f2 : 'XK_ncaron',
+	0x01f5 : 'XK_odoubleacute',
+	0x01f8 : 'XK_rcaron',
+	0x01f9 : 'XK_uring',
+	0x01fb : 'XK_udoubleacute',
+	0x01fe : 'XK_tcedilla',
+	0x01ff : 'XK_abovedot',
+	0x02a1 : 'XK_Hstroke',
+	0x02a6 : 'XK_Hcircumflex',
+	0x02a9 : 'XK_Iabovedot',
+	0x02ab : 'XK_Gbreve',
+	0x02ac : 'XK_Jcircumflex',
+	0x02b1 : 'XK_hstroke',
+	0x02b6 : 'XK_hcircumflex',
+	0x02b9 : 'XK_idotless',
+	0x02bb : 'XK_gbreve',
+	0x02bc : 'XK_jcircumflex',
+	0x02c5 : 'XK_Cabovedot',
+	0x02c6 : 'XK_Ccircumflex',
+	0x02d5 : 'XK_Gabovedot',
+	0x02d8 : 'XK_Gcircumflex',
+	0x02dd : 'XK_Ubreve',
+	0x02de : 'XK_Scircumflex',
+	0x02e5 : 'XK_cabovedot',
+	0x02e6 : 'XK_ccircumflex',
+	0x02f5 : 'XK_gabovedot',
+	0x02f8 : 'XK_gcircumflex',
+	0x02fd : 'XK_ubreve',
+	0x02fe : 'XK_scircumflex',
+	0x03a2 : 'XK_kappa',
+	0x03a3 : 'XK_Rcedilla',
+	0x03a5 : 'XK_Itilde',
+	0x03a6 : 'XK_Lcedilla',
+	0x03aa : 'XK_Emacron',
+	0x03ab : 'XK_Gcedilla',
+	0x03ac : 'XK_Tslash',
+	0x03b3 : 'XK_rcedilla',
+	0x03b5 : 'XK_itilde',
+	0x03b6 : 'XK_lcedilla',
+	0x03ba : 'XK_emacron',
+	0x03bb : 'XK_gcedilla',
+	0x03bc : 'XK_tslash',
+	0x03bd : 'XK_ENG',
+	0x03bf : 'XK_eng',
+	0x03c0 : 'XK_Amacron',
+	0x03c7 : 'XK_Iogonek',
+	0x03cc : 'XK_Eabovedot',
+	0x03cf : 'XK_Imacron',
+	0x03d1 : 'XK_Ncedilla',
+	0x03d2 : 'XK_Omacron',
+	0x03d3 : 'XK_Kcedilla',
+	0x03d9 : 'XK_Uogonek',
+	0x03dd : 'XK_Utilde',
+	0x03de : 'XK_Umacron',
+	0x03e0 : 'XK_amacron',
+	0x03e7 : 'XK_iogonek',
+	0x03ec : 'XK_eabovedot',
+	0x03ef : 'XK_imacron',
+	0x03f1 : 'XK_ncedilla',
+	0x03f2 : 'XK_omacron',
+	0x03f3 : 'XK_kcedilla',
+	0x03f9 : 'XK_uogonek',
+	0x03fd : 'XK_utilde',
+	0x03fe : 'XK_umacron',
+	0x047e : 'XK_overline',
+	0x04a1 : 'XK_kana_fullstop',
+	0x04a2 : 'XK_kana_openingbracket',
+	0x04a3 : 'XK_kana_closingbracket',
+	0x04a4 : 'XK_kana_comma',
+	0x04a5 : 'XK_kana_conjunctive',
+	0x04a6 : 'XK_kana_WO',
+	0x04a7 : 'XK_kana_a',
+	0x04a8 : 'XK_kana_i',
+	0x04a9 : 'XK_kana_u',
+	0x04aa : 'XK_kana_e',
+	0x04ab : 'XK_kana_o',
+	0x04ac : 'XK_kana_ya',
+	0x04ad : 'XK_kana_yu',
+	0x04ae : 'XK_kana_yo',
+	0x04af : 'XK_kana_tsu',
+	0x04b0 : 'XK_prolongedsound',
+	0x04b1 : 'XK_kana_A',
+	0x04b2 : 'XK_kana_I',
+	0x04b3 : 'XK_kana_U',
+	0x04b4 : 'XK_kana_E',
+	0x04b5 : 'XK_kana_O',
+	0x04b6 : 'XK_kana_KA',
+	0x04b7 : 'XK_kana_KI',
+	0x04b8 : 'XK_kana_KU',
+	0x04b9 : 'XK_kana_KE',
+	0x04ba : 'XK_kana_KO',
+	0x04bb : 'XK_kana_SA',
+	0x04bc : 'XK_kana_SHI',
+	0x04bd : 'XK_kana_SU',
+	0x04be : 'XK_kana_SE',
+	0x04bf : 'XK_kana_SO',
+	0x04c0 : 'XK_kana_TA',
+	0x04c1 : 'XK_kana_CHI',
+	0x04c2 : 'XK_kana_TSU',
+	0x04c3 : 'XK_kana_TE',
+	0x04c4 : 'XK_kana_TO',
+	0x04c5 : 'XK_kana_NA',
+	0x04c6 : 'XK_kana_NI',
+	0x04c7 : 'XK_kana_NU',
+	0x04c8 : 'XK_kana_NE',
+	0x04c9 : 'XK_kana_NO',
+	0x04ca : 'XK_kana_HA',
+	0x04cb : 'XK_kana_HI',
+	0x04cc : 'XK_kana_FU',
+	0x04cd : 'XK_kana_HE',
+	0x04ce : 'XK_kana_HO',
+	0x04cf : 'XK_kana_MA',
+	0x04d0 : 'XK_kana_MI',
+	0x04d1 : 'XK_kana_MU',
+	0x04d2 : 'XK_kana_ME',
+	0x04d3 : 'XK_kana_MO',
+	0x04d4 : 'XK_kana_YA',
+	0x04d5 : 'XK_kana_YU',
+	0x04d6 : 'XK_kana_YO',
+	0x04d7 : 'XK_kana_RA',
+	0x04d8 : 'XK_kana_RI',
+	0x04d9 : 'XK_kana_RU',
+	0x04da : 'XK_kana_RE',
+	0x04db : 'XK_kana_RO',
+	0x04dc : 'XK_kana_WA',
+	0x04dd : 'XK_kana_N',
+	0x04de : 'XK_voicedsound',
+	0x04df : 'XK_semivoicedsound',
+	0x05ac : 'XK_Arabic_comma',
+	0x05bb : 'XK_Arabic_semicolon',
+	0x05bf : 'XK_Arabic_question_mark',
+	0x05c1 : 'XK_Arabic_hamza',
+	0x05c2 : 'XK_Arabic_maddaonalef',
+	0x05c3 : 'XK_Arabic_hamzaonalef',
+	0x05c4 : 'XK_Arabic_hamzaonwaw',
+	0x05c5 : 'XK_Arabic_hamzaunderalef',
+	0x05c6 : 'XK_Arabic_hamzaonyeh',
+	0x05c7 : 'XK_Arabic_alef',
+	0x05c8 : 'XK_Arabic_beh',
+	0x05c9 : 'XK_Arabic_tehmarbuta',
+	0x05ca : 'XK_Arabic_teh',
+	0x05cb : 'XK_Arabic_theh',
+	0x05cc : 'XK_Arabic_jeem',
+	0x05cd : 'XK_Arabic_hah',
+	0x05ce : 'XK_Arabic_khah',
+	0x05cf : 'XK_Arabic_dal',
+	0x05d0 : 'XK_Arabic_thal',
+	0x05d1 : 'XK_Arabic_ra',
+	0x05d2 : 'XK_Arabic_zain',
+	0x05d3 : 'XK_Arabic_seen',
+	0x05d4 : 'XK_Arabic_sheen',
+	0x05d5 : 'XK_Arabic_sad',
+	0x05d6 : 'XK_Arabic_dad',
+	0x05d7 : 'XK_Arabic_tah',
+	0x05d8 : 'XK_Arabic_zah',
+	0x05d9 : 'XK_Arabic_ain',
+	0x05da : 'XK_Arabic_ghain',
+	0x05e0 : 'XK_Arabic_tatweel',
+	0x05e1 : 'XK_Arabic_feh',
+	0x05e2 : 'XK_Arabic_qaf',
+	0x05e3 : 'XK_Arabic_kaf',
+	0x05e4 : 'XK_Arabic_lam',
+	0x05e5 : 'XK_Arabic_meem',
+	0x05e6 : 'XK_Arabic_noon',
+	0x05e7 : 'XK_Arabic_ha',
+	0x05e8 : 'XK_Arabic_waw',
+	0x05e9 : 'XK_Arabic_alefmaksura',
+	0x05ea : 'XK_Arabic_yeh',
+	0x05eb : 'XK_Arabic_fathatan',
+	0x05ec : 'XK_Arabic_dammatan',
+	0x05ed : 'XK_Arabic_kasratan',
+	0x05ee : 'XK_Arabic_fatha',
+	0x05ef : 'XK_Arabic_damma',
+	0x05f0 : 'XK_Arabic_kasra',
+	0x05f1 : 'XK_Arabic_shadda',
+	0x05f2 : 'XK_Arabic_sukun',
+	0x06a1 : 'XK_Serbian_dje',
+	0x06a2 : 'XK_Macedonia_gje',
+	0x06a3 : 'XK_Cyrillic_io',
+	0x06a4 : 'XK_Ukrainian_ie',
+	0x06a5 : 'XK_Macedonia_dse',
+	0x06a6 : 'XK_Ukrainian_i',
+	0x06a7 : 'XK_Ukrainian_yi',
+	0x06a8 : 'XK_Cyrillic_je',
+	0x06a9 : 'XK_Cyrillic_lje',
+	0x06aa : 'XK_Cyrillic_nje',
+	0x06ab : 'XK_Serbian_tshe',
+	0x06ac : 'XK_Macedonia_kje',
+	0x06ad : 'XK_Ukrainian_ghe_with_upturn',
+	0x06ae : 'XK_Byelorussian_shortu',
+	0x06af : 'XK_Cyrillic_dzhe',
+	0x06b0 : 'XK_numerosign',
+	0x06b1 : 'XK_Serbian_DJE',
+	0x06b2 : 'XK_Macedonia_GJE',
+	0x06b3 : 'XK_Cyrillic_IO',
+	0x06b4 : 'XK_Ukrainian_IE',
+	0x06b5 : 'XK_Macedonia_DSE',
+	0x06b6 : 'XK_Ukrainian_I',
+	0x06b7 : 'XK_Ukrainian_YI',
+	0x06b8 : 'XK_Cyrillic_JE',
+	0x06b9 : 'XK_Cyrillic_LJE',
+	0x06ba : 'XK_Cyrillic_NJE',
+	0x06bb : 'XK_Serbian_TSHE',
+	0x06bc : 'XK_Macedonia_KJE',
+	0x06bd : 'XK_Ukrainian_GHE_WITH_UPTURN',
+	0x06be : 'XK_Byelorussian_SHORTU',
+	0x06bf : 'XK_Cyrillic_DZHE',
+	0x06c0 : 'XK_Cyrillic_yu',
+	0x06c1 : 'XK_Cyrillic_a',
+	0x06c2 : 'XK_Cyrillic_be',
+	0x06c3 : 'XK_Cyrillic_tse',
+	0x06c4 : 'XK_Cyrillic_de',
+	0x06c5 : 'XK_Cyrillic_ie',
+	0x06c6 : 'XK_Cyrillic_ef',
+	0x06c7 : 'XK_Cyrillic_ghe',
+	0x06c8 : 'XK_Cyrillic_ha',
+	0x06c9 : 'XK_Cyrillic_i',
+	0x06ca : 'XK_Cyrillic_shorti',
+	0x06cb : 'XK_Cyrillic_ka',
+	0x06cc : 'XK_Cyrillic_el',
+	0x06cd : 'XK_Cyrillic_em',
+	0x06ce : 'XK_Cyrillic_en',
+	0x06cf : 'XK_Cyrillic_o',
+	0x06d0 : 'XK_Cyrillic_pe',
+	0x06d1 : 'XK_Cyrillic_ya',
+	0x06d2 : 'XK_Cyrillic_er',
+	0x06d3 : 'XK_Cyrillic_es',
+	0x06d4 : 'XK_Cyrillic_te',
+	0x06d5 : 'XK_Cyrillic_u',
+	0x06d6 : 'XK_Cyrillic_zhe',
+	0x06d7 : 'XK_Cyrillic_ve',
+	0x06d8 : 'XK_Cyrillic_softsign',
+	0x06d9 : 'XK_Cyrillic_yeru',
+	0x06da : 'XK_Cyrillic_ze',
+	0x06db : 'XK_Cyrillic_sha',
+	0x06dc : 'XK_Cyrillic_e',
+	0x06dd : 'XK_Cyrillic_shcha',
+	0x06de : 'XK_Cyrillic_che',
+	0x06df : 'XK_Cyrillic_hardsign',
+	0x06e0 : 'XK_Cyrillic_YU',
+	0x06e1 : 'XK_Cyrillic_A',
+	0x06e2 : 'XK_Cyrillic_BE',
+	0x06e3 : 'XK_Cyrillic_TSE',
+	0x06e4 : 'XK_Cyrillic_DE',
+	0x06e5 : 'XK_Cyrillic_IE',
+	0x06e6 : 'XK_Cyrillic_EF',
+	0x06e7 : 'XK_Cyrillic_GHE',
+	0x06e8 : 'XK_Cyrillic_HA',
+	0x06e9 : 'XK_Cyrillic_I',
+	0x06ea : 'XK_Cyrillic_SHORTI',
+	0x06eb : 'XK_Cyrillic_KA',
+	0x06ec : 'XK_Cyrillic_EL',
+	0x06ed : 'XK_Cyrillic_EM',
+	0x06ee : 'XK_Cyrillic_EN',
+	0x06ef : 'XK_Cyrillic_O',
+	0x06f0 : 'XK_Cyrillic_PE',
+	0x06f1 : 'XK_Cyrillic_YA',
+	0x06f2 : 'XK_Cyrillic_ER',
+	0x06f3 : 'XK_Cyrillic_ES',
+	0x06f4 : 'XK_Cyrillic_TE',
+	0x06f5 : 'XK_Cyrillic_U',
+	0x06f6 : 'XK_Cyrillic_ZHE',
+	0x06f7 : 'XK_Cyrillic_VE',
+	0x06f8 : 'XK_Cyrillic_SOFTSIGN',
+	0x06f9 : 'XK_Cyrillic_YERU',
+	0x06fa : 'XK_Cyrillic_ZE',
+	0x06fb : 'XK_Cyrillic_SHA',
+	0x06fc : 'XK_Cyrillic_E',
+	0x06fd : 'XK_Cyrillic_SHCHA',
+	0x06fe : 'XK_Cyrillic_CHE',
+	0x06ff : 'XK_Cyrillic_HARDSIGN',
+	0x07a1 : 'XK_Greek_ALPHAaccent',
+	0x07a2 : 'XK_Greek_EPSILONaccent',
+	0x07a3 : 'XK_Greek_ETAaccent',
+	0x07a4 : 'XK_Greek_IOTAaccent',
+	0x07a5 : 'XK_Greek_IOTAdiaeresis',
+	0x07a7 : 'XK_Greek_OMICRONaccent',
+	0x07a8 : 'XK_Greek_UPSILONaccent',
+	0x07a9 : 'XK_Greek_UPSILONdieresis',
+	0x07ab : 'XK_Greek_OMEGAaccent',
+	0x07ae : 'XK_Greek_accentdieresis',
+	0x07af : 'XK_Greek_horizbar',
+	0x07b1 : 'XK_Greek_alphaaccent',
+	0x07b2 : 'XK_Greek_epsilonaccent',
+	0x07b3 : 'XK_Greek_etaaccent',
+	0x07b4 : 'XK_Greek_iotaaccent',
+	0x07b5 : 'XK_Greek_iotadieresis',
+	0x07b6 : 'XK_Greek_iotaaccentdieresis',
+	0x07b7 : 'XK_Greek_omicronaccent',
+	0x07b8 : 'XK_Greek_upsilonaccent',
+	0x07b9 : 'XK_Greek_upsilondieresis',
+	0x07ba : 'XK_Greek_upsilonaccentdieresis',
+	0x07bb : 'XK_Greek_omegaaccent',
+	0x07c1 : 'XK_Greek_ALPHA',
+	0x07c2 : 'XK_Greek_BETA',
+	0x07c3 : 'XK_Greek_GAMMA',
+	0x07c4 : 'XK_Greek_DELTA',
+	0x07c5 : 'XK_Greek_EPSILON',
+	0x07c6 : 'XK_Greek_ZETA',
+	0x07c7 : 'XK_Greek_ETA',
+	0x07c8 : 'XK_Greek_THETA',
+	0x07c9 : 'XK_Greek_IOTA',
+	0x07ca : 'XK_Greek_KAPPA',
+	0x07cb : 'XK_Greek_LAMBDA',
+	0x07cc : 'XK_Greek_MU',
+	0x07cd : 'XK_Greek_NU',
+	0x07ce : 'XK_Greek_XI',
+	0x07cf : 'XK_Greek_OMICRON',
+	0x07d0 : 'XK_Greek_PI',
+	0x07d1 : 'XK_Greek_RHO',
+	0x07d2 : 'XK_Greek_SIGMA',
+	0x07d4 : 'XK_Greek_TAU',
+	0x07d5 : 'XK_Greek_UPSILON',
+	0x07d6 : 'XK_Greek_PHI',
+	0x07d7 : 'XK_Greek_CHI',
+	0x07d8 : 'XK_Greek_PSI',
+	0x07d9 : 'XK_Greek_OMEGA',
+	0x07e1 : 'XK_Greek_alpha',
+	0x07e2 : 'XK_Greek_beta',
+	0x07e3 : 'XK_Greek_gamma',
+	0x07e4 : 'XK_Greek_delta',
+	0x07e5 : 'XK_Greek_epsilon',
+	0x07e6 : 'XK_Greek_zeta',
+	0x07e7 : 'XK_Greek_eta',
+	0x07e8 : 'XK_Greek_theta',
+	0x07e9 : 'XK_Greek_iota',
+	0x07ea : 'XK_Greek_kappa',
+	0x07eb : 'XK_Greek_lambda',
+	0x07ec : 'XK_Greek_mu',
+	0x07ed : 'XK_Greek_nu',
+	0x07ee : 'XK_Greek_xi',
+	0x07ef : 'XK_Greek_omicron',
+	0x07f0 : 'XK_Greek_pi',
+	0x07f1 : 'XK_Greek_rho',
+	0x07f2 : 'XK_Greek_sigma',
+	0x07f3 : 'XK_Greek_finalsmallsigma',
+	0x07f4 : 'XK_Greek_tau',
+	0x07f5 : 'XK_Greek_upsilon',
+	0x07f6 : 'XK_Greek_phi',
+	0x07f7 : 'XK_Greek_chi',
+	0x07f8 : 'XK_Greek_psi',
+	0x07f9 : 'XK_Greek_omega',
+	0x08a1 : 'XK_leftradical',
+	0x08a2 : 'XK_topleftradical',
+	0x08a3 : 'XK_horizconnector',
+	0x08a4 : 'XK_topintegral',
+	0x08a5 : 'XK_botintegral',
+	0x08a6 : 'XK_vertconnector',
+	0x08a7 : 'XK_topleftsqbracket',
+	0x08a8 : 'XK_botleftsqbracket',
+	0x08a9 : 'XK_toprightsqbracket',
+	0x08aa : 'XK_botrightsqbracket',
+	0x08ab : 'XK_topleftparens',
+	0x08ac : 'XK_botleftparens',
+	0x08ad : 'XK_toprightparens',
+	0x08ae : 'XK_botrightparens',
+	0x08af : 'XK_leftmiddlecurlybrace',
+	0x08b0 : 'XK_rightmiddlecurlybrace',
+	0x08b1 : 'XK_topleftsummation',
+	0x08b2 : 'XK_botleftsummation',
+	0x08b3 : 'XK_topvertsummationconnector',
+	0x08b4 : 'XK_botvertsummationconnector',
+	0x08b5 : 'XK_toprightsummation',
+	0x08b6 : 'XK_botrightsummation',
+	0x08b7 : 'XK_rightmiddlesummation',
+	0x08bc : 'XK_lessthanequal',
+	0x08bd : 'XK_notequal',
+	0x08be : 'XK_greaterthanequal',
+	0x08bf : 'XK_integral',
+	0x08c0 : 'XK_therefore',
+	0x08c1 : 'XK_variation',
+	0x08c2 : 'XK_infinity',
+	0x08c5 : 'XK_nabla',
+	0x08c8 : 'XK_approximate',
+	0x08c9 : 'XK_similarequal',
+	0x08cd : 'XK_ifonlyif',
+	0x08ce : 'XK_implies',
+	0x08cf : 'XK_identical',
+	0x08d6 : 'XK_radical',
+	0x08da : 'XK_includedin',
+	0x08db : 'XK_includes',
+	0x08dc : 'XK_intersection',
+	0x08dd : 'XK_union',
+	0x08de : 'XK_logicaland',
+	0x08df : 'XK_logicalor',
+	0x08ef : 'XK_partialderivative',
+	0x08f6 : 'XK_function',
+	0x08fb : 'XK_leftarrow',
+	0x08fc : 'XK_uparrow',
+	0x08fd : 'XK_rightarrow',
+	0x08fe : 'XK_downarrow',
+	0x09df : 'XK_blank',
+	0x09e0 : 'XK_soliddiamond',
+	0x09e1 : 'XK_checkerboard',
+	0x09e2 : 'XK_ht',
+	0x09e3 : 'XK_ff',
+	0x09e4 : 'XK_cr',
+	0x09e5 : 'XK_lf',
+	0x09e8 : 'XK_nl',
+	0x09e9 : 'XK_vt',
+	0x09ea : 'XK_lowrightcorner',
+	0x09eb : 'XK_uprightcorner',
+	0x09ec : 'XK_upleftcorner',
+	0x09ed : 'XK_lowleftcorner',
+	0x09ee : 'XK_crossinglines',
+	0x09ef : 'XK_horizlinescan1',
+	0x09f0 : 'XK_horizlinescan3',
+	0x09f1 : 'XK_horizlinescan5',
+	0x09f2 : 'XK_horizlinescan7',
+	0x09f3 : 'XK_horizlinescan9',
+	0x09f4 : 'XK_leftt',
+	0x09f5 : 'XK_rightt',
+	0x09f6 : 'XK_bott',
+	0x09f7 : 'XK_topt',
+	0x09f8 : 'XK_vertbar',
+	0x0aa1 : 'XK_emspace',
+	0x0aa2 : 'XK_enspace',
+	0x0aa3 : 'XK_em3space',
+	0x0aa4 : 'XK_em4space',
+	0x0aa5 : 'XK_digitspace',
+	0x0aa6 : 'XK_punctspace',
+	0x0aa7 : 'XK_thinspace',
+	0x0aa8 : 'XK_hairspace',
+	0x0aa9 : 'XK_emdash',
+	0x0aaa : 'XK_endash',
+	0x0aac : 'XK_signifblank',
+	0x0aae : 'XK_ellipsis',
+	0x0aaf : 'XK_doubbaselinedot',
+	0x0ab0 : 'XK_onethird',
+	0x0ab1 : 'XK_twothirds',
+	0x0ab2 : 'XK_onefifth',
+	0x0ab3 : 'XK_twofifths',
+	0x0ab4 : 'XK_threefifths',
+	0x0ab5 : 'XK_fourfifths',
+	0x0ab6 : 'XK_onesixth',
+	0x0ab7 : 'XK_fivesixths',
+	0x0ab8 : 'XK_careof',
+	0x0abb : 'XK_figdash',
+	0x0abc : 'XK_leftanglebracket',
+	0x0abd : 'XK_decimalpoint',
+	0x0abe : 'XK_rightanglebracket',
+	0x0abf : 'XK_marker',
+	0x0ac3 : 'XK_oneeighth',
+	0x0ac4 : 'XK_threeeighths',
+	0x0ac5 : 'XK_fiveeighths',
+	0x0ac6 : 'XK_seveneighths',
+	0x0ac9 : 'XK_trademark',
+	0x0aca : 'XK_signaturemark',
+	0x0acb : 'XK_trademarkincircle',
+	0x0acc : 'XK_leftopentriangle',
+	0x0acd : 'XK_rightopentriangle',
+	0x0ace : 'XK_emopencircle',
+	0x0acf : 'XK_emopenrectangle',
+	0x0ad0 : 'XK_leftsinglequotemark',
+	0x0ad1 : 'XK_rightsinglequotemark',
+	0x0ad2 : 'XK_leftdoublequotemark',
+	0x0ad3 : 'XK_rightdoublequotemark',
+	0x0ad4 : 'XK_prescription',
+	0x0ad5 : 'XK_permille',
+	0x0ad6 : 'XK_minutes',
+	0x0ad7 : 'XK_seconds',
+	0x0ad9 : 'XK_latincross',
+	0x0ada : 'XK_hexagram',
+	0x0adb : 'XK_filledrectbullet',
+	0x0adc : 'XK_filledlefttribullet',
+	0x0add : 'XK_filledrighttribullet',
+	0x0ade : 'XK_emfilledcircle',
+	0x0adf : 'XK_emfilledrect',
+	0x0ae0 : 'XK_enopencircbullet',
+	0x0ae1 : 'XK_enopensquarebullet',
+	0x0ae2 : 'XK_openrectbullet',
+	0x0ae3 : 'XK_opentribulletup',
+	0x0ae4 : 'XK_opentribulletdown',
+	0x0ae5 : 'XK_openstar',
+	0x0ae6 : 'XK_enfilledcircbullet',
+	0x0ae7 : 'XK_enfilledsqbullet',
+	0x0ae8 : 'XK_filledtribulletup',
+	0x0ae9 : 'XK_filledtribulletdown',
+	0x0aea : 'XK_leftpointer',
+	0x0aeb : 'XK_rightpointer',
+	0x0aec : 'XK_club',
+	0x0aed : 'XK_diamond',
+	0x0aee : 'XK_heart',
+	0x0af0 : 'XK_maltesecross',
+	0x0af1 : 'XK_dagger',
+	0x0af2 : 'XK_doubledagger',
+	0x0af3 : 'XK_checkmark',
+	0x0af4 : 'XK_ballotcross',
+	0x0af5 : 'XK_musicalsharp',
+	0x0af6 : 'XK_musicalflat',
+	0x0af7 : 'XK_malesymbol',
+	0x0af8 : 'XK_femalesymbol',
+	0x0af9 : 'XK_telephone',
+	0x0afa : 'XK_telephonerecorder',
+	0x0afb : 'XK_phonographcopyright',
+	0x0afc : 'XK_caret',
+	0x0afd : 'XK_singlelowquotemark',
+	0x0afe : 'XK_doublelowquotemark',
+	0x0aff : 'XK_cursor',
+	0x0ba3 : 'XK_leftcaret',
+	0x0ba6 : 'XK_rightcaret',
+	0x0ba8 : 'XK_downcaret',
+	0x0ba9 : 'XK_upcaret',
+	0x0bc0 : 'XK_overbar',
+	0x0bc2 : 'XK_downtack',
+	0x0bc3 : 'XK_upshoe',
+	0x0bc4 : 'XK_downstile',
+	0x0bc6 : 'XK_underbar',
+	0x0bca : 'XK_jot',
+	0x0bcc : 'XK_quad',
+	0x0bce : 'XK_uptack',
+	0x0bcf : 'XK_circle',
+	0x0bd3 : 'XK_upstile',
+	0x0bd6 : 'XK_downshoe',
+	0x0bd8 : 'XK_rightshoe',
+	0x0bda : 'XK_leftshoe',
+	0x0bdc : 'XK_lefttack',
+	0x0bfc : 'XK_righttack',
+	0x0cdf : 'XK_hebrew_doublelowline',
+	0x0ce0 : 'XK_hebrew_aleph',
+	0x0ce1 : 'XK_hebrew_bet',
+	0x0ce2 : 'XK_hebrew_gimel',
+	0x0ce3 : 'XK_hebrew_dalet',
+	0x0ce4 : 'XK_hebrew_he',
+	0x0ce5 : 'XK_hebrew_waw',
+	0x0ce6 : 'XK_hebrew_zain',
+	0x0ce7 : 'XK_hebrew_chet',
+	0x0ce8 : 'XK_hebrew_tet',
+	0x0ce9 : 'XK_hebrew_yod',
+	0x0cea : 'XK_hebrew_finalkaph',
+	0x0ceb : 'XK_hebrew_kaph',
+	0x0cec : 'XK_hebrew_lamed',
+	0x0ced : 'XK_hebrew_finalmem',
+	0x0cee : 'XK_hebrew_mem',
+	0x0cef : 'XK_hebrew_finalnun',
+	0x0cf0 : 'XK_hebrew_nun',
+	0x0cf1 : 'XK_hebrew_samech',
+	0x0cf2 : 'XK_hebrew_ayin',
+	0x0cf3 : 'XK_hebrew_finalpe',
+	0x0cf4 : 'XK_hebrew_pe',
+	0x0cf5 : 'XK_hebrew_finalzade',
+	0x0cf6 : 'XK_hebrew_zade',
+	0x0cf7 : 'XK_hebrew_kuf',
+	0x0cf8 : 'XK_hebrew_resh',
+	0x0cf9 : 'XK_hebrew_shin',
+	0x0cfa : 'XK_hebrew_taf',
+	0x0da1 : 'XK_Thai_kokai',
+	0x0da2 : 'XK_Thai_khokhai',
+	0x0da3 : 'XK_Thai_khokhuat',
+	0x0da4 : 'XK_Thai_khokhwai',
+	0x0da5 : 'XK_Thai_khokhon',
+	0x0da6 : 'XK_Thai_khorakhang',
+	0x0da7 : 'XK_Thai_ngongu',
+	0x0da8 : 'XK_Thai_chochan',
+	0x0da9 : 'XK_Thai_choching',
+	0x0daa : 'XK_Thai_chochang',
+	0x0dab : 'XK_Thai_soso',
+	0x0dac : 'XK_Thai_chochoe',
+	0x0dad : 'XK_Thai_yoying',
+	0x0dae : 'XK_Thai_dochada',
+	0x0daf : 'XK_Thai_topatak',
+	0x0db0 : 'XK_Thai_thothan',
+	0x0db1 : 'XK_Thai_thonangmontho',
+	0x0db2 : 'XK_Thai_thophuthao',
+	0x0db3 : 'XK_Thai_nonen',
+	0x0db4 : 'XK_Thai_dodek',
+	0x0db5 : 'XK_Thai_totao',
+	0x0db6 : 'XK_Thai_thothung',
+	0x0db7 : 'XK_Thai_thothahan',
+	0x0db8 : 'XK_Thai_thothong',
+	0x0db9 : 'XK_Thai_nonu',
+	0x0dba : 'XK_Thai_bobaimai',
+	0x0dbb : 'XK_Thai_popla',
+	0x0dbc : 'XK_Thai_phophung',
+	0x0dbd : 'XK_Thai_fofa',
+	0x0dbe : 'XK_Thai_phophan',
+	0x0dbf : 'XK_Thai_fofan',
+	0x0dc0 : 'XK_Thai_phosamphao',
+	0x0dc1 : 'XK_Thai_moma',
+	0x0dc2 : 'XK_Thai_yoyak',
+	0x0dc3 : 'XK_Thai_rorua',
+	0x0dc4 : 'XK_Thai_ru',
+	0x0dc5 : 'XK_Thai_loling',
+	0x0dc6 : 'XK_Thai_lu',
+	0x0dc7 : 'XK_Thai_wowaen',
+	0x0dc8 : 'XK_Thai_sosala',
+	0x0dc9 : 'XK_Thai_sorusi',
+	0x0dca : 'XK_Thai_sosua',
+	0x0dcb : 'XK_Thai_hohip',
+	0x0dcc : 'XK_Thai_lochula',
+	0x0dcd : 'XK_Thai_oang',
+	0x0dce : 'XK_Thai_honokhuk',
+	0x0dcf : 'XK_Thai_paiyannoi',
+	0x0dd0 : 'XK_Thai_saraa',
+	0x0dd1 : 'XK_Thai_maihanakat',
+	0x0dd2 : 'XK_Thai_saraaa',
+	0x0dd3 : 'XK_Thai_saraam',
+	0x0dd4 : 'XK_Thai_sarai',
+	0x0dd5 : 'XK_Thai_saraii',
+	0x0dd6 : 'XK_Thai_saraue',
+	0x0dd7 : 'XK_Thai_sarauee',
+	0x0dd8 : 'XK_Thai_sarau',
+	0x0dd9 : 'XK_Thai_sarauu',
+	0x0dda : 'XK_Thai_phinthu',
+	0x0dde : 'XK_Thai_maihanakat_maitho',
+	0x0ddf : 'XK_Thai_baht',
+	0x0de0 : 'XK_Thai_sarae',
+	0x0de1 : 'XK_Thai_saraae',
+	0x0de2 : 'XK_Thai_sarao',
+	0x0de3 : 'XK_Thai_saraaimaimuan',
+	0x0de4 : 'XK_Thai_saraaimaimalai',
+	0x0de5 : 'XK_Thai_lakkhangyao',
+	0x0de6 : 'XK_Thai_maiyamok',
+	0x0de7 : 'XK_Thai_maitaikhu',
+	0x0de8 : 'XK_Thai_maiek',
+	0x0de9 : 'XK_Thai_maitho',
+	0x0dea : 'XK_Thai_maitri',
+	0x0deb : 'XK_Thai_maichattawa',
+	0x0dec : 'XK_Thai_thanthakhat',
+	0x0ded : 'XK_Thai_nikhahit',
+	0x0df0 : 'XK_Thai_leksun',
+	0x0df1 : 'XK_Thai_leknung',
+	0x0df2 : 'XK_Thai_leksong',
+	0x0df3 : 'XK_Thai_leksam',
+	0x0df4 : 'XK_Thai_leksi',
+	0x0df5 : 'XK_Thai_lekha',
+	0x0df6 : 'XK_Thai_lekhok',
+	0x0df7 : 'XK_Thai_lekchet',
+	0x0df8 : 'XK_Thai_lekpaet',
+	0x0df9 : 'XK_Thai_lekkao',
+	0x0ea1 : 'XK_Hangul_Kiyeog',
+	0x0ea2 : 'XK_Hangul_SsangKiyeog',
+	0x0ea3 : 'XK_Hangul_KiyeogSios',
+	0x0ea4 : 'XK_Hangul_Nieun',
+	0x0ea5 : 'XK_Hangul_NieunJieuj',
+	0x0ea6 : 'XK_Hangul_NieunHieuh',
+	0x0ea7 : 'XK_Hangul_Dikeud',
+	0x0ea8 : 'XK_Hangul_SsangDikeud',
+	0x0ea9 : 'XK_Hangul_Rieul',
+	0x0eaa : 'XK_Hangul_RieulKiyeog',
+	0x0eab : 'XK_Hangul_RieulMieum',
+	0x0eac : 'XK_Hangul_RieulPieub',
+	0x0ead : 'XK_Hangul_RieulSios',
+	0x0eae : 'XK_Hangul_RieulTieut',
+	0x0eaf : 'XK_Hangul_RieulPhieuf',
+	0x0eb0 : 'XK_Hangul_RieulHieuh',
+	0x0eb1 : 'XK_Hangul_Mieum',
+	0x0eb2 : 'XK_Hangul_Pieub',
+	0x0eb3 : 'XK_Hangul_SsangPieub',
+	0x0eb4 : 'XK_Hangul_PieubSios',
+	0x0eb5 : 'XK_Hangul_Sios',
+	0x0eb6 : 'XK_Hangul_SsangSios',
+	0x0eb7 : 'XK_Hangul_Ieung',
+	0x0eb8 : 'XK_Hangul_Jieuj',
+	0x0eb9 : 'XK_Hangul_SsangJieuj',
+	0x0eba : 'XK_Hangul_Cieuc',
+	0x0ebb : 'XK_Hangul_Khieuq',
+	0x0ebc : 'XK_Hangul_Tieut',
+	0x0ebd : 'XK_Hangul_Phieuf',
+	0x0ebe : 'XK_Hangul_Hieuh',
+	0x0ebf : 'XK_Hangul_A',
+	0x0ec0 : 'XK_Hangul_AE',
+	0x0ec1 : 'XK_Hangul_YA',
+	0x0ec2 : 'XK_Hangul_YAE',
+	0x0ec3 : 'XK_Hangul_EO',
+	0x0ec4 : 'XK_Hangul_E',
+	0x0ec5 : 'XK_Hangul_YEO',
+	0x0ec6 : 'XK_Hangul_YE',
+	0x0ec7 : 'XK_Hangul_O',
+	0x0ec8 : 'XK_Hangul_WA',
+	0x0ec9 : 'XK_Hangul_WAE',
+	0x0eca : 'XK_Hangul_OE',
+	0x0ecb : 'XK_Hangul_YO',
+	0x0ecc : 'XK_Hangul_U',
+	0x0ecd : 'XK_Hangul_WEO',
+	0x0ece : 'XK_Hangul_WE',
+	0x0ecf : 'XK_Hangul_WI',
+	0x0ed0 : 'XK_Hangul_YU',
+	0x0ed1 : 'XK_Hangul_EU',
+	0x0ed2 : 'XK_Hangul_YI',
+	0x0ed3 : 'XK_Hangul_I',
+	0x0ed4 : 'XK_Hangul_J_Kiyeog',
+	0x0ed5 : 'XK_Hangul_J_SsangKiyeog',
+	0x0ed6 : 'XK_Hangul_J_KiyeogSios',
+	0x0ed7 : 'XK_Hangul_J_Nieun',
+	0x0ed8 : 'XK_Hangul_J_NieunJieuj',
+	0x0ed9 : 'XK_Hangul_J_NieunHieuh',
+	0x0eda : 'XK_Hangul_J_Dikeud',
+	0x0edb : 'XK_Hangul_J_Rieul',
+	0x0edc : 'XK_Hangul_J_RieulKiyeog',
+	0x0edd : 'XK_Hangul_J_RieulMieum',
+	0x0ede : 'XK_Hangul_J_RieulPieub',
+	0x0edf : 'XK_Hangul_J_RieulSios',
+	0x0ee0 : 'XK_Hangul_J_RieulTieut',
+	0x0ee1 : 'XK_Hangul_J_RieulPhieuf',
+	0x0ee2 : 'XK_Hangul_J_RieulHieuh',
+	0x0ee3 : 'XK_Hangul_J_Mieum',
+	0x0ee4 : 'XK_Hangul_J_Pieub',
+	0x0ee5 : 'XK_Hangul_J_PieubSios',
+	0x0ee6 : 'XK_Hangul_J_Sios',
+	0x0ee7 : 'XK_Hangul_J_SsangSios',
+	0x0ee8 : 'XK_Hangul_J_Ieung',
+	0x0ee9 : 'XK_Hangul_J_Jieuj',
+	0x0eea : 'XK_Hangul_J_Cieuc',
+	0x0eeb : 'XK_Hangul_J_Khieuq',
+	0x0eec : 'XK_Hangul_J_Tieut',
+	0x0eed : 'XK_Hangul_J_Phieuf',
+	0x0eee : 'XK_Hangul_J_Hieuh',
+	0x0eef : 'XK_Hangul_RieulYeorinHieuh',
+	0x0ef0 : 'XK_Hangul_SunkyeongeumMieum',
+	0x0ef1 : 'XK_Hangul_SunkyeongeumPieub',
+	0x0ef2 : 'XK_Hangul_PanSios',
+	0x0ef3 : 'XK_Hangul_KkogjiDalrinIeung',
+	0x0ef4 : 'XK_Hangul_SunkyeongeumPhieuf',
+	0x0ef5 : 'XK_Hangul_YeorinHieuh',
+	0x0ef6 : 'XK_Hangul_AraeA',
+	0x0ef7 : 'XK_Hangul_AraeAE',
+	0x0ef8 : 'XK_Hangul_J_PanSios',
+	0x0ef9 : 'XK_Hangul_J_KkogjiDalrinIeung',
+	0x0efa : 'XK_Hangul_J_YeorinHieuh',
+	0x0eff : 'XK_Korean_Won',
+	0x13bc : 'XK_OE',
+	0x13bd : 'XK_oe',
+	0x13be : 'XK_Ydiaeresis',
+	0x20ac : 'XK_EuroSign',
+	0xfd01 : 'XK_3270_Duplicate',
+	0xfd02 : 'XK_3270_FieldMark',
+	0xfd03 : 'XK_3270_Right2',
+	0xfd04 : 'XK_3270_Left2',
+	0xfd05 : 'XK_3270_BackTab',
+	0xfd06 : 'XK_3270_EraseEOF',
+	0xfd07 : 'XK_3270_EraseInput',
+	0xfd08 : 'XK_3270_Reset',
+	0xfd09 : 'XK_3270_Quit',
+	0xfd0a : 'XK_3270_PA1',
+	0xfd0b : 'XK_3270_PA2',
+	0xfd0c : 'XK_3270_PA3',
+	0xfd0d : 'XK_3270_Test',
+	0xfd0e : 'XK_3270_Attn',
+	0xfd0f : 'XK_3270_CursorBlink',
+	0xfd10 : 'XK_3270_AltCursor',
+	0xfd11 : 'XK_3270_KeyClick',
+	0xfd12 : 'XK_3270_Jump',
+	0xfd13 : 'XK_3270_Ident',
+	0xfd14 : 'XK_3270_Rule',
+	0xfd15 : 'XK_3270_Copy',
+	0xfd16 : 'XK_3270_Play',
+	0xfd17 : 'XK_3270_Setup',
+	0xfd18 : 'XK_3270_Record',
+	0xfd19 : 'XK_3270_ChangeScreen',
+	0xfd1a : 'XK_3270_DeleteWord',
+	0xfd1b : 'XK_3270_ExSelect',
+	0xfd1c : 'XK_3270_CursorSelect',
+	0xfd1d : 'XK_3270_PrintScreen',
+	0xfd1e : 'XK_3270_Enter',
+	0xfe01 : 'XK_ISO_Lock',
+	0xfe02 : 'XK_ISO_Level2_Latch',
+	0xfe03 : 'XK_ISO_Level3_Shift',
+	0xfe04 : 'XK_ISO_Level3_Latch',
+	0xfe05 : 'XK_ISO_Level3_Lock',
+	0xfe06 : 'XK_ISO_Group_Latch',
+	0xfe07 : 'XK_ISO_Group_Lock',
+	0xfe08 : 'XK_ISO_Next_Group',
+	0xfe09 : 'XK_ISO_Next_Group_Lock',
+	0xfe0a : 'XK_ISO_Prev_Group',
+	0xfe0b : 'XK_ISO_Prev_Group_Lock',
+	0xfe0c : 'XK_ISO_First_Group',
+	0xfe0d : 'XK_ISO_First_Group_Lock',
+	0xfe0e : 'XK_ISO_Last_Group',
+	0xfe0f : 'XK_ISO_Last_Group_Lock',
+	0xfe11 : 'XK_ISO_Level5_Shift',
+	0xfe12 : 'XK_ISO_Level5_Latch',
+	0xfe13 : 'XK_ISO_Level5_Lock',
+	0xfe20 : 'XK_ISO_Left_Tab',
+	0xfe21 : 'XK_ISO_Move_Line_Up',
+	0xfe22 : 'XK_ISO_Move_Line_Down',
+	0xfe23 : 'XK_ISO_Partial_Line_Up',
+	0xfe24 : 'XK_ISO_Partial_Line_Down',
+	0xfe25 : 'XK_ISO_Partial_Space_Left',
+	0xfe26 : 'XK_ISO_Partial_Space_Right',
+	0xfe27 : 'XK_ISO_Set_Margin_Left',
+	0xfe28 : 'XK_ISO_Set_Margin_Right',
+	0xfe29 : 'XK_ISO_Release_Margin_Left',
+	0xfe2a : 'XK_ISO_Release_Margin_Right',
+	0xfe2b : 'XK_ISO_Release_Both_Margins',
+	0xfe2c : 'XK_ISO_Fast_Cursor_Left',
+	0xfe2d : 'XK_ISO_Fast_Cursor_Right',
+	0xfe2e : 'XK_ISO_Fast_Cursor_Up',
+	0xfe2f : 'XK_ISO_Fast_Cursor_Down',
+	0xfe30 : 'XK_ISO_Continuous_Underline',
+	0xfe31 : 'XK_ISO_Discontinuous_Underline',
+	0xfe32 : 'XK_ISO_Emphasize',
+	0xfe33 : 'XK_ISO_Center_Object',
+	0xfe34 : 'XK_ISO_Enter',
+	0xfe50 : 'XK_dead_grave',
+	0xfe51 : 'XK_dead_acute',
+	0xfe52 : 'XK_dead_circumflex',
+	0xfe53 : 'XK_dead_perispomeni',
+	0xfe54 : 'XK_dead_macron',
+	0xfe55 : 'XK_dead_breve',
+	0xfe56 : 'XK_dead_abovedot',
+	0xfe57 : 'XK_dead_diaeresis',
+	0xfe58 : 'XK_dead_abovering',
+	0xfe59 : 'XK_dead_doubleacute',
+	0xfe5a : 'XK_dead_caron',
+	0xfe5b : 'XK_dead_cedilla',
+	0xfe5c : 'XK_dead_ogonek',
+	0xfe5d : 'XK_dead_iota',
+	0xfe5e : 'XK_dead_voiced_sound',
+	0xfe5f : 'XK_dead_semivoiced_sound',
+	0xfe60 : 'XK_dead_belowdot',
+	0xfe61 : 'XK_dead_hook',
+	0xfe62 : 'XK_dead_horn',
+	0xfe63 : 'XK_dead_stroke',
+	0xfe64 : 'XK_dead_abovecomma',
+	0xfe65 : 'XK_dead_abovereversedcomma',
+	0xfe66 : 'XK_dead_doublegrave',
+	0xfe67 : 'XK_dead_belowring',
+	0xfe68 : 'XK_dead_belowmacron',
+	0xfe69 : 'XK_dead_belowcircumflex',
+	0xfe6a : 'XK_dead_belowtilde',
+	0xfe6b : 'XK_dead_belowbreve',
+	0xfe6c : 'XK_dead_belowdiaeresis',
+	0xfe6d : 'XK_dead_invertedbreve',
+	0xfe6e : 'XK_dead_belowcomma',
+	0xfe6f : 'XK_dead_currency',
+	0xfe70 : 'XK_AccessX_Enable',
+	0xfe71 : 'XK_AccessX_Feedback_Enable',
+	0xfe72 : 'XK_RepeatKeys_Enable',
+	0xfe73 : 'XK_SlowKeys_Enable',
+	0xfe74 : 'XK_BounceKeys_Enable',
+	0xfe75 : 'XK_StickyKeys_Enable',
+	0xfe76 : 'XK_MouseKeys_Enable',
+	0xfe77 : 'XK_MouseKeys_Accel_Enable',
+	0xfe78 : 'XK_Overlay1_Enable',
+	0xfe79 : 'XK_Overlay2_Enable',
+	0xfe7a : 'XK_AudibleBell_Enable',
+	0xfe80 : 'XK_dead_a',
+	0xfe81 : 'XK_dead_A',
+	0xfe82 : 'XK_dead_e',
+	0xfe83 : 'XK_dead_E',
+	0xfe84 : 'XK_dead_i',
+	0xfe85 : 'XK_dead_I',
+	0xfe86 : 'XK_dead_o',
+	0xfe87 : 'XK_dead_O',
+	0xfe88 : 'XK_dead_u',
+	0xfe89 : 'XK_dead_U',
+	0xfe8a : 'XK_dead_small_schwa',
+	0xfe8b : 'XK_dead_capital_schwa',
+	0xfe8c : 'XK_dead_greek',
+	0xfe90 : 'XK_dead_lowline',
+	0xfe91 : 'XK_dead_aboveverticalline',
+	0xfe92 : 'XK_dead_belowverticalline',
+	0xfe93 : 'XK_dead_longsolidusoverlay',
+	0xfea0 : 'XK_ch',
+	0xfea1 : 'XK_Ch',
+	0xfea2 : 'XK_CH',
+	0xfea3 : 'XK_c_h',
+	0xfea4 : 'XK_C_h',
+	0xfea5 : 'XK_C_H',
+	0xfed0 : 'XK_First_Virtual_Screen',
+	0xfed1 : 'XK_Prev_Virtual_Screen',
+	0xfed2 : 'XK_Next_Virtual_Screen',
+	0xfed4 : 'XK_Last_Virtual_Screen',
+	0xfed5 : 'XK_Terminate_Server',
+	0xfee0 : 'XK_Pointer_Left',
+	0xfee1 : 'XK_Pointer_Right',
+	0xfee2 : 'XK_Pointer_Up',
+	0xfee3 : 'XK_Pointer_Down',
+	0xfee4 : 'XK_Pointer_UpLeft',
+	0xfee5 : 'XK_Pointer_UpRight',
+	0xfee6 : 'XK_Pointer_DownLeft',
+	0xfee7 : 'XK_Pointer_DownRight',
+	0xfee8 : 'XK_Pointer_Button_Dflt',
+	0xfee9 : 'XK_Pointer_Button1',
+	0xfeea : 'XK_Pointer_Button2',
+	0xfeeb : 'XK_Pointer_Button3',
+	0xfeec : 'XK_Pointer_Button4',
+	0xfeed : 'XK_Pointer_Button5',
+	0xfeee : 'XK_Pointer_DblClick_Dflt',
+	0xfeef : 'XK_Pointer_DblClick1',
+	0xfef0 : 'XK_Pointer_DblClick2',
+	0xfef1 : 'XK_Pointer_DblClick3',
+	0xfef2 : 'XK_Pointer_DblClick4',
+	0xfef3 : 'XK_Pointer_DblClick5',
+	0xfef4 : 'XK_Pointer_Drag_Dflt',
+	0xfef5 : 'XK_Pointer_Drag1',
+	0xfef6 : 'XK_Pointer_Drag2',
+	0xfef7 : 'XK_Pointer_Drag3',
+	0xfef8 : 'XK_Pointer_Drag4',
+	0xfef9 : 'XK_Pointer_EnableKeys',
+	0xfefa : 'XK_Pointer_Accelerate',
+	0xfefb : 'XK_Pointer_DfltBtnNext',
+	0xfefc : 'XK_Pointer_DfltBtnPrev',
+	0xfefd : 'XK_Pointer_Drag5',
+	0xff08 : 'XK_BackSpace',
+	0xff09 : 'XK_Tab',
+	0xff0a : 'XK_Linefeed',
+	0xff0b : 'XK_Clear',
+	0xff0d : 'XK_Return',
+	0xff13 : 'XK_Pause',
+	0xff14 : 'XK_Scroll_Lock',
+	0xff15 : 'XK_Sys_Req',
+	0xff1b : 'XK_Escape',
+	0xff20 : 'XK_Multi_key',
+	0xff21 : 'XK_Kanji',
+	0xff22 : 'XK_Muhenkan',
+	0xff23 : 'XK_Henkan',
+	0xff24 : 'XK_Romaji',
+	0xff25 : 'XK_Hiragana',
+	0xff26 : 'XK_Katakana',
+	0xff27 : 'XK_Hiragana_Katakana',
+	0xff28 : 'XK_Zenkaku',
+	0xff29 : 'XK_Hankaku',
+	0xff2a : 'XK_Zenkaku_Hankaku',
+	0xff2b : 'XK_Touroku',
+	0xff2c : 'XK_Massyo',
+	0xff2d : 'XK_Kana_Lock',
+	0xff2e : 'XK_Kana_Shift',
+	0xff2f : 'XK_Eisu_Shift',
+	0xff30 : 'XK_Eisu_toggle',
+	0xff31 : 'XK_Hangul',
+	0xff32 : 'XK_Hangul_Start',
+	0xff33 : 'XK_Hangul_End',
+	0xff34 : 'XK_Hangul_Hanja',
+	0xff35 : 'XK_Hangul_Jamo',
+	0xff36 : 'XK_Hangul_Romaja',
+	0xff37 : 'XK_Codeinput',
+	0xff38 : 'XK_Hangul_Jeonja',
+	0xff39 : 'XK_Hangul_Banja',
+	0xff3a : 'XK_Hangul_PreHanja',
+	0xff3b : 'XK_Hangul_PostHanja',
+	0xff3c : 'XK_Hangul_SingleCandidate',
+	0xff3d : 'XK_Hangul_MultipleCandidate',
+	0xff3e : 'XK_Hangul_PreviousCandidate',
+	0xff3f : 'XK_Hangul_Special',
+	0xff50 : 'XK_Home',
+	0xff51 : 'XK_Left',
+	0xff52 : 'XK_Up',
+	0xff53 : 'XK_Right',
+	0xff54 : 'XK_Down',
+	0xff55 : 'XK_Page_Up',
+	0xff56 : 'XK_Next',
+	0xff57 : 'XK_End',
+	0xff58 : 'XK_Begin',
+	0xff60 : 'XK_Select',
+	0xff61 : 'XK_Print',
+	0xff62 : 'XK_Execute',
+	0xff63 : 'XK_Insert',
+	0xff65 : 'XK_Undo',
+	0xff66 : 'XK_Redo',
+	0xff67 : 'XK_Menu',
+	0xff68 : 'XK_Find',
+	0xff69 : 'XK_Cancel',
+	0xff6a : 'XK_Help',
+	0xff6b : 'XK_Break',
+	0xff7e : 'XK_Arabic_switch',
+	0xff7f : 'XK_Num_Lock',
+	0xff80 : 'XK_KP_Space',
+	0xff89 : 'XK_KP_Tab',
+	0xff8d : 'XK_KP_Enter',
+	0xff91 : 'XK_KP_F1',
+	0xff92 : 'XK_KP_F2',
+	0xff93 : 'XK_KP_F3',
+	0xff94 : 'XK_KP_F4',
+	0xff95 : 'XK_KP_Home',
+	0xff96 : 'XK_KP_Left',
+	0xff97 : 'XK_KP_Up',
+	0xff98 : 'XK_KP_Right',
+	0xff99 : 'XK_KP_Down',
+	0xff9a : 'XK_KP_Page_Up',
+	0xff9b : 'XK_KP_Next',
+	0xff9c : 'XK_KP_End',
+	0xff9d : 'XK_KP_Begin',
+	0xff9e : 'XK_KP_Insert',
+	0xff9f : 'XK_KP_Delete',
+	0xffaa : 'XK_KP_Multiply',
+	0xffab : 'XK_KP_Add',
+	0xffac : 'XK_KP_Separator',
+	0xffad : 'XK_KP_Subtract',
+	0xffae : 'XK_KP_Decimal',
+	0xffaf : 'XK_KP_Divide',
+	0xffb0 : 'XK_KP_0',
+	0xffb1 : 'XK_KP_1',
+	0xffb2 : 'XK_KP_2',
+	0xffb3 : 'XK_KP_3',
+	0xffb4 : 'XK_KP_4',
+	0xffb5 : 'XK_KP_5',
+	0xffb6 : 'XK_KP_6',
+	0xffb7 : 'XK_KP_7',
+	0xffb8 : 'XK_KP_8',
+	0xffb9 : 'XK_KP_9',
+	0xffbd : 'XK_KP_Equal',
+	0xffbe : 'XK_F1',
+	0xffbf : 'XK_F2',
+	0xffc0 : 'XK_F3',
+	0xffc1 : 'XK_F4',
+	0xffc2 : 'XK_F5',
+	0xffc3 : 'XK_F6',
+	0xffc4 : 'XK_F7',
+	0xffc5 : 'XK_F8',
+	0xffc6 : 'XK_F9',
+	0xffc7 : 'XK_F10',
+	0xffc8 : 'XK_F11',
+	0xffc9 : 'XK_F12',
+	0xffca : 'XK_F13',
+	0xffcb : 'XK_F14',
+	0xffcc : 'XK_F15',
+	0xffcd : 'XK_F16',
+	0xffce : 'XK_F17',
+	0xffcf : 'XK_F18',
+	0xffd0 : 'XK_F19',
+	0xffd1 : 'XK_F20',
+	0xffd2 : 'XK_F21',
+	0xffd3 : 'XK_F22',
+	0xffd4 : 'XK_F23',
+	0xffd5 : 'XK_F24',
+	0xffd6 : 'XK_F25',
+	0xffd7 : 'XK_F26',
+	0xffd8 : 'XK_F27',
+	0xffd9 : 'XK_F28',
+	0xffda : 'XK_F29',
+	0xffdb : 'XK_F30',
+	0xffdc : 'XK_F31',
+	0xffdd : 'XK_F32',
+	0xffde : 'XK_F33',
+	0xffdf : 'XK_F34',
+	0xffe0 : 'XK_F35',
+	0xffe1 : 'XK_Shift_L',
+	0xffe2 : 'XK_Shift_R',
+	0xffe3 : 'XK_Control_L',
+	0xffe4 : 'XK_Control_R',
+	0xffe5 : 'XK_Caps_Lock',
+	0xffe6 : 'XK_Shift_Lock',
+	0xffe7 : 'XK_Meta_L',
+	0xffe8 : 'XK_Meta_R',
+	0xffe9 : 'XK_Alt_L',
+	0xffea : 'XK_Alt_R',
+	0xffeb : 'XK_Super_L',
+	0xffec : 'XK_Super_R',
+	0xffed : 'XK_Hyper_L',
+	0xffee : 'XK_Hyper_R',
+	0xfff1 : 'XK_braille_dot_1',
+	0xfff2 : 'XK_braille_dot_2',
+	0xfff3 : 'XK_braille_dot_3',
+	0xfff4 : 'XK_braille_dot_4',
+	0xfff5 : 'XK_braille_dot_5',
+	0xfff6 : 'XK_braille_dot_6',
+	0xfff7 : 'XK_braille_dot_7',
+	0xfff8 : 'XK_braille_dot_8',
+	0xfff9 : 'XK_braille_dot_9',
+	0xfffa : 'XK_braille_dot_10',
+	0xffff : 'XK_Delete',
+	0xffffff : 'XK_VoidSymbol',
+	0x100012c : 'XK_Ibreve',
+	0x100012d : 'XK_ibreve',
+	0x1000174 : 'XK_Wcircumflex',
+	0x1000175 : 'XK_wcircumflex',
+	0x1000176 : 'XK_Ycircumflex',
+	0x1000177 : 'XK_ycircumflex',
+	0x100018f : 'XK_SCHWA',
+	0x100019f : 'XK_Obarred',
+	0x10001a0 : 'XK_Ohorn',
+	0x10001a1 : 'XK_ohorn',
+	0x10001af : 'XK_Uhorn',
+	0x10001b0 : 'XK_uhorn',
+	0x10001b5 : 'XK_Zstroke',
+	0x10001b6 : 'XK_zstroke',
+	0x10001b7 : 'XK_EZH',
+	0x10001d1 : 'XK_Ocaron',
+	0x10001d2 : 'XK_ocaron',
+	0x10001e6 : 'XK_Gcaron',
+	0x10001e7 : 'XK_gcaron',
+	0x1000259 : 'XK_schwa',
+	0x1000275 : 'XK_obarred',
+	0x1000292 : 'XK_ezh',
+	0x1000300 : 'XK_combining_grave',
+	0x1000301 : 'XK_combining_acute',
+	0x1000303 : 'XK_combining_tilde',
+	0x1000309 : 'XK_combining_hook',
+	0x1000323 : 'XK_combining_belowdot',
+	0x1000492 : 'XK_Cyrillic_GHE_bar',
+	0x1000493 : 'XK_Cyrillic_ghe_bar',
+	0x1000496 : 'XK_Cyrillic_ZHE_descender',
+	0x1000497 : 'XK_Cyrillic_zhe_descender',
+	0x100049a : 'XK_Cyrillic_KA_descender',
+	0x100049b : 'XK_Cyrillic_ka_descender',
+	0x100049c : 'XK_Cyrillic_KA_vertstroke',
+	0x100049d : 'XK_Cyrillic_ka_vertstroke',
+	0x10004a2 : 'XK_Cyrillic_EN_descender',
+	0x10004a3 : 'XK_Cyrillic_en_descender',
+	0x10004ae : 'XK_Cyrillic_U_straight',
+	0x10004af : 'XK_Cyrillic_u_straight',
+	0x10004b0 : 'XK_Cyrillic_U_straight_bar',
+	0x10004b1 : 'XK_Cyrillic_u_straight_bar',
+	0x10004b2 : 'XK_Cyrillic_HA_descender',
+	0x10004b3 : 'XK_Cyrillic_ha_descender',
+	0x10004b6 : 'XK_Cyrillic_CHE_descender',
+	0x10004b7 : 'XK_Cyrillic_che_descender',
+	0x10004b8 : 'XK_Cyrillic_CHE_vertstroke',
+	0x10004b9 : 'XK_Cyrillic_che_vertstroke',
+	0x10004ba : 'XK_Cyrillic_SHHA',
+	0x10004bb : 'XK_Cyrillic_shha',
+	0x10004d8 : 'XK_Cyrillic_SCHWA',
+	0x10004d9 : 'XK_Cyrillic_schwa',
+	0x10004e2 : 'XK_Cyrillic_I_macron',
+	0x10004e3 : 'XK_Cyrillic_i_macron',
+	0x10004e8 : 'XK_Cyrillic_O_bar',
+	0x10004e9 : 'XK_Cyrillic_o_bar',
+	0x10004ee : 'XK_Cyrillic_U_macron',
+	0x10004ef : 'XK_Cyrillic_u_macron',
+	0x1000531 : 'XK_Armenian_AYB',
+	0x1000532 : 'XK_Armenian_BEN',
+	0x1000533 : 'XK_Armenian_GIM',
+	0x1000534 : 'XK_Armenian_DA',
+	0x1000535 : 'XK_Armenian_YECH',
+	0x1000536 : 'XK_Armenian_ZA',
+	0x1000537 : 'XK_Armenian_E',
+	0x1000538 : 'XK_Armenian_AT',
+	0x1000539 : 'XK_Armenian_TO',
+	0x100053a : 'XK_Armenian_ZHE',
+	0x100053b : 'XK_Armenian_INI',
+	0x100053c : 'XK_Armenian_LYUN',
+	0x100053d : 'XK_Armenian_KHE',
+	0x100053e : 'XK_Armenian_TSA',
+	0x100053f : 'XK_Armenian_KEN',
+	0x1000540 : 'XK_Armenian_HO',
+	0x1000541 : 'XK_Armenian_DZA',
+	0x1000542 : 'XK_Armenian_GHAT',
+	0x1000543 : 'XK_Armenian_TCHE',
+	0x1000544 : 'XK_Armenian_MEN',
+	0x1000545 : 'XK_Armenian_HI',
+	0x1000546 : 'XK_Armenian_NU',
+	0x1000547 : 'XK_Armenian_SHA',
+	0x1000548 : 'XK_Armenian_VO',
+	0x1000549 : 'XK_Armenian_CHA',
+	0x100054a : 'XK_Armenian_PE',
+	0x100054b : 'XK_Armenian_JE',
+	0x100054c : 'XK_Armenian_RA',
+	0x100054d : 'XK_Armenian_SE',
+	0x100054e : 'XK_Armenian_VEV',
+	0x100054f : 'XK_Armenian_TYUN',
+	0x1000550 : 'XK_Armenian_RE',
+	0x1000551 : 'XK_Armenian_TSO',
+	0x1000552 : 'XK_Armenian_VYUN',
+	0x1000553 : 'XK_Armenian_PYUR',
+	0x1000554 : 'XK_Armenian_KE',
+	0x1000555 : 'XK_Armenian_O',
+	0x1000556 : 'XK_Armenian_FE',
+	0x100055a : 'XK_Armenian_apostrophe',
+	0x100055b : 'XK_Armenian_accent',
+	0x100055c : 'XK_Armenian_amanak',
+	0x100055d : 'XK_Armenian_but',
+	0x100055e : 'XK_Armenian_paruyk',
+	0x1000561 : 'XK_Armenian_ayb',
+	0x1000562 : 'XK_Armenian_ben',
+	0x1000563 : 'XK_Armenian_gim',
+	0x1000564 : 'XK_Armenian_da',
+	0x1000565 : 'XK_Armenian_yech',
+	0x1000566 : 'XK_Armenian_za',
+	0x1000567 : 'XK_Armenian_e',
+	0x1000568 : 'XK_Armenian_at',
+	0x1000569 : 'XK_Armenian_to',
+	0x100056a : 'XK_Armenian_zhe',
+	0x100056b : 'XK_Armenian_ini',
+	0x100056c : 'XK_Armenian_lyun',
+	0x100056d : 'XK_Armenian_khe',
+	0x100056e : 'XK_Armenian_tsa',
+	0x100056f : 'XK_Armenian_ken',
+	0x1000570 : 'XK_Armenian_ho',
+	0x1000571 : 'XK_Armenian_dza',
+	0x1000572 : 'XK_Armenian_ghat',
+	0x1000573 : 'XK_Armenian_tche',
+	0x1000574 : 'XK_Armenian_men',
+	0x1000575 : 'XK_Armenian_hi',
+	0x1000576 : 'XK_Armenian_nu',
+	0x1000577 : 'XK_Armenian_sha',
+	0x1000578 : 'XK_Armenian_vo',
+	0x1000579 : 'XK_Armenian_cha',
+	0x100057a : 'XK_Armenian_pe',
+	0x100057b : 'XK_Armenian_je',
+	0x100057c : 'XK_Armenian_ra',
+	0x100057d : 'XK_Armenian_se',
+	0x100057e : 'XK_Armenian_vev',
+	0x100057f : 'XK_Armenian_tyun',
+	0x1000580 : 'XK_Armenian_re',
+	0x1000581 : 'XK_Armenian_tso',
+	0x1000582 : 'XK_Armenian_vyun',
+	0x1000583 : 'XK_Armenian_pyur',
+	0x1000584 : 'XK_Armenian_ke',
+	0x1000585 : 'XK_Armenian_o',
+	0x1000586 : 'XK_Armenian_fe',
+	0x1000587 : 'XK_Armenian_ligature_ew',
+	0x1000589 : 'XK_Armenian_full_stop',
+	0x100058a : 'XK_Armenian_hyphen',
+	0x1000653 : 'XK_Arabic_madda_above',
+	0x1000654 : 'XK_Arabic_hamza_above',
+	0x1000655 : 'XK_Arabic_hamza_below',
+	0x1000660 : 'XK_Arabic_0',
+	0x1000661 : 'XK_Arabic_1',
+	0x1000662 : 'XK_Arabic_2',
+	0x1000663 : 'XK_Arabic_3',
+	0x1000664 : 'XK_Arabic_4',
+	0x1000665 : 'XK_Arabic_5',
+	0x1000666 : 'XK_Arabic_6',
+	0x1000667 : 'XK_Arabic_7',
+	0x1000668 : 'XK_Arabic_8',
+	0x1000669 : 'XK_Arabic_9',
+	0x100066a : 'XK_Arabic_percent',
+	0x1000670 : 'XK_Arabic_superscript_alef',
+	0x1000679 : 'XK_Arabic_tteh',
+	0x100067e : 'XK_Arabic_peh',
+	0x1000686 : 'XK_Arabic_tcheh',
+	0x1000688 : 'XK_Arabic_ddal',
+	0x1000691 : 'XK_Arabic_rreh',
+	0x1000698 : 'XK_Arabic_jeh',
+	0x10006a4 : 'XK_Arabic_veh',
+	0x10006a9 : 'XK_Arabic_keheh',
+	0x10006af : 'XK_Arabic_gaf',
+	0x10006ba : 'XK_Arabic_noon_ghunna',
+	0x10006be : 'XK_Arabic_heh_doachashmee',
+	0x10006c1 : 'XK_Arabic_heh_goal',
+	0x10006cc : 'XK_Arabic_farsi_yeh',
+	0x10006d2 : 'XK_Arabic_yeh_baree',
+	0x10006d4 : 'XK_Arabic_fullstop',
+	0x10006f0 : 'XK_Farsi_0',
+	0x10006f1 : 'XK_Farsi_1',
+	0x10006f2 : 'XK_Farsi_2',
+	0x10006f3 : 'XK_Farsi_3',
+	0x10006f4 : 'XK_Farsi_4',
+	0x10006f5 : 'XK_Farsi_5',
+	0x10006f6 : 'XK_Farsi_6',
+	0x10006f7 : 'XK_Farsi_7',
+	0x10006f8 : 'XK_Farsi_8',
+	0x10006f9 : 'XK_Farsi_9',
+	0x1000d82 : 'XK_Sinh_ng',
+	0x1000d83 : 'XK_Sinh_h2',
+	0x1000d85 : 'XK_Sinh_a',
+	0x1000d86 : 'XK_Sinh_aa',
+	0x1000d87 : 'XK_Sinh_ae',
+	0x1000d88 : 'XK_Sinh_aee',
+	0x1000d89 : 'XK_Sinh_i',
+	0x1000d8a : 'XK_Sinh_ii',
+	0x1000d8b : 'XK_Sinh_u',
+	0x1000d8c : 'XK_Sinh_uu',
+	0x1000d8d : 'XK_Sinh_ri',
+	0x1000d8e : 'XK_Sinh_rii',
+	0x1000d8f : 'XK_Sinh_lu',
+	0x1000d90 : 'XK_Sinh_luu',
+	0x1000d91 : 'XK_Sinh_e',
+	0x1000d92 : 'XK_Sinh_ee',
+	0x1000d93 : 'XK_Sinh_ai',
+	0x1000d94 : 'XK_Sinh_o',
+	0x1000d95 : 'XK_Sinh_oo',
+	0x1000d96 : 'XK_Sinh_au',
+	0x1000d9a : 'XK_Sinh_ka',
+	0x1000d9b : 'XK_Sinh_kha',
+	0x1000d9c : 'XK_Sinh_ga',
+	0x1000d9d : 'XK_Sinh_gha',
+	0x1000d9e : 'XK_Sinh_ng2',
+	0x1000d9f : 'XK_Sinh_nga',
+	0x1000da0 : 'XK_Sinh_ca',
+	0x1000da1 : 'XK_Sinh_cha',
+	0x1000da2 : 'XK_Sinh_ja',
+	0x1000da3 : 'XK_Sinh_jha',
+	0x1000da4 : 'XK_Sinh_nya',
+	0x1000da5 : 'XK_Sinh_jnya',
+	0x1000da6 : 'XK_Sinh_nja',
+	0x1000da7 : 'XK_Sinh_tta',
+	0x1000da8 : 'XK_Sinh_ttha',
+	0x1000da9 : 'XK_Sinh_dda',
+	0x1000daa : 'XK_Sinh_ddha',
+	0x1000dab : 'XK_Sinh_nna',
+	0x1000dac : 'XK_Sinh_ndda',
+	0x1000dad : 'XK_Sinh_tha',
+	0x1000dae : 'XK_Sinh_thha',
+	0x1000daf : 'XK_Sinh_dha',
+	0x1000db0 : 'XK_Sinh_dhha',
+	0x1000db1 : 'XK_Sinh_na',
+	0x1000db3 : 'XK_Sinh_ndha',
+	0x1000db4 : 'XK_Sinh_pa',
+	0x1000db5 : 'XK_Sinh_pha',
+	0x1000db6 : 'XK_Sinh_ba',
+	0x1000db7 : 'XK_Sinh_bha',
+	0x1000db8 : 'XK_Sinh_ma',
+	0x1000db9 : 'XK_Sinh_mba',
+	0x1000dba : 'XK_Sinh_ya',
+	0x1000dbb : 'XK_Sinh_ra',
+	0x1000dbd : 'XK_Sinh_la',
+	0x1000dc0 : 'XK_Sinh_va',
+	0x1000dc1 : 'XK_Sinh_sha',
+	0x1000dc2 : 'XK_Sinh_ssha',
+	0x1000dc3 : 'XK_Sinh_sa',
+	0x1000dc4 : 'XK_Sinh_ha',
+	0x1000dc5 : 'XK_Sinh_lla',
+	0x1000dc6 : 'XK_Sinh_fa',
+	0x1000dca : 'XK_Sinh_al',
+	0x1000dcf : 'XK_Sinh_aa2',
+	0x1000dd0 : 'XK_Sinh_ae2',
+	0x1000dd1 : 'XK_Sinh_aee2',
+	0x1000dd2 : 'XK_Sinh_i2',
+	0x1000dd3 : 'XK_Sinh_ii2',
+	0x1000dd4 : 'XK_Sinh_u2',
+	0x1000dd6 : 'XK_Sinh_uu2',
+	0x1000dd8 : 'XK_Sinh_ru2',
+	0x1000dd9 : 'XK_Sinh_e2',
+	0x1000dda : 'XK_Sinh_ee2',
+	0x1000ddb : 'XK_Sinh_ai2',
+	0x1000ddc : 'XK_Sinh_o2',
+	0x1000ddd : 'XK_Sinh_oo2',
+	0x1000dde : 'XK_Sinh_au2',
+	0x1000ddf : 'XK_Sinh_lu2',
+	0x1000df2 : 'XK_Sinh_ruu2',
+	0x1000df3 : 'XK_Sinh_luu2',
+	0x1000df4 : 'XK_Sinh_kunddaliya',
+	0x10010d0 : 'XK_Georgian_an',
+	0x10010d1 : 'XK_Georgian_ban',
+	0x10010d2 : 'XK_Georgian_gan',
+	0x10010d3 : 'XK_Georgian_don',
+	0x10010d4 : 'XK_Georgian_en',
+	0x10010d5 : 'XK_Georgian_vin',
+	0x10010d6 : 'XK_Georgian_zen',
+	0x10010d7 : 'XK_Georgian_tan',
+	0x10010d8 : 'XK_Georgian_in',
+	0x10010d9 : 'XK_Georgian_kan',
+	0x10010da : 'XK_Georgian_las',
+	0x10010db : 'XK_Georgian_man',
+	0x10010dc : 'XK_Georgian_nar',
+	0x10010dd : 'XK_Georgian_on',
+	0x10010de : 'XK_Georgian_par',
+	0x10010df : 'XK_Georgian_zhar',
+	0x10010e0 : 'XK_Georgian_rae',
+	0x10010e1 : 'XK_Georgian_san',
+	0x10010e2 : 'XK_Georgian_tar',
+	0x10010e3 : 'XK_Georgian_un',
+	0x10010e4 : 'XK_Georgian_phar',
+	0x10010e5 : 'XK_Georgian_khar',
+	0x10010e6 : 'XK_Georgian_ghan',
+	0x10010e7 : 'XK_Georgian_qar',
+	0x10010e8 : 'XK_Georgian_shin',
+	0x10010e9 : 'XK_Georgian_chin',
+	0x10010ea : 'XK_Georgian_can',
+	0x10010eb : 'XK_Georgian_jil',
+	0x10010ec : 'XK_Georgian_cil',
+	0x10010ed : 'XK_Georgian_char',
+	0x10010ee : 'XK_Georgian_xan',
+	0x10010ef : 'XK_Georgian_jhan',
+	0x10010f0 : 'XK_Georgian_hae',
+	0x10010f1 : 'XK_Georgian_he',
+	0x10010f2 : 'XK_Georgian_hie',
+	0x10010f3 : 'XK_Georgian_we',
+	0x10010f4 : 'XK_Georgian_har',
+	0x10010f5 : 'XK_Georgian_hoe',
+	0x10010f6 : 'XK_Georgian_fi',
+	0x1001e02 : 'XK_Babovedot',
+	0x1001e03 : 'XK_babovedot',
+	0x1001e0a : 'XK_Dabovedot',
+	0x1001e0b : 'XK_dabovedot',
+	0x1001e1e : 'XK_Fabovedot',
+	0x1001e1f : 'XK_fabovedot',
+	0x1001e36 : 'XK_Lbelowdot',
+	0x1001e37 : 'XK_lbelowdot',
+	0x1001e40 : 'XK_Mabovedot',
+	0x1001e41 : 'XK_mabovedot',
+	0x1001e56 : 'XK_Pabovedot',
+	0x1001e57 : 'XK_pabovedot',
+	0x1001e60 : 'XK_Sabovedot',
+	0x1001e61 : 'XK_sabovedot',
+	0x1001e6a : 'XK_Tabovedot',
+	0x1001e6b : 'XK_tabovedot',
+	0x1001e80 : 'XK_Wgrave',
+	0x1001e81 : 'XK_wgrave',
+	0x1001e82 : 'XK_Wacute',
+	0x1001e83 : 'XK_wacute',
+	0x1001e84 : 'XK_Wdiaeresis',
+	0x1001e85 : 'XK_wdiaeresis',
+	0x1001e8a : 'XK_Xabovedot',
+	0x1001e8b : 'XK_xabovedot',
+	0x1001ea0 : 'XK_Abelowdot',
+	0x1001ea1 : 'XK_abelowdot',
+	0x1001ea2 : 'XK_Ahook',
+	0x1001ea3 : 'XK_ahook',
+	0x1001ea4 : 'XK_Acircumflexacute',
+	0x1001ea5 : 'XK_acircumflexacute',
+	0x1001ea6 : 'XK_Acircumflexgrave',
+	0x1001ea7 : 'XK_acircumflexgrave',
+	0x1001ea8 : 'XK_Acircumflexhook',
+	0x1001ea9 : 'XK_acircumflexhook',
+	0x1001eaa : 'XK_Acircumflextilde',
+	0x1001eab : 'XK_acircumflextilde',
+	0x1001eac : 'XK_Acircumflexbelowdot',
+	0x1001ead : 'XK_acircumflexbelowdot',
+	0x1001eae : 'XK_Abreveacute',
+	0x1001eaf : 'XK_abreveacute',
+	0x1001eb0 : 'XK_Abrevegrave',
+	0x1001eb1 : 'XK_abrevegrave',
+	0x1001eb2 : 'XK_Abrevehook',
+	0x1001eb3 : 'XK_abrevehook',
+	0x1001eb4 : 'XK_Abrevetilde',
+	0x1001eb5 : 'XK_abrevetilde',
+	0x1001eb6 : 'XK_Abrevebelowdot',
+	0x1001eb7 : 'XK_abrevebelowdot',
+	0x1001eb8 : 'XK_Ebelowdot',
+	0x1001eb9 : 'XK_ebelowdot',
+	0x1001eba : 'XK_Ehook',
+	0x1001ebb : 'XK_ehook',
+	0x1001ebc : 'XK_Etilde',
+	0x1001ebd : 'XK_etilde',
+	0x1001ebe : 'XK_Ecircumflexacute',
+	0x1001ebf : 'XK_ecircumflexacute',
+	0x1001ec0 : 'XK_Ecircumflexgrave',
+	0x1001ec1 : 'XK_ecircumflexgrave',
+	0x1001ec2 : 'XK_Ecircumflexhook',
+	0x1001ec3 : 'XK_ecircumflexhook',
+	0x1001ec4 : 'XK_Ecircumflextilde',
+	0x1001ec5 : 'XK_ecircumflextilde',
+	0x1001ec6 : 'XK_Ecircumflexbelowdot',
+	0x1001ec7 : 'XK_ecircumflexbelowdot',
+	0x1001ec8 : 'XK_Ihook',
+	0x1001ec9 : 'XK_ihook',
+	0x1001eca : 'XK_Ibelowdot',
+	0x1001ecb : 'XK_ibelowdot',
+	0x1001ecc : 'XK_Obelowdot',
+	0x1001ecd : 'XK_obelowdot',
+	0x1001ece : 'XK_Ohook',
+	0x1001ecf : 'XK_ohook',
+	0x1001ed0 : 'XK_Ocircumflexacute',
+	0x1001ed1 : 'XK_ocircumflexacute',
+	0x1001ed2 : 'XK_Ocircumflexgrave',
+	0x1001ed3 : 'XK_ocircumflexgrave',
+	0x1001ed4 : 'XK_Ocircumflexhook',
+	0x1001ed5 : 'XK_ocircumflexhook',
+	0x1001ed6 : 'XK_Ocircumflextilde',
+	0x1001ed7 : 'XK_ocircumflextilde',
+	0x1001ed8 : 'XK_Ocircumflexbelowdot',
+	0x1001ed9 : 'XK_ocircumflexbelowdot',
+	0x1001eda : 'XK_Ohornacute',
+	0x1001edb : 'XK_ohornacute',
+	0x1001edc : 'XK_Ohorngrave',
+	0x1001edd : 'XK_ohorngrave',
+	0x1001ede : 'XK_Ohornhook',
+	0x1001edf : 'XK_ohornhook',
+	0x1001ee0 : 'XK_Ohorntilde',
+	0x1001ee1 : 'XK_ohorntilde',
+	0x1001ee2 : 'XK_Ohornbelowdot',
+	0x1001ee3 : 'XK_ohornbelowdot',
+	0x1001ee4 : 'XK_Ubelowdot',
+	0x1001ee5 : 'XK_ubelowdot',
+	0x1001ee6 : 'XK_Uhook',
+	0x1001ee7 : 'XK_uhook',
+	0x1001ee8 : 'XK_Uhornacute',
+	0x1001ee9 : 'XK_uhornacute',
+	0x1001eea : 'XK_Uhorngrave',
+	0x1001eeb : 'XK_uhorngrave',
+	0x1001eec : 'XK_Uhornhook',
+	0x1001eed : 'XK_uhornhook',
+	0x1001eee : 'XK_Uhorntilde',
+	0x1001eef : 'XK_uhorntilde',
+	0x1001ef0 : 'XK_Uhornbelowdot',
+	0x1001ef1 : 'XK_uhornbelowdot',
+	0x1001ef2 : 'XK_Ygrave',
+	0x1001ef3 : 'XK_ygrave',
+	0x1001ef4 : 'XK_Ybelowdot',
+	0x1001ef5 : 'XK_ybelowdot',
+	0x1001ef6 : 'XK_Yhook',
+	0x1001ef7 : 'XK_yhook',
+	0x1001ef8 : 'XK_Ytilde',
+	0x1001ef9 : 'XK_ytilde',
+	0x1002070 : 'XK_zerosuperior',
+	0x1002074 : 'XK_foursuperior',
+	0x1002075 : 'XK_fivesuperior',
+	0x1002076 : 'XK_sixsuperior',
+	0x1002077 : 'XK_sevensuperior',
+	0x1002078 : 'XK_eightsuperior',
+	0x1002079 : 'XK_ninesuperior',
+	0x1002080 : 'XK_zerosubscript',
+	0x1002081 : 'XK_onesubscript',
+	0x1002082 : 'XK_twosubscript',
+	0x1002083 : 'XK_threesubscript',
+	0x1002084 : 'XK_foursubscript',
+	0x1002085 : 'XK_fivesubscript',
+	0x1002086 : 'XK_sixsubscript',
+	0x1002087 : 'XK_sevensubscript',
+	0x1002088 : 'XK_eightsubscript',
+	0x1002089 : 'XK_ninesubscript',
+	0x10020a0 : 'XK_EcuSign',
+	0x10020a1 : 'XK_ColonSign',
+	0x10020a2 : 'XK_CruzeiroSign',
+	0x10020a3 : 'XK_FFrancSign',
+	0x10020a4 : 'XK_LiraSign',
+	0x10020a5 : 'XK_MillSign',
+	0x10020a6 : 'XK_NairaSign',
+	0x10020a7 : 'XK_PesetaSign',
+	0x10020a8 : 'XK_RupeeSign',
+	0x10020a9 : 'XK_WonSign',
+	0x10020aa : 'XK_NewSheqelSign',
+	0x10020ab : 'XK_DongSign',
+	0x1002202 : 'XK_partdifferential',
+	0x1002205 : 'XK_emptyset',
+	0x1002208 : 'XK_elementof',
+	0x1002209 : 'XK_notelementof',
+	0x100220b : 'XK_containsas',
+	0x100221a : 'XK_squareroot',
+	0x100221b : 'XK_cuberoot',
+	0x100221c : 'XK_fourthroot',
+	0x100222c : 'XK_dintegral',
+	0x100222d : 'XK_tintegral',
+	0x1002235 : 'XK_because',
+	0x1002247 : 'XK_notapproxeq',
+	0x1002248 : 'XK_approxeq',
+	0x1002262 : 'XK_notidentical',
+	0x1002263 : 'XK_stricteq',
+	0x1002800 : 'XK_braille_blank',
+	0x1002801 : 'XK_braille_dots_1',
+	0x1002802 : 'XK_braille_dots_2',
+	0x1002803 : 'XK_braille_dots_12',
+	0x1002804 : 'XK_braille_dots_3',
+	0x1002805 : 'XK_braille_dots_13',
+	0x1002806 : 'XK_braille_dots_23',
+	0x1002807 : 'XK_braille_dots_123',
+	0x1002808 : 'XK_braille_dots_4',
+	0x1002809 : 'XK_braille_dots_14',
+	0x100280a : 'XK_braille_dots_24',
+	0x100280b : 'XK_braille_dots_124',
+	0x100280c : 'XK_braille_dots_34',
+	0x100280d : 'XK_braille_dots_134',
+	0x100280e : 'XK_braille_dots_234',
+	0x100280f : 'XK_braille_dots_1234',
+	0x1002810 : 'XK_braille_dots_5',
+	0x1002811 : 'XK_braille_dots_15',
+	0x1002812 : 'XK_braille_dots_25',
+	0x1002813 : 'XK_braille_dots_125',
+	0x1002814 : 'XK_braille_dots_35',
+	0x1002815 : 'XK_braille_dots_135',
+	0x1002816 : 'XK_braille_dots_235',
+	0x1002817 : 'XK_braille_dots_1235',
+	0x1002818 : 'XK_braille_dots_45',
+	0x1002819 : 'XK_braille_dots_145',
+	0x100281a : 'XK_braille_dots_245',
+	0x100281b : 'XK_braille_dots_1245',
+	0x100281c : 'XK_braille_dots_345',
+	0x100281d : 'XK_braille_dots_1345',
+	0x100281e : 'XK_braille_dots_2345',
+	0x100281f : 'XK_braille_dots_12345',
+	0x1002820 : 'XK_braille_dots_6',
+	0x1002821 : 'XK_braille_dots_16',
+	0x1002822 : 'XK_braille_dots_26',
+	0x1002823 : 'XK_braille_dots_126',
+	0x1002824 : 'XK_braille_dots_36',
+	0x1002825 : 'XK_braille_dots_136',
+	0x1002826 : 'XK_braille_dots_236',
+	0x1002827 : 'XK_braille_dots_1236',
+	0x1002828 : 'XK_braille_dots_46',
+	0x1002829 : 'XK_braille_dots_146',
+	0x100282a : 'XK_braille_dots_246',
+	0x100282b : 'XK_braille_dots_1246',
+	0x100282c : 'XK_braille_dots_346',
+	0x100282d : 'XK_braille_dots_1346',
+	0x100282e : 'XK_braille_dots_2346',
+	0x100282f : 'XK_braille_dots_12346',
+	0x1002830 : 'XK_braille_dots_56',
+	0x1002831 : 'XK_braille_dots_156',
+	0x1002832 : 'XK_braille_dots_256',
+	0x1002833 : 'XK_braille_dots_1256',
+	0x1002834 : 'XK_braille_dots_356',
+	0x1002835 : 'XK_braille_dots_1356',
+	0x1002836 : 'XK_braille_dots_2356',
+	0x1002837 : 'XK_braille_dots_12356',
+	0x1002838 : 'XK_braille_dots_456',
+	0x1002839 : 'XK_braille_dots_1456',
+	0x100283a : 'XK_braille_dots_2456',
+	0x100283b : 'XK_braille_dots_12456',
+	0x100283c : 'XK_braille_dots_3456',
+	0x100283d : 'XK_braille_dots_13456',
+	0x100283e : 'XK_braille_dots_23456',
+	0x100283f : 'XK_braille_dots_123456',
+	0x1002840 : 'XK_braille_dots_7',
+	0x1002841 : 'XK_braille_dots_17',
+	0x1002842 : 'XK_braille_dots_27',
+	0x1002843 : 'XK_braille_dots_127',
+	0x1002844 : 'XK_braille_dots_37',
+	0x1002845 : 'XK_braille_dots_137',
+	0x1002846 : 'XK_braille_dots_237',
+	0x1002847 : 'XK_braille_dots_1237',
+	0x1002848 : 'XK_braille_dots_47',
+	0x1002849 : 'XK_braille_dots_147',
+	0x100284a : 'XK_braille_dots_247',
+	0x100284b : 'XK_braille_dots_1247',
+	0x100284c : 'XK_braille_dots_347',
+	0x100284d : 'XK_braille_dots_1347',
+	0x100284e : 'XK_braille_dots_2347',
+	0x100284f : 'XK_braille_dots_12347',
+	0x1002850 : 'XK_braille_dots_57',
+	0x1002851 : 'XK_braille_dots_157',
+	0x1002852 : 'XK_braille_dots_257',
+	0x1002853 : 'XK_braille_dots_1257',
+	0x1002854 : 'XK_braille_dots_357',
+	0x1002855 : 'XK_braille_dots_1357',
+	0x1002856 : 'XK_braille_dots_2357',
+	0x1002857 : 'XK_braille_dots_12357',
+	0x1002858 : 'XK_braille_dots_457',
+	0x1002859 : 'XK_braille_dots_1457',
+	0x100285a : 'XK_braille_dots_2457',
+	0x100285b : 'XK_braille_dots_12457',
+	0x100285c : 'XK_braille_dots_3457',
+	0x100285d : 'XK_braille_dots_13457',
+	0x100285e : 'XK_braille_dots_23457',
+	0x100285f : 'XK_braille_dots_123457',
+	0x1002860 : 'XK_braille_dots_67',
+	0x1002861 : 'XK_braille_dots_167',
+	0x1002862 : 'XK_braille_dots_267',
+	0x1002863 : 'XK_braille_dots_1267',
+	0x1002864 : 'XK_braille_dots_367',
+	0x1002865 : 'XK_braille_dots_1367',
+	0x1002866 : 'XK_braille_dots_2367',
+	0x1002867 : 'XK_braille_dots_12367',
+	0x1002868 : 'XK_braille_dots_467',
+	0x1002869 : 'XK_braille_dots_1467',
+	0x100286a : 'XK_braille_dots_2467',
+	0x100286b : 'XK_braille_dots_12467',
+	0x100286c : 'XK_braille_dots_3467',
+	0x100286d : 'XK_braille_dots_13467',
+	0x100286e : 'XK_braille_dots_23467',
+	0x100286f : 'XK_braille_dots_123467',
+	0x1002870 : 'XK_braille_dots_567',
+	0x1002871 : 'XK_braille_dots_1567',
+	0x1002872 : 'XK_braille_dots_2567',
+	0x1002873 : 'XK_braille_dots_12567',
+	0x1002874 : 'XK_braille_dots_3567',
+	0x1002875 : 'XK_braille_dots_13567',
+	0x1002876 : 'XK_braille_dots_23567',
+	0x1002877 : 'XK_braille_dots_123567',
+	0x1002878 : 'XK_braille_dots_4567',
+	0x1002879 : 'XK_braille_dots_14567',
+	0x100287a : 'XK_braille_dots_24567',
+	0x100287b : 'XK_braille_dots_124567',
+	0x100287c : 'XK_braille_dots_34567',
+	0x100287d : 'XK_braille_dots_134567',
+	0x100287e : 'XK_braille_dots_234567',
+	0x100287f : 'XK_braille_dots_1234567',
+	0x1002880 : 'XK_braille_dots_8',
+	0x1002881 : 'XK_braille_dots_18',
+	0x1002882 : 'XK_braille_dots_28',
+	0x1002883 : 'XK_braille_dots_128',
+	0x1002884 : 'XK_braille_dots_38',
+	0x1002885 : 'XK_braille_dots_138',
+	0x1002886 : 'XK_braille_dots_238',
+	0x1002887 : 'XK_braille_dots_1238',
+	0x1002888 : 'XK_braille_dots_48',
+	0x1002889 : 'XK_braille_dots_148',
+	0x100288a : 'XK_braille_dots_248',
+	0x100288b : 'XK_braille_dots_1248',
+	0x100288c : 'XK_braille_dots_348',
+	0x100288d : 'XK_braille_dots_1348',
+	0x100288e : 'XK_braille_dots_2348',
+	0x100288f : 'XK_braille_dots_12348',
+	0x1002890 : 'XK_braille_dots_58',
+	0x1002891 : 'XK_braille_dots_158',
+	0x1002892 : 'XK_braille_dots_258',
+	0x1002893 : 'XK_braille_dots_1258',
+	0x1002894 : 'XK_braille_dots_358',
+	0x1002895 : 'XK_braille_dots_1358',
+	0x1002896 : 'XK_braille_dots_2358',
+	0x1002897 : 'XK_braille_dots_12358',
+	0x1002898 : 'XK_braille_dots_458',
+	0x1002899 : 'XK_braille_dots_1458',
+	0x100289a : 'XK_braille_dots_2458',
+	0x100289b : 'XK_braille_dots_12458',
+	0x100289c : 'XK_braille_dots_3458',
+	0x100289d : 'XK_braille_dots_13458',
+	0x100289e : 'XK_braille_dots_23458',
+	0x100289f : 'XK_braille_dots_123458',
+	0x10028a0 : 'XK_braille_dots_68',
+	0x10028a1 : 'XK_braille_dots_168',
+	0x10028a2 : 'XK_braille_dots_268',
+	0x10028a3 : 'XK_braille_dots_1268',
+	0x10028a4 : 'XK_braille_dots_368',
+	0x10028a5 : 'XK_braille_dots_1368',
+	0x10028a6 : 'XK_braille_dots_2368',
+	0x10028a7 : 'XK_braille_dots_12368',
+	0x10028a8 : 'XK_braille_dots_468',
+	0x10028a9 : 'XK_braille_dots_1468',
+	0x10028aa : 'XK_braille_dots_2468',
+	0x10028ab : 'XK_braille_dots_12468',
+	0x10028ac : 'XK_braille_dots_3468',
+	0x10028ad : 'XK_braille_dots_13468',
+	0x10028ae : 'XK_braille_dots_23468',
+	0x10028af : 'XK_braille_dots_123468',
+	0x10028b0 : 'XK_braille_dots_568',
+	0x10028b1 : 'XK_braille_dots_1568',
+	0x10028b2 : 'XK_braille_dots_2568',
+	0x10028b3 : 'XK_braille_dots_12568',
+	0x10028b4 : 'XK_braille_dots_3568',
+	0x10028b5 : 'XK_braille_dots_13568',
+	0x10028b6 : 'XK_braille_dots_23568',
+	0x10028b7 : 'XK_braille_dots_123568',
+	0x10028b8 : 'XK_braille_dots_4568',
+	0x10028b9 : 'XK_braille_dots_14568',
+	0x10028ba : 'XK_braille_dots_24568',
+	0x10028bb : 'XK_braille_dots_124568',
+	0x10028bc : 'XK_braille_dots_34568',
+	0x10028bd : 'XK_braille_dots_134568',
+	0x10028be : 'XK_braille_dots_234568',
+	0x10028bf : 'XK_braille_dots_1234568',
+	0x10028c0 : 'XK_braille_dots_78',
+	0x10028c1 : 'XK_braille_dots_178',
+	0x10028c2 : 'XK_braille_dots_278',
+	0x10028c3 : 'XK_braille_dots_1278',
+	0x10028c4 : 'XK_braille_dots_378',
+	0x10028c5 : 'XK_braille_dots_1378',
+	0x10028c6 : 'XK_braille_dots_2378',
+	0x10028c7 : 'XK_braille_dots_12378',
+	0x10028c8 : 'XK_braille_dots_478',
+	0x10028c9 : 'XK_braille_dots_1478',
+	0x10028ca : 'XK_braille_dots_2478',
+	0x10028cb : 'XK_braille_dots_12478',
+	0x10028cc : 'XK_braille_dots_3478',
+	0x10028cd : 'XK_braille_dots_13478',
+	0x10028ce : 'XK_braille_dots_23478',
+	0x10028cf : 'XK_braille_dots_123478',
+	0x10028d0 : 'XK_braille_dots_578',
+	0x10028d1 : 'XK_braille_dots_1578',
+	0x10028d2 : 'XK_braille_dots_2578',
+	0x10028d3 : 'XK_braille_dots_12578',
+	0x10028d4 : 'XK_braille_dots_3578',
+	0x10028d5 : 'XK_braille_dots_13578',
+	0x10028d6 : 'XK_braille_dots_23578',
+	0x10028d7 : 'XK_braille_dots_123578',
+	0x10028d8 : 'XK_braille_dots_4578',
+	0x10028d9 : 'XK_braille_dots_14578',
+	0x10028da : 'XK_braille_dots_24578',
+	0x10028db : 'XK_braille_dots_124578',
+	0x10028dc : 'XK_braille_dots_34578',
+	0x10028dd : 'XK_braille_dots_134578',
+	0x10028de : 'XK_braille_dots_234578',
+	0x10028df : 'XK_braille_dots_1234578',
+	0x10028e0 : 'XK_braille_dots_678',
+	0x10028e1 : 'XK_braille_dots_1678',
+	0x10028e2 : 'XK_braille_dots_2678',
+	0x10028e3 : 'XK_braille_dots_12678',
+	0x10028e4 : 'XK_braille_dots_3678',
+	0x10028e5 : 'XK_braille_dots_13678',
+	0x10028e6 : 'XK_braille_dots_23678',
+	0x10028e7 : 'XK_braille_dots_123678',
+	0x10028e8 : 'XK_braille_dots_4678',
+	0x10028e9 : 'XK_braille_dots_14678',
+	0x10028ea : 'XK_braille_dots_24678',
+	0x10028eb : 'XK_braille_dots_124678',
+	0x10028ec : 'XK_braille_dots_34678',
+	0x10028ed : 'XK_braille_dots_134678',
+	0x10028ee : 'XK_braille_dots_234678',
+	0x10028ef : 'XK_braille_dots_1234678',
+	0x10028f0 : 'XK_braille_dots_5678',
+	0x10028f1 : 'XK_braille_dots_15678',
+	0x10028f2 : 'XK_braille_dots_25678',
+	0x10028f3 : 'XK_braille_dots_125678',
+	0x10028f4 : 'XK_braille_dots_35678',
+	0x10028f5 : 'XK_braille_dots_135678',
+	0x10028f6 : 'XK_braille_dots_235678',
+	0x10028f7 : 'XK_braille_dots_1235678',
+	0x10028f8 : 'XK_braille_dots_45678',
+	0x10028f9 : 'XK_braille_dots_145678',
+	0x10028fa : 'XK_braille_dots_245678',
+	0x10028fb : 'XK_braille_dots_1245678',
+	0x10028fc : 'XK_braille_dots_345678',
+	0x10028fd : 'XK_braille_dots_1345678',
+	0x10028fe : 'XK_braille_dots_2345678',
+	0x10028ff : 'XK_braille_dots_12345678',}
 
 PRINTABLE = {
 	XK.XK_space : '\u0020',
@@ -736,9 +4833,9 @@ PRINTABLE = {
 	XK.XK_fivesixths : '\u215A',
 	XK.XK_careof : '\u2105',
 	XK.XK_figdash : '\u2012',
-	XK.XK_leftanglebracket : '\u27E8',
+	XK.XK_leftanglebracket : '\u2329',
 	XK.XK_decimalpoint : '\u002E',
-	XK.XK_rightanglebracket : '\u27E9',
+	XK.XK_rightanglebracket : '\u232A',
 	XK.XK_oneeighth : '\u215B',
 	XK.XK_threeeighths : '\u215C',
 	XK.XK_fiveeighths : '\u215D',
@@ -904,6 +5001,96 @@ PRINTABLE = {
 	XK.XK_Thai_lekchet : '\u0E57',
 	XK.XK_Thai_lekpaet : '\u0E58',
 	XK.XK_Thai_lekkao : '\u0E59',
+	XK.XK_Hangul_Kiyeog : '\u3131',
+	XK.XK_Hangul_SsangKiyeog : '\u3132',
+	XK.XK_Hangul_KiyeogSios : '\u3133',
+	XK.XK_Hangul_Nieun : '\u3134',
+	XK.XK_Hangul_NieunJieuj : '\u3135',
+	XK.XK_Hangul_NieunHieuh : '\u3136',
+	XK.XK_Hangul_Dikeud : '\u3137',
+	XK.XK_Hangul_SsangDikeud : '\u3138',
+	XK.XK_Hangul_Rieul : '\u3139',
+	XK.XK_Hangul_RieulKiyeog : '\u313A',
+	XK.XK_Hangul_RieulMieum : '\u313B',
+	XK.XK_Hangul_RieulPieub : '\u313C',
+	XK.XK_Hangul_RieulSios : '\u313D',
+	XK.XK_Hangul_RieulTieut : '\u313E',
+	XK.XK_Hangul_RieulPhieuf : '\u313F',
+	XK.XK_Hangul_RieulHieuh : '\u3140',
+	XK.XK_Hangul_Mieum : '\u3141',
+	XK.XK_Hangul_Pieub : '\u3142',
+	XK.XK_Hangul_SsangPieub : '\u3143',
+	XK.XK_Hangul_PieubSios : '\u3144',
+	XK.XK_Hangul_Sios : '\u3145',
+	XK.XK_Hangul_SsangSios : '\u3146',
+	XK.XK_Hangul_Ieung : '\u3147',
+	XK.XK_Hangul_Jieuj : '\u3148',
+	XK.XK_Hangul_SsangJieuj : '\u3149',
+	XK.XK_Hangul_Cieuc : '\u314A',
+	XK.XK_Hangul_Khieuq : '\u314B',
+	XK.XK_Hangul_Tieut : '\u314C',
+	XK.XK_Hangul_Phieuf : '\u314D',
+	XK.XK_Hangul_Hieuh : '\u314E',
+	XK.XK_Hangul_A : '\u314F',
+	XK.XK_Hangul_AE : '\u3150',
+	XK.XK_Hangul_YA : '\u3151',
+	XK.XK_Hangul_YAE : '\u3152',
+	XK.XK_Hangul_EO : '\u3153',
+	XK.XK_Hangul_E : '\u3154',
+	XK.XK_Hangul_YEO : '\u3155',
+	XK.XK_Hangul_YE : '\u3156',
+	XK.XK_Hangul_O : '\u3157',
+	XK.XK_Hangul_WA : '\u3158',
+	XK.XK_Hangul_WAE : '\u3159',
+	XK.XK_Hangul_OE : '\u315A',
+	XK.XK_Hangul_YO : '\u315B',
+	XK.XK_Hangul_U : '\u315C',
+	XK.XK_Hangul_WEO : '\u315D',
+	XK.XK_Hangul_WE : '\u315E',
+	XK.XK_Hangul_WI : '\u315F',
+	XK.XK_Hangul_YU : '\u3160',
+	XK.XK_Hangul_EU : '\u3161',
+	XK.XK_Hangul_YI : '\u3162',
+	XK.XK_Hangul_I : '\u3163',
+	XK.XK_Hangul_J_Kiyeog : '\u11A8',
+	XK.XK_Hangul_J_SsangKiyeog : '\u11A9',
+	XK.XK_Hangul_J_KiyeogSios : '\u11AA',
+	XK.XK_Hangul_J_Nieun : '\u11AB',
+	XK.XK_Hangul_J_NieunJieuj : '\u11AC',
+	XK.XK_Hangul_J_NieunHieuh : '\u11AD',
+	XK.XK_Hangul_J_Dikeud : '\u11AE',
+	XK.XK_Hangul_J_Rieul : '\u11AF',
+	XK.XK_Hangul_J_RieulKiyeog : '\u11B0',
+	XK.XK_Hangul_J_RieulMieum : '\u11B1',
+	XK.XK_Hangul_J_RieulPieub : '\u11B2',
+	XK.XK_Hangul_J_RieulSios : '\u11B3',
+	XK.XK_Hangul_J_RieulTieut : '\u11B4',
+	XK.XK_Hangul_J_RieulPhieuf : '\u11B5',
+	XK.XK_Hangul_J_RieulHieuh : '\u11B6',
+	XK.XK_Hangul_J_Mieum : '\u11B7',
+	XK.XK_Hangul_J_Pieub : '\u11B8',
+	XK.XK_Hangul_J_PieubSios : '\u11B9',
+	XK.XK_Hangul_J_Sios : '\u11BA',
+	XK.XK_Hangul_J_SsangSios : '\u11BB',
+	XK.XK_Hangul_J_Ieung : '\u11BC',
+	XK.XK_Hangul_J_Jieuj : '\u11BD',
+	XK.XK_Hangul_J_Cieuc : '\u11BE',
+	XK.XK_Hangul_J_Khieuq : '\u11BF',
+	XK.XK_Hangul_J_Tieut : '\u11C0',
+	XK.XK_Hangul_J_Phieuf : '\u11C1',
+	XK.XK_Hangul_J_Hieuh : '\u11C2',
+	XK.XK_Hangul_RieulYeorinHieuh : '\u316D',
+	XK.XK_Hangul_SunkyeongeumMieum : '\u3171',
+	XK.XK_Hangul_SunkyeongeumPieub : '\u3178',
+	XK.XK_Hangul_PanSios : '\u317F',
+	XK.XK_Hangul_KkogjiDalrinIeung : '\u3181',
+	XK.XK_Hangul_SunkyeongeumPhieuf : '\u3184',
+	XK.XK_Hangul_YeorinHieuh : '\u3186',
+	XK.XK_Hangul_AraeA : '\u318D',
+	XK.XK_Hangul_AraeAE : '\u318E',
+	XK.XK_Hangul_J_PanSios : '\u11EB',
+	XK.XK_Hangul_J_KkogjiDalrinIeung : '\u11F0',
+	XK.XK_Hangul_J_YeorinHieuh : '\u11F9',
 	XK.XK_Korean_Won : '\u20A9',
 	XK.XK_Armenian_ligature_ew : '\u0587',
 	XK.XK_Armenian_full_stop : '\u0589',
@@ -1038,7 +5225,7 @@ PRINTABLE = {
 	XK.XK_Ibreve : '\u012C',
 	XK.XK_Zstroke : '\u01B5',
 	XK.XK_Gcaron : '\u01E6',
-	XK.XK_Ocaron : '\u01D2',
+	XK.XK_Ocaron : '\u01D1',
 	XK.XK_Obarred : '\u019F',
 	XK.XK_xabovedot : '\u1E8B',
 	XK.XK_ibreve : '\u012D',
@@ -1144,6 +5331,11 @@ PRINTABLE = {
 	XK.XK_ohorn : '\u01A1',
 	XK.XK_Uhorn : '\u01AF',
 	XK.XK_uhorn : '\u01B0',
+	XK.XK_combining_tilde : '\u0303',
+	XK.XK_combining_grave : '\u0300',
+	XK.XK_combining_acute : '\u0301',
+	XK.XK_combining_hook : '\u0309',
+	XK.XK_combining_belowdot : '\u0323',
 	XK.XK_EcuSign : '\u20A0',
 	XK.XK_ColonSign : '\u20A1',
 	XK.XK_CruzeiroSign : '\u20A2',
@@ -1185,7 +5377,7 @@ PRINTABLE = {
 	XK.XK_dintegral : '\u222C',
 	XK.XK_tintegral : '\u222D',
 	XK.XK_because : '\u2235',
-	XK.XK_approxeq : '\u2245',
+	XK.XK_approxeq : '\u2248',
 	XK.XK_notapproxeq : '\u2247',
 	XK.XK_notidentical : '\u2262',
 	XK.XK_stricteq : '\u2263',
@@ -1268,23 +5460,1390 @@ PRINTABLE = {
 	XK.XK_Sinh_lu2 : '\u0DDF',
 	XK.XK_Sinh_ruu2 : '\u0DF2',
 	XK.XK_Sinh_luu2 : '\u0DF3',
-	XK.XK_Sinh_kunddaliya : '\u0DF4',	'XK_KP_Space' : ' ',
-	XK.XK_KP_0 : '0',
-	XK.XK_KP_1 : '1',
-	XK.XK_KP_2 : '2',
-	XK.XK_KP_3 : '3',
-	XK.XK_KP_4 : '4',
-	XK.XK_KP_5 : '5',
-	XK.XK_KP_6 : '6',
-	XK.XK_KP_7 : '7',
-	XK.XK_KP_8 : '8',
-	XK.XK_KP_9 : '9',
-	XK.XK_KP_Divide : '/',
-	XK.XK_KP_Multiply : '*',
-	XK.XK_KP_Add : '+',
-	XK.XK_KP_Subtract : '-',
-	XK.XK_KP_Decimal : '.',
-	XK.XK_KP_Separator : ','}
+	XK.XK_Sinh_kunddaliya : '\u0DF4',
+	XK.XK_KP_Space : '\u0020',
+	XK.XK_KP_0 : '\u0030',
+	XK.XK_KP_1 : '\u0031',
+	XK.XK_KP_2 : '\u0032',
+	XK.XK_KP_3 : '\u0033',
+	XK.XK_KP_4 : '\u0034',
+	XK.XK_KP_5 : '\u0035',
+	XK.XK_KP_6 : '\u0036',
+	XK.XK_KP_7 : '\u0037',
+	XK.XK_KP_8 : '\u0038',
+	XK.XK_KP_9 : '\u0039',
+	XK.XK_KP_Divide : '\u002F',
+	XK.XK_KP_Multiply : '\u002A',
+	XK.XK_KP_Add : '\u002B',
+	XK.XK_KP_Subtract : '\u002D',
+	XK.XK_KP_Decimal : '\u002E',
+	XK.XK_KP_Separator : '\u002C',}
+
+CHARS = {
+	'\u0020' : XK.XK_space,
+	'\u0021' : XK.XK_exclam,
+	'\u0022' : XK.XK_quotedbl,
+	'\u0023' : XK.XK_numbersign,
+	'\u0024' : XK.XK_dollar,
+	'\u0025' : XK.XK_percent,
+	'\u0026' : XK.XK_ampersand,
+	'\u0027' : XK.XK_apostrophe,
+	'\u0028' : XK.XK_parenleft,
+	'\u0029' : XK.XK_parenright,
+	'\u002A' : XK.XK_asterisk,
+	'\u002B' : XK.XK_plus,
+	'\u002C' : XK.XK_comma,
+	'\u002D' : XK.XK_minus,
+	'\u002E' : XK.XK_period,
+	'\u002F' : XK.XK_slash,
+	'\u0030' : XK.XK_0,
+	'\u0031' : XK.XK_1,
+	'\u0032' : XK.XK_2,
+	'\u0033' : XK.XK_3,
+	'\u0034' : XK.XK_4,
+	'\u0035' : XK.XK_5,
+	'\u0036' : XK.XK_6,
+	'\u0037' : XK.XK_7,
+	'\u0038' : XK.XK_8,
+	'\u0039' : XK.XK_9,
+	'\u003A' : XK.XK_colon,
+	'\u003B' : XK.XK_semicolon,
+	'\u003C' : XK.XK_less,
+	'\u003D' : XK.XK_equal,
+	'\u003E' : XK.XK_greater,
+	'\u003F' : XK.XK_question,
+	'\u0040' : XK.XK_at,
+	'\u0041' : XK.XK_A,
+	'\u0042' : XK.XK_B,
+	'\u0043' : XK.XK_C,
+	'\u0044' : XK.XK_D,
+	'\u0045' : XK.XK_E,
+	'\u0046' : XK.XK_F,
+	'\u0047' : XK.XK_G,
+	'\u0048' : XK.XK_H,
+	'\u0049' : XK.XK_I,
+	'\u004A' : XK.XK_J,
+	'\u004B' : XK.XK_K,
+	'\u004C' : XK.XK_L,
+	'\u004D' : XK.XK_M,
+	'\u004E' : XK.XK_N,
+	'\u004F' : XK.XK_O,
+	'\u0050' : XK.XK_P,
+	'\u0051' : XK.XK_Q,
+	'\u0052' : XK.XK_R,
+	'\u0053' : XK.XK_S,
+	'\u0054' : XK.XK_T,
+	'\u0055' : XK.XK_U,
+	'\u0056' : XK.XK_V,
+	'\u0057' : XK.XK_W,
+	'\u0058' : XK.XK_X,
+	'\u0059' : XK.XK_Y,
+	'\u005A' : XK.XK_Z,
+	'\u005B' : XK.XK_bracketleft,
+	'\u005C' : XK.XK_backslash,
+	'\u005D' : XK.XK_bracketright,
+	'\u005E' : XK.XK_asciicircum,
+	'\u005F' : XK.XK_underscore,
+	'\u0060' : XK.XK_grave,
+	'\u0061' : XK.XK_a,
+	'\u0062' : XK.XK_b,
+	'\u0063' : XK.XK_c,
+	'\u0064' : XK.XK_d,
+	'\u0065' : XK.XK_e,
+	'\u0066' : XK.XK_f,
+	'\u0067' : XK.XK_g,
+	'\u0068' : XK.XK_h,
+	'\u0069' : XK.XK_i,
+	'\u006A' : XK.XK_j,
+	'\u006B' : XK.XK_k,
+	'\u006C' : XK.XK_l,
+	'\u006D' : XK.XK_m,
+	'\u006E' : XK.XK_n,
+	'\u006F' : XK.XK_o,
+	'\u0070' : XK.XK_p,
+	'\u0071' : XK.XK_q,
+	'\u0072' : XK.XK_r,
+	'\u0073' : XK.XK_s,
+	'\u0074' : XK.XK_t,
+	'\u0075' : XK.XK_u,
+	'\u0076' : XK.XK_v,
+	'\u0077' : XK.XK_w,
+	'\u0078' : XK.XK_x,
+	'\u0079' : XK.XK_y,
+	'\u007A' : XK.XK_z,
+	'\u007B' : XK.XK_braceleft,
+	'\u007C' : XK.XK_bar,
+	'\u007D' : XK.XK_braceright,
+	'\u007E' : XK.XK_asciitilde,
+	'\u00A0' : XK.XK_nobreakspace,
+	'\u00A1' : XK.XK_exclamdown,
+	'\u00A2' : XK.XK_cent,
+	'\u00A3' : XK.XK_sterling,
+	'\u00A4' : XK.XK_currency,
+	'\u00A5' : XK.XK_yen,
+	'\u00A6' : XK.XK_brokenbar,
+	'\u00A7' : XK.XK_section,
+	'\u00A8' : XK.XK_diaeresis,
+	'\u00A9' : XK.XK_copyright,
+	'\u00AA' : XK.XK_ordfeminine,
+	'\u00AB' : XK.XK_guillemotleft,
+	'\u00AC' : XK.XK_notsign,
+	'\u00AD' : XK.XK_hyphen,
+	'\u00AE' : XK.XK_registered,
+	'\u00AF' : XK.XK_macron,
+	'\u00B0' : XK.XK_degree,
+	'\u00B1' : XK.XK_plusminus,
+	'\u00B2' : XK.XK_twosuperior,
+	'\u00B3' : XK.XK_threesuperior,
+	'\u00B4' : XK.XK_acute,
+	'\u00B5' : XK.XK_mu,
+	'\u00B6' : XK.XK_paragraph,
+	'\u00B7' : XK.XK_periodcentered,
+	'\u00B8' : XK.XK_cedilla,
+	'\u00B9' : XK.XK_onesuperior,
+	'\u00BA' : XK.XK_masculine,
+	'\u00BB' : XK.XK_guillemotright,
+	'\u00BC' : XK.XK_onequarter,
+	'\u00BD' : XK.XK_onehalf,
+	'\u00BE' : XK.XK_threequarters,
+	'\u00BF' : XK.XK_questiondown,
+	'\u00C0' : XK.XK_Agrave,
+	'\u00C1' : XK.XK_Aacute,
+	'\u00C2' : XK.XK_Acircumflex,
+	'\u00C3' : XK.XK_Atilde,
+	'\u00C4' : XK.XK_Adiaeresis,
+	'\u00C5' : XK.XK_Aring,
+	'\u00C6' : XK.XK_AE,
+	'\u00C7' : XK.XK_Ccedilla,
+	'\u00C8' : XK.XK_Egrave,
+	'\u00C9' : XK.XK_Eacute,
+	'\u00CA' : XK.XK_Ecircumflex,
+	'\u00CB' : XK.XK_Ediaeresis,
+	'\u00CC' : XK.XK_Igrave,
+	'\u00CD' : XK.XK_Iacute,
+	'\u00CE' : XK.XK_Icircumflex,
+	'\u00CF' : XK.XK_Idiaeresis,
+	'\u00D0' : XK.XK_ETH,
+	'\u00D1' : XK.XK_Ntilde,
+	'\u00D2' : XK.XK_Ograve,
+	'\u00D3' : XK.XK_Oacute,
+	'\u00D4' : XK.XK_Ocircumflex,
+	'\u00D5' : XK.XK_Otilde,
+	'\u00D6' : XK.XK_Odiaeresis,
+	'\u00D7' : XK.XK_multiply,
+	'\u00D8' : XK.XK_Oslash,
+	'\u00D9' : XK.XK_Ugrave,
+	'\u00DA' : XK.XK_Uacute,
+	'\u00DB' : XK.XK_Ucircumflex,
+	'\u00DC' : XK.XK_Udiaeresis,
+	'\u00DD' : XK.XK_Yacute,
+	'\u00DE' : XK.XK_THORN,
+	'\u00DF' : XK.XK_ssharp,
+	'\u00E0' : XK.XK_agrave,
+	'\u00E1' : XK.XK_aacute,
+	'\u00E2' : XK.XK_acircumflex,
+	'\u00E3' : XK.XK_atilde,
+	'\u00E4' : XK.XK_adiaeresis,
+	'\u00E5' : XK.XK_aring,
+	'\u00E6' : XK.XK_ae,
+	'\u00E7' : XK.XK_ccedilla,
+	'\u00E8' : XK.XK_egrave,
+	'\u00E9' : XK.XK_eacute,
+	'\u00EA' : XK.XK_ecircumflex,
+	'\u00EB' : XK.XK_ediaeresis,
+	'\u00EC' : XK.XK_igrave,
+	'\u00ED' : XK.XK_iacute,
+	'\u00EE' : XK.XK_icircumflex,
+	'\u00EF' : XK.XK_idiaeresis,
+	'\u00F0' : XK.XK_eth,
+	'\u00F1' : XK.XK_ntilde,
+	'\u00F2' : XK.XK_ograve,
+	'\u00F3' : XK.XK_oacute,
+	'\u00F4' : XK.XK_ocircumflex,
+	'\u00F5' : XK.XK_otilde,
+	'\u00F6' : XK.XK_odiaeresis,
+	'\u00F7' : XK.XK_division,
+	'\u00F8' : XK.XK_oslash,
+	'\u00F9' : XK.XK_ugrave,
+	'\u00FA' : XK.XK_uacute,
+	'\u00FB' : XK.XK_ucircumflex,
+	'\u00FC' : XK.XK_udiaeresis,
+	'\u00FD' : XK.XK_yacute,
+	'\u00FE' : XK.XK_thorn,
+	'\u00FF' : XK.XK_ydiaeresis,
+	'\u0100' : XK.XK_Amacron,
+	'\u0101' : XK.XK_amacron,
+	'\u0102' : XK.XK_Abreve,
+	'\u0103' : XK.XK_abreve,
+	'\u0104' : XK.XK_Aogonek,
+	'\u0105' : XK.XK_aogonek,
+	'\u0106' : XK.XK_Cacute,
+	'\u0107' : XK.XK_cacute,
+	'\u0108' : XK.XK_Ccircumflex,
+	'\u0109' : XK.XK_ccircumflex,
+	'\u010A' : XK.XK_Cabovedot,
+	'\u010B' : XK.XK_cabovedot,
+	'\u010C' : XK.XK_Ccaron,
+	'\u010D' : XK.XK_ccaron,
+	'\u010E' : XK.XK_Dcaron,
+	'\u010F' : XK.XK_dcaron,
+	'\u0110' : XK.XK_Dstroke,
+	'\u0111' : XK.XK_dstroke,
+	'\u0112' : XK.XK_Emacron,
+	'\u0113' : XK.XK_emacron,
+	'\u0116' : XK.XK_Eabovedot,
+	'\u0117' : XK.XK_eabovedot,
+	'\u0118' : XK.XK_Eogonek,
+	'\u0119' : XK.XK_eogonek,
+	'\u011A' : XK.XK_Ecaron,
+	'\u011B' : XK.XK_ecaron,
+	'\u011C' : XK.XK_Gcircumflex,
+	'\u011D' : XK.XK_gcircumflex,
+	'\u011E' : XK.XK_Gbreve,
+	'\u011F' : XK.XK_gbreve,
+	'\u0120' : XK.XK_Gabovedot,
+	'\u0121' : XK.XK_gabovedot,
+	'\u0122' : XK.XK_Gcedilla,
+	'\u0123' : XK.XK_gcedilla,
+	'\u0124' : XK.XK_Hcircumflex,
+	'\u0125' : XK.XK_hcircumflex,
+	'\u0126' : XK.XK_Hstroke,
+	'\u0127' : XK.XK_hstroke,
+	'\u0128' : XK.XK_Itilde,
+	'\u0129' : XK.XK_itilde,
+	'\u012A' : XK.XK_Imacron,
+	'\u012B' : XK.XK_imacron,
+	'\u012C' : XK.XK_Ibreve,
+	'\u012D' : XK.XK_ibreve,
+	'\u012E' : XK.XK_Iogonek,
+	'\u012F' : XK.XK_iogonek,
+	'\u0130' : XK.XK_Iabovedot,
+	'\u0131' : XK.XK_idotless,
+	'\u0134' : XK.XK_Jcircumflex,
+	'\u0135' : XK.XK_jcircumflex,
+	'\u0136' : XK.XK_Kcedilla,
+	'\u0137' : XK.XK_kcedilla,
+	'\u0138' : XK.XK_kra,
+	'\u0139' : XK.XK_Lacute,
+	'\u013A' : XK.XK_lacute,
+	'\u013B' : XK.XK_Lcedilla,
+	'\u013C' : XK.XK_lcedilla,
+	'\u013D' : XK.XK_Lcaron,
+	'\u013E' : XK.XK_lcaron,
+	'\u0141' : XK.XK_Lstroke,
+	'\u0142' : XK.XK_lstroke,
+	'\u0143' : XK.XK_Nacute,
+	'\u0144' : XK.XK_nacute,
+	'\u0145' : XK.XK_Ncedilla,
+	'\u0146' : XK.XK_ncedilla,
+	'\u0147' : XK.XK_Ncaron,
+	'\u0148' : XK.XK_ncaron,
+	'\u014A' : XK.XK_ENG,
+	'\u014B' : XK.XK_eng,
+	'\u014C' : XK.XK_Omacron,
+	'\u014D' : XK.XK_omacron,
+	'\u0150' : XK.XK_Odoubleacute,
+	'\u0151' : XK.XK_odoubleacute,
+	'\u0152' : XK.XK_OE,
+	'\u0153' : XK.XK_oe,
+	'\u0154' : XK.XK_Racute,
+	'\u0155' : XK.XK_racute,
+	'\u0156' : XK.XK_Rcedilla,
+	'\u0157' : XK.XK_rcedilla,
+	'\u0158' : XK.XK_Rcaron,
+	'\u0159' : XK.XK_rcaron,
+	'\u015A' : XK.XK_Sacute,
+	'\u015B' : XK.XK_sacute,
+	'\u015C' : XK.XK_Scircumflex,
+	'\u015D' : XK.XK_scircumflex,
+	'\u015E' : XK.XK_Scedilla,
+	'\u015F' : XK.XK_scedilla,
+	'\u0160' : XK.XK_Scaron,
+	'\u0161' : XK.XK_scaron,
+	'\u0162' : XK.XK_Tcedilla,
+	'\u0163' : XK.XK_tcedilla,
+	'\u0164' : XK.XK_Tcaron,
+	'\u0165' : XK.XK_tcaron,
+	'\u0166' : XK.XK_Tslash,
+	'\u0167' : XK.XK_tslash,
+	'\u0168' : XK.XK_Utilde,
+	'\u0169' : XK.XK_utilde,
+	'\u016A' : XK.XK_Umacron,
+	'\u016B' : XK.XK_umacron,
+	'\u016C' : XK.XK_Ubreve,
+	'\u016D' : XK.XK_ubreve,
+	'\u016E' : XK.XK_Uring,
+	'\u016F' : XK.XK_uring,
+	'\u0170' : XK.XK_Udoubleacute,
+	'\u0171' : XK.XK_udoubleacute,
+	'\u0172' : XK.XK_Uogonek,
+	'\u0173' : XK.XK_uogonek,
+	'\u0174' : XK.XK_Wcircumflex,
+	'\u0175' : XK.XK_wcircumflex,
+	'\u0176' : XK.XK_Ycircumflex,
+	'\u0177' : XK.XK_ycircumflex,
+	'\u0178' : XK.XK_Ydiaeresis,
+	'\u0179' : XK.XK_Zacute,
+	'\u017A' : XK.XK_zacute,
+	'\u017B' : XK.XK_Zabovedot,
+	'\u017C' : XK.XK_zabovedot,
+	'\u017D' : XK.XK_Zcaron,
+	'\u017E' : XK.XK_zcaron,
+	'\u018F' : XK.XK_SCHWA,
+	'\u019F' : XK.XK_Obarred,
+	'\u01A0' : XK.XK_Ohorn,
+	'\u01A1' : XK.XK_ohorn,
+	'\u01AF' : XK.XK_Uhorn,
+	'\u01B0' : XK.XK_uhorn,
+	'\u01B5' : XK.XK_Zstroke,
+	'\u01B6' : XK.XK_zstroke,
+	'\u01B7' : XK.XK_EZH,
+	'\u01D1' : XK.XK_Ocaron,
+	'\u01D2' : XK.XK_ocaron,
+	'\u01E6' : XK.XK_Gcaron,
+	'\u01E7' : XK.XK_gcaron,
+	'\u0259' : XK.XK_schwa,
+	'\u0275' : XK.XK_obarred,
+	'\u0292' : XK.XK_ezh,
+	'\u02C7' : XK.XK_caron,
+	'\u02D8' : XK.XK_breve,
+	'\u02D9' : XK.XK_abovedot,
+	'\u02DB' : XK.XK_ogonek,
+	'\u02DD' : XK.XK_doubleacute,
+	'\u0300' : XK.XK_combining_grave,
+	'\u0301' : XK.XK_combining_acute,
+	'\u0303' : XK.XK_combining_tilde,
+	'\u0309' : XK.XK_combining_hook,
+	'\u0323' : XK.XK_combining_belowdot,
+	'\u0385' : XK.XK_Greek_accentdieresis,
+	'\u0386' : XK.XK_Greek_ALPHAaccent,
+	'\u0388' : XK.XK_Greek_EPSILONaccent,
+	'\u0389' : XK.XK_Greek_ETAaccent,
+	'\u038A' : XK.XK_Greek_IOTAaccent,
+	'\u038C' : XK.XK_Greek_OMICRONaccent,
+	'\u038E' : XK.XK_Greek_UPSILONaccent,
+	'\u038F' : XK.XK_Greek_OMEGAaccent,
+	'\u0390' : XK.XK_Greek_iotaaccentdieresis,
+	'\u0391' : XK.XK_Greek_ALPHA,
+	'\u0392' : XK.XK_Greek_BETA,
+	'\u0393' : XK.XK_Greek_GAMMA,
+	'\u0394' : XK.XK_Greek_DELTA,
+	'\u0395' : XK.XK_Greek_EPSILON,
+	'\u0396' : XK.XK_Greek_ZETA,
+	'\u0397' : XK.XK_Greek_ETA,
+	'\u0398' : XK.XK_Greek_THETA,
+	'\u0399' : XK.XK_Greek_IOTA,
+	'\u039A' : XK.XK_Greek_KAPPA,
+	'\u039B' : XK.XK_Greek_LAMDA,
+	'\u039C' : XK.XK_Greek_MU,
+	'\u039D' : XK.XK_Greek_NU,
+	'\u039E' : XK.XK_Greek_XI,
+	'\u039F' : XK.XK_Greek_OMICRON,
+	'\u03A0' : XK.XK_Greek_PI,
+	'\u03A1' : XK.XK_Greek_RHO,
+	'\u03A3' : XK.XK_Greek_SIGMA,
+	'\u03A4' : XK.XK_Greek_TAU,
+	'\u03A5' : XK.XK_Greek_UPSILON,
+	'\u03A6' : XK.XK_Greek_PHI,
+	'\u03A7' : XK.XK_Greek_CHI,
+	'\u03A8' : XK.XK_Greek_PSI,
+	'\u03A9' : XK.XK_Greek_OMEGA,
+	'\u03AA' : XK.XK_Greek_IOTAdieresis,
+	'\u03AB' : XK.XK_Greek_UPSILONdieresis,
+	'\u03AC' : XK.XK_Greek_alphaaccent,
+	'\u03AD' : XK.XK_Greek_epsilonaccent,
+	'\u03AE' : XK.XK_Greek_etaaccent,
+	'\u03AF' : XK.XK_Greek_iotaaccent,
+	'\u03B0' : XK.XK_Greek_upsilonaccentdieresis,
+	'\u03B1' : XK.XK_Greek_alpha,
+	'\u03B2' : XK.XK_Greek_beta,
+	'\u03B3' : XK.XK_Greek_gamma,
+	'\u03B4' : XK.XK_Greek_delta,
+	'\u03B5' : XK.XK_Greek_epsilon,
+	'\u03B6' : XK.XK_Greek_zeta,
+	'\u03B7' : XK.XK_Greek_eta,
+	'\u03B8' : XK.XK_Greek_theta,
+	'\u03B9' : XK.XK_Greek_iota,
+	'\u03BA' : XK.XK_Greek_kappa,
+	'\u03BB' : XK.XK_Greek_lamda,
+	'\u03BC' : XK.XK_Greek_mu,
+	'\u03BD' : XK.XK_Greek_nu,
+	'\u03BE' : XK.XK_Greek_xi,
+	'\u03BF' : XK.XK_Greek_omicron,
+	'\u03C0' : XK.XK_Greek_pi,
+	'\u03C1' : XK.XK_Greek_rho,
+	'\u03C2' : XK.XK_Greek_finalsmallsigma,
+	'\u03C3' : XK.XK_Greek_sigma,
+	'\u03C4' : XK.XK_Greek_tau,
+	'\u03C5' : XK.XK_Greek_upsilon,
+	'\u03C6' : XK.XK_Greek_phi,
+	'\u03C7' : XK.XK_Greek_chi,
+	'\u03C8' : XK.XK_Greek_psi,
+	'\u03C9' : XK.XK_Greek_omega,
+	'\u03CA' : XK.XK_Greek_iotadieresis,
+	'\u03CB' : XK.XK_Greek_upsilondieresis,
+	'\u03CC' : XK.XK_Greek_omicronaccent,
+	'\u03CD' : XK.XK_Greek_upsilonaccent,
+	'\u03CE' : XK.XK_Greek_omegaaccent,
+	'\u0401' : XK.XK_Cyrillic_IO,
+	'\u0402' : XK.XK_Serbian_DJE,
+	'\u0403' : XK.XK_Macedonia_GJE,
+	'\u0404' : XK.XK_Ukrainian_IE,
+	'\u0405' : XK.XK_Macedonia_DSE,
+	'\u0406' : XK.XK_Ukrainian_I,
+	'\u0407' : XK.XK_Ukrainian_YI,
+	'\u0408' : XK.XK_Cyrillic_JE,
+	'\u0409' : XK.XK_Cyrillic_LJE,
+	'\u040A' : XK.XK_Cyrillic_NJE,
+	'\u040B' : XK.XK_Serbian_TSHE,
+	'\u040C' : XK.XK_Macedonia_KJE,
+	'\u040E' : XK.XK_Byelorussian_SHORTU,
+	'\u040F' : XK.XK_Cyrillic_DZHE,
+	'\u0410' : XK.XK_Cyrillic_A,
+	'\u0411' : XK.XK_Cyrillic_BE,
+	'\u0412' : XK.XK_Cyrillic_VE,
+	'\u0413' : XK.XK_Cyrillic_GHE,
+	'\u0414' : XK.XK_Cyrillic_DE,
+	'\u0415' : XK.XK_Cyrillic_IE,
+	'\u0416' : XK.XK_Cyrillic_ZHE,
+	'\u0417' : XK.XK_Cyrillic_ZE,
+	'\u0418' : XK.XK_Cyrillic_I,
+	'\u0419' : XK.XK_Cyrillic_SHORTI,
+	'\u041A' : XK.XK_Cyrillic_KA,
+	'\u041B' : XK.XK_Cyrillic_EL,
+	'\u041C' : XK.XK_Cyrillic_EM,
+	'\u041D' : XK.XK_Cyrillic_EN,
+	'\u041E' : XK.XK_Cyrillic_O,
+	'\u041F' : XK.XK_Cyrillic_PE,
+	'\u0420' : XK.XK_Cyrillic_ER,
+	'\u0421' : XK.XK_Cyrillic_ES,
+	'\u0422' : XK.XK_Cyrillic_TE,
+	'\u0423' : XK.XK_Cyrillic_U,
+	'\u0424' : XK.XK_Cyrillic_EF,
+	'\u0425' : XK.XK_Cyrillic_HA,
+	'\u0426' : XK.XK_Cyrillic_TSE,
+	'\u0427' : XK.XK_Cyrillic_CHE,
+	'\u0428' : XK.XK_Cyrillic_SHA,
+	'\u0429' : XK.XK_Cyrillic_SHCHA,
+	'\u042A' : XK.XK_Cyrillic_HARDSIGN,
+	'\u042B' : XK.XK_Cyrillic_YERU,
+	'\u042C' : XK.XK_Cyrillic_SOFTSIGN,
+	'\u042D' : XK.XK_Cyrillic_E,
+	'\u042E' : XK.XK_Cyrillic_YU,
+	'\u042F' : XK.XK_Cyrillic_YA,
+	'\u0430' : XK.XK_Cyrillic_a,
+	'\u0431' : XK.XK_Cyrillic_be,
+	'\u0432' : XK.XK_Cyrillic_ve,
+	'\u0433' : XK.XK_Cyrillic_ghe,
+	'\u0434' : XK.XK_Cyrillic_de,
+	'\u0435' : XK.XK_Cyrillic_ie,
+	'\u0436' : XK.XK_Cyrillic_zhe,
+	'\u0437' : XK.XK_Cyrillic_ze,
+	'\u0438' : XK.XK_Cyrillic_i,
+	'\u0439' : XK.XK_Cyrillic_shorti,
+	'\u043A' : XK.XK_Cyrillic_ka,
+	'\u043B' : XK.XK_Cyrillic_el,
+	'\u043C' : XK.XK_Cyrillic_em,
+	'\u043D' : XK.XK_Cyrillic_en,
+	'\u043E' : XK.XK_Cyrillic_o,
+	'\u043F' : XK.XK_Cyrillic_pe,
+	'\u0440' : XK.XK_Cyrillic_er,
+	'\u0441' : XK.XK_Cyrillic_es,
+	'\u0442' : XK.XK_Cyrillic_te,
+	'\u0443' : XK.XK_Cyrillic_u,
+	'\u0444' : XK.XK_Cyrillic_ef,
+	'\u0445' : XK.XK_Cyrillic_ha,
+	'\u0446' : XK.XK_Cyrillic_tse,
+	'\u0447' : XK.XK_Cyrillic_che,
+	'\u0448' : XK.XK_Cyrillic_sha,
+	'\u0449' : XK.XK_Cyrillic_shcha,
+	'\u044A' : XK.XK_Cyrillic_hardsign,
+	'\u044B' : XK.XK_Cyrillic_yeru,
+	'\u044C' : XK.XK_Cyrillic_softsign,
+	'\u044D' : XK.XK_Cyrillic_e,
+	'\u044E' : XK.XK_Cyrillic_yu,
+	'\u044F' : XK.XK_Cyrillic_ya,
+	'\u0451' : XK.XK_Cyrillic_io,
+	'\u0452' : XK.XK_Serbian_dje,
+	'\u0453' : XK.XK_Macedonia_gje,
+	'\u0454' : XK.XK_Ukrainian_ie,
+	'\u0455' : XK.XK_Macedonia_dse,
+	'\u0456' : XK.XK_Ukrainian_i,
+	'\u0457' : XK.XK_Ukrainian_yi,
+	'\u0458' : XK.XK_Cyrillic_je,
+	'\u0459' : XK.XK_Cyrillic_lje,
+	'\u045A' : XK.XK_Cyrillic_nje,
+	'\u045B' : XK.XK_Serbian_tshe,
+	'\u045C' : XK.XK_Macedonia_kje,
+	'\u045E' : XK.XK_Byelorussian_shortu,
+	'\u045F' : XK.XK_Cyrillic_dzhe,
+	'\u0490' : XK.XK_Ukrainian_GHE_WITH_UPTURN,
+	'\u0491' : XK.XK_Ukrainian_ghe_with_upturn,
+	'\u0492' : XK.XK_Cyrillic_GHE_bar,
+	'\u0493' : XK.XK_Cyrillic_ghe_bar,
+	'\u0496' : XK.XK_Cyrillic_ZHE_descender,
+	'\u0497' : XK.XK_Cyrillic_zhe_descender,
+	'\u049A' : XK.XK_Cyrillic_KA_descender,
+	'\u049B' : XK.XK_Cyrillic_ka_descender,
+	'\u049C' : XK.XK_Cyrillic_KA_vertstroke,
+	'\u049D' : XK.XK_Cyrillic_ka_vertstroke,
+	'\u04A2' : XK.XK_Cyrillic_EN_descender,
+	'\u04A3' : XK.XK_Cyrillic_en_descender,
+	'\u04AE' : XK.XK_Cyrillic_U_straight,
+	'\u04AF' : XK.XK_Cyrillic_u_straight,
+	'\u04B0' : XK.XK_Cyrillic_U_straight_bar,
+	'\u04B1' : XK.XK_Cyrillic_u_straight_bar,
+	'\u04B2' : XK.XK_Cyrillic_HA_descender,
+	'\u04B3' : XK.XK_Cyrillic_ha_descender,
+	'\u04B6' : XK.XK_Cyrillic_CHE_descender,
+	'\u04B7' : XK.XK_Cyrillic_che_descender,
+	'\u04B8' : XK.XK_Cyrillic_CHE_vertstroke,
+	'\u04B9' : XK.XK_Cyrillic_che_vertstroke,
+	'\u04BA' : XK.XK_Cyrillic_SHHA,
+	'\u04BB' : XK.XK_Cyrillic_shha,
+	'\u04D8' : XK.XK_Cyrillic_SCHWA,
+	'\u04D9' : XK.XK_Cyrillic_schwa,
+	'\u04E2' : XK.XK_Cyrillic_I_macron,
+	'\u04E3' : XK.XK_Cyrillic_i_macron,
+	'\u04E8' : XK.XK_Cyrillic_O_bar,
+	'\u04E9' : XK.XK_Cyrillic_o_bar,
+	'\u04EE' : XK.XK_Cyrillic_U_macron,
+	'\u04EF' : XK.XK_Cyrillic_u_macron,
+	'\u0531' : XK.XK_Armenian_AYB,
+	'\u0532' : XK.XK_Armenian_BEN,
+	'\u0533' : XK.XK_Armenian_GIM,
+	'\u0534' : XK.XK_Armenian_DA,
+	'\u0535' : XK.XK_Armenian_YECH,
+	'\u0536' : XK.XK_Armenian_ZA,
+	'\u0537' : XK.XK_Armenian_E,
+	'\u0538' : XK.XK_Armenian_AT,
+	'\u0539' : XK.XK_Armenian_TO,
+	'\u053A' : XK.XK_Armenian_ZHE,
+	'\u053B' : XK.XK_Armenian_INI,
+	'\u053C' : XK.XK_Armenian_LYUN,
+	'\u053D' : XK.XK_Armenian_KHE,
+	'\u053E' : XK.XK_Armenian_TSA,
+	'\u053F' : XK.XK_Armenian_KEN,
+	'\u0540' : XK.XK_Armenian_HO,
+	'\u0541' : XK.XK_Armenian_DZA,
+	'\u0542' : XK.XK_Armenian_GHAT,
+	'\u0543' : XK.XK_Armenian_TCHE,
+	'\u0544' : XK.XK_Armenian_MEN,
+	'\u0545' : XK.XK_Armenian_HI,
+	'\u0546' : XK.XK_Armenian_NU,
+	'\u0547' : XK.XK_Armenian_SHA,
+	'\u0548' : XK.XK_Armenian_VO,
+	'\u0549' : XK.XK_Armenian_CHA,
+	'\u054A' : XK.XK_Armenian_PE,
+	'\u054B' : XK.XK_Armenian_JE,
+	'\u054C' : XK.XK_Armenian_RA,
+	'\u054D' : XK.XK_Armenian_SE,
+	'\u054E' : XK.XK_Armenian_VEV,
+	'\u054F' : XK.XK_Armenian_TYUN,
+	'\u0550' : XK.XK_Armenian_RE,
+	'\u0551' : XK.XK_Armenian_TSO,
+	'\u0552' : XK.XK_Armenian_VYUN,
+	'\u0553' : XK.XK_Armenian_PYUR,
+	'\u0554' : XK.XK_Armenian_KE,
+	'\u0555' : XK.XK_Armenian_O,
+	'\u0556' : XK.XK_Armenian_FE,
+	'\u055A' : XK.XK_Armenian_apostrophe,
+	'\u055B' : XK.XK_Armenian_accent,
+	'\u055C' : XK.XK_Armenian_exclam,
+	'\u055D' : XK.XK_Armenian_separation_mark,
+	'\u055E' : XK.XK_Armenian_question,
+	'\u0561' : XK.XK_Armenian_ayb,
+	'\u0562' : XK.XK_Armenian_ben,
+	'\u0563' : XK.XK_Armenian_gim,
+	'\u0564' : XK.XK_Armenian_da,
+	'\u0565' : XK.XK_Armenian_yech,
+	'\u0566' : XK.XK_Armenian_za,
+	'\u0567' : XK.XK_Armenian_e,
+	'\u0568' : XK.XK_Armenian_at,
+	'\u0569' : XK.XK_Armenian_to,
+	'\u056A' : XK.XK_Armenian_zhe,
+	'\u056B' : XK.XK_Armenian_ini,
+	'\u056C' : XK.XK_Armenian_lyun,
+	'\u056D' : XK.XK_Armenian_khe,
+	'\u056E' : XK.XK_Armenian_tsa,
+	'\u056F' : XK.XK_Armenian_ken,
+	'\u0570' : XK.XK_Armenian_ho,
+	'\u0571' : XK.XK_Armenian_dza,
+	'\u0572' : XK.XK_Armenian_ghat,
+	'\u0573' : XK.XK_Armenian_tche,
+	'\u0574' : XK.XK_Armenian_men,
+	'\u0575' : XK.XK_Armenian_hi,
+	'\u0576' : XK.XK_Armenian_nu,
+	'\u0577' : XK.XK_Armenian_sha,
+	'\u0578' : XK.XK_Armenian_vo,
+	'\u0579' : XK.XK_Armenian_cha,
+	'\u057A' : XK.XK_Armenian_pe,
+	'\u057B' : XK.XK_Armenian_je,
+	'\u057C' : XK.XK_Armenian_ra,
+	'\u057D' : XK.XK_Armenian_se,
+	'\u057E' : XK.XK_Armenian_vev,
+	'\u057F' : XK.XK_Armenian_tyun,
+	'\u0580' : XK.XK_Armenian_re,
+	'\u0581' : XK.XK_Armenian_tso,
+	'\u0582' : XK.XK_Armenian_vyun,
+	'\u0583' : XK.XK_Armenian_pyur,
+	'\u0584' : XK.XK_Armenian_ke,
+	'\u0585' : XK.XK_Armenian_o,
+	'\u0586' : XK.XK_Armenian_fe,
+	'\u0587' : XK.XK_Armenian_ligature_ew,
+	'\u0589' : XK.XK_Armenian_full_stop,
+	'\u058A' : XK.XK_Armenian_hyphen,
+	'\u05D0' : XK.XK_hebrew_aleph,
+	'\u05D1' : XK.XK_hebrew_bet,
+	'\u05D2' : XK.XK_hebrew_gimel,
+	'\u05D3' : XK.XK_hebrew_dalet,
+	'\u05D4' : XK.XK_hebrew_he,
+	'\u05D5' : XK.XK_hebrew_waw,
+	'\u05D6' : XK.XK_hebrew_zain,
+	'\u05D7' : XK.XK_hebrew_chet,
+	'\u05D8' : XK.XK_hebrew_tet,
+	'\u05D9' : XK.XK_hebrew_yod,
+	'\u05DA' : XK.XK_hebrew_finalkaph,
+	'\u05DB' : XK.XK_hebrew_kaph,
+	'\u05DC' : XK.XK_hebrew_lamed,
+	'\u05DD' : XK.XK_hebrew_finalmem,
+	'\u05DE' : XK.XK_hebrew_mem,
+	'\u05DF' : XK.XK_hebrew_finalnun,
+	'\u05E0' : XK.XK_hebrew_nun,
+	'\u05E1' : XK.XK_hebrew_samech,
+	'\u05E2' : XK.XK_hebrew_ayin,
+	'\u05E3' : XK.XK_hebrew_finalpe,
+	'\u05E4' : XK.XK_hebrew_pe,
+	'\u05E5' : XK.XK_hebrew_finalzade,
+	'\u05E6' : XK.XK_hebrew_zade,
+	'\u05E7' : XK.XK_hebrew_qoph,
+	'\u05E8' : XK.XK_hebrew_resh,
+	'\u05E9' : XK.XK_hebrew_shin,
+	'\u05EA' : XK.XK_hebrew_taw,
+	'\u060C' : XK.XK_Arabic_comma,
+	'\u061B' : XK.XK_Arabic_semicolon,
+	'\u061F' : XK.XK_Arabic_question_mark,
+	'\u0621' : XK.XK_Arabic_hamza,
+	'\u0622' : XK.XK_Arabic_maddaonalef,
+	'\u0623' : XK.XK_Arabic_hamzaonalef,
+	'\u0624' : XK.XK_Arabic_hamzaonwaw,
+	'\u0625' : XK.XK_Arabic_hamzaunderalef,
+	'\u0626' : XK.XK_Arabic_hamzaonyeh,
+	'\u0627' : XK.XK_Arabic_alef,
+	'\u0628' : XK.XK_Arabic_beh,
+	'\u0629' : XK.XK_Arabic_tehmarbuta,
+	'\u062A' : XK.XK_Arabic_teh,
+	'\u062B' : XK.XK_Arabic_theh,
+	'\u062C' : XK.XK_Arabic_jeem,
+	'\u062D' : XK.XK_Arabic_hah,
+	'\u062E' : XK.XK_Arabic_khah,
+	'\u062F' : XK.XK_Arabic_dal,
+	'\u0630' : XK.XK_Arabic_thal,
+	'\u0631' : XK.XK_Arabic_ra,
+	'\u0632' : XK.XK_Arabic_zain,
+	'\u0633' : XK.XK_Arabic_seen,
+	'\u0634' : XK.XK_Arabic_sheen,
+	'\u0635' : XK.XK_Arabic_sad,
+	'\u0636' : XK.XK_Arabic_dad,
+	'\u0637' : XK.XK_Arabic_tah,
+	'\u0638' : XK.XK_Arabic_zah,
+	'\u0639' : XK.XK_Arabic_ain,
+	'\u063A' : XK.XK_Arabic_ghain,
+	'\u0640' : XK.XK_Arabic_tatweel,
+	'\u0641' : XK.XK_Arabic_feh,
+	'\u0642' : XK.XK_Arabic_qaf,
+	'\u0643' : XK.XK_Arabic_kaf,
+	'\u0644' : XK.XK_Arabic_lam,
+	'\u0645' : XK.XK_Arabic_meem,
+	'\u0646' : XK.XK_Arabic_noon,
+	'\u0647' : XK.XK_Arabic_ha,
+	'\u0648' : XK.XK_Arabic_waw,
+	'\u0649' : XK.XK_Arabic_alefmaksura,
+	'\u064A' : XK.XK_Arabic_yeh,
+	'\u064B' : XK.XK_Arabic_fathatan,
+	'\u064C' : XK.XK_Arabic_dammatan,
+	'\u064D' : XK.XK_Arabic_kasratan,
+	'\u064E' : XK.XK_Arabic_fatha,
+	'\u064F' : XK.XK_Arabic_damma,
+	'\u0650' : XK.XK_Arabic_kasra,
+	'\u0651' : XK.XK_Arabic_shadda,
+	'\u0652' : XK.XK_Arabic_sukun,
+	'\u0653' : XK.XK_Arabic_madda_above,
+	'\u0654' : XK.XK_Arabic_hamza_above,
+	'\u0655' : XK.XK_Arabic_hamza_below,
+	'\u0660' : XK.XK_Arabic_0,
+	'\u0661' : XK.XK_Arabic_1,
+	'\u0662' : XK.XK_Arabic_2,
+	'\u0663' : XK.XK_Arabic_3,
+	'\u0664' : XK.XK_Arabic_4,
+	'\u0665' : XK.XK_Arabic_5,
+	'\u0666' : XK.XK_Arabic_6,
+	'\u0667' : XK.XK_Arabic_7,
+	'\u0668' : XK.XK_Arabic_8,
+	'\u0669' : XK.XK_Arabic_9,
+	'\u066A' : XK.XK_Arabic_percent,
+	'\u0670' : XK.XK_Arabic_superscript_alef,
+	'\u0679' : XK.XK_Arabic_tteh,
+	'\u067E' : XK.XK_Arabic_peh,
+	'\u0686' : XK.XK_Arabic_tcheh,
+	'\u0688' : XK.XK_Arabic_ddal,
+	'\u0691' : XK.XK_Arabic_rreh,
+	'\u0698' : XK.XK_Arabic_jeh,
+	'\u06A4' : XK.XK_Arabic_veh,
+	'\u06A9' : XK.XK_Arabic_keheh,
+	'\u06AF' : XK.XK_Arabic_gaf,
+	'\u06BA' : XK.XK_Arabic_noon_ghunna,
+	'\u06BE' : XK.XK_Arabic_heh_doachashmee,
+	'\u06C1' : XK.XK_Arabic_heh_goal,
+	'\u06CC' : XK.XK_Farsi_yeh,
+	'\u06D2' : XK.XK_Arabic_yeh_baree,
+	'\u06D4' : XK.XK_Arabic_fullstop,
+	'\u06F0' : XK.XK_Farsi_0,
+	'\u06F1' : XK.XK_Farsi_1,
+	'\u06F2' : XK.XK_Farsi_2,
+	'\u06F3' : XK.XK_Farsi_3,
+	'\u06F4' : XK.XK_Farsi_4,
+	'\u06F5' : XK.XK_Farsi_5,
+	'\u06F6' : XK.XK_Farsi_6,
+	'\u06F7' : XK.XK_Farsi_7,
+	'\u06F8' : XK.XK_Farsi_8,
+	'\u06F9' : XK.XK_Farsi_9,
+	'\u0D82' : XK.XK_Sinh_ng,
+	'\u0D83' : XK.XK_Sinh_h2,
+	'\u0D85' : XK.XK_Sinh_a,
+	'\u0D86' : XK.XK_Sinh_aa,
+	'\u0D87' : XK.XK_Sinh_ae,
+	'\u0D88' : XK.XK_Sinh_aee,
+	'\u0D89' : XK.XK_Sinh_i,
+	'\u0D8A' : XK.XK_Sinh_ii,
+	'\u0D8B' : XK.XK_Sinh_u,
+	'\u0D8C' : XK.XK_Sinh_uu,
+	'\u0D8D' : XK.XK_Sinh_ri,
+	'\u0D8E' : XK.XK_Sinh_rii,
+	'\u0D8F' : XK.XK_Sinh_lu,
+	'\u0D90' : XK.XK_Sinh_luu,
+	'\u0D91' : XK.XK_Sinh_e,
+	'\u0D92' : XK.XK_Sinh_ee,
+	'\u0D93' : XK.XK_Sinh_ai,
+	'\u0D94' : XK.XK_Sinh_o,
+	'\u0D95' : XK.XK_Sinh_oo,
+	'\u0D96' : XK.XK_Sinh_au,
+	'\u0D9A' : XK.XK_Sinh_ka,
+	'\u0D9B' : XK.XK_Sinh_kha,
+	'\u0D9C' : XK.XK_Sinh_ga,
+	'\u0D9D' : XK.XK_Sinh_gha,
+	'\u0D9E' : XK.XK_Sinh_ng2,
+	'\u0D9F' : XK.XK_Sinh_nga,
+	'\u0DA0' : XK.XK_Sinh_ca,
+	'\u0DA1' : XK.XK_Sinh_cha,
+	'\u0DA2' : XK.XK_Sinh_ja,
+	'\u0DA3' : XK.XK_Sinh_jha,
+	'\u0DA4' : XK.XK_Sinh_nya,
+	'\u0DA5' : XK.XK_Sinh_jnya,
+	'\u0DA6' : XK.XK_Sinh_nja,
+	'\u0DA7' : XK.XK_Sinh_tta,
+	'\u0DA8' : XK.XK_Sinh_ttha,
+	'\u0DA9' : XK.XK_Sinh_dda,
+	'\u0DAA' : XK.XK_Sinh_ddha,
+	'\u0DAB' : XK.XK_Sinh_nna,
+	'\u0DAC' : XK.XK_Sinh_ndda,
+	'\u0DAD' : XK.XK_Sinh_tha,
+	'\u0DAE' : XK.XK_Sinh_thha,
+	'\u0DAF' : XK.XK_Sinh_dha,
+	'\u0DB0' : XK.XK_Sinh_dhha,
+	'\u0DB1' : XK.XK_Sinh_na,
+	'\u0DB3' : XK.XK_Sinh_ndha,
+	'\u0DB4' : XK.XK_Sinh_pa,
+	'\u0DB5' : XK.XK_Sinh_pha,
+	'\u0DB6' : XK.XK_Sinh_ba,
+	'\u0DB7' : XK.XK_Sinh_bha,
+	'\u0DB8' : XK.XK_Sinh_ma,
+	'\u0DB9' : XK.XK_Sinh_mba,
+	'\u0DBA' : XK.XK_Sinh_ya,
+	'\u0DBB' : XK.XK_Sinh_ra,
+	'\u0DBD' : XK.XK_Sinh_la,
+	'\u0DC0' : XK.XK_Sinh_va,
+	'\u0DC1' : XK.XK_Sinh_sha,
+	'\u0DC2' : XK.XK_Sinh_ssha,
+	'\u0DC3' : XK.XK_Sinh_sa,
+	'\u0DC4' : XK.XK_Sinh_ha,
+	'\u0DC5' : XK.XK_Sinh_lla,
+	'\u0DC6' : XK.XK_Sinh_fa,
+	'\u0DCA' : XK.XK_Sinh_al,
+	'\u0DCF' : XK.XK_Sinh_aa2,
+	'\u0DD0' : XK.XK_Sinh_ae2,
+	'\u0DD1' : XK.XK_Sinh_aee2,
+	'\u0DD2' : XK.XK_Sinh_i2,
+	'\u0DD3' : XK.XK_Sinh_ii2,
+	'\u0DD4' : XK.XK_Sinh_u2,
+	'\u0DD6' : XK.XK_Sinh_uu2,
+	'\u0DD8' : XK.XK_Sinh_ru2,
+	'\u0DD9' : XK.XK_Sinh_e2,
+	'\u0DDA' : XK.XK_Sinh_ee2,
+	'\u0DDB' : XK.XK_Sinh_ai2,
+	'\u0DDC' : XK.XK_Sinh_o2,
+	'\u0DDD' : XK.XK_Sinh_oo2,
+	'\u0DDE' : XK.XK_Sinh_au2,
+	'\u0DDF' : XK.XK_Sinh_lu2,
+	'\u0DF2' : XK.XK_Sinh_ruu2,
+	'\u0DF3' : XK.XK_Sinh_luu2,
+	'\u0DF4' : XK.XK_Sinh_kunddaliya,
+	'\u0E01' : XK.XK_Thai_kokai,
+	'\u0E02' : XK.XK_Thai_khokhai,
+	'\u0E03' : XK.XK_Thai_khokhuat,
+	'\u0E04' : XK.XK_Thai_khokhwai,
+	'\u0E05' : XK.XK_Thai_khokhon,
+	'\u0E06' : XK.XK_Thai_khorakhang,
+	'\u0E07' : XK.XK_Thai_ngongu,
+	'\u0E08' : XK.XK_Thai_chochan,
+	'\u0E09' : XK.XK_Thai_choching,
+	'\u0E0A' : XK.XK_Thai_chochang,
+	'\u0E0B' : XK.XK_Thai_soso,
+	'\u0E0C' : XK.XK_Thai_chochoe,
+	'\u0E0D' : XK.XK_Thai_yoying,
+	'\u0E0E' : XK.XK_Thai_dochada,
+	'\u0E0F' : XK.XK_Thai_topatak,
+	'\u0E10' : XK.XK_Thai_thothan,
+	'\u0E11' : XK.XK_Thai_thonangmontho,
+	'\u0E12' : XK.XK_Thai_thophuthao,
+	'\u0E13' : XK.XK_Thai_nonen,
+	'\u0E14' : XK.XK_Thai_dodek,
+	'\u0E15' : XK.XK_Thai_totao,
+	'\u0E16' : XK.XK_Thai_thothung,
+	'\u0E17' : XK.XK_Thai_thothahan,
+	'\u0E18' : XK.XK_Thai_thothong,
+	'\u0E19' : XK.XK_Thai_nonu,
+	'\u0E1A' : XK.XK_Thai_bobaimai,
+	'\u0E1B' : XK.XK_Thai_popla,
+	'\u0E1C' : XK.XK_Thai_phophung,
+	'\u0E1D' : XK.XK_Thai_fofa,
+	'\u0E1E' : XK.XK_Thai_phophan,
+	'\u0E1F' : XK.XK_Thai_fofan,
+	'\u0E20' : XK.XK_Thai_phosamphao,
+	'\u0E21' : XK.XK_Thai_moma,
+	'\u0E22' : XK.XK_Thai_yoyak,
+	'\u0E23' : XK.XK_Thai_rorua,
+	'\u0E24' : XK.XK_Thai_ru,
+	'\u0E25' : XK.XK_Thai_loling,
+	'\u0E26' : XK.XK_Thai_lu,
+	'\u0E27' : XK.XK_Thai_wowaen,
+	'\u0E28' : XK.XK_Thai_sosala,
+	'\u0E29' : XK.XK_Thai_sorusi,
+	'\u0E2A' : XK.XK_Thai_sosua,
+	'\u0E2B' : XK.XK_Thai_hohip,
+	'\u0E2C' : XK.XK_Thai_lochula,
+	'\u0E2D' : XK.XK_Thai_oang,
+	'\u0E2E' : XK.XK_Thai_honokhuk,
+	'\u0E2F' : XK.XK_Thai_paiyannoi,
+	'\u0E30' : XK.XK_Thai_saraa,
+	'\u0E31' : XK.XK_Thai_maihanakat,
+	'\u0E32' : XK.XK_Thai_saraaa,
+	'\u0E33' : XK.XK_Thai_saraam,
+	'\u0E34' : XK.XK_Thai_sarai,
+	'\u0E35' : XK.XK_Thai_saraii,
+	'\u0E36' : XK.XK_Thai_saraue,
+	'\u0E37' : XK.XK_Thai_sarauee,
+	'\u0E38' : XK.XK_Thai_sarau,
+	'\u0E39' : XK.XK_Thai_sarauu,
+	'\u0E3A' : XK.XK_Thai_phinthu,
+	'\u0E3F' : XK.XK_Thai_baht,
+	'\u0E40' : XK.XK_Thai_sarae,
+	'\u0E41' : XK.XK_Thai_saraae,
+	'\u0E42' : XK.XK_Thai_sarao,
+	'\u0E43' : XK.XK_Thai_saraaimaimuan,
+	'\u0E44' : XK.XK_Thai_saraaimaimalai,
+	'\u0E45' : XK.XK_Thai_lakkhangyao,
+	'\u0E46' : XK.XK_Thai_maiyamok,
+	'\u0E47' : XK.XK_Thai_maitaikhu,
+	'\u0E48' : XK.XK_Thai_maiek,
+	'\u0E49' : XK.XK_Thai_maitho,
+	'\u0E4A' : XK.XK_Thai_maitri,
+	'\u0E4B' : XK.XK_Thai_maichattawa,
+	'\u0E4C' : XK.XK_Thai_thanthakhat,
+	'\u0E4D' : XK.XK_Thai_nikhahit,
+	'\u0E50' : XK.XK_Thai_leksun,
+	'\u0E51' : XK.XK_Thai_leknung,
+	'\u0E52' : XK.XK_Thai_leksong,
+	'\u0E53' : XK.XK_Thai_leksam,
+	'\u0E54' : XK.XK_Thai_leksi,
+	'\u0E55' : XK.XK_Thai_lekha,
+	'\u0E56' : XK.XK_Thai_lekhok,
+	'\u0E57' : XK.XK_Thai_lekchet,
+	'\u0E58' : XK.XK_Thai_lekpaet,
+	'\u0E59' : XK.XK_Thai_lekkao,
+	'\u10D0' : XK.XK_Georgian_an,
+	'\u10D1' : XK.XK_Georgian_ban,
+	'\u10D2' : XK.XK_Georgian_gan,
+	'\u10D3' : XK.XK_Georgian_don,
+	'\u10D4' : XK.XK_Georgian_en,
+	'\u10D5' : XK.XK_Georgian_vin,
+	'\u10D6' : XK.XK_Georgian_zen,
+	'\u10D7' : XK.XK_Georgian_tan,
+	'\u10D8' : XK.XK_Georgian_in,
+	'\u10D9' : XK.XK_Georgian_kan,
+	'\u10DA' : XK.XK_Georgian_las,
+	'\u10DB' : XK.XK_Georgian_man,
+	'\u10DC' : XK.XK_Georgian_nar,
+	'\u10DD' : XK.XK_Georgian_on,
+	'\u10DE' : XK.XK_Georgian_par,
+	'\u10DF' : XK.XK_Georgian_zhar,
+	'\u10E0' : XK.XK_Georgian_rae,
+	'\u10E1' : XK.XK_Georgian_san,
+	'\u10E2' : XK.XK_Georgian_tar,
+	'\u10E3' : XK.XK_Georgian_un,
+	'\u10E4' : XK.XK_Georgian_phar,
+	'\u10E5' : XK.XK_Georgian_khar,
+	'\u10E6' : XK.XK_Georgian_ghan,
+	'\u10E7' : XK.XK_Georgian_qar,
+	'\u10E8' : XK.XK_Georgian_shin,
+	'\u10E9' : XK.XK_Georgian_chin,
+	'\u10EA' : XK.XK_Georgian_can,
+	'\u10EB' : XK.XK_Georgian_jil,
+	'\u10EC' : XK.XK_Georgian_cil,
+	'\u10ED' : XK.XK_Georgian_char,
+	'\u10EE' : XK.XK_Georgian_xan,
+	'\u10EF' : XK.XK_Georgian_jhan,
+	'\u10F0' : XK.XK_Georgian_hae,
+	'\u10F1' : XK.XK_Georgian_he,
+	'\u10F2' : XK.XK_Georgian_hie,
+	'\u10F3' : XK.XK_Georgian_we,
+	'\u10F4' : XK.XK_Georgian_har,
+	'\u10F5' : XK.XK_Georgian_hoe,
+	'\u10F6' : XK.XK_Georgian_fi,
+	'\u11A8' : XK.XK_Hangul_J_Kiyeog,
+	'\u11A9' : XK.XK_Hangul_J_SsangKiyeog,
+	'\u11AA' : XK.XK_Hangul_J_KiyeogSios,
+	'\u11AB' : XK.XK_Hangul_J_Nieun,
+	'\u11AC' : XK.XK_Hangul_J_NieunJieuj,
+	'\u11AD' : XK.XK_Hangul_J_NieunHieuh,
+	'\u11AE' : XK.XK_Hangul_J_Dikeud,
+	'\u11AF' : XK.XK_Hangul_J_Rieul,
+	'\u11B0' : XK.XK_Hangul_J_RieulKiyeog,
+	'\u11B1' : XK.XK_Hangul_J_RieulMieum,
+	'\u11B2' : XK.XK_Hangul_J_RieulPieub,
+	'\u11B3' : XK.XK_Hangul_J_RieulSios,
+	'\u11B4' : XK.XK_Hangul_J_RieulTieut,
+	'\u11B5' : XK.XK_Hangul_J_RieulPhieuf,
+	'\u11B6' : XK.XK_Hangul_J_RieulHieuh,
+	'\u11B7' : XK.XK_Hangul_J_Mieum,
+	'\u11B8' : XK.XK_Hangul_J_Pieub,
+	'\u11B9' : XK.XK_Hangul_J_PieubSios,
+	'\u11BA' : XK.XK_Hangul_J_Sios,
+	'\u11BB' : XK.XK_Hangul_J_SsangSios,
+	'\u11BC' : XK.XK_Hangul_J_Ieung,
+	'\u11BD' : XK.XK_Hangul_J_Jieuj,
+	'\u11BE' : XK.XK_Hangul_J_Cieuc,
+	'\u11BF' : XK.XK_Hangul_J_Khieuq,
+	'\u11C0' : XK.XK_Hangul_J_Tieut,
+	'\u11C1' : XK.XK_Hangul_J_Phieuf,
+	'\u11C2' : XK.XK_Hangul_J_Hieuh,
+	'\u11EB' : XK.XK_Hangul_J_PanSios,
+	'\u11F0' : XK.XK_Hangul_J_KkogjiDalrinIeung,
+	'\u11F9' : XK.XK_Hangul_J_YeorinHieuh,
+	'\u1E02' : XK.XK_Babovedot,
+	'\u1E03' : XK.XK_babovedot,
+	'\u1E0A' : XK.XK_Dabovedot,
+	'\u1E0B' : XK.XK_dabovedot,
+	'\u1E1E' : XK.XK_Fabovedot,
+	'\u1E1F' : XK.XK_fabovedot,
+	'\u1E36' : XK.XK_Lbelowdot,
+	'\u1E37' : XK.XK_lbelowdot,
+	'\u1E40' : XK.XK_Mabovedot,
+	'\u1E41' : XK.XK_mabovedot,
+	'\u1E56' : XK.XK_Pabovedot,
+	'\u1E57' : XK.XK_pabovedot,
+	'\u1E60' : XK.XK_Sabovedot,
+	'\u1E61' : XK.XK_sabovedot,
+	'\u1E6A' : XK.XK_Tabovedot,
+	'\u1E6B' : XK.XK_tabovedot,
+	'\u1E80' : XK.XK_Wgrave,
+	'\u1E81' : XK.XK_wgrave,
+	'\u1E82' : XK.XK_Wacute,
+	'\u1E83' : XK.XK_wacute,
+	'\u1E84' : XK.XK_Wdiaeresis,
+	'\u1E85' : XK.XK_wdiaeresis,
+	'\u1E8A' : XK.XK_Xabovedot,
+	'\u1E8B' : XK.XK_xabovedot,
+	'\u1EA0' : XK.XK_Abelowdot,
+	'\u1EA1' : XK.XK_abelowdot,
+	'\u1EA2' : XK.XK_Ahook,
+	'\u1EA3' : XK.XK_ahook,
+	'\u1EA4' : XK.XK_Acircumflexacute,
+	'\u1EA5' : XK.XK_acircumflexacute,
+	'\u1EA6' : XK.XK_Acircumflexgrave,
+	'\u1EA7' : XK.XK_acircumflexgrave,
+	'\u1EA8' : XK.XK_Acircumflexhook,
+	'\u1EA9' : XK.XK_acircumflexhook,
+	'\u1EAA' : XK.XK_Acircumflextilde,
+	'\u1EAB' : XK.XK_acircumflextilde,
+	'\u1EAC' : XK.XK_Acircumflexbelowdot,
+	'\u1EAD' : XK.XK_acircumflexbelowdot,
+	'\u1EAE' : XK.XK_Abreveacute,
+	'\u1EAF' : XK.XK_abreveacute,
+	'\u1EB0' : XK.XK_Abrevegrave,
+	'\u1EB1' : XK.XK_abrevegrave,
+	'\u1EB2' : XK.XK_Abrevehook,
+	'\u1EB3' : XK.XK_abrevehook,
+	'\u1EB4' : XK.XK_Abrevetilde,
+	'\u1EB5' : XK.XK_abrevetilde,
+	'\u1EB6' : XK.XK_Abrevebelowdot,
+	'\u1EB7' : XK.XK_abrevebelowdot,
+	'\u1EB8' : XK.XK_Ebelowdot,
+	'\u1EB9' : XK.XK_ebelowdot,
+	'\u1EBA' : XK.XK_Ehook,
+	'\u1EBB' : XK.XK_ehook,
+	'\u1EBC' : XK.XK_Etilde,
+	'\u1EBD' : XK.XK_etilde,
+	'\u1EBE' : XK.XK_Ecircumflexacute,
+	'\u1EBF' : XK.XK_ecircumflexacute,
+	'\u1EC0' : XK.XK_Ecircumflexgrave,
+	'\u1EC1' : XK.XK_ecircumflexgrave,
+	'\u1EC2' : XK.XK_Ecircumflexhook,
+	'\u1EC3' : XK.XK_ecircumflexhook,
+	'\u1EC4' : XK.XK_Ecircumflextilde,
+	'\u1EC5' : XK.XK_ecircumflextilde,
+	'\u1EC6' : XK.XK_Ecircumflexbelowdot,
+	'\u1EC7' : XK.XK_ecircumflexbelowdot,
+	'\u1EC8' : XK.XK_Ihook,
+	'\u1EC9' : XK.XK_ihook,
+	'\u1ECA' : XK.XK_Ibelowdot,
+	'\u1ECB' : XK.XK_ibelowdot,
+	'\u1ECC' : XK.XK_Obelowdot,
+	'\u1ECD' : XK.XK_obelowdot,
+	'\u1ECE' : XK.XK_Ohook,
+	'\u1ECF' : XK.XK_ohook,
+	'\u1ED0' : XK.XK_Ocircumflexacute,
+	'\u1ED1' : XK.XK_ocircumflexacute,
+	'\u1ED2' : XK.XK_Ocircumflexgrave,
+	'\u1ED3' : XK.XK_ocircumflexgrave,
+	'\u1ED4' : XK.XK_Ocircumflexhook,
+	'\u1ED5' : XK.XK_ocircumflexhook,
+	'\u1ED6' : XK.XK_Ocircumflextilde,
+	'\u1ED7' : XK.XK_ocircumflextilde,
+	'\u1ED8' : XK.XK_Ocircumflexbelowdot,
+	'\u1ED9' : XK.XK_ocircumflexbelowdot,
+	'\u1EDA' : XK.XK_Ohornacute,
+	'\u1EDB' : XK.XK_ohornacute,
+	'\u1EDC' : XK.XK_Ohorngrave,
+	'\u1EDD' : XK.XK_ohorngrave,
+	'\u1EDE' : XK.XK_Ohornhook,
+	'\u1EDF' : XK.XK_ohornhook,
+	'\u1EE0' : XK.XK_Ohorntilde,
+	'\u1EE1' : XK.XK_ohorntilde,
+	'\u1EE2' : XK.XK_Ohornbelowdot,
+	'\u1EE3' : XK.XK_ohornbelowdot,
+	'\u1EE4' : XK.XK_Ubelowdot,
+	'\u1EE5' : XK.XK_ubelowdot,
+	'\u1EE6' : XK.XK_Uhook,
+	'\u1EE7' : XK.XK_uhook,
+	'\u1EE8' : XK.XK_Uhornacute,
+	'\u1EE9' : XK.XK_uhornacute,
+	'\u1EEA' : XK.XK_Uhorngrave,
+	'\u1EEB' : XK.XK_uhorngrave,
+	'\u1EEC' : XK.XK_Uhornhook,
+	'\u1EED' : XK.XK_uhornhook,
+	'\u1EEE' : XK.XK_Uhorntilde,
+	'\u1EEF' : XK.XK_uhorntilde,
+	'\u1EF0' : XK.XK_Uhornbelowdot,
+	'\u1EF1' : XK.XK_uhornbelowdot,
+	'\u1EF2' : XK.XK_Ygrave,
+	'\u1EF3' : XK.XK_ygrave,
+	'\u1EF4' : XK.XK_Ybelowdot,
+	'\u1EF5' : XK.XK_ybelowdot,
+	'\u1EF6' : XK.XK_Yhook,
+	'\u1EF7' : XK.XK_yhook,
+	'\u1EF8' : XK.XK_Ytilde,
+	'\u1EF9' : XK.XK_ytilde,
+	'\u2002' : XK.XK_enspace,
+	'\u2003' : XK.XK_emspace,
+	'\u2004' : XK.XK_em3space,
+	'\u2005' : XK.XK_em4space,
+	'\u2007' : XK.XK_digitspace,
+	'\u2008' : XK.XK_punctspace,
+	'\u2009' : XK.XK_thinspace,
+	'\u200A' : XK.XK_hairspace,
+	'\u2012' : XK.XK_figdash,
+	'\u2013' : XK.XK_endash,
+	'\u2014' : XK.XK_emdash,
+	'\u2015' : XK.XK_Greek_horizbar,
+	'\u2017' : XK.XK_hebrew_doublelowline,
+	'\u2018' : XK.XK_leftsinglequotemark,
+	'\u2019' : XK.XK_rightsinglequotemark,
+	'\u201A' : XK.XK_singlelowquotemark,
+	'\u201C' : XK.XK_leftdoublequotemark,
+	'\u201D' : XK.XK_rightdoublequotemark,
+	'\u201E' : XK.XK_doublelowquotemark,
+	'\u2020' : XK.XK_dagger,
+	'\u2021' : XK.XK_doubledagger,
+	'\u2022' : XK.XK_enfilledcircbullet,
+	'\u2025' : XK.XK_doubbaselinedot,
+	'\u2026' : XK.XK_ellipsis,
+	'\u2030' : XK.XK_permille,
+	'\u2032' : XK.XK_minutes,
+	'\u2033' : XK.XK_seconds,
+	'\u2038' : XK.XK_caret,
+	'\u203E' : XK.XK_overline,
+	'\u2070' : XK.XK_zerosuperior,
+	'\u2074' : XK.XK_foursuperior,
+	'\u2075' : XK.XK_fivesuperior,
+	'\u2076' : XK.XK_sixsuperior,
+	'\u2077' : XK.XK_sevensuperior,
+	'\u2078' : XK.XK_eightsuperior,
+	'\u2079' : XK.XK_ninesuperior,
+	'\u2080' : XK.XK_zerosubscript,
+	'\u2081' : XK.XK_onesubscript,
+	'\u2082' : XK.XK_twosubscript,
+	'\u2083' : XK.XK_threesubscript,
+	'\u2084' : XK.XK_foursubscript,
+	'\u2085' : XK.XK_fivesubscript,
+	'\u2086' : XK.XK_sixsubscript,
+	'\u2087' : XK.XK_sevensubscript,
+	'\u2088' : XK.XK_eightsubscript,
+	'\u2089' : XK.XK_ninesubscript,
+	'\u20A0' : XK.XK_EcuSign,
+	'\u20A1' : XK.XK_ColonSign,
+	'\u20A2' : XK.XK_CruzeiroSign,
+	'\u20A3' : XK.XK_FFrancSign,
+	'\u20A4' : XK.XK_LiraSign,
+	'\u20A5' : XK.XK_MillSign,
+	'\u20A6' : XK.XK_NairaSign,
+	'\u20A7' : XK.XK_PesetaSign,
+	'\u20A8' : XK.XK_RupeeSign,
+	'\u20A9' : XK.XK_Korean_Won,
+	'\u20AA' : XK.XK_NewSheqelSign,
+	'\u20AB' : XK.XK_DongSign,
+	'\u20AC' : XK.XK_EuroSign,
+	'\u2105' : XK.XK_careof,
+	'\u2116' : XK.XK_numerosign,
+	'\u2117' : XK.XK_phonographcopyright,
+	'\u211E' : XK.XK_prescription,
+	'\u2122' : XK.XK_trademark,
+	'\u2153' : XK.XK_onethird,
+	'\u2154' : XK.XK_twothirds,
+	'\u2155' : XK.XK_onefifth,
+	'\u2156' : XK.XK_twofifths,
+	'\u2157' : XK.XK_threefifths,
+	'\u2158' : XK.XK_fourfifths,
+	'\u2159' : XK.XK_onesixth,
+	'\u215A' : XK.XK_fivesixths,
+	'\u215B' : XK.XK_oneeighth,
+	'\u215C' : XK.XK_threeeighths,
+	'\u215D' : XK.XK_fiveeighths,
+	'\u215E' : XK.XK_seveneighths,
+	'\u2202' : XK.XK_partdifferential,
+	'\u2205' : XK.XK_emptyset,
+	'\u2208' : XK.XK_elementof,
+	'\u2209' : XK.XK_notelementof,
+	'\u220B' : XK.XK_containsas,
+	'\u221A' : XK.XK_squareroot,
+	'\u221B' : XK.XK_cuberoot,
+	'\u221C' : XK.XK_fourthroot,
+	'\u222C' : XK.XK_dintegral,
+	'\u222D' : XK.XK_tintegral,
+	'\u2235' : XK.XK_because,
+	'\u2247' : XK.XK_notapproxeq,
+	'\u2248' : XK.XK_approxeq,
+	'\u2262' : XK.XK_notidentical,
+	'\u2263' : XK.XK_stricteq,
+	'\u2315' : XK.XK_telephonerecorder,
+	'\u2329' : XK.XK_leftanglebracket,
+	'\u232A' : XK.XK_rightanglebracket,
+	'\u2423' : XK.XK_signifblank,
+	'\u25AA' : XK.XK_enfilledsqbullet,
+	'\u25AB' : XK.XK_enopensquarebullet,
+	'\u25AC' : XK.XK_filledrectbullet,
+	'\u25AD' : XK.XK_openrectbullet,
+	'\u25AE' : XK.XK_emfilledrect,
+	'\u25AF' : XK.XK_emopenrectangle,
+	'\u25B2' : XK.XK_filledtribulletup,
+	'\u25B3' : XK.XK_opentribulletup,
+	'\u25B6' : XK.XK_filledrighttribullet,
+	'\u25B7' : XK.XK_rightopentriangle,
+	'\u25BC' : XK.XK_filledtribulletdown,
+	'\u25BD' : XK.XK_opentribulletdown,
+	'\u25C0' : XK.XK_filledlefttribullet,
+	'\u25C1' : XK.XK_leftopentriangle,
+	'\u25CB' : XK.XK_emopencircle,
+	'\u25CF' : XK.XK_emfilledcircle,
+	'\u25E6' : XK.XK_enopencircbullet,
+	'\u2606' : XK.XK_openstar,
+	'\u260E' : XK.XK_telephone,
+	'\u2613' : XK.XK_signaturemark,
+	'\u261C' : XK.XK_leftpointer,
+	'\u261E' : XK.XK_rightpointer,
+	'\u2640' : XK.XK_femalesymbol,
+	'\u2642' : XK.XK_malesymbol,
+	'\u2663' : XK.XK_club,
+	'\u2665' : XK.XK_heart,
+	'\u2666' : XK.XK_diamond,
+	'\u266D' : XK.XK_musicalflat,
+	'\u266F' : XK.XK_musicalsharp,
+	'\u2713' : XK.XK_checkmark,
+	'\u2717' : XK.XK_ballotcross,
+	'\u271D' : XK.XK_latincross,
+	'\u2720' : XK.XK_maltesecross,
+	'\u3001' : XK.XK_kana_comma,
+	'\u3002' : XK.XK_kana_fullstop,
+	'\u300C' : XK.XK_kana_openingbracket,
+	'\u300D' : XK.XK_kana_closingbracket,
+	'\u309B' : XK.XK_voicedsound,
+	'\u309C' : XK.XK_semivoicedsound,
+	'\u30A1' : XK.XK_kana_a,
+	'\u30A2' : XK.XK_kana_A,
+	'\u30A3' : XK.XK_kana_i,
+	'\u30A4' : XK.XK_kana_I,
+	'\u30A5' : XK.XK_kana_u,
+	'\u30A6' : XK.XK_kana_U,
+	'\u30A7' : XK.XK_kana_e,
+	'\u30A8' : XK.XK_kana_E,
+	'\u30A9' : XK.XK_kana_o,
+	'\u30AA' : XK.XK_kana_O,
+	'\u30AB' : XK.XK_kana_KA,
+	'\u30AD' : XK.XK_kana_KI,
+	'\u30AF' : XK.XK_kana_KU,
+	'\u30B1' : XK.XK_kana_KE,
+	'\u30B3' : XK.XK_kana_KO,
+	'\u30B5' : XK.XK_kana_SA,
+	'\u30B7' : XK.XK_kana_SHI,
+	'\u30B9' : XK.XK_kana_SU,
+	'\u30BB' : XK.XK_kana_SE,
+	'\u30BD' : XK.XK_kana_SO,
+	'\u30BF' : XK.XK_kana_TA,
+	'\u30C1' : XK.XK_kana_CHI,
+	'\u30C3' : XK.XK_kana_tsu,
+	'\u30C4' : XK.XK_kana_TSU,
+	'\u30C6' : XK.XK_kana_TE,
+	'\u30C8' : XK.XK_kana_TO,
+	'\u30CA' : XK.XK_kana_NA,
+	'\u30CB' : XK.XK_kana_NI,
+	'\u30CC' : XK.XK_kana_NU,
+	'\u30CD' : XK.XK_kana_NE,
+	'\u30CE' : XK.XK_kana_NO,
+	'\u30CF' : XK.XK_kana_HA,
+	'\u30D2' : XK.XK_kana_HI,
+	'\u30D5' : XK.XK_kana_FU,
+	'\u30D8' : XK.XK_kana_HE,
+	'\u30DB' : XK.XK_kana_HO,
+	'\u30DE' : XK.XK_kana_MA,
+	'\u30DF' : XK.XK_kana_MI,
+	'\u30E0' : XK.XK_kana_MU,
+	'\u30E1' : XK.XK_kana_ME,
+	'\u30E2' : XK.XK_kana_MO,
+	'\u30E3' : XK.XK_kana_ya,
+	'\u30E4' : XK.XK_kana_YA,
+	'\u30E5' : XK.XK_kana_yu,
+	'\u30E6' : XK.XK_kana_YU,
+	'\u30E7' : XK.XK_kana_yo,
+	'\u30E8' : XK.XK_kana_YO,
+	'\u30E9' : XK.XK_kana_RA,
+	'\u30EA' : XK.XK_kana_RI,
+	'\u30EB' : XK.XK_kana_RU,
+	'\u30EC' : XK.XK_kana_RE,
+	'\u30ED' : XK.XK_kana_RO,
+	'\u30EF' : XK.XK_kana_WA,
+	'\u30F2' : XK.XK_kana_WO,
+	'\u30F3' : XK.XK_kana_N,
+	'\u30FB' : XK.XK_kana_conjunctive,
+	'\u30FC' : XK.XK_prolongedsound,
+	'\u3131' : XK.XK_Hangul_Kiyeog,
+	'\u3132' : XK.XK_Hangul_SsangKiyeog,
+	'\u3133' : XK.XK_Hangul_KiyeogSios,
+	'\u3134' : XK.XK_Hangul_Nieun,
+	'\u3135' : XK.XK_Hangul_NieunJieuj,
+	'\u3136' : XK.XK_Hangul_NieunHieuh,
+	'\u3137' : XK.XK_Hangul_Dikeud,
+	'\u3138' : XK.XK_Hangul_SsangDikeud,
+	'\u3139' : XK.XK_Hangul_Rieul,
+	'\u313A' : XK.XK_Hangul_RieulKiyeog,
+	'\u313B' : XK.XK_Hangul_RieulMieum,
+	'\u313C' : XK.XK_Hangul_RieulPieub,
+	'\u313D' : XK.XK_Hangul_RieulSios,
+	'\u313E' : XK.XK_Hangul_RieulTieut,
+	'\u313F' : XK.XK_Hangul_RieulPhieuf,
+	'\u3140' : XK.XK_Hangul_RieulHieuh,
+	'\u3141' : XK.XK_Hangul_Mieum,
+	'\u3142' : XK.XK_Hangul_Pieub,
+	'\u3143' : XK.XK_Hangul_SsangPieub,
+	'\u3144' : XK.XK_Hangul_PieubSios,
+	'\u3145' : XK.XK_Hangul_Sios,
+	'\u3146' : XK.XK_Hangul_SsangSios,
+	'\u3147' : XK.XK_Hangul_Ieung,
+	'\u3148' : XK.XK_Hangul_Jieuj,
+	'\u3149' : XK.XK_Hangul_SsangJieuj,
+	'\u314A' : XK.XK_Hangul_Cieuc,
+	'\u314B' : XK.XK_Hangul_Khieuq,
+	'\u314C' : XK.XK_Hangul_Tieut,
+	'\u314D' : XK.XK_Hangul_Phieuf,
+	'\u314E' : XK.XK_Hangul_Hieuh,
+	'\u314F' : XK.XK_Hangul_A,
+	'\u3150' : XK.XK_Hangul_AE,
+	'\u3151' : XK.XK_Hangul_YA,
+	'\u3152' : XK.XK_Hangul_YAE,
+	'\u3153' : XK.XK_Hangul_EO,
+	'\u3154' : XK.XK_Hangul_E,
+	'\u3155' : XK.XK_Hangul_YEO,
+	'\u3156' : XK.XK_Hangul_YE,
+	'\u3157' : XK.XK_Hangul_O,
+	'\u3158' : XK.XK_Hangul_WA,
+	'\u3159' : XK.XK_Hangul_WAE,
+	'\u315A' : XK.XK_Hangul_OE,
+	'\u315B' : XK.XK_Hangul_YO,
+	'\u315C' : XK.XK_Hangul_U,
+	'\u315D' : XK.XK_Hangul_WEO,
+	'\u315E' : XK.XK_Hangul_WE,
+	'\u315F' : XK.XK_Hangul_WI,
+	'\u3160' : XK.XK_Hangul_YU,
+	'\u3161' : XK.XK_Hangul_EU,
+	'\u3162' : XK.XK_Hangul_YI,
+	'\u3163' : XK.XK_Hangul_I,
+	'\u316D' : XK.XK_Hangul_RieulYeorinHieuh,
+	'\u3171' : XK.XK_Hangul_SunkyeongeumMieum,
+	'\u3178' : XK.XK_Hangul_SunkyeongeumPieub,
+	'\u317F' : XK.XK_Hangul_PanSios,
+	'\u3181' : XK.XK_Hangul_KkogjiDalrinIeung,
+	'\u3184' : XK.XK_Hangul_SunkyeongeumPhieuf,
+	'\u3186' : XK.XK_Hangul_YeorinHieuh,
+	'\u318D' : XK.XK_Hangul_AraeA,
+	'\u318E' : XK.XK_Hangul_AraeAE,}
+
+KEYPAD = {
+	XK.XK_KP_0,
+	XK.XK_KP_1,
+	XK.XK_KP_2,
+	XK.XK_KP_3,
+	XK.XK_KP_4,
+	XK.XK_KP_5,
+	XK.XK_KP_6,
+	XK.XK_KP_7,
+	XK.XK_KP_8,
+	XK.XK_KP_9,
+	XK.XK_KP_Add,
+	XK.XK_KP_Begin,
+	XK.XK_KP_Decimal,
+	XK.XK_KP_Delete,
+	XK.XK_KP_Divide,
+	XK.XK_KP_Down,
+	XK.XK_KP_End,
+	XK.XK_KP_Enter,
+	XK.XK_KP_Equal,
+	XK.XK_KP_F1,
+	XK.XK_KP_F2,
+	XK.XK_KP_F3,
+	XK.XK_KP_F4,
+	XK.XK_KP_Home,
+	XK.XK_KP_Insert,
+	XK.XK_KP_Left,
+	XK.XK_KP_Multiply,
+	XK.XK_KP_Next,
+	XK.XK_KP_Page_Down,
+	XK.XK_KP_Page_Up,
+	XK.XK_KP_Prior,
+	XK.XK_KP_Right,
+	XK.XK_KP_Separator,
+	XK.XK_KP_Space,
+	XK.XK_KP_Subtract,
+	XK.XK_KP_Tab,
+	XK.XK_KP_Up,}
 
 MODIFIERS = {
 	XK.XK_Shift_L,
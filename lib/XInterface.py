@@ -13,13 +13,14 @@ import time
 import subprocess
 import threading
 import queue
+import collections
 import logging
 import gi
 from gi.repository import Gtk, Gdk, GLib
-from Xlib import X, display
+from Xlib import X, Xatom, display, error
 from Xlib.ext import record
-from Xlib.protocol import rq, event
-from . import app, CONSTANTS
+from Xlib.protocol import rq, event, request
+from . import app, CONSTANTS, xkb, symbols
 
 MainLogger = logging.getLogger('Xpander')
 Logger = MainLogger.getChild(__name__)
@@ -35,6 +36,64 @@ if GI_VERSION_MINOR < 10.2:
 	sys.exit(1)
 
 LAYOUT_SPLIT = re.compile(r'(\w+)(?:\((\w+)\))?')
+# Core modifier state bits (Shift, Lock, Control, Mod1 through Mod5).
+STATE_BITS = 0xFF
+# MappingNotify events caused by our own layout switching are ignored
+# for this many seconds.
+MAPPING_GRACE = 1.0
+# Maximum number of windows to keep info of.
+WINDOW_CACHE_SIZE = 256
+
+
+class LayoutCache(object):
+	"""Size bounded LRU cache partitioned by keyboard layout.
+
+		Each layout gets it's own partition, so switching layouts doesn't
+		discard warm lookups of other layouts.
+	"""
+
+	def __init__(self, maxsize=1024):
+
+		self.maxsize = maxsize
+		self.__partitions = {}
+
+	def get(self, layout, key):
+		"""Return cached value for key in layout partition.
+
+			Raise KeyError if key is not cached.
+		"""
+
+		partition = self.__partitions[layout]
+		value = partition[key]
+		partition.move_to_end(key)
+		return value
+
+	def put(self, layout, key, value):
+		"""Cache value for key in layout partition, evicting oldest entry
+		if partition is full.
+		"""
+
+		try:
+			partition = self.__partitions[layout]
+		except KeyError:
+			partition = self.__partitions[layout] = collections.OrderedDict()
+		partition[key] = value
+		partition.move_to_end(key)
+		if len(partition) > self.maxsize:
+			partition.popitem(last=False)
+
+	def clear(self):
+		"""Drop all partitions."""
+
+		self.__partitions.clear()
+
+
+def property_text(value):
+	"""Return text property value as string."""
+
+	if isinstance(value, bytes):
+		return value.decode('utf-8', 'replace')
+	return value
 
 
 class Interface(object):
@@ -53,6 +112,9 @@ class Interface(object):
 			where first member is the layout group and second member is
 			the variant.
 
+		MODIFIER_BIT - ordered dict, maps modifier names to bits of the int
+			modifier bitmask sent to callback.
+
 		Methods:
 		get_active_window - return currently focused window's window object;
 		get_window_class - return given window's class string;
@@ -73,12 +135,22 @@ class Interface(object):
 			state flags;
 		send_string - send keypress events for every character in given string;
 		send_string_clipboard - paste given string using given method;
-		start - run event loop, layout watcher and event hook threads;
-		stop - kill event loop, layout watcher and event hook threads;
+		start - run event loop, layout watcher, window watcher and event hook
+			threads;
+		stop - kill event loop, layout watcher, window watcher and event hook
+			threads;
 		ungrab_keyboard - release active keyboard grabs, allowing keyboard
 			events to pass.
 	"""
 
+	MODIFIER_BIT = collections.OrderedDict((
+		('NoModifier', 0),
+		('<Shift>', 1 << 0),
+		('<AltGr>', 1 << 1),
+		('<Alt>', 1 << 2),
+		('<Control>', 1 << 3),
+		('<Super>', 1 << 4)))
+
 	def __init__(self):
 		"""Initialize layout watcher, event hook and event loop.
 
@@ -87,10 +159,10 @@ class Interface(object):
 				It must take 3 arguments:
 				keysym - int, keysym for the key pressed;
 				keypress - boolean, True on key press, False on key release;
-				modifiers - dict, contains boolean values for modifier keys'
-					logical states.
+				modifiers - int, bitmask of modifier keys' logical states.
 
-			modifiers keys are <Shift>, <AltGr>, <Alt>, <Control> and <Super>.
+			Modifier bits are defined in MODIFIER_BIT for <Shift>, <AltGr>,
+			<Alt>, <Control> and <Super>.
 		"""
 
 		# Main loop
@@ -109,12 +181,36 @@ class Interface(object):
 		if not xkbmap[3].startswith('variant:'):
 			variants = ['' for l in layouts]
 		self.xkb_layouts = tuple(zip(layouts, variants))
-		output = subprocess.check_output(
-			['xkb-switch'],
-			universal_newlines=True).strip()
-		current_layout = LAYOUT_SPLIT.match(output).groups()
-		self.xkb_current = (current_layout[0], (current_layout[1]
-			if current_layout[1] else ''))
+		# Layout changes are tracked with XKB StateNotify events on a
+		# dedicated connection and keysyms of every group are resolved from
+		# XKB keymap, xkb-switch and setxkbmap are only used as a fallback.
+		self.__xkb_display = display.Display()
+		try:
+			self.__xkb = xkb.XKB(self.__xkb_display)
+			self.__keymap = self.__xkb.get_keymap()
+		except Exception:
+			Logger.exception('Cannot use XKB extension, '
+				'falling back to xkb-switch.')
+			self.__xkb = None
+			self.__keymap = None
+		self.__xkb_switch = None
+		self.__layout_switched = threading.Event()
+		self.__layout_switched.set()
+		if self.__xkb is not None:
+			self.xkb_current = self.__group_layout(self.__xkb.get_group())
+		else:
+			output = subprocess.check_output(
+				['xkb-switch'],
+				universal_newlines=True).strip()
+			current_layout = LAYOUT_SPLIT.match(output).groups()
+			self.xkb_current = (current_layout[0], (current_layout[1]
+				if current_layout[1] else ''))
+		# Layout keysym lookups currently resolve in,
+		# lookup caches are partitioned by it.
+		self.__mapped_layout = self.xkb_current
+		self.__group = self.__group_index(self.xkb_current)
+		# Modifier state for keycode_to_keysym index, set with modifier masks.
+		self.__INDEX_STATE = {}
 		self.__xkb_run = True
 		Logger.debug('Available layouts {}.'.format(self.xkb_layouts))
 		Logger.debug('Currently active layout group: {}.'.format(
@@ -146,7 +242,19 @@ class Interface(object):
 				'errors': (0, 0),
 				'client_started': False,
 				'client_died': False,
+			}, {
+				'core_requests': (0, 0),
+				'core_replies': (0, 0),
+				'ext_requests': (0, 0, 0, 0),
+				'ext_replies': (0, 0, 0, 0),
+				'delivered_events': (X.MappingNotify, X.MappingNotify),
+				'device_events': (0, 0),
+				'errors': (0, 0),
+				'client_started': False,
+				'client_died': False,
 			}])
+		self.__ignore_mapping_until = 0
+		self.__mapping_changed_pending = False
 		# Determine and set mod1 through mod5.
 		self.__MODIFIER_MAP = self.__local_display.get_modifier_mapping()
 		self.__MODIFIER_INDEX = {X.ShiftMapIndex: X.ShiftMask,
@@ -165,33 +273,49 @@ class Interface(object):
 							'<Super>': 0,
 							'<NumLock>': 0}
 		self.__set_modifier_masks()
-		# Get available keysyms for each layout.
+		# Get available keysyms for each layout in the background,
+		# they're only needed to send printable characters.
 		self.__KEYSYMS = {}
-		self.__set_keysym_sets()
+		self.__keysyms_loaded = threading.Event()
+		threading.Thread(
+			target=self.__set_keysym_sets, name='Keysym Loader',
+			daemon=True).start()
 		# Keypad workaround: define a list of keypad keycodes for reference.
-		self.__KEYPAD_CODES = set()
-		for name in dir(CONSTANTS.XK):
-			if name.startswith('XK_KP'):
-				self.__KEYPAD_CODES.add(self.lookup_keycode(
-					getattr(CONSTANTS.XK, name)))
+		# Filled by the main loop before it handles any keyboard event.
+		self.__KEYPAD_CODES = frozenset()
+		self.__enqueue(self.__set_keypad_codes)
 		# Window name atoms.
 		self.__name_atom = self.__local_display.intern_atom(
 			"_NET_WM_NAME", True)
 		self.__visible_name_atom = self.__local_display.intern_atom(
 			"_NET_WM_VISIBLE_NAME", True)
+		# Active toplevel window is read from root window, if the window
+		# manager supports it. Atom is 0 otherwise.
+		self.__active_window_atom = self.__local_display.intern_atom(
+			"_NET_ACTIVE_WINDOW", True)
+		# Window info cache, maps active window id to list of window class,
+		# title and id of the window holding the title. Both windows are
+		# watched on a dedicated connection, along with active window
+		# changes, until their info changes or they're destroyed.
+		self.__window_info = collections.OrderedDict()
+		self.__window_display = display.Display()
+		if self.__active_window_atom:
+			self.__window_display.screen().root.change_attributes(
+				event_mask=X.PropertyChangeMask)
+			self.__window_display.flush()
+		self._window_watcher = threading.Thread(
+			target=self.__window_watcher, name='Window Watcher', daemon=True)
 		# Set initial window info.
 		self.root_window = self.__local_display.screen().root
-		self.active_window = self.get_active_window()
-		self.active_window_class = self.get_window_class(self.active_window)
-		self.active_window_title = self.get_window_title(self.active_window)
+		self.__active_window_id = None
+		self.__update_active_window()
 
 		# Clipboard
 		self.__clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
 		self.__selection = Gtk.Clipboard.get(Gdk.SELECTION_PRIMARY)
+		# Contents are stored on demand, before they're used.
 		self.clipboard_contents = ''
-		self.store_clipboard()
 		self.selection_contents = ''
-		self.store_selection()
 		# Define paste methods
 		self.__paste_method = {
 			0: (self.lookup_keycode(CONSTANTS.XK.XK_v),
@@ -223,35 +347,77 @@ class Interface(object):
 
 			self.__queue.task_done()
 
+	def __group_layout(self, group):
+		"""Return layout tuple from self.xkb_layouts for given group index."""
+
+		if group < len(self.xkb_layouts):
+			return self.xkb_layouts[group]
+		return self.xkb_layouts[0]
+
 	def __layout_watcher(self):
-		"""Use xkb-switch to wait for keyboard layout changes.
+		"""Wait for keyboard layout changes.
 
 			When change occurs update self.xkb-current and
 			enqueue self.__switch_layout.
 		"""
 
 		Logger.debug('Initializing layout watcher.')
-		watch = True
+		if self.__xkb is not None:
+			self.__watch_xkb_state()
+		else:
+			self.__watch_xkb_switch()
+
+	def __layout_changed(self, layout):
+		"""Update self.xkb_current, switch layout and wait untill it's done.
+
+			Only used with xkb-switch, which would miss changes made while
+			switching.
+		"""
+
+		self.xkb_current = layout
+		Logger.debug('Currently active layout group: {}.'.format(
+			self.xkb_current))
+		self.__layout_switched.clear()
+		self.__enqueue(self.__switch_layout)
+		# Queued separately, so it's set even if switching fails.
+		self.__enqueue(self.__layout_switched.set)
+		self.__layout_switched.wait()
+
+	def __watch_xkb_state(self):
+		"""Wait for XKB StateNotify events on layout group changes."""
+
+		self.__xkb.select_group_events()
+		while self.__xkb_run:
+			try:
+				event = self.__xkb_display.next_event()
+			except Exception:
+				if self.__xkb_run:
+					Logger.exception('Cannot read XKB events.')
+				break
+			if not self.__xkb.is_state_notify(event):
+				continue
+			layout = self.__group_layout(event.group)
+			if layout != self.xkb_current:
+				self.xkb_current = layout
+				Logger.debug('Currently active layout group: {}.'.format(
+					self.xkb_current))
+				self.__enqueue(self.__switch_layout)
+
+	def __watch_xkb_switch(self):
+		"""Use xkb-switch to wait for keyboard layout changes."""
+
 		try:
 			while self.__xkb_run:
-				if watch:
-					self.__xkb_switch = subprocess.Popen(
-						['xkb-switch', '-w', '-p'],
-						stdout=subprocess.PIPE,
-						universal_newlines=True)
-					output = self.__xkb_switch.stdout.readline(
-					).strip('\n')
-					current_layout = LAYOUT_SPLIT.match(output).groups()
-					self.xkb_current = (current_layout[0], (current_layout[1]
-						if current_layout[1] else ''))
-					if self.__xkb_run:
-						Logger.debug('Currently active layout group: {}.'.format(
-							self.xkb_current))
-						watch = False
-						self.__layout_switched = False
-						self.__enqueue(self.__switch_layout)
-				if self.__layout_switched:
-					watch = True
+				self.__xkb_switch = subprocess.Popen(
+					['xkb-switch', '-w', '-p'],
+					stdout=subprocess.PIPE,
+					universal_newlines=True)
+				output = self.__xkb_switch.stdout.readline().strip('\n')
+				if not self.__xkb_run:
+					break
+				current_layout = LAYOUT_SPLIT.match(output).groups()
+				self.__layout_changed((current_layout[0], (current_layout[1]
+					if current_layout[1] else '')))
 		except:
 			Logger.exception('Missing dependency: xkb-switch. Cannot continue.')
 			sys.exit(1)
@@ -284,22 +450,45 @@ class Interface(object):
 		_cache[self.xkb_current] = ','.join(layouts), ','.join(variants)
 		return ','.join(layouts), ','.join(variants)
 
+	def __group_index(self, layout):
+		"""Return int group index of layout in self.xkb_layouts.
+
+			Layouts reported by xkb-switch may be missing from the list, the
+			first group is used for them.
+		"""
+
+		try:
+			return self.xkb_layouts.index(layout)
+		except ValueError:
+			Logger.warning(
+				'Layout {} not configured, using first group.'.format(layout))
+			return 0
+
 	def __switch_layout(self):
-		"""Change keyboard layout in a way python Xlib can detect."""
+		"""Make keysym lookups use layout in self.xkb_current.
+
+			With XKB keymap this only changes active group. Otherwise change
+			keyboard layout in a way python Xlib can detect.
+		"""
+
+		if self.__keymap is not None:
+			Logger.info('Switching active layout group.')
+			self.__group = self.__group_index(self.xkb_current)
+			self.__mapped_layout = self.xkb_current
+			return
 
 		# Switch X keyboard layout order.
 		# This doesn't necessarily change the active layout.
 		Logger.info('Switching X keyboard layout.')
 		layouts, variants = self.__transient_layouts()
+		self.__ignore_mapping_until = time.time() + MAPPING_GRACE
 		subprocess.call(['setxkbmap',
 						'-layout', layouts,
 						'-variant', variants])
 		# Reload display object so it can pick up changed layout.
 		self.__reload_display()
-		# Clear caches because the mapping has probably changed.
-		self.keycode_to_keysym(clear_cache=True)
-		self.keysym_to_keycode(clear_cache=True)
-		self.lookup_keycode(clear_cache=True)
+		# Caches are partitioned by layout, so they don't need clearing here.
+		self.__mapped_layout = self.xkb_current
 		# Restore X keyboard layout order.
 		# Transient order no longer needed,
 		# because display object has already picked up changes.
@@ -310,12 +499,12 @@ class Interface(object):
 			['xkb-switch', '-s',
 			('{0}({1})'.format(*self.xkb_current)
 				if self.xkb_current[1] else self.xkb_current[0])])
-		self.__layout_switched = True
 
 	def __restore_layouts(self):
 		"""Restore X keyboard layouts to initial order stored in self.xkb_layouts."""
 
 		Logger.debug('Restoring keyboard layouts to initial state.')
+		self.__ignore_mapping_until = time.time() + MAPPING_GRACE
 		layouts = []
 		variants = []
 		for layout in self.xkb_layouts:
@@ -325,108 +514,28 @@ class Interface(object):
 						'-layout', ','.join(layouts),
 						'-variant', ','.join(variants)])
 
-	def __get_keysym_sets(self, layout):
-		"""Parse xkb symbols file for given layout.
-
-			layout must be a tuple where first member is layout group string
-			and second member is layout variant string.
-
-			Return tuple of 4 sets, first set contains keysyms for unmodified
-			keys, second for shifted, third contains keysyms for alt grid,
-			forth for shifted alt grid."""
-
-		# Variant is a group withing file.
-		# If variant is an empty string, default group should be parsed.
-		if layout[1] == '' or layout[1] is None:
-			layout = (layout[0], 'default')
-
-		keysym_set = set()
-		keysym_set_shift = set()
-		keysym_set_alt = set()
-		keysym_set_alt_shift = set()
-		includes = []
-		definition_location = '/usr/share/X11/xkb/symbols'
-		match_include = re.compile(r'include\s*\"(\w*)(?:\((\w*)\))*\"')
-		match_keys = re.compile(r'.*[\[|<].*[\]|>].*\[\s*([\w|\d]*)'
-			r'(?:,\s*([\w|\d]*)(?:,\s*([\w|\d]*))?(?:,\s*([\w|\d]*))?)?')
-		parse = False
-		with open(os.path.join(definition_location, layout[0])) as definition:
-			for line in definition:
-				if not parse:
-					if (line.startswith('xkb_symbols "{}"'.format(layout[1])) or
-						line.startswith(layout[1])):
-						parse = True
-				if parse:
-					if line.startswith('};'):
-						parse = False
-						break
-					include = match_include.search(line)
-					if include:
-						includes.append((include.group(1), include.group(2)))
-					key = match_keys.search(line)
-					if key:
-						try:
-							keysym_set.add(getattr(
-								CONSTANTS.XK, 'XK_' + key.group(1)))
-						except:
-							try:
-								keysym_set.add(int(key.group(1), 16))
-							except:
-								#~ Logger.exception('Error building keysym set.'
-								#~ 'Cannot find keysym value.')
-								pass
-						try:
-							keysym_set_shift.add(getattr(
-								CONSTANTS.XK, 'XK_' + key.group(2)))
-						except:
-							try:
-								keysym_set_shift.add(int(key.group(2), 16))
-							except:
-								#~ Logger.exception('Error building keysym set.'
-								#~ 'Cannot find keysym value.')
-								pass
-						try:
-							keysym_set_alt.add(getattr(
-								CONSTANTS.XK, 'XK_' + key.group(3)))
-						except:
-							try:
-								keysym_set_alt.add(int(key.group(3), 16))
-							except:
-								#~ Logger.exception('Error building keysym set.'
-								#~ 'Cannot find keysym value.')
-								pass
-						try:
-							keysym_set_alt_shift.add(getattr(
-								CONSTANTS.XK, 'XK_' + key.group(4)))
-						except:
-							try:
-								keysym_set_alt_shift.add(int(key.group(4), 16))
-							except:
-								#~ Logger.exception('Error building keysym set.'
-								#~ 'Cannot find keysym value.')
-								pass
-
-		if includes:
-			for include in includes:
-				normal, shifted, alt, alt_shifted = self.__get_keysym_sets(
-					include)
-				keysym_set |= normal
-				keysym_set_shift |= shifted
-				keysym_set_alt |= alt
-				keysym_set_alt_shift |= alt_shifted
-
-		return (keysym_set, keysym_set_shift,
-				keysym_set_alt, keysym_set_alt_shift)
-
 	def __set_keysym_sets(self):
 		"""Fill self.__KEYSYMS dict with keysyms sets for every layout configured."""
 
-		for layout in self.xkb_layouts:
-			normal, shifted, alt, alt_shifted = self.__get_keysym_sets(layout)
-			self.__KEYSYMS[layout[0]] = normal
-			self.__KEYSYMS[layout[0] + '_Shift'] = shifted
-			self.__KEYSYMS[layout[0] + '_Alt'] = alt
-			self.__KEYSYMS[layout[0] + '_Alt_Shift'] = alt_shifted
+		try:
+			keysym_sets = symbols.get_keysym_sets(
+				self.xkb_layouts, os.path.join(app._cache_dir, 'keysyms.json'))
+			for layout in self.xkb_layouts:
+				normal, shifted, alt, alt_shifted = keysym_sets[layout]
+				self.__KEYSYMS[layout[0]] = normal
+				self.__KEYSYMS[layout[0] + '_Shift'] = shifted
+				self.__KEYSYMS[layout[0] + '_Alt'] = alt
+				self.__KEYSYMS[layout[0] + '_Alt_Shift'] = alt_shifted
+		except Exception:
+			Logger.exception('Cannot load keysym sets.')
+		finally:
+			self.__keysyms_loaded.set()
+
+	def __set_keypad_codes(self):
+		"""Fill self.__KEYPAD_CODES with keycodes of keypad keys."""
+
+		self.__KEYPAD_CODES = frozenset(
+			self.lookup_keycode(keysym) for keysym in CONSTANTS.KEYPAD)
 
 	def __reload_display(self):
 		"""Close self.__local_display's socket and create a new
@@ -477,19 +586,211 @@ class Interface(object):
 								event.detail,
 								event.state)
 
+			# Keyboard mapping changed. The event is delivered to every
+			# client, so only enqueue a single refresh.
+			if (event.type is X.MappingNotify and
+				event.request != X.MappingPointer and
+				time.time() > self.__ignore_mapping_until and
+				not self.__mapping_changed_pending):
+				self.__mapping_changed_pending = True
+				self.__enqueue(self.__mapping_changed)
+
+	def __mapping_changed(self):
+		"""Reload display and drop cached lookups after keyboard mapping
+		was changed by another client.
+		"""
+
+		self.__mapping_changed_pending = False
+		if time.time() <= self.__ignore_mapping_until:
+			return
+		Logger.info('Keyboard mapping changed.')
+		self.__reload_display()
+		if self.__xkb is not None:
+			self.__keymap = self.__xkb.get_keymap()
+		self.keycode_to_keysym(clear_cache=True)
+		self.keysym_to_keycode(clear_cache=True)
+		self.lookup_keycode(clear_cache=True)
+
 	def __update_active_window(self):
-		"""Update active window object and class and title strings."""
+		"""Update active window object and class and title strings.
 
-		self.active_window = self.get_active_window()
-		self.active_window_class = self.get_window_class(self.active_window)
-		self.active_window_title = self.get_window_title(self.active_window)
+			Window info is cached by active window id until class or title
+			of the window changes, see self.__window_changed.
+		"""
+
+		self.active_window, window = self.__get_focus()
+		window_id = getattr(window, 'id', None)
+		if window_id == self.root_window.id:
+			window_id = None
+		self.__active_window_id = window_id
+		info = self.__window_info.get(window_id)
+		if info is not None:
+			self.__window_info.move_to_end(window_id)
+		else:
+			window_class, title_window, title = self.__get_window_info(window)
+			info = [window_class, title, getattr(title_window, 'id', window_id)]
+			if window_id is not None:
+				self.__window_info[window_id] = info
+				self.__watch_window(window_id)
+				if info[2] != window_id:
+					self.__watch_window(info[2])
+				if len(self.__window_info) > WINDOW_CACHE_SIZE:
+					self.__forget_windows([next(iter(self.__window_info))])
+		self.active_window_class, self.active_window_title = info[0], info[1]
+
+	def __get_focus(self):
+		"""Return tuple of focused window object and active toplevel
+		window object.
+
+			Active window is read from root's _NET_ACTIVE_WINDOW property,
+			in the same round trip as input focus. If window manager doesn't
+			set it, focused window is returned as active window.
+		"""
+
+		focus = request.GetInputFocus(
+			display=self.__local_display.display, defer=True)
+		active = None
+		if self.__active_window_atom:
+			active = request.GetProperty(
+				display=self.__local_display.display,
+				defer=True,
+				delete=False,
+				window=self.root_window,
+				property=self.__active_window_atom,
+				type=Xatom.WINDOW,
+				long_offset=0,
+				long_length=1)
+		try:
+			focus.reply()
+			window = focus.focus
+		except:
+			Logger.exception('Problem getting active window.')
+			window = None
+		if active is not None:
+			try:
+				active.reply()
+				if active.property_type and active.value and active.value[0]:
+					return window, self.__local_display.create_resource_object(
+						'window', active.value[0])
+			except:
+				Logger.exception('Problem getting _NET_ACTIVE_WINDOW.')
+		return window, window
+
+	def __get_window_info(self, window):
+		"""Return tuple of given window's class string, window holding
+		it's title and title string.
+
+			Class and title properties are requested in one round trip.
+			If window has none, they're looked up in window's ancestors.
+		"""
+
+		display_ = self.__local_display.display
+		properties = []
+		try:
+			for atom in (Xatom.WM_CLASS, self.__visible_name_atom,
+				self.__name_atom):
+				if atom:
+					properties.append(request.GetProperty(
+						display=display_,
+						defer=True,
+						delete=False,
+						window=window,
+						property=atom,
+						type=X.AnyPropertyType,
+						long_offset=0,
+						long_length=255))
+			for reply in properties:
+				reply.reply()
+		except:
+			#~ Logger.exception('Cannot determine window info. '
+			#~ 'Window {0}, {1}'.format(window, type(window)))
+			return '', None, ''
+
+		wm_class = property_text(properties[0].value).split('\0')
+		if properties[0].property_type and len(wm_class) >= 2:
+			window_class = '{0}.{1}'.format(wm_class[0], wm_class[1])
+		else:
+			window_class = self.get_window_class(window)
+		for reply in properties[1:]:
+			if reply.property_type:
+				return window_class, window, property_text(reply.value)
+		return (window_class,) + self.__get_title_window(window)
+
+	def __watch_window(self, window_id, watch=True):
+		"""Start or, if watch is False, stop receiving PropertyNotify and
+		DestroyNotify events for window with given id.
+		"""
+
+		if window_id is None or window_id == self.root_window.id:
+			return
+		window = self.__window_display.create_resource_object(
+			'window', window_id)
+		window.change_attributes(
+			onerror=error.CatchError(error.BadWindow),
+			event_mask=(X.PropertyChangeMask | X.StructureNotifyMask
+				if watch else X.NoEventMask))
+		self.__window_display.flush()
+
+	def __forget_windows(self, window_ids):
+		"""Remove cached info of windows with given ids and stop watching
+		windows no cached info refers to anymore.
+		"""
+
+		dropped = set()
+		for window_id in window_ids:
+			info = self.__window_info.pop(window_id, None)
+			if info is not None:
+				dropped.update((window_id, info[2]))
+		for window_id, info in self.__window_info.items():
+			dropped.difference_update((window_id, info[2]))
+		for window_id in dropped:
+			self.__watch_window(window_id, False)
+
+	def __window_watcher(self):
+		"""Wait for class and title changes and destruction of watched
+		windows and active window changes.
+
+			When watched window changes enqueue self.__window_changed, when
+			active window changes enqueue self.__update_active_window.
+		"""
+
+		Logger.debug('Initializing window watcher.')
+		info_atoms = {
+			Xatom.WM_CLASS, self.__name_atom, self.__visible_name_atom}
+		while True:
+			try:
+				event = self.__window_display.next_event()
+			except Exception:
+				Logger.info('Disabling window watcher.')
+				break
+			if event.type == X.DestroyNotify:
+				self.__enqueue(self.__window_changed, event.window.id, True)
+			elif event.type != X.PropertyNotify:
+				continue
+			elif event.atom in info_atoms:
+				self.__enqueue(self.__window_changed, event.window.id)
+			elif event.atom == self.__active_window_atom:
+				self.__enqueue(self.__update_active_window)
+
+	def __window_changed(self, window_id, destroyed=False):
+		"""Drop cached info held by window with given id.
+
+			If it's active window's info and app.window_title_lazy isn't set,
+			it's read again, so title is kept up to date. Otherwise it's read
+			on next focus change.
+		"""
+
+		window_ids = [
+			info_id for info_id, info in self.__window_info.items()
+			if window_id in (info_id, info[2])]
+		self.__forget_windows(window_ids)
+		if (not destroyed and not app.window_title_lazy and
+			self.__active_window_id in window_ids):
+			self.__update_active_window()
 
 	def __handle_key_event(self, type_, keycode, state):
 		"""Further process keyboard event and send data to callback."""
 
-		if not app.window_title_lazy:
-			self.active_window_title = self.get_window_title(self.active_window)
-
 		keypress = (type_ == X.KeyPress)
 		keysym = self.keycode_to_keysym(keycode, 0)
 		index, modifiers = self.translate_state(state, keycode)
@@ -514,46 +815,65 @@ class Interface(object):
 				self.MODIFIER_MASK['<Super>'] = mask
 			elif CONSTANTS.XK.XK_Num_Lock in keylist:
 				self.MODIFIER_MASK['<NumLock>'] = mask
+		self.__STATE_TABLE = (
+			self.__build_state_table(False), self.__build_state_table(True))
+		shift = self.MODIFIER_MASK['<Shift>']
+		altgr = self.MODIFIER_MASK['<AltGr>']
+		self.__INDEX_STATE = {
+			0: 0, 1: shift, 4: altgr, 5: shift | altgr,
+			7: self.MODIFIER_MASK['<NumLock>']}
+
+	def __build_state_table(self, keypad):
+		"""Return tuple of (index, modifiers) pairs for every core state.
+
+			Tuple is indexed by the low 8 bits of the event state, keypad
+			determines wether the table applies to keypad keys.
+		"""
 
-	def translate_state(self, state, keycode, _modifiers={}):
-		"""Parse keyboard event state flags and return modifier index and dict.
-
-			Index is used by keycode_to_keysym method and dict is sent to callback.
+		shift = self.MODIFIER_MASK['<Shift>']
+		altgr = self.MODIFIER_MASK['<AltGr>']
+		table = []
+		for state in range(STATE_BITS + 1):
+			index = 0
+			modifiers = 0
+			if ((state & shift) ^ (state & X.LockMask)) and not keypad:
+				index += 1
+				if state & shift:
+					modifiers |= self.MODIFIER_BIT['<Shift>']
+			if state & altgr and not keypad:
+				index += 4
+				modifiers |= self.MODIFIER_BIT['<AltGr>']
+			if state & self.MODIFIER_MASK['<NumLock>'] and keypad:
+				index += 7
+			if state & self.MODIFIER_MASK['<Alt>']:
+				modifiers |= self.MODIFIER_BIT['<Alt>']
+			if state & X.ControlMask:
+				modifiers |= self.MODIFIER_BIT['<Control>']
+			if state & self.MODIFIER_MASK['<Super>']:
+				modifiers |= self.MODIFIER_BIT['<Super>']
+			table.append((index, modifiers))
+		return tuple(table)
+
+	def translate_state(self, state, keycode):
+		"""Parse keyboard event state flags and return modifier index and mask.
+
+			Index is used by keycode_to_keysym method and int modifier bitmask
+			(see MODIFIER_BIT) is sent to callback.
 		"""
 
-		index = 0
-		if (((state & self.MODIFIER_MASK['<Shift>']) ^ (state & X.LockMask)) and
-			keycode not in self.__KEYPAD_CODES):
-			index += 1
-			if state & self.MODIFIER_MASK['<Shift>']:
-				_modifiers['<Shift>'] = True
-		else:
-			_modifiers['<Shift>'] = False
-		if ((state & self.MODIFIER_MASK['<AltGr>']) and
-			keycode not in self.__KEYPAD_CODES):
-			index += 4
-			_modifiers['<AltGr>'] = True
-		else:
-			_modifiers['<AltGr>'] = False
-		if (state & self.MODIFIER_MASK['<NumLock>'] and
-			keycode in self.__KEYPAD_CODES):
-			index += 7
-		if state & self.MODIFIER_MASK['<Alt>']:
-			_modifiers['<Alt>'] = True
-		else:
-			_modifiers['<Alt>'] = False
-		if state & X.ControlMask:
-			_modifiers['<Control>'] = True
-		else:
-			_modifiers['<Control>'] = False
-		if state & self.MODIFIER_MASK['<Super>']:
-			_modifiers['<Super>'] = True
-		else:
-			_modifiers['<Super>'] = False
+		return self.__STATE_TABLE[keycode in self.__KEYPAD_CODES][
+			state & STATE_BITS]
+
+	def modifier_bits(self, modifiers):
+		"""Return int modifier bitmask for given iterable of modifier names."""
 
-		return index, _modifiers
+		bits = 0
+		for modifier in modifiers:
+			bits |= self.MODIFIER_BIT[modifier]
+		return bits
 
-	def keycode_to_keysym(self, keycode=0, index=0, clear_cache=False, _cache={}):
+	def keycode_to_keysym(
+		self, keycode=0, index=0, clear_cache=False, _cache=LayoutCache()):
 		"""Return int keysym bound to given keycode at given index.
 
 			Arguments:
@@ -568,43 +888,39 @@ class Interface(object):
 			return
 
 		key = (keycode, index)
-		if key in _cache:
-			return _cache[key]
+		try:
+			return _cache.get(self.__mapped_layout, key)
+		except KeyError:
+			pass
 
-		keysym = self.__local_display.keycode_to_keysym(keycode, index)
-		_cache[key] = keysym
+		if self.__keymap is not None:
+			keysym = self.__keymap.keysym(
+				keycode, self.__group, self.__INDEX_STATE.get(index, 0))
+		else:
+			keysym = self.__local_display.keycode_to_keysym(keycode, index)
+		_cache.put(self.__mapped_layout, key, keysym)
 
 		return keysym
 
-	def lookup_string(self, keysym, _cache={}):
+	def lookup_string(self, keysym):
 		"""Return str character for given int keysym.
 
 			If there's no printable character for given keysym, return str
 			name of given keysym. If name is not found return empty string.
 		"""
 
-		if keysym in _cache:
-			return _cache[keysym]
-
 		if keysym in CONSTANTS.PRINTABLE:
-			string = CONSTANTS.PRINTABLE[keysym]
+			return CONSTANTS.PRINTABLE[keysym]
 		elif keysym == CONSTANTS.XK.XK_Return:
-			string = '\n'
+			return '\n'
 		elif keysym == CONSTANTS.XK.XK_Tab:
-			string = '\t'
-		else:
-			for name in dir(CONSTANTS.XK):
-				if getattr(CONSTANTS.XK, name) == keysym:
-					string = name
-					break
-			else:
-				string = ''
-		_cache[keysym] = string
+			return '\t'
+		return CONSTANTS.KEYSYM_NAMES.get(keysym, '')
 
-		return string
-
-	def lookup_keycode(self, keysym=0, clear_cache=False, _cache={}):
-		"""Return int keycode bound to given keysym.
+	def lookup_keycode(
+		self, keysym=0, group=None, clear_cache=False, _cache=LayoutCache()):
+		"""Return int keycode bound to given keysym in given layout group,
+		active group if it's None.
 
 			If clear_cache is True, clear cache and return None.
 		"""
@@ -613,11 +929,18 @@ class Interface(object):
 			_cache.clear()
 			return
 
-		if keysym in _cache:
-			return _cache[keysym]
+		if group is None:
+			group = self.__group
+		try:
+			return _cache.get(self.__mapped_layout, (keysym, group))
+		except KeyError:
+			pass
 
-		keycode = self.__local_display.keysym_to_keycode(keysym)
-		_cache[keysym] = keycode
+		if self.__keymap is not None:
+			keycode = self.__keymap.keycode(keysym, group)
+		else:
+			keycode = self.__local_display.keysym_to_keycode(keysym)
+		_cache.put(self.__mapped_layout, (keysym, group), keycode)
 		return keycode
 
 	def get_active_window(self):
@@ -656,19 +979,28 @@ class Interface(object):
 			If window title cannot be determined, return empty string.
 		"""
 
+		return self.__get_title_window(window)[1]
+
+	def __get_title_window(self, window):
+		"""Return tuple of window holding given window's title and title string.
+
+			Title is looked up in window's ancestors if window has none.
+			If window title cannot be determined, return (None, '').
+		"""
+
 		try:
 			atom = window.get_property(self.__visible_name_atom, 0, 0, 255)
 			if atom is None:
 				atom = window.get_property(self.__name_atom, 0, 0, 255)
 			if atom:
 				#~ Logger.debug('Active window title {}.'.format(atom.value))
-				return atom.value
+				return window, property_text(atom.value)
 			else:
-				return self.get_window_title(window.query_tree().parent)
+				return self.__get_title_window(window.query_tree().parent)
 		except:
 			#~ Logger.exception('Cannot determine window title. '
 			#~ 'Window {0}, {1}'.format(window, type(window)))
-			return ''
+			return None, ''
 
 	def grab_keyboard(self):
 		"""Actively grab keyboard, consuming all keyboard events untill
@@ -716,40 +1048,24 @@ class Interface(object):
 		self.__local_display.ungrab_keyboard(X.CurrentTime)
 		self.__local_display.flush()
 
-	def lookup_keysym(self, string, _cache={}):
+	def lookup_keysym(self, string):
 		"""Return int keysym for given string.
 
 			string must be a single unicode character or a name of the keysym.
 		"""
 
-		if string in _cache:
-			return _cache[string]
-
-		for keysym, char in CONSTANTS.PRINTABLE.items():
-			if char == string:
-				_cache[string] = keysym
-				return keysym
-				break
-		else:
-			if string == '\b':
-				_cache[string] = CONSTANTS.XK.XK_BackSpace
-				return CONSTANTS.XK.XK_BackSpace
-			elif string == '\t':
-				_cache[string] = CONSTANTS.XK.XK_Tab
-				return CONSTANTS.XK.XK_Tab
-			elif string == '\n':
-				_cache[string] = CONSTANTS.XK.XK_Return
-				return CONSTANTS.XK.XK_Return
-			else:
-				for name in dir(CONSTANTS.XK):
-					if name == string:
-						_cache[string] = getattr(CONSTANTS.XK, name)
-						return getattr(CONSTANTS.XK, name)
-				else:
-					_cache[string] = 0
-					return 0
-
-	def keysym_to_keycode(self, keysym=0, clear_cache=False, _cache={}):
+		if string in CONSTANTS.CHARS:
+			return CONSTANTS.CHARS[string]
+		elif string == '\b':
+			return CONSTANTS.XK.XK_BackSpace
+		elif string == '\t':
+			return CONSTANTS.XK.XK_Tab
+		elif string == '\n':
+			return CONSTANTS.XK.XK_Return
+		return CONSTANTS.KEYSYMS.get(string, 0)
+
+	def keysym_to_keycode(
+		self, keysym=0, clear_cache=False, _cache=LayoutCache()):
 		"""Return tuple of ints.
 
 			First member is keycode bound to given keysym and second member is
@@ -762,36 +1078,43 @@ class Interface(object):
 			_cache.clear()
 			return
 
-		if keysym in _cache:
-			return _cache[keysym]
-
-		keycode = self.lookup_keycode(keysym)
-		state = 0
+		try:
+			return _cache.get(self.__mapped_layout, keysym)
+		except KeyError:
+			pass
+
+		if not self.__keysyms_loaded.is_set():
+			# Control keys like Tab and BackSpace don't need keysym sets,
+			# so don't wait for them to load.
+			if keysym not in CONSTANTS.PRINTABLE:
+				return self.lookup_keycode(keysym), 0
+			Logger.debug('Waiting for keysym sets.')
+			self.__keysyms_loaded.wait()
+
+		# Keycode is looked up in the group state flags select, so keysyms
+		# of several, or inactive, layouts are typed in the same one.
 		layout_mask = 0x2000
-
+		levels = (
+			('', 0),
+			('_Shift', self.MODIFIER_MASK['<Shift>']),
+			('_Alt', self.MODIFIER_MASK['<AltGr>']),
+			('_Alt_Shift',
+				self.MODIFIER_MASK['<AltGr>'] | self.MODIFIER_MASK['<Shift>']))
+		empty = frozenset()
+		result = None
 		for index, layout in enumerate(self.xkb_layouts):
-			if keysym in self.__KEYSYMS[layout[0]]:
-				state |= layout_mask * index
-				_cache[keysym] = keycode, state
-				return keycode, state
-			elif keysym in self.__KEYSYMS[layout[0] + '_Shift']:
-				state |= self.MODIFIER_MASK['<Shift>'] | (layout_mask * index)
-				_cache[keysym] = keycode, state
-				return keycode, state
-			elif keysym in self.__KEYSYMS[layout[0] + '_Alt']:
-				state |= (
-					self.MODIFIER_MASK['<AltGr>'] | (layout_mask * index))
-				_cache[keysym] = keycode, state
-				return keycode, state
-			elif keysym in self.__KEYSYMS[layout[0] + '_Alt_Shift']:
-				state |= (
-					self.MODIFIER_MASK['<AltGr>'] |
-					self.MODIFIER_MASK['<Shift>'] | (layout_mask * index))
-				_cache[keysym] = keycode, state
-				return keycode, state
+			for suffix, modifiers in levels:
+				if keysym in self.__KEYSYMS.get(layout[0] + suffix, empty):
+					result = (
+						self.lookup_keycode(keysym, index),
+						modifiers | (layout_mask * index))
+					break
+			if result is not None:
+				break
 		else:
-			_cache[keysym] = keycode, state
-			return keycode, state
+			result = self.lookup_keycode(keysym), 0
+		_cache.put(self.__mapped_layout, keysym, result)
+		return result
 
 	def send_key_press(self, keycode, state):
 		"""Send key press event of given keycode and logical state flags."""
@@ -947,19 +1270,28 @@ class Interface(object):
 			self.ungrab_keyboard()
 
 	def start(self):
-		"""Run event loop, layout watcher and event hook threads."""
+		"""Run event loop, layout watcher, window watcher and event hook
+		threads.
+		"""
 
 		self._layout_watcher.start()
+		self._window_watcher.start()
 		self._event_hook.start()
 		self._main_loop.start()
 
 	def stop(self):
-		"""Kill event loop, layout watcher and event hook threads."""
+		"""Kill event loop, layout watcher, window watcher and event hook
+		threads.
+		"""
 
 		self.__enqueue(None)
 		Logger.info('Disbabling layout watcher.')
 		self.__xkb_run = False
-		self.__xkb_switch.terminate()
+		self.__layout_switched.set()
+		if self.__xkb_switch is not None:
+			self.__xkb_switch.terminate()
+		self.__xkb_display.close()
+		self.__window_display.close()
 		Logger.info('Disabling recording context.')
 		self.__local_display.record_disable_context(self.__context)
 		self.__local_display.flush()
@@ -18,7 +18,26 @@ backspace_undo = True
 
 # manager
 _config_dir = os.path.expanduser('~/.config')
+_cache_dir = os.path.expanduser('~/.cache/Xpander')
 phrases_dir = os.path.expanduser('~/.phrases')
+#   Path of SQLite phrase database. If empty, phrases are stored in
+#   phrases_dir, one JSON file each, else phrases_dir is imported into the
+#   database once, while it's empty.
+phrases_database = ''
+#   Path of phrase bundle compiled by xpander-compile. If set, phrases are
+#   read from it instead and can't be edited.
+phrases_bundle = ''
+#   Read-only phrase directories and bundles merged below phrases_dir, e.g.
+#   a system bundle and a team share, lowest precedence first. Phrases of
+#   higher layers shadow those with the same uuid, or the same hotstring or
+#   hotkey and window filters, in lower ones.
+phrases_layers = []
+#   Seconds between rescans of phrases_dir on network filesystems and of
+#   phrases_layers, or checks for a replaced phrases_bundle, 0 disables them.
+phrases_poll_interval = 5
+#   Characters of phrase bodies kept in memory. Bodies of the least recently
+#   used phrases are read again from phrases_dir or phrases_database.
+phrases_cache_size = 1048576
 #   Global hotkeys
 _hotkeys = [('\t', ['NoModifier'])]
 pause_service = ('p', ('<Shift>', '<Super>'))
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Provides compiled phrase bundles.
+
+	A bundle holds a whole phrase library in a single read-only file,
+	meant to be memory mapped, so it loads without parsing and it's pages
+	are shared by every process mapping it. Bundles are built by
+	xpander-compile and must only be replaced, never modified in place.
+
+	Layout is a header followed by sections:
+	strings - UTF-8 string table, every distinct string stored once;
+	phrases - fixed size phrase records, in library order;
+	uuids - record indexes sorted by phrase uuid;
+	folders - every folder path;
+	hotkeys - record indexes of phrases with a hotkey;
+	nodes, edges, matches - trie of reversed hotstrings, matching
+		hotstrings that end typed text in a single backwards walk.
+	Header holds a SHA-256 digest of everything after it.
+"""
+
+import os
+import json
+import mmap
+import struct
+import hashlib
+import logging
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+MAGIC = b'XPANDER\0'
+VERSION = 1
+# Suffix of temporary files phrases are written to before they replace
+# phrase files. Files with it are never loaded.
+TEMP_SUFFIX = '.xpander-tmp'
+SECTIONS = (
+	'strings', 'phrases', 'uuids', 'folders', 'hotkeys', 'nodes', 'edges',
+	'matches')
+# Magic, version, digest and offset and item count of each section.
+HEADER = struct.Struct('<8sI32s{}I'.format(2 * len(SECTIONS)))
+# Offset and length of a string in string table.
+STRING = struct.Struct('<2I')
+# Length of strings that are None.
+NONE = 0xFFFFFFFF
+# Phrase strings stored in records, JSON values as JSON text.
+STRING_FIELDS = (
+	'uuid', 'name', 'path', 'body', 'hotstring', 'send', 'hotkey',
+	'window_class', 'window_title')
+JSON_FIELDS = ('send', 'hotkey', 'window_class', 'window_title')
+# String references, script, trigger and timestamp.
+RECORD = struct.Struct('<{}I2B2xq'.format(2 * len(STRING_FIELDS)))
+INDEX = struct.Struct('<I')
+# First edge, edge count, first match and match count.
+NODE = struct.Struct('<4I')
+# Code point and node index.
+EDGE = struct.Struct('<2I')
+
+
+class StringTable(object):
+	"""Builder of bundle string table, storing each distinct string once."""
+
+	def __init__(self):
+
+		self.data = bytearray()
+		self.__offsets = {}
+
+	def add(self, string):
+		"""Add string, return it's packed reference."""
+
+		if string is None:
+			return (0, NONE)
+		if string not in self.__offsets:
+			encoded = string.encode('utf-8')
+			self.__offsets[string] = (len(self.data), len(encoded))
+			self.data += encoded
+		return self.__offsets[string]
+
+
+def read_library(library):
+	"""Return list of phrase dicts and list of folder paths of library.
+
+		Phrases are in load order, each folder's files before it's
+		subfolders, both sorted. Names and paths are taken from file
+		locations, invalid files are skipped.
+	"""
+
+	phrases, folders = [], []
+	pending = ['.']
+	while pending:
+		folder = pending.pop()
+		folder_path = os.path.join(library, folder)
+		names = sorted(os.listdir(folder_path))
+		subfolders = []
+		for name in names:
+			path = os.path.join(folder_path, name)
+			if os.path.isdir(path):
+				subfolders.append(os.path.normpath(os.path.join(folder, name)))
+				continue
+			if name.endswith(TEMP_SUFFIX):
+				continue
+			try:
+				with open(path) as p_file:
+					phrase = json.loads(p_file.read())
+			except ValueError:
+				Logger.exception('Invalid phrase file {}.'.format(path))
+				continue
+			except OSError:
+				Logger.exception('Cannot read phrase file {}.'.format(path))
+				continue
+			if (not isinstance(phrase, dict) or
+				not isinstance(phrase.get('uuid'), str)):
+				Logger.error('Invalid phrase file {}.'.format(path))
+				continue
+			if not isinstance(phrase.get('body'), str):
+				phrase['body'] = ''
+			phrase['name'], phrase['path'] = name, folder
+			phrases.append(phrase)
+		folders.extend(subfolders)
+		pending.extend(reversed(subfolders))
+	return phrases, folders
+
+
+def build_trie(phrases):
+	"""Return lists of nodes, edges and matches of reversed hotstring trie
+	for phrases.
+	"""
+
+	root = ({}, [])
+	for index, phrase in enumerate(phrases):
+		if phrase.get('hotstring') is None:
+			continue
+		node = root
+		for char in reversed(phrase['hotstring']):
+			node = node[0].setdefault(ord(char), ({}, []))
+		node[1].append(index)
+
+	nodes, edges, matches = [], [], []
+	queue = [root]
+	for node in queue:
+		children = sorted(node[0].items())
+		nodes.append((len(edges), len(children), len(matches), len(node[1])))
+		for code_point, child in children:
+			edges.append((code_point, len(queue)))
+			queue.append(child)
+		matches.extend(node[1])
+	return nodes, edges, matches
+
+
+def compile_library(library, bundle_path):
+	"""Compile phrase library into bundle at bundle_path.
+
+		Bundle is written to a temporary file which then replaces
+		bundle_path, so processes mapping the old bundle aren't affected.
+		If bundle_path already holds an identical bundle, it's left
+		untouched. Return hex digest of bundle.
+	"""
+
+	phrases, folders = read_library(library)
+	strings = StringTable()
+	records = bytearray()
+	for phrase in phrases:
+		refs = []
+		for field in STRING_FIELDS:
+			value = phrase.get(field)
+			if field in JSON_FIELDS and value is not None:
+				value = json.dumps(value, separators=(',', ':'))
+			refs.extend(strings.add(value))
+		records += RECORD.pack(
+			*refs, bool(phrase.get('script')), phrase.get('trigger') or 0,
+			phrase.get('timestamp') or 0)
+	uuids = sorted(
+		range(len(phrases)), key=lambda index: phrases[index]['uuid'])
+	hotkeys = [
+		index for index, phrase in enumerate(phrases) if phrase.get('hotkey')]
+	folder_refs = [strings.add(folder) for folder in folders]
+	nodes, edges, matches = build_trie(phrases)
+
+	sections = (
+		(bytes(strings.data), len(strings.data)),
+		(bytes(records), len(phrases)),
+		(b''.join(INDEX.pack(index) for index in uuids), len(uuids)),
+		(b''.join(STRING.pack(*ref) for ref in folder_refs), len(folders)),
+		(b''.join(INDEX.pack(index) for index in hotkeys), len(hotkeys)),
+		(b''.join(NODE.pack(*node) for node in nodes), len(nodes)),
+		(b''.join(EDGE.pack(*edge) for edge in edges), len(edges)),
+		(b''.join(INDEX.pack(index) for index in matches), len(matches)))
+	data = b''.join(section for section, count in sections)
+	digest = hashlib.sha256(data).digest()
+	if read_digest(bundle_path) == digest.hex():
+		Logger.info('Bundle {} is up to date.'.format(bundle_path))
+		return digest.hex()
+
+	offsets = []
+	offset = HEADER.size
+	for section, count in sections:
+		offsets.extend((offset, count))
+		offset += len(section)
+	temp_path = bundle_path + '.tmp'
+	os.makedirs(os.path.dirname(os.path.abspath(bundle_path)), exist_ok=True)
+	with open(temp_path, 'wb') as bundle_file:
+		bundle_file.write(HEADER.pack(MAGIC, VERSION, digest, *offsets))
+		bundle_file.write(data)
+		bundle_file.flush()
+		os.fsync(bundle_file.fileno())
+	os.replace(temp_path, bundle_path)
+	Logger.info('Compiled {0} phrases into {1}.'.format(
+		len(phrases), bundle_path))
+	return digest.hex()
+
+
+def read_digest(bundle_path):
+	"""Return hex digest of bundle at bundle_path or None if it's missing
+	or invalid.
+	"""
+
+	try:
+		with open(bundle_path, 'rb') as bundle_file:
+			header = bundle_file.read(HEADER.size)
+		magic, version, digest = HEADER.unpack(header)[:3]
+	except (OSError, struct.error):
+		return None
+	if magic != MAGIC or version != VERSION:
+		return None
+	return digest.hex()
+
+
+class Bundle(object):
+	"""Read-only memory mapped phrase bundle.
+
+		Properties:
+		path - string path of bundle file;
+		digest - string hex digest of bundle contents.
+
+		Methods:
+		phrase - return phrase dict of record at given index;
+		index - return record index of phrase with given uuid;
+		records - yield uuid, record index and raw values of phrases;
+		uuids - return list of phrase uuids in library order;
+		folders - return list of folder paths;
+		hotkey_indexes - return record indexes of phrases with hotkey;
+		hotstring_indexes - return record indexes of phrases whose
+			hotstring ends given text.
+	"""
+
+	def __init__(self, path):
+		"""Map bundle at path.
+
+			Raise OSError if it cannot be read, ValueError if it's not
+			a valid bundle.
+		"""
+
+		self.path = path
+		with open(path, 'rb') as bundle_file:
+			try:
+				self.__data = mmap.mmap(
+					bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+			except ValueError as error:
+				raise ValueError('Empty phrase bundle.') from error
+		if len(self.__data) < HEADER.size:
+			raise ValueError('Truncated phrase bundle.')
+		header = HEADER.unpack_from(self.__data)
+		if header[0] != MAGIC:
+			raise ValueError('Not a phrase bundle.')
+		if header[1] != VERSION:
+			raise ValueError('Unsupported phrase bundle version {}.'.format(
+				header[1]))
+		self.digest = header[2].hex()
+		self.__sections = {
+			name: (header[3 + 2 * index], header[4 + 2 * index])
+			for index, name in enumerate(SECTIONS)}
+		self.__strings = self.__sections['strings'][0]
+
+	def __len__(self):
+
+		return self.__sections['phrases'][1]
+
+	def __string(self, offset, length):
+
+		if length == NONE:
+			return None
+		start = self.__strings + offset
+		return str(self.__data[start:start + length], 'utf-8')
+
+	def __item(self, section, item_struct, index):
+
+		return item_struct.unpack_from(
+			self.__data, self.__sections[section][0] + index * item_struct.size)
+
+	def __indexes(self, section, start, count):
+
+		offset = self.__sections[section][0] + start * INDEX.size
+		return list(struct.unpack_from(
+			'<{}I'.format(count), self.__data, offset))
+
+	def __raw(self, offset, length):
+
+		if length == NONE:
+			return None
+		start = self.__strings + offset
+		return self.__data[start:start + length]
+
+	def __uuid(self, index):
+
+		return self.__string(*self.__item('phrases', RECORD, index)[:2])
+
+	def phrase(self, index):
+		"""Return phrase dict of record at given index."""
+
+		record = self.__item('phrases', RECORD, index)
+		phrase = {}
+		for number, field in enumerate(STRING_FIELDS):
+			value = self.__string(*record[2 * number:2 * number + 2])
+			if field in JSON_FIELDS and value is not None:
+				value = json.loads(value)
+			phrase[field] = value
+		phrase['script'], phrase['trigger'], phrase['timestamp'] = (
+			bool(record[-3]), record[-2], record[-1])
+		return phrase
+
+	def index(self, p_uuid):
+		"""Return record index of phrase with given uuid or None if there's
+		none.
+		"""
+
+		low, high = 0, len(self)
+		while low < high:
+			middle = (low + high) // 2
+			index = self.__item('uuids', INDEX, middle)[0]
+			found = self.__uuid(index)
+			if found == p_uuid:
+				return index
+			if found < p_uuid:
+				low = middle + 1
+			else:
+				high = middle
+		return None
+
+	def records(self):
+		"""Yield tuple of uuid, record index and raw values of every phrase,
+		by uuid.
+
+			Phrases of different bundles are equal if their raw values are.
+		"""
+
+		for position in range(len(self)):
+			index = self.__item('uuids', INDEX, position)[0]
+			record = self.__item('phrases', RECORD, index)
+			values = tuple(
+				self.__raw(*record[2 * number:2 * number + 2])
+				for number in range(len(STRING_FIELDS))) + record[-3:]
+			yield str(values[0], 'utf-8'), index, values
+
+	def uuids(self):
+		"""Return list of phrase uuids in library order."""
+
+		return [self.__uuid(index) for index in range(len(self))]
+
+	def folders(self):
+		"""Return list of folder paths."""
+
+		return [
+			self.__string(*self.__item('folders', STRING, index))
+			for index in range(self.__sections['folders'][1])]
+
+	def hotkey_indexes(self):
+		"""Return list of record indexes of phrases with hotkey."""
+
+		return self.__indexes('hotkeys', 0, self.__sections['hotkeys'][1])
+
+	def hotstring_indexes(self, text):
+		"""Return sorted list of record indexes of phrases whose hotstring
+		is a suffix of text.
+		"""
+
+		first_edge, n_edges, first_match, n_matches = self.__item(
+			'nodes', NODE, 0)
+		indexes = self.__indexes('matches', first_match, n_matches)
+		for char in reversed(text):
+			code_point = ord(char)
+			low, high = first_edge, first_edge + n_edges
+			node = None
+			while low < high:
+				middle = (low + high) // 2
+				edge_point, child = self.__item('edges', EDGE, middle)
+				if edge_point == code_point:
+					node = child
+					break
+				if edge_point < code_point:
+					low = middle + 1
+				else:
+					high = middle
+			if node is None:
+				break
+			first_edge, n_edges, first_match, n_matches = self.__item(
+				'nodes', NODE, node)
+			indexes.extend(self.__indexes('matches', first_match, n_matches))
+		indexes.sort()
+		return indexes
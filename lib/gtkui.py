@@ -5,8 +5,6 @@ import re
 import collections
 import time
 import threading
-import subprocess
-import sys
 import logging
 import gi
 gi.require_version('Gtk', '3.0')
@@ -102,6 +100,7 @@ class ManagerUI(Gtk.Window):
 			[target], Gdk.DragAction.DEFAULT | Gdk.DragAction.MOVE)
 		# Selection
 		self.selection = self.treeview.get_selection()
+		self.editor_phrase = None
 		# Toolbar
 		toolbar = Gtk.Box(margin=2, spacing=2)
 		add_menu = Gtk.Menu()
@@ -223,7 +222,7 @@ class ManagerUI(Gtk.Window):
 
 		# Preferences
 		phrase_dir_label = Gtk.Label.new_with_mnemonic(
-			'Phrase _directory (needs restart)')
+			'Phrase _directory')
 		prefs_grid.attach(phrase_dir_label, 0, 0, 2, 1)
 		phrase_dir = Gtk.FileChooserButton.new(
 			'Phrase directory', Gtk.FileChooserAction.SELECT_FOLDER)
@@ -233,7 +232,7 @@ class ManagerUI(Gtk.Window):
 		prefs_grid.attach(
 			phrase_dir, 3, 0, 2, 1)
 		indicator_theme_label = Gtk.Label.new_with_mnemonic(
-			'Prefer light _indicator icon theme (needs restart)')
+			'Prefer light _indicator icon theme')
 		prefs_grid.attach(indicator_theme_label, 0, 1, 2, 1)
 		indicator_theme = Gtk.Switch()
 		indicator_theme.set_active(app.indicator_theme_light)
@@ -308,7 +307,8 @@ class ManagerUI(Gtk.Window):
 		remove_button.connect('clicked', self.remove_item)
 		self.treeview.connect('drag-data-get', self.drag_data_get)
 		self.treeview.connect('drag-data-received', self.drag_data_received)
-		self.selection.connect('changed', self.selection_changed)
+		self.selection_handler = self.selection.connect(
+			'changed', self.selection_changed)
 		text_wrap.connect('toggled', self.wrap_text)
 		insert_token.connect('changed', self.token_insert)
 		hotkey_button.connect('clicked', self.get_phrase_hotkey)
@@ -323,6 +323,8 @@ class ManagerUI(Gtk.Window):
 		lazy_title.connect('notify::active', self.lazy_title_toggle)
 		pause_expansion_set.connect('clicked', self.get_pause_expansion)
 		show_manager_set.connect('clicked', self.get_show_manager)
+		self.connect('destroy', self.window_destroyed)
+		app._phrases_manager.subscribe(self.phrases_changed)
 
 	def sort_treeview(self):
 
@@ -331,15 +333,24 @@ class ManagerUI(Gtk.Window):
 
 	def load_phrases(self):
 
+		# Maps uuids of phrases to references to their rows.
+		self.phrase_rows = {}
 		seen_paths = {'.': None}
+		for folder in sorted(app._folders):
+			path = '.'
+			for name in folder.split('/'):
+				path = os.path.join(path, name)
+				if path not in seen_paths:
+					seen_paths[path] = self.treestore.append(
+						seen_paths[os.path.dirname(path)], ['0', 'folder', name])
 		for p_uuid in app._phrases:
 			phrase = app._phrases[p_uuid]
-			if phrase['path'] in seen_paths:
-				self.treestore.append(
-					seen_paths[phrase['path']],
-					[p_uuid, 'document', phrase['name'][:-5]])
+			if phrase.path in seen_paths:
+				self.track_phrase(self.treestore.append(
+					seen_paths[phrase.path],
+					[p_uuid, 'document', phrase.name[:-5]]))
 			else:
-				path_iter = phrase['path'].split('/')
+				path_iter = phrase.path.split('/')
 				path = '.'
 				for folder in path_iter:
 					path = os.path.join(path, folder)
@@ -348,11 +359,107 @@ class ManagerUI(Gtk.Window):
 							seen_paths[os.path.dirname(path)],
 							['0', 'folder', folder])
 						seen_paths[path] = tree_iter
-				self.treestore.append(
-					seen_paths[os.path.join('.', phrase['path'])],
-					[p_uuid, 'document', phrase['name'][:-5]])
+				self.track_phrase(self.treestore.append(
+					seen_paths[os.path.join('.', phrase.path)],
+					[p_uuid, 'document', phrase.name[:-5]]))
 		self.sort_treeview()
 
+	def track_phrase(self, tree_iter):
+
+		self.phrase_rows[self.treestore[tree_iter][0]] = \
+			Gtk.TreeRowReference.new(
+				self.treestore, self.treestore.get_path(tree_iter))
+		return tree_iter
+
+	def get_folder_iter(self, path):
+
+		tree_iter = None
+		if path == '.':
+			return tree_iter
+		for name in path.split('/'):
+			child_iter = self.treestore.iter_children(tree_iter)
+			while child_iter is not None and (
+				self.treestore[child_iter][0] != '0' or
+				self.treestore[child_iter][2] != name):
+				child_iter = self.treestore.iter_next(child_iter)
+			if child_iter is None:
+				child_iter = self.treestore.append(
+					tree_iter, ['0', 'folder', name])
+			tree_iter = child_iter
+		return tree_iter
+
+	def update_folders(self, tree_iter=None):
+		"""Add rows of folders in app._folders missing from phrase tree and
+		remove empty folder rows of folders that are gone.
+		"""
+
+		if tree_iter is None:
+			for folder in app._folders:
+				self.get_folder_iter(folder)
+		child_iter = self.treestore.iter_children(tree_iter)
+		while child_iter is not None:
+			next_iter = self.treestore.iter_next(child_iter)
+			if self.treestore[child_iter][0] == '0':
+				self.update_folders(child_iter)
+				if (not self.treestore.iter_has_child(child_iter) and
+					self.get_rel_path(child_iter) not in app._folders):
+					self.treestore.remove(child_iter)
+			child_iter = next_iter
+
+	def phrases_changed(self, events):
+		"""Apply phrase events of changes made outside of the manager, e.g.
+		by editing phrase files, to phrase tree. Unsaved edits of selected
+		phrase are only discarded if user agrees to.
+		"""
+
+		model, tree_iter = self.selection.get_selected()
+		selected = model[tree_iter][0] if tree_iter is not None else None
+		moved = False
+		for event in events:
+			if not event.external:
+				continue
+			if event.type != manager.CHANGED:
+				# Keep selection, and editor, on phrase that's still there.
+				keep = event.uuid == selected and event.new is not None
+				if keep:
+					self.selection.handler_block(self.selection_handler)
+				row = self.phrase_rows.pop(event.uuid, None)
+				if row is not None and row.valid():
+					self.treestore.remove(
+						self.treestore.get_iter(row.get_path()))
+				if event.new is not None:
+					tree_iter = self.treestore.append(
+						self.get_folder_iter(event.new.path),
+						[event.uuid, 'document', event.new.name[:-5]])
+					self.track_phrase(tree_iter)
+					if keep:
+						self.treeview.expand_to_path(
+							self.treestore.get_path(tree_iter))
+						self.selection.select_iter(tree_iter)
+						self.selection.handler_unblock(self.selection_handler)
+				moved = True
+			if (event.uuid == selected and event.new is not None
+					and (not self.editor_dirty()
+						or self.confirm_reload(event.new.name[:-5]))):
+				self.selection_changed(self.selection)
+		if moved:
+			self.sort_treeview()
+
+	def confirm_reload(self, name):
+
+		dialog = Gtk.MessageDialog(
+			self, 0, Gtk.MessageType.QUESTION, Gtk.ButtonsType.YES_NO,
+			'Phrase "{}" was changed outside of the manager'.format(name))
+		dialog.format_secondary_text(
+			'Reload it and discard your unsaved changes?')
+		response = dialog.run()
+		dialog.destroy()
+		return response == Gtk.ResponseType.YES
+
+	def window_destroyed(self, widget):
+
+		app._phrases_manager.unsubscribe(self.phrases_changed)
+
 	def get_rel_path(self, tree_iter):
 
 		if tree_iter is None:
@@ -388,22 +495,12 @@ class ManagerUI(Gtk.Window):
 
 	def row_edited(self, renderer, path, text):
 
-		def move_children(parent_iter):
-
-			child_iter = self.treestore.iter_children(parent_iter)
-			for i in range(self.treestore.iter_n_children(parent_iter)):
-				if self.treestore[child_iter][0] == '0':
-					move_children(child_iter)
-				else:
-					path = self.get_rel_path(parent_iter)
-					p_uuid = self.treestore[child_iter][0]
-					app._phrases_manager.edit(p_uuid, path=path)
-				child_iter = self.treestore.iter_next(child_iter)
-
 		if self.treestore[path][0] == '0':
-			self.treestore[path][2] = text
 			tree_iter = self.treestore.get_iter(path)
-			move_children(tree_iter)
+			old_path = self.get_rel_path(tree_iter)
+			self.treestore[path][2] = text
+			app._phrases_manager.rename_folder(
+				old_path, self.get_rel_path(tree_iter))
 		else:
 			self.treestore[path][2] = text
 			p_uuid = self.treestore[path][0]
@@ -425,7 +522,8 @@ class ManagerUI(Gtk.Window):
 			path = self.get_rel_path(tree_iter)
 		name = self.get_new_phrase_name(model, parent_iter)
 		p_uuid = app._phrases_manager.new(name + '.json', path=path)
-		model.append(parent_iter, [p_uuid, 'document', name])
+		self.track_phrase(
+			model.append(parent_iter, [p_uuid, 'document', name]))
 		self.sort_treeview()
 
 	def new_folder(self, menu_item):
@@ -443,21 +541,13 @@ class ManagerUI(Gtk.Window):
 		while not self.check_name(model, parent_iter, folder_name):
 			folder_count += 1
 			folder_name = 'New folder ' + str(folder_count)
-		self.treestore.append(parent_iter, ['0', 'folder', folder_name])
+		tree_iter = self.treestore.append(
+			parent_iter, ['0', 'folder', folder_name])
+		app._phrases_manager.new_folder(self.get_rel_path(tree_iter))
 		self.sort_treeview()
 
 	def remove_item(self, widget):
 
-		def remove_children(model, parent_iter):
-
-			child_iter = model.iter_children(parent_iter)
-			for i in range(model.iter_n_children(parent_iter)):
-				if model[child_iter][0] == '0':
-					remove_children(model, child_iter)
-				else:
-					app._phrases_manager.remove(model[child_iter][0])
-				model.remove(child_iter)
-
 		model, tree_iter = self.selection.get_selected()
 		if tree_iter is not None:
 			if model[tree_iter][0] != '0':
@@ -475,7 +565,8 @@ class ManagerUI(Gtk.Window):
 						delete = False
 					dialog.destroy()
 				if delete:
-					remove_children(model, tree_iter)
+					app._phrases_manager.remove_folder(
+						self.get_rel_path(tree_iter))
 					model.remove(tree_iter)
 
 	def drag_data_get(self, widget, context, data, info, timestamp):
@@ -487,7 +578,7 @@ class ManagerUI(Gtk.Window):
 
 	def drag_data_received(self, widget, context, x, y, data, info, timestamp):
 
-		def move_children(model, source, dest):
+		def move_children(model, source, dest, edit=True):
 
 			child_iter = model.iter_children(source)
 			for i in range(model.iter_n_children(source)):
@@ -504,7 +595,7 @@ class ManagerUI(Gtk.Window):
 								parent = check_iter
 								break
 							check_iter = model.iter_next(check_iter)
-					move_children(model, child_iter, parent)
+					move_children(model, child_iter, parent, edit)
 					model.remove(child_iter)
 				else:
 					while not self.check_name(model, dest, p_name):
@@ -512,10 +603,13 @@ class ManagerUI(Gtk.Window):
 						p_name = content[2] + ' ({})'.format(name_count)
 					new_row = [content[0], content[1], p_name]
 					p_name += '.json'
-					tree_iter = model.insert(dest, -1, new_row)
+					tree_iter = self.track_phrase(
+						model.insert(dest, -1, new_row))
 					p_path = self.get_rel_path(model.iter_parent(tree_iter))
 					p_uuid = self.treestore[tree_iter][0]
-					app._phrases_manager.edit(p_uuid, path=p_path, name=p_name)
+					if edit:
+						app._phrases_manager.edit(
+							p_uuid, path=p_path, name=p_name)
 					model.remove(child_iter)
 
 		model = widget.get_model()
@@ -540,10 +634,14 @@ class ManagerUI(Gtk.Window):
 			p_name += '.json'
 			app._phrases_manager.edit(content[0], path=p_path, name=p_name)
 			print(dest)
-			model.insert(dest, -1, new_row)
+			self.track_phrase(model.insert(dest, -1, new_row))
 		else:
+			old_path = self.get_rel_path(source)
 			if self.check_name(model, dest, content[2]):
 				parent = model.insert(dest, -1, content)
+				move_children(model, source, parent, edit=False)
+				app._phrases_manager.rename_folder(
+					old_path, self.get_rel_path(parent))
 			else:
 				check_iter = model.iter_children(dest)
 				for i in range(model.iter_n_children(dest)):
@@ -551,7 +649,9 @@ class ManagerUI(Gtk.Window):
 						parent = check_iter
 						break
 					check_iter = model.iter_next(check_iter)
-			move_children(model, source, parent)
+				with app._phrases_manager.transaction():
+					move_children(model, source, parent)
+				app._phrases_manager.remove_folder(old_path)
 			model.remove(source)
 		self.sort_treeview()
 
@@ -565,42 +665,44 @@ class ManagerUI(Gtk.Window):
 		if p_uuid != '0':
 			self.right_grid.set_sensitive(True)
 			phrase = app._phrases[p_uuid]
-			if phrase['script']:
+			if phrase.script:
 				self.command.set_active(True)
 			else:
 				self.plain_text.set_active(True)
-			text_buffer.set_text(phrase['body'])
-			if phrase['hotstring']:
-				self.hotstring.set_text(phrase['hotstring'])
+			text_buffer.set_text(app._phrases_manager.body(p_uuid))
+			if phrase.hotstring:
+				self.hotstring.set_text(phrase.hotstring)
 			else:
 				self.hotstring.set_text('')
 			for index, trigger in enumerate(TRIGGERS.values()):
-				if trigger == phrase['trigger']:
+				if trigger == phrase.trigger:
 					self.triggers.set_active(index)
 					break
 			hotkey_modifiers = ''
-			if phrase['hotkey']:
-				for modifier in phrase['hotkey'][1]:
+			if phrase.hotkey:
+				for modifier in phrase.hotkey[1]:
 					hotkey_modifiers += modifier
-				self.hotkey.set_text(hotkey_modifiers + phrase['hotkey'][0])
+				self.hotkey.set_text(hotkey_modifiers + phrase.hotkey[0])
 			else:
 				self.hotkey.set_text('')
 			for index, method in enumerate(SEND.values()):
-				if method == phrase['send']:
+				if tuple(method) == phrase.send:
 					self.send.set_active(index)
 					break
-			if phrase['window_class']:
-				self.filter_class.set_text(','.join(phrase['window_class']))
+			if phrase.window_class:
+				self.filter_class.set_text(','.join(phrase.window_class))
 			else:
 				self.filter_class.set_text('')
-			if phrase['window_title']:
-				title, case_sensitive = phrase['window_title']
+			if phrase.window_title:
+				title, case_sensitive = phrase.window_title
 				self.filter_title.set_text(title)
 				self.filter_case.set_active(case_sensitive)
 			else:
 				self.filter_title.set_text('')
 				self.filter_case.set_active(False)
+			self.editor_phrase = self.get_editor_phrase()
 		else:
+			self.editor_phrase = None
 			self.right_grid.set_sensitive(False)
 			text_buffer.set_text('')
 			self.hotstring.set_text('')
@@ -644,8 +746,8 @@ class ManagerUI(Gtk.Window):
 			index, modifiers = app._interface.translate_state(
 				event.state, event.hardware_keycode)
 			modifier_string = ''
-			for modifier in modifiers:
-				if modifiers[modifier]:
+			for modifier, bit in app._interface.MODIFIER_BIT.items():
+				if modifiers & bit:
 					modifier_string += modifier
 			if modifier_string:
 				self.disconnect(self.key_event_hid)
@@ -699,75 +801,69 @@ class ManagerUI(Gtk.Window):
 				GLib.idle_add(self.filter_title.set_text, filter_title)
 				GLib.idle_add(widget.set_active, False)
 
+	def get_editor_phrase(self):
+		"""Return phrase attributes as currently shown in the editor."""
+
+		text_buffer = self.textview.get_buffer()
+		body_start, body_end = text_buffer.get_bounds()
+		p_body = text_buffer.get_text(body_start, body_end, False)
+		hotstring = self.hotstring.get_text()
+		p_hotstring = hotstring if hotstring else None
+		trigger = self.triggers.get_active_text()
+		p_trigger = TRIGGERS.get(trigger)
+		hotkey = KEY_SPLIT.match(self.hotkey.get_text())
+		if hotkey:
+			hotkey = hotkey.groups()
+			p_hotkey = (
+				hotkey[5],
+				[modifier for modifier in hotkey[:-2]
+					if modifier is not None])
+		else:
+			p_hotkey = None
+		send_method = self.send.get_active_text()
+		p_send = SEND.get(send_method)
+		filter_class = self.filter_class.get_text()
+		if filter_class:
+			p_filter_class = filter_class.split(',')
+		else:
+			p_filter_class = None
+		filter_title = self.filter_title.get_text()
+		if filter_title:
+			p_filter_title = (filter_title, self.filter_case.get_active())
+		else:
+			p_filter_title = None
+		return dict(
+			body=p_body, script=self.command.get_active(),
+			hotstring=p_hotstring, trigger=p_trigger, hotkey=p_hotkey,
+			send=p_send, window_class=p_filter_class,
+			window_title=p_filter_title)
+
+	def editor_dirty(self):
+		"""Check whether editor holds changes not saved to phrase yet."""
+
+		return (self.editor_phrase is not None
+			and self.get_editor_phrase() != self.editor_phrase)
+
 	def save_phrase(self, widget):
 
 		model, tree_iter = self.selection.get_selected()
-		text_buffer = self.textview.get_buffer()
 		p_uuid = '0'
 		if tree_iter is not None:
 			p_uuid = model[tree_iter][0]
 		if p_uuid != '0':
-			body_start, body_end = text_buffer.get_bounds()
-			p_body = text_buffer.get_text(body_start, body_end, False)
-			hotstring = self.hotstring.get_text()
-			p_hotstring = hotstring if hotstring else None
-			trigger = self.triggers.get_active_text()
-			p_trigger = TRIGGERS[trigger]
-			hotkey = KEY_SPLIT.match(self.hotkey.get_text())
-			if hotkey:
-				hotkey = hotkey.groups()
-				p_hotkey = (
-					hotkey[5],
-					[modifier for modifier in hotkey[:-2]
-						if modifier is not None])
-			else:
-				p_hotkey = None
-			send_method = self.send.get_active_text()
-			p_send = SEND[send_method]
-			filter_class = self.filter_class.get_text()
-			if filter_class:
-				p_filter_class = filter_class.split(',')
-			else:
-				p_filter_class = None
-			filter_title = self.filter_title.get_text()
-			if filter_title:
-				p_filter_title = (filter_title, self.filter_case.get_active())
-			else:
-				p_filter_title = None
-			app._phrases_manager.edit(
-				p_uuid, body=p_body, script=self.command.get_active(),
-				hotstring=p_hotstring, trigger=p_trigger, hotkey=p_hotkey,
-				send=p_send, window_class=p_filter_class,
-				window_title=p_filter_title)
-
-	def restart_app(self, warning_text):
-
-		dialog = Gtk.MessageDialog(self, 0, Gtk.MessageType.WARNING,
-			Gtk.ButtonsType.OK_CANCEL, 'Restart now?')
-		dialog.format_secondary_text(warning_text)
-		response = dialog.run()
-		dialog.destroy()
-		if response == Gtk.ResponseType.OK:
-			try:
-				subprocess.Popen(['xpander-indicator'])
-			except FileNotFoundError:
-				subprocess.Popen(['./xpander-indicator'])
-			app._interface.stop()
-			app._service.stop()
-			Gtk.main_quit()
-			sys.exit(0)
+			self.editor_phrase = self.get_editor_phrase()
+			app._phrases_manager.edit(p_uuid, **self.editor_phrase)
 
 	def set_phrase_dir(self, widget):
 
+		# Phrase rows follow the phrase events of the switch, only folder
+		# rows are left to update.
 		app._conf_manager.edit('phrases_dir', widget.get_filename())
-		self.restart_app('Phrase editing and creation will not'
-			' function corectly until application is restarted.')
+		self.update_folders()
 
 	def set_indicator_theme(self, widget, pspec):
 
 		app._conf_manager.edit('indicator_theme_light', widget.get_active())
-		self.restart_app(
-			'Changes will not take effect until application is restarted.')
 
 	def folder_warning_toggle(self, widget, pspec):
 
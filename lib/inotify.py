@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Provides minimal inotify support through ctypes.
+
+	Only the calls needed to watch directory trees for changes of
+	phrase files are wrapped.
+"""
+
+import os
+import struct
+import ctypes
+import ctypes.util
+import logging
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+# inotify_init1 flags.
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+# Event masks.
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+EVENT = struct.Struct('iIII')
+BUFFER_SIZE = 65536
+
+
+class Inotify(object):
+	"""inotify instance.
+
+		Methods:
+		add_watch - watch given path for events in given mask, return
+			int watch descriptor;
+		rm_watch - stop watching given watch descriptor;
+		read_events - return list of pending events;
+		fileno - return int file descriptor, for use with select;
+		close - close inotify instance.
+	"""
+
+	def __init__(self):
+		"""Initialize inotify instance.
+
+			Raise OSError if inotify is not available.
+		"""
+
+		try:
+			self.__libc = ctypes.CDLL(
+				ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+			self.__libc.inotify_init1
+		except (OSError, AttributeError) as error:
+			raise OSError('inotify is not available.') from error
+		self.__libc.inotify_add_watch.argtypes = (
+			ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+		self.__fd = self.__libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if self.__fd < 0:
+			self.__raise()
+
+	def __raise(self):
+
+		errno = ctypes.get_errno()
+		raise OSError(errno, os.strerror(errno))
+
+	def fileno(self):
+		"""Return int file descriptor of inotify instance."""
+
+		return self.__fd
+
+	def add_watch(self, path, mask):
+		"""Watch given path for events in given mask.
+
+			Return int watch descriptor, raise OSError on failure.
+		"""
+
+		wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(path), mask)
+		if wd < 0:
+			self.__raise()
+		return wd
+
+	def rm_watch(self, wd):
+		"""Stop watching given watch descriptor.
+
+			Raise OSError on failure, i.e. if watch was already removed.
+		"""
+
+		if self.__libc.inotify_rm_watch(self.__fd, wd) < 0:
+			self.__raise()
+
+	def read_events(self):
+		"""Return list of pending events.
+
+			Each event is a tuple of int watch descriptor, int mask,
+			int cookie and string name, which is empty for events
+			of the watched path itself.
+		"""
+
+		try:
+			data = os.read(self.__fd, BUFFER_SIZE)
+		except BlockingIOError:
+			return []
+		events = []
+		offset = 0
+		while offset < len(data):
+			wd, mask, cookie, length = EVENT.unpack_from(data, offset)
+			offset += EVENT.size
+			name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+			offset += length
+			events.append((wd, mask, cookie, name))
+		return events
+
+	def close(self):
+		"""Close inotify instance."""
+
+		if self.__fd >= 0:
+			os.close(self.__fd)
+			self.__fd = -1
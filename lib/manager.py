@@ -1,20 +1,604 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import shutil
 import threading
+import select
 import json
 import uuid
 import time
+import hashlib
+import collections
+import collections.abc
+import contextlib
+import concurrent.futures
+import multiprocessing
 import logging
-from . import app
+from gi.repository import GLib
+from . import app, inotify, store, bundle
 
 MainLogger = logging.getLogger('Xpander')
 Logger = MainLogger.getChild(__name__)
 
+SNAPSHOT_VERSION = 2
+# Phrase files are parsed in parallel, on multi-core machines, if at least
+# this many need parsing.
+PARALLEL_LOAD = 256
+# Processes phrase files are parsed in, number of CPUs if None.
+LOAD_WORKERS = None
+TEMP_SUFFIX = bundle.TEMP_SUFFIX
+# Phrase changes are written to files once there are no new ones for this
+# many seconds.
+WRITE_DELAY = 0.5
+# Changes of phrase files are applied once there are no new ones for this
+# many seconds.
+WATCH_DELAY = 0.2
+# Every this many polls of a library, files are checked even in folders
+# that didn't change.
+FULL_POLL = 12
+# User configuration is checked for changes every this many seconds where
+# inotify is not available.
+CONF_POLL = 5
+# Phrase files whose name didn't match their location at load are
+# rewritten this many seconds later, once the service is running.
+FIX_DELAY = 10
+# Filesystems on which inotify doesn't see remote changes, phrase
+# directories on them are polled instead.
+NETWORK_FILESYSTEMS = {
+	'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ncpfs', 'afs', '9p', 'ceph',
+	'glusterfs', 'fuse.sshfs', 'fuse.glusterfs', 'fuse.cephfs'}
+WATCH_MASK = (
+	inotify.IN_CLOSE_WRITE | inotify.IN_CREATE | inotify.IN_DELETE |
+	inotify.IN_MOVED_FROM | inotify.IN_MOVED_TO | inotify.IN_ONLYDIR)
+# Phrase attributes, in phrase file order.
+FIELDS = (
+	'uuid', 'name', 'body', 'path', 'script', 'send', 'hotstring', 'trigger',
+	'hotkey', 'window_class', 'window_title', 'timestamp')
+# Types of phrase events, see Phrases.subscribe.
+ADDED, CHANGED, REMOVED, MOVED = 'added', 'changed', 'removed', 'moved'
+PhraseEvent = collections.namedtuple(
+	'PhraseEvent', ('type', 'uuid', 'old', 'new', 'external'))
+
+
+def shared(value, _cache={}):
+	"""Return shared immutable copy of given JSON value.
+
+		Strings are interned and lists become tuples, equal tuples are
+		returned as the same object.
+	"""
+
+	if isinstance(value, str):
+		return sys.intern(value)
+	if isinstance(value, (list, tuple)):
+		value = tuple(shared(item) for item in value)
+		return _cache.setdefault(value, value)
+	return value
+
+
+class Phrase(object):
+	"""Phrase, see Phrases.new for meaning of it's attributes.
+
+		Paths, window classes, hotkeys and other values repeated across
+		phrases are shared, lists are stored as tuples. Body is None
+		once phrase is loaded, use Phrases.body to get it.
+	"""
+
+	__slots__ = FIELDS
+
+	def __init__(
+		self, uuid, name, body='', path='.', script=False, send=(1, 0),
+		hotstring=None, trigger=0, hotkey=None, window_class=None,
+		window_title=None, timestamp=0):
+
+		self.uuid = uuid
+		self.name = name
+		self.body = body
+		self.path = sys.intern(path)
+		self.script = script
+		self.send = shared(send)
+		self.hotstring = hotstring
+		self.trigger = trigger
+		self.hotkey = shared(hotkey)
+		self.window_class = shared(window_class)
+		self.window_title = shared(window_title)
+		self.timestamp = timestamp
+
+	@classmethod
+	def from_dict(cls, data):
+		"""Return phrase constructed from dict of attributes.
+
+			Raise ValueError if data is not a valid phrase.
+		"""
+
+		try:
+			return cls(**{
+				field: data[field] for field in FIELDS if field in data})
+		except (TypeError, AttributeError) as error:
+			raise ValueError('Invalid phrase.') from error
+
+	def to_dict(self):
+		"""Return dict of phrase attributes."""
+
+		return {field: getattr(self, field) for field in FIELDS}
+
+	def replace(self, **changes):
+		"""Return copy of phrase with given attributes changed."""
+
+		data = self.to_dict()
+		data.update(changes)
+		return Phrase(**data)
+
+	def __eq__(self, other):
+
+		if not isinstance(other, Phrase):
+			return NotImplemented
+		return all(
+			getattr(self, field) == getattr(other, field) for field in FIELDS)
+
+	__hash__ = None
+
+
+class BundlePhrases(collections.abc.Mapping):
+	"""Read-only phrases dict backed by a phrase bundle.
+
+		Phrases are built from the bundle when accessed, so only the pages
+		of the bundle in use are resident.
+	"""
+
+	def __init__(self, phrase_bundle):
+
+		self.bundle = phrase_bundle
+
+	def __getitem__(self, p_uuid):
+
+		index = self.bundle.index(p_uuid)
+		if index is None:
+			raise KeyError(p_uuid)
+		return Phrase.from_dict(self.bundle.phrase(index))
+
+	def __iter__(self):
+
+		return iter(self.bundle.uuids())
+
+	def __len__(self):
+
+		return len(self.bundle)
+
+	def items(self):
+
+		for index in range(len(self.bundle)):
+			phrase = Phrase.from_dict(self.bundle.phrase(index))
+			yield phrase.uuid, phrase
+
+	def values(self):
+
+		for index in range(len(self.bundle)):
+			yield Phrase.from_dict(self.bundle.phrase(index))
+
+	def hotkey_phrases(self):
+		"""Return list of phrases with hotkey."""
+
+		return [
+			Phrase.from_dict(self.bundle.phrase(index))
+			for index in self.bundle.hotkey_indexes()]
+
+	def hotstring_phrases(self, text):
+		"""Return list of phrases whose hotstring is a suffix of text."""
+
+		return [
+			Phrase.from_dict(self.bundle.phrase(index))
+			for index in self.bundle.hotstring_indexes(text)]
+
+
+class Layer(object):
+	"""Read-only phrase library below app.phrases_dir, either a phrase
+	directory or a bundle.
+
+		Properties:
+		path - string path of directory or bundle;
+		phrases - dict of uuids mapped to phrases, without bodies.
+
+		Methods:
+		scan - return update of layer or None if nothing changed;
+		apply - apply update returned by scan, return dict of uuids of
+			changed phrases mapped to new phrases, None if removed;
+		body - return body of phrase with given uuid.
+	"""
+
+	def __init__(self, path):
+
+		self.path = path
+		self.phrases = {}
+		self.__is_bundle = os.path.isfile(path)
+		self.__bundle = None
+		self.__signature = None
+		# Manifest of directory, see rescan_library, and dict of paths
+		# of it's phrase files mapped to their uuids.
+		self.__manifest = {}
+		self.__paths = {}
+
+	def scan(self, full=False):
+		"""Return update of layer or None if nothing changed.
+
+			Update of a bundle is the new bundle, it's only returned if
+			bundle's digest changed. Update of a directory is a dict of
+			paths of changed files mapped to their phrases, None if
+			removed. Directories are checked like by rescan_library.
+		"""
+
+		if not self.__is_bundle:
+			update = {}
+			for path in rescan_library(self.path, self.__manifest, full):
+				phrase = None
+				file_path = os.path.join(self.path, path)
+				if os.path.isfile(file_path):
+					phrase = build_phrase(read_phrase(file_path), file_path)
+				if phrase is not None:
+					folder, file_ = os.path.split(path)
+					phrase.name, phrase.path = file_, sys.intern(folder or '.')
+					phrase.body = None
+				update[path] = phrase
+			return update or None
+
+		try:
+			signature = file_signature(os.stat(self.path))
+		except OSError:
+			return None
+		if signature == self.__signature:
+			return None
+		self.__signature = signature
+		try:
+			phrase_bundle = bundle.Bundle(self.path)
+		except (OSError, ValueError):
+			Logger.exception('Cannot load phrase bundle {}.'.format(self.path))
+			return None
+		if (self.__bundle is not None and
+			phrase_bundle.digest == self.__bundle.digest):
+			return None
+		return phrase_bundle
+
+	def apply(self, update):
+		"""Apply update returned by scan to phrases dict.
+
+			Return dict of uuids of changed phrases mapped to new phrases,
+			None if they were removed.
+		"""
+
+		changes = {}
+		if self.__is_bundle:
+			changes = dict.fromkeys(self.phrases)
+			self.__bundle = update
+			self.phrases = {}
+			for index in range(len(update)):
+				phrase = Phrase.from_dict(update.phrase(index))
+				phrase.body = None
+				self.phrases[phrase.uuid] = phrase
+				changes[phrase.uuid] = phrase
+			return changes
+
+		# Removals first, so phrases moved within layer are kept.
+		for path in update:
+			old_uuid = self.__paths.pop(path, None)
+			if old_uuid is not None:
+				self.phrases.pop(old_uuid, None)
+				changes[old_uuid] = None
+		for path, phrase in update.items():
+			if phrase is not None:
+				self.__paths[path] = phrase.uuid
+				self.phrases[phrase.uuid] = phrase
+				changes[phrase.uuid] = phrase
+		return changes
+
+	def body(self, p_uuid):
+		"""Return body of phrase with given uuid or None if there's none."""
+
+		phrase = self.phrases.get(p_uuid)
+		if phrase is None:
+			return None
+		if self.__is_bundle:
+			index = self.__bundle.index(p_uuid)
+			if index is None:
+				return None
+			return self.__bundle.phrase(index)['body']
+		data = read_phrase(os.path.join(self.path, phrase.path, phrase.name))
+		return data.get('body') if isinstance(data, dict) else None
+
+
+class PhraseIndex(object):
+	"""Matcher index of phrases merged from several layers.
+
+		Phrases of a higher layer shadow phrases of lower layers with the
+		same uuid, or with the same hotstring, or hotkey, and window
+		filters. Shadowing is resolved when a layer changes, only for the
+		hotstrings and hotkeys it affects, so lookups just read the index.
+
+		Methods:
+		uuids - return set of uuids of phrases in given layer;
+		update - apply changes of given layer, return sets of hotkeys
+			no longer used and newly used;
+		hotstring_phrases - return phrases whose hotstring ends text;
+		hotkey_phrases - return phrases with one of given hotkey keys.
+	"""
+
+	def __init__(self, n_layers):
+
+		# Per layer, dict of uuids mapped to (order, phrase). Order keeps
+		# phrases of a layer in the order they were loaded.
+		self.__layers = [{} for layer in range(n_layers)]
+		self.__order = 0
+		# Per layer, dicts of hotstrings and hotkey keys mapped to sets of
+		# uuids of phrases using them.
+		self.__by_hotstring = [{} for layer in range(n_layers)]
+		self.__by_key = [{} for layer in range(n_layers)]
+		# Hotstrings and hotkey keys mapped to lists of (-layer, order,
+		# phrase) of phrases that aren't shadowed.
+		self.__hotstrings = {}
+		self.__keys = {}
+		self.__longest = 0
+		self.__hotkey_counts = collections.Counter()
+
+	def uuids(self, layer):
+		"""Return set of uuids of phrases in given layer."""
+
+		return set(self.__layers[layer])
+
+	def update(self, layer, changes):
+		"""Apply changes dict of given layer, mapping uuids to new phrases,
+		None for removed ones.
+
+			Return set of hotkeys no longer used by any phrase and set of
+			hotkeys that weren't used before.
+		"""
+
+		hotstrings, keys = set(), set()
+		counts = {}
+
+		def affect(phrase):
+			if phrase.hotstring is not None:
+				hotstrings.add(phrase.hotstring)
+			if phrase.hotkey:
+				keys.add(phrase.hotkey[0])
+
+		def count(hotkey, change):
+			counts.setdefault(hotkey, self.__hotkey_counts[hotkey])
+			self.__hotkey_counts[hotkey] += change
+
+		for p_uuid, phrase in changes.items():
+			# Same uuid in other layers may get shadowed or revealed.
+			for entries in self.__layers:
+				if p_uuid in entries:
+					affect(entries[p_uuid][1])
+			old = self.__layers[layer].pop(p_uuid, None)
+			if old is not None:
+				old_phrase = old[1]
+				if old_phrase.hotstring is not None:
+					self.__discard(self.__by_hotstring[layer],
+						old_phrase.hotstring, p_uuid)
+				if old_phrase.hotkey:
+					self.__discard(
+						self.__by_key[layer], old_phrase.hotkey[0], p_uuid)
+					count(old_phrase.hotkey, -1)
+			if phrase is None:
+				continue
+			if old is not None:
+				order = old[0]
+			else:
+				order = self.__order
+				self.__order += 1
+			self.__layers[layer][p_uuid] = (order, phrase)
+			if phrase.hotstring is not None:
+				self.__by_hotstring[layer].setdefault(
+					phrase.hotstring, set()).add(p_uuid)
+				if len(phrase.hotstring) > self.__longest:
+					self.__longest = len(phrase.hotstring)
+			if phrase.hotkey:
+				self.__by_key[layer].setdefault(
+					phrase.hotkey[0], set()).add(p_uuid)
+				count(phrase.hotkey, 1)
+			affect(phrase)
+
+		for hotstring in hotstrings:
+			self.__merge(self.__hotstrings, self.__by_hotstring, hotstring,
+				lambda phrase: (phrase.window_class, phrase.window_title))
+		for key in keys:
+			self.__merge(self.__keys, self.__by_key, key,
+				lambda phrase: (
+					phrase.hotkey, phrase.window_class, phrase.window_title))
+		lost = {hotkey for hotkey, before in counts.items()
+			if before and not self.__hotkey_counts[hotkey]}
+		gained = {hotkey for hotkey, before in counts.items()
+			if not before and self.__hotkey_counts[hotkey]}
+		for hotkey in lost:
+			del self.__hotkey_counts[hotkey]
+		return lost, gained
+
+	def __discard(self, mapping, key, p_uuid):
+
+		uuids = mapping.get(key)
+		if uuids is not None:
+			uuids.discard(p_uuid)
+			if not uuids:
+				del mapping[key]
+
+	def __merge(self, merged, by_layer, key, conflict):
+		"""Rebuild merged list of phrases for key from every layer, highest
+		first, leaving out shadowed phrases.
+
+			conflict returns the value phrases shadowing each other share.
+		"""
+
+		entries = []
+		shadowed = set()
+		for layer in reversed(range(len(self.__layers))):
+			higher = self.__layers[layer + 1:]
+			found = []
+			for p_uuid in by_layer[layer].get(key, ()):
+				if higher and any(p_uuid in entries for entries in higher):
+					continue
+				order, phrase = self.__layers[layer][p_uuid]
+				if conflict(phrase) not in shadowed:
+					found.append((-layer, order, phrase))
+			shadowed.update(conflict(entry[2]) for entry in found)
+			entries.extend(sorted(found, key=lambda entry: entry[1]))
+		if entries:
+			merged[key] = entries
+		else:
+			merged.pop(key, None)
+
+	def hotstring_phrases(self, text):
+		"""Return list of phrases whose hotstring is a suffix of text,
+		higher layers first, each in load order.
+		"""
+
+		entries = []
+		for start in range(max(0, len(text) - self.__longest), len(text) + 1):
+			entries.extend(self.__hotstrings.get(text[start:], ()))
+		entries.sort(key=lambda entry: entry[:2])
+		return [entry[2] for entry in entries]
+
+	def hotkey_phrases(self, keys):
+		"""Return list of phrases whose hotkey key is one of given keys,
+		higher layers first, each in load order.
+		"""
+
+		entries = []
+		for key in keys:
+			entries.extend(self.__keys.get(key, ()))
+		entries.sort(key=lambda entry: entry[:2])
+		return [entry[2] for entry in entries]
+
+
+class HotkeyRegistry(object):
+	"""Counts of phrases using each hotkey, grabbing hotkeys once a phrase
+	uses them and ungrabbing them once none does.
+
+		Methods:
+		hotkeys - return list of used hotkeys;
+		update - apply list of phrase events.
+	"""
+
+	def __init__(self, phrases):
+
+		self.__counts = collections.Counter(
+			phrase.hotkey for phrase in phrases if phrase.hotkey)
+
+	def hotkeys(self):
+		"""Return list of hotkeys used by at least one phrase."""
+
+		return list(self.__counts)
+
+	def update(self, events):
+		"""Apply list of phrase events, grabbing and ungrabbing hotkeys
+		whose use changed.
+		"""
+
+		before = {}
+		for event in events:
+			old = event.old.hotkey if event.old is not None else None
+			new = event.new.hotkey if event.new is not None else None
+			if old == new:
+				continue
+			for hotkey, change in ((old, -1), (new, 1)):
+				if hotkey:
+					before.setdefault(hotkey, self.__counts[hotkey])
+					self.__counts[hotkey] += change
+		for hotkey, count in before.items():
+			if not self.__counts[hotkey]:
+				del self.__counts[hotkey]
+				if count:
+					ungrab_hotkey(hotkey)
+			elif not count:
+				grab_hotkey(hotkey)
+
+
+def phrase_event(p_uuid, old, new, external=False):
+	"""Return PhraseEvent of change of phrase with given uuid from old to
+	new phrase, either None if phrase was added or removed.
+
+		Return None if phrase didn't change.
+	"""
+
+	if old is None and new is None:
+		return None
+	if old is None:
+		event_type = ADDED
+	elif new is None:
+		event_type = REMOVED
+	elif old.path != new.path or old.name != new.name:
+		event_type = MOVED
+	elif old == new:
+		return None
+	else:
+		event_type = CHANGED
+	return PhraseEvent(event_type, p_uuid, old, new, external)
+
+
+def merge_events(events):
+	"""Return list of phrase events with events of each phrase merged into
+	one, e.g. removal and addition of a moved phrase file.
+	"""
+
+	# Maps uuids to first and last event of phrase.
+	changes = collections.OrderedDict()
+	for event in events:
+		changes[event.uuid] = (changes.get(event.uuid, (event,))[0], event)
+	merged = []
+	for p_uuid, (first, last) in changes.items():
+		if first is last:
+			merged.append(first)
+			continue
+		event = phrase_event(p_uuid, first.old, last.new, first.external)
+		if event is not None:
+			merged.append(event)
+	return merged
+
+
+def bundle_events(old_bundle, new_bundle):
+	"""Return list of phrase events of replacing old_bundle with new_bundle.
+
+		Records of both are compared in uuid order, phrases are only built
+		for those that differ. Events of remaining phrases are in library
+		order of new_bundle, after those of removed phrases.
+	"""
+
+	events = []
+	old_records, new_records = old_bundle.records(), new_bundle.records()
+	old_record, new_record = next(old_records, None), next(new_records, None)
+	while old_record is not None or new_record is not None:
+		if new_record is None or (
+			old_record is not None and old_record[0] < new_record[0]):
+			events.append((-1, PhraseEvent(
+				REMOVED, old_record[0],
+				Phrase.from_dict(old_bundle.phrase(old_record[1])), None,
+				True)))
+			old_record = next(old_records, None)
+			continue
+		if old_record is None or new_record[0] < old_record[0]:
+			old = None
+		elif old_record[2] != new_record[2]:
+			old = Phrase.from_dict(old_bundle.phrase(old_record[1]))
+		else:
+			old_record = next(old_records, None)
+			new_record = next(new_records, None)
+			continue
+		event = phrase_event(
+			new_record[0], old,
+			Phrase.from_dict(new_bundle.phrase(new_record[1])), True)
+		if event is not None:
+			events.append((new_record[1], event))
+		if old is not None:
+			old_record = next(old_records, None)
+		new_record = next(new_records, None)
+	events.sort(key=lambda item: item[0])
+	return [event for index, event in events]
+
 
 def grab_hotkey(hotkey):
 
+	# Command line tools have no interface and grab nothing.
+	if getattr(app, '_interface', None) is None:
+		return
 	keycode = app._interface.lookup_keycode(
 		app._interface.lookup_keysym(hotkey[0]))
 	mask = 0
@@ -25,6 +609,8 @@ def grab_hotkey(hotkey):
 
 def ungrab_hotkey(hotkey):
 
+	if getattr(app, '_interface', None) is None:
+		return
 	keycode = app._interface.lookup_keycode(
 		app._interface.lookup_keysym(hotkey[0]))
 	mask = 0
@@ -45,18 +631,304 @@ def ungrab_hotkeys():
 		ungrab_hotkey(hotkey)
 
 
+def snapshot_path(library):
+	"""Return path of phrase library snapshot for given phrases directory."""
+
+	return os.path.join(app._cache_dir, 'phrases-{}.json'.format(
+		hashlib.sha1(os.path.abspath(library).encode()).hexdigest()))
+
+
+def read_snapshot(path, library):
+	"""Return phrase library snapshot dict read from path.
+
+		Snapshot maps 'dirs' to dict of directory paths relative to library,
+		mapped to list of directory modification time, list of subdirectory
+		names and list of file names. It maps 'files' to dict of file paths
+		relative to library, mapped to list of file signature and phrase.
+		Return empty snapshot if it's missing, invalid, outdated or
+		belongs to another library.
+	"""
+
+	try:
+		with open(path) as snapshot_file:
+			snapshot = json.loads(snapshot_file.read())
+		if (snapshot['version'] == SNAPSHOT_VERSION and
+			snapshot['library'] == os.path.abspath(library)):
+			return {'dirs': snapshot['dirs'], 'files': snapshot['files']}
+	except FileNotFoundError:
+		pass
+	except Exception:
+		Logger.exception('Invalid phrase library snapshot.')
+	return {'dirs': {}, 'files': {}}
+
+
+def write_snapshot(path, library, snapshot):
+	"""Atomically write phrase library snapshot dict to path."""
+
+	temp_path = path + '.tmp'
+	try:
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		with open(temp_path, 'w') as snapshot_file:
+			snapshot_file.write(json.dumps({
+				'version': SNAPSHOT_VERSION,
+				'library': os.path.abspath(library),
+				'dirs': snapshot['dirs'],
+				'files': snapshot['files']}, separators=(',', ':')))
+		os.replace(temp_path, path)
+	except OSError:
+		Logger.exception('Cannot write phrase library snapshot.')
+
+
+def file_signature(stat_result):
+	"""Return list of modification time, size and inode of given
+	os.stat_result, used to tell if a file changed.
+	"""
+
+	return [stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino]
+
+
+def read_phrase(file_path):
+	"""Return phrase dict parsed from file_path or None if it's invalid.
+
+		Dicts, rather than phrases, are returned, so phrases are built and
+		their values shared in the loading process.
+	"""
+
+	try:
+		with open(file_path) as p_file:
+			return json.loads(p_file.read())
+	except ValueError:
+		Logger.exception('Invalid phrase file {}.'.format(file_path))
+	except OSError:
+		Logger.exception('Cannot read phrase file {}.'.format(file_path))
+	return None
+
+
+def is_phrase_file(name):
+	"""Return True if file name may be a phrase file."""
+
+	return not name.endswith(TEMP_SUFFIX)
+
+
+def dump_phrase(phrase):
+	"""Return JSON text of phrase file of phrase.
+
+		Output equals json.dumps with tab indent and sorted keys, only
+		nested values go through the slow indenting encoder.
+	"""
+
+	encode = json.encoder.encode_basestring_ascii
+	lines = []
+	for key, value in sorted(phrase.to_dict().items()):
+		if isinstance(value, str):
+			value = encode(value)
+		elif isinstance(value, (list, tuple, dict)) and value:
+			value = json.dumps(value, indent='\t', sort_keys=True).replace(
+				'\n', '\n\t')
+		else:
+			value = json.dumps(value)
+		lines.append('\t' + encode(key) + ': ' + value)
+	return '{\n' + ',\n'.join(lines) + '\n}'
+
+
+def write_temp(library, phrase):
+	"""Write phrase to temporary file next to it's file in library and sync
+	it to disk, return tuple of temporary and phrase file path.
+	"""
+
+	file_path = os.path.join(library, phrase.path, phrase.name)
+	temp_path = file_path + TEMP_SUFFIX
+	try:
+		p_file = open(temp_path, 'w')
+	except FileNotFoundError:
+		os.makedirs(os.path.dirname(file_path), exist_ok=True)
+		p_file = open(temp_path, 'w')
+	with p_file:
+		p_file.write(dump_phrase(phrase))
+		p_file.flush()
+		os.fsync(p_file.fileno())
+	return temp_path, file_path
+
+
+def write_phrase(library, phrase):
+	"""Atomically write phrase to it's file in library.
+
+		Phrase is written to a temporary file which then replaces the
+		phrase file, so it's never left truncated.
+	"""
+
+	os.replace(*write_temp(library, phrase))
+
+
+def write_phrases(library, phrases):
+	"""Atomically write every phrase of phrases to it's file in library,
+	return list of phrases written.
+
+		Like write_phrase, but each folder written to is synced to disk
+		once, after it's phrase files are replaced, so their renames are
+		durable too. Phrases that cannot be written are logged and left
+		out.
+	"""
+
+	written = []
+	folders = set()
+	for phrase in phrases:
+		try:
+			temp_path, file_path = write_temp(library, phrase)
+			os.replace(temp_path, file_path)
+		except OSError:
+			Logger.exception('Cannot write phrase {}.'.format(
+				os.path.join(phrase.path, phrase.name)))
+		else:
+			written.append(phrase)
+			folders.add(os.path.dirname(file_path))
+	for folder in folders:
+		try:
+			fd = os.open(folder, os.O_RDONLY)
+			try:
+				os.fsync(fd)
+			finally:
+				os.close(fd)
+		except OSError:
+			Logger.exception('Cannot sync phrase folder {}.'.format(folder))
+	return written
+
+
+def build_phrase(data, file_path):
+	"""Return phrase built from dict parsed from file_path or None if
+	it's invalid.
+	"""
+
+	if data is None:
+		return None
+	try:
+		return Phrase.from_dict(data)
+	except ValueError:
+		Logger.exception('Invalid phrase file {}.'.format(file_path))
+	return None
+
+
+def scan_folder(library, folder):
+	"""Return manifest entry of folder, relative to library.
+
+		Entry is a list of folder modification time, dict of file names
+		mapped to their signatures and list of subfolder paths relative
+		to library. Return None if folder doesn't exist.
+	"""
+
+	folder_path = os.path.join(library, folder)
+	files, folders = {}, []
+	try:
+		mtime = os.stat(folder_path).st_mtime_ns
+		with os.scandir(folder_path) as entries:
+			for entry in entries:
+				try:
+					if entry.is_dir():
+						folders.append(
+							os.path.normpath(os.path.join(folder, entry.name)))
+					elif is_phrase_file(entry.name):
+						files[entry.name] = file_signature(entry.stat())
+				except FileNotFoundError:
+					pass
+	except OSError:
+		return None
+	return [mtime, files, folders]
+
+
+def rescan_library(library, manifest, full=False):
+	"""Update manifest dict of library and return set of paths of changed
+	files, relative to library.
+
+		manifest maps folder paths relative to library to entries returned
+		by scan_folder. Only folders whose modification time changed are
+		listed again, unless full is True. Files modified in place don't
+		change their folder, so they're only seen on full rescans.
+	"""
+
+	changed = set()
+	seen = set()
+	folders = ['.']
+	while folders:
+		folder = folders.pop()
+		seen.add(folder)
+		entry = manifest.get(folder)
+		if entry is not None and not full:
+			try:
+				unchanged = os.stat(
+					os.path.join(library, folder)).st_mtime_ns == entry[0]
+			except OSError:
+				unchanged = False
+			if unchanged:
+				folders.extend(entry[2])
+				continue
+		new_entry = scan_folder(library, folder)
+		old_files = entry[1] if entry is not None else {}
+		new_files = new_entry[1] if new_entry is not None else {}
+		for name in old_files.keys() | new_files.keys():
+			if old_files.get(name) != new_files.get(name):
+				changed.add(os.path.normpath(os.path.join(folder, name)))
+		if new_entry is None:
+			manifest.pop(folder, None)
+		else:
+			manifest[folder] = new_entry
+			folders.extend(new_entry[2])
+	for folder in list(manifest):
+		if folder not in seen:
+			for name in manifest.pop(folder)[1]:
+				changed.add(os.path.normpath(os.path.join(folder, name)))
+	return changed
+
+
+def filesystem_type(path):
+	"""Return string type of filesystem given path is on.
+
+		Return empty string if it cannot be determined.
+	"""
+
+	path = os.path.realpath(path)
+	fs_type, mount_point = '', ''
+	try:
+		with open('/proc/mounts') as mounts:
+			for line in mounts:
+				fields = line.split()
+				if len(fields) < 3:
+					continue
+				point = fields[1].replace('\\040', ' ')
+				if ((path == point or
+					path.startswith(os.path.join(point, ''))) and
+					len(point) >= len(mount_point)):
+					fs_type, mount_point = fields[2], point
+	except OSError:
+		pass
+	return fs_type
+
+
 class Conf(object):
+	"""User configuration, stored in app._config_dir/Xpander.json.
+
+		Changed keys are applied to app right away, written after
+		WRITE_DELAY. Changes made to the file outside of the application
+		are applied too, in Gtk main loop.
+	"""
 
-	def __init__(self):
+	def __init__(self, watch=True):
 		"""Load initial configuration and grab/ungrab global hotkeys.
 
 			If user configuration exists, load it. Else load defaults.
+			If watch is False, changes of Xpander.json aren't applied,
+			e.g. in command line tools.
 		"""
 
 		self.config = {}
 		self.__user_config_path = os.path.join(app._config_dir, 'Xpander.json')
 		self.__json_types = (
 			str, bool, int, float, list, tuple, dict, type(None))
+		# Lock guards config and writes, timer writes config after
+		# WRITE_DELAY.
+		self.__write_lock = threading.RLock()
+		self.__write_timer = None
+		# Callbacks called with dicts of changed keys, see self.subscribe.
+		self.__subscribers = []
 
 		try:
 			self.read_user()
@@ -77,15 +949,22 @@ class Conf(object):
 			app._hotkeys.append(app.pause_service)
 		if app.show_manager:
 			app._hotkeys.append(app.show_manager)
+		if watch:
+			self.watch()
 
 	def read_defaults(self):
-		"""Read default configuration into config."""
+		"""Read default configuration into config.
+
+			Values are stored as they'd be read from Xpander.json, i.e.
+			tuples become lists.
+		"""
 
 		Logger.debug('Reading default configuration.')
 		for name in dir(app):
 			if (not name.startswith('_') and
 				type(getattr(app, name)) in self.__json_types):
 				self.config[name] = getattr(app, name)
+		self.config = json.loads(json.dumps(self.config))
 
 	def read_user(self):
 		"""Read user configuration into config."""
@@ -121,80 +1000,880 @@ class Conf(object):
 		return
 
 	def write(self):
-		"""Write configuration stored in config to app._config_dir/config.json.
+		"""Atomically write configuration stored in config to
+		app._config_dir/Xpander.json.
 		"""
 
 		Logger.debug('Writing configuration.')
+		temp_path = self.__user_config_path + TEMP_SUFFIX
 		try:
-			with open(self.__user_config_path, 'w') as user_config:
-				user_config.write(json.dumps(
-					self.config, ensure_ascii=False, indent='\t', sort_keys=True))
+			with self.__write_lock:
+				with open(temp_path, 'w') as user_config:
+					user_config.write(json.dumps(
+						self.config, ensure_ascii=False, indent='\t',
+						sort_keys=True))
+					user_config.flush()
+					os.fsync(user_config.fileno())
+				os.replace(temp_path, self.__user_config_path)
 		except:
 			Logger.exception('Cannot save user configuration.')
 
+	def flush(self):
+		"""Write configuration now if it has changes pending.
+
+			Must be called before application exits.
+		"""
+
+		with self.__write_lock:
+			if self.__write_timer is None:
+				return
+			self.__write_timer.cancel()
+			self.__write_timer = None
+			self.write()
+
+	def __schedule_write(self):
+		"""Write configuration once there are no new changes for
+		WRITE_DELAY.
+		"""
+
+		with self.__write_lock:
+			if self.__write_timer is not None:
+				self.__write_timer.cancel()
+			self.__write_timer = threading.Timer(WRITE_DELAY, self.flush)
+			self.__write_timer.daemon = True
+			self.__write_timer.start()
+
 	def edit(self, key, value):
-		"""Replace value of given key, load it to app and save to config.json"""
+		"""Replace value of given key, load it to app and schedule write of
+		Xpander.json.
+
+			Value is stored as it'd be read from Xpander.json, i.e. tuples
+			become lists.
+		"""
+
+		self.__apply({key: json.loads(json.dumps(value))})
+		self.__schedule_write()
+
+	def subscribe(self, callback):
+		"""Call callback with dict of changed keys mapped to their new
+		values whenever configuration changes.
+		"""
 
-		if key == 'pause_service':
-			if app.pause_service:
-				ungrab_hotkey(app.pause_service)
-			if value:
-				grab_hotkey(value)
-		if key == 'show_manager':
-			if app.show_manager:
-				ungrab_hotkey(app.show_manager)
-			if value:
-				grab_hotkey(value)
+		if callback not in self.__subscribers:
+			self.__subscribers.append(callback)
 
-		self.config[key] = value
-		self.load()
-		self.write()
+	def unsubscribe(self, callback):
+		"""Stop calling callback with configuration changes."""
+
+		if callback in self.__subscribers:
+			self.__subscribers.remove(callback)
+
+	def __apply(self, changes):
+		"""Apply dict of changed keys to config and app, updating hotkey
+		grabs and phrases.
+		"""
+
+		for key, value in changes.items():
+			if key in ('pause_service', 'show_manager'):
+				if getattr(app, key):
+					ungrab_hotkey(getattr(app, key))
+				if value:
+					grab_hotkey(value)
+			with self.__write_lock:
+				self.config[key] = value
+			phrases_manager = getattr(app, '_phrases_manager', None)
+			if key == 'phrases_dir' and phrases_manager is not None:
+				phrases_manager.set_library(value)
+				continue
+			if key in ('phrases_database', 'phrases_bundle', 'phrases_layers'):
+				Logger.info('{} is applied after restart.'.format(key))
+			setattr(app, key, value)
+		for callback in list(self.__subscribers):
+			try:
+				callback(changes)
+			except Exception:
+				Logger.exception('Configuration subscriber failed.')
+
+	def watch(self):
+		"""Watch Xpander.json for changes made outside of the application
+		and apply them with self.__reload.
+
+			Without inotify, the file is checked every CONF_POLL seconds.
+		"""
+
+		try:
+			notifier = inotify.Inotify()
+		except OSError:
+			Logger.info('Polling user configuration.')
+			threading.Thread(
+				target=self.__poller,
+				name='Configuration Poller', daemon=True).start()
+			return
+		try:
+			notifier.add_watch(
+				app._config_dir, inotify.IN_CLOSE_WRITE | inotify.IN_MOVED_TO)
+		except OSError:
+			Logger.exception('Cannot watch user configuration.')
+			notifier.close()
+			return
+		threading.Thread(
+			target=self.__watcher, args=(notifier,),
+			name='Configuration Watcher', daemon=True).start()
+
+	def __watcher(self, notifier):
+		"""Wait for writes of Xpander.json and reload it once they settle
+		down.
+		"""
+
+		name = os.path.basename(self.__user_config_path)
+		changed = False
+		while True:
+			try:
+				readable = select.select(
+					[notifier], [], [], WATCH_DELAY if changed else None)[0]
+			except (OSError, ValueError):
+				Logger.info('Disabling configuration watcher.')
+				break
+			if not readable:
+				GLib.idle_add(self.__reload)
+				changed = False
+				continue
+			for wd, mask, cookie, event_name in notifier.read_events():
+				if event_name == name:
+					changed = True
+
+	def __poller(self):
+		"""Check signature of Xpander.json every CONF_POLL seconds and
+		reload it once it changes.
+		"""
+
+		signature = None
+		while True:
+			try:
+				new_signature = file_signature(
+					os.stat(self.__user_config_path))
+			except OSError:
+				new_signature = None
+			if signature is not None and new_signature != signature:
+				GLib.idle_add(self.__reload)
+			signature = new_signature
+			time.sleep(CONF_POLL)
+
+	def __reload(self):
+		"""Read Xpander.json and apply keys whose values changed.
+
+			Changes not written yet take precedence, they overwrite the
+			file once written.
+		"""
+
+		with self.__write_lock:
+			if self.__write_timer is not None:
+				return False
+		try:
+			with open(self.__user_config_path) as user_config:
+				config = json.loads(user_config.read())
+		except (OSError, ValueError):
+			Logger.exception('Cannot read user configuration.')
+			return False
+		if not isinstance(config, dict):
+			Logger.error('Invalid user configuration.')
+			return False
+		changes = {
+			key: value for key, value in config.items()
+			if not key.startswith('_') and value != self.config.get(key)}
+		if changes:
+			Logger.info('Reloading configuration of {}.'.format(
+				', '.join(sorted(changes))))
+			self.__apply(changes)
+		return False
 
 
 class Phrases(object):
 
-	def __init__(self, app):
+	def __init__(self, app, watch=True):
+		"""Load phrases of app.phrases_dir and it's layers.
+
+			If watch is False, changes made outside of the manager aren't
+			picked up, e.g. in command line tools.
+		"""
 
 		self.app = app
 		self.app._phrases = {}
+		# Paths of folders relative to app.phrases_dir, including empty ones.
+		self.app._folders = set()
+		# Uuids of phrases whose changes aren't written yet, written by
+		# self.flush after WRITE_DELAY. Lock guards them and phrase files.
+		self.__pending_writes = collections.OrderedDict()
+		self.__write_lock = threading.RLock()
+		self.__write_timer = None
+		# Maps paths of phrase files, relative to app.phrases_dir, the
+		# manager wrote to their signature afterwards, so the watcher
+		# tells it's own writes from changes made outside of the manager.
+		self.__written = {}
+		# Paths of folders renamed by the manager whose watcher events
+		# aren't applied yet, relative to app.phrases_dir.
+		self.__moved_folders = set()
+		# Maps uuids of phrases changed in current transaction to their
+		# state before it, None for new phrases. None outside transactions.
+		self.__transaction = None
+		# Maps uuids, or layer paths and uuids for phrases of layers, to
+		# bodies of recently used phrases, least recently used first,
+		# holding up to app.phrases_cache_size characters.
+		self.__bodies = collections.OrderedDict()
+		self.__bodies_size = 0
+		self.__body_lock = threading.RLock()
+		self.__bundle = None
+		self.__store = None
+		if self.app.phrases_database:
+			self.__store = store.PhraseStore(
+				os.path.expanduser(self.app.phrases_database))
+		# Read-only layers below app.phrases_dir, lowest first, and matcher
+		# index merging them with it. Without layers, phrases of a database
+		# or bundle are looked up in it instead and index is None.
+		self.__layers = [
+			Layer(os.path.expanduser(path))
+			for path in self.app.phrases_layers]
+		self.__index = None
+		# Callbacks called with lists of phrase events, see self.subscribe.
+		self.__subscribers = []
+		# Write end of pipe closed to stop phrase watcher.
+		self.__stop_watcher = None
+		self.__watching = watch
 		self.load(self.app.phrases_dir)
-		for p_uuid, phrase in self.app._phrases.items():
-			if phrase['hotkey']:
-				self.app._hotkeys.append(phrase['hotkey'])
+		if self.__layers or (self.__store is None and self.__bundle is None):
+			self.__index = PhraseIndex(len(self.__layers) + 1)
+			changes = [
+				(len(self.__layers), dict(self.app._phrases.items()))]
+			for number, layer in enumerate(self.__layers):
+				Logger.info('Loading phrase layer {}.'.format(layer.path))
+				update = layer.scan(full=True)
+				if update is not None:
+					changes.append((number, layer.apply(update)))
+			for number, layer_changes in changes:
+				# Nothing is removed while building index, so no hotkey is lost.
+				self.app._hotkeys.extend(
+					self.__index.update(number, layer_changes)[1])
+			self.subscribe(self.__index_events)
+		else:
+			if self.__bundle is not None:
+				phrases = self.app._phrases.hotkey_phrases()
+			else:
+				phrases = self.app._phrases.values()
+			hotkeys = HotkeyRegistry(phrases)
+			self.app._hotkeys.extend(hotkeys.hotkeys())
+			self.subscribe(hotkeys.update)
+		if watch:
+			self.watch(self.app.phrases_dir)
 
 	def load(self, folder):
-		"""Recursively load phrases from app.phrases_dir into phrases dict."""
+		"""Recursively load phrases from folder into phrases dict.
+
+			If phrases are stored in a database, they're loaded from it
+			instead, once folder is imported into it. Files unchanged since
+			the last snapshot of folder are taken from it, directories
+			unchanged since then aren't listed again. Only new and modified
+			files are parsed, in a process pool if there are many of them.
+			Snapshot is rewritten afterwards if anything changed. Names and
+			paths not matching file locations are fixed in memory, files
+			with wrong names are rewritten later by self.__fix_files.
+
+			Bodies aren't kept, see self.body. If app.phrases_bundle is set,
+			phrases are mapped from that bundle instead and can't be edited.
+		"""
+
+		if self.app.phrases_bundle:
+			try:
+				phrase_bundle = bundle.Bundle(
+					os.path.expanduser(self.app.phrases_bundle))
+			except (OSError, ValueError):
+				Logger.exception('Cannot load phrase bundle.')
+			else:
+				Logger.info('Loading phrase bundle {}.'.format(
+					phrase_bundle.digest))
+				self.__bundle = phrase_bundle
+				self.app._phrases = BundlePhrases(phrase_bundle)
+				self.app._folders.update(phrase_bundle.folders())
+				return
+
+		if self.__store is not None:
+			if not self.__store.is_empty():
+				for data in self.__store.phrases():
+					self.app._phrases[data['uuid']] = Phrase.from_dict(data)
+				self.app._folders.update(self.__store.folders())
+				return
+			if not os.path.isdir(folder):
+				return
+			Logger.info('Importing {} into phrase database.'.format(folder))
+
+		path = snapshot_path(folder)
+		if self.__store is None:
+			old_snapshot = read_snapshot(path, folder)
+		else:
+			# Snapshot holds no bodies, every file has to be imported.
+			old_snapshot = {'dirs': {}, 'files': {}}
+		new_snapshot = {'dirs': {}, 'files': {}}
+		# List of [folder, file name, signature, phrase] in walk order,
+		# phrase is None until parsed.
+		entries = []
+		self.__scan_folder(folder, '.', old_snapshot, new_snapshot, entries)
 
-		for file_ in os.listdir(folder):
-			Logger.info('Loading phrase {}'.format(file_))
-			update = False
+		pending = [entry for entry in entries if entry[3] is None]
+		paths = [os.path.join(folder, entry[0], entry[1]) for entry in pending]
+		phrases = None
+		workers = LOAD_WORKERS or os.cpu_count() or 1
+		if len(paths) >= PARALLEL_LOAD and workers > 1:
+			Logger.info('Loading {} phrases in parallel.'.format(len(paths)))
 			try:
-				with open(os.path.join(folder, file_)) as p_file:
+				# Workers are forked from a fresh server process, as this
+				# one may have threads running, e.g. a previous watcher.
+				with concurrent.futures.ProcessPoolExecutor(
+					max_workers=workers,
+					mp_context=multiprocessing.get_context('forkserver')
+				) as executor:
+					phrases = list(executor.map(
+						read_phrase, paths,
+						chunksize=max(1, len(paths) // (4 * workers))))
+			except Exception:
+				Logger.exception('Cannot load phrases in parallel.')
+		if phrases is None:
+			phrases = []
+			for entry, file_path in zip(pending, paths):
+				Logger.info('Loading phrase {}'.format(entry[1]))
+				phrases.append(read_phrase(file_path))
+		# List of [uuid, folder, file name] of phrase files with wrong name.
+		stale = []
+		for entry, file_path, data in zip(pending, paths, phrases):
+			phrase = build_phrase(data, file_path)
+			if phrase is not None and self.__fix_phrase(
+				entry[0], entry[1], phrase):
+				stale.append([phrase.uuid, entry[0], entry[1]])
+			entry[3] = phrase
+
+		self.__manifest = {}
+		for p_folder, (mtime, folders, files) in new_snapshot['dirs'].items():
+			self.__manifest[p_folder] = [mtime, {}, [
+				os.path.normpath(os.path.join(p_folder, name))
+				for name in folders]]
+		for p_folder, file_, signature, phrase in entries:
+			self.__manifest[p_folder][1][file_] = signature
+			if phrase is not None:
+				self.app._phrases[phrase.uuid] = phrase
+				if self.__store is None:
+					phrase.body = None
+					key = os.path.join(p_folder, file_)
+					cached = old_snapshot['files'].get(key)
+					if cached is None or cached[0] != signature:
+						cached = [signature, phrase.to_dict()]
+					new_snapshot['files'][key] = cached
+		self.app._folders.update(
+			p_folder for p_folder in new_snapshot['dirs'] if p_folder != '.')
+		if self.__store is not None:
+			self.__store.apply(
+				phrases=[
+					phrase.to_dict() for phrase in self.app._phrases.values()],
+				folders=self.app._folders)
+			for phrase in self.app._phrases.values():
+				phrase.body = None
+		else:
+			# Cached phrases hold tuples where snapshot has lists, so
+			# snapshots are compared by what was parsed and listed.
+			if (pending or new_snapshot['dirs'] != old_snapshot['dirs'] or
+				new_snapshot['files'].keys() != old_snapshot['files'].keys()):
+				write_snapshot(path, folder, new_snapshot)
+			if stale:
+				timer = threading.Timer(
+					FIX_DELAY, self.__fix_files, args=(folder, stale))
+				timer.daemon = True
+				timer.start()
+
+	def __scan_folder(
+		self, library, folder, old_snapshot, new_snapshot, entries):
+		"""Append phrase files of folder, relative to library, and it's
+		subfolders to entries list, recording folders in new_snapshot.
+
+			Phrases of files whose signature matches old_snapshot are taken
+			from it.
+		"""
+
+		folder_path = os.path.join(library, folder)
+		mtime = os.stat(folder_path).st_mtime_ns
+		entry = old_snapshot['dirs'].get(folder)
+		signatures = {}
+		if entry is not None and entry[0] == mtime:
+			mtime, folders, files = entry
+		else:
+			folders, files = [], []
+			with os.scandir(folder_path) as dir_entries:
+				for dir_entry in dir_entries:
 					try:
-						phrase = json.loads(p_file.read())
-						if not phrase['name'] == file_:
-							phrase['name'] = file_
-							update = True
-						if not phrase['path'] == os.path.relpath(
-							folder, start=self.app.phrases_dir):
-							phrase['path'] = os.path.relpath(
-								folder, start=self.app.phrases_dir)
-							update = True
-						self.app._phrases[phrase['uuid']] = phrase
-					except ValueError:
-						Logger.exception('Invalid phrase file.')
-			except IsADirectoryError:
-				self.load(os.path.join(folder, file_))
-
-			if update:
-				Logger.debug('Updating phrase file {}.'.format(file_))
-				with open(os.path.join(folder, file_), 'w') as p_file:
-					p_file.write(json.dumps(phrase, indent='\t', sort_keys=True))
+						if dir_entry.is_dir():
+							folders.append(dir_entry.name)
+						elif is_phrase_file(dir_entry.name):
+							signatures[dir_entry.name] = file_signature(
+								dir_entry.stat())
+							files.append(dir_entry.name)
+					except FileNotFoundError:
+						pass
+			folders.sort()
+			files.sort()
+		new_snapshot['dirs'][folder] = [mtime, folders, files]
+
+		for file_ in files:
+			try:
+				signature = signatures.get(file_) or file_signature(
+					os.stat(os.path.join(folder_path, file_)))
+			except FileNotFoundError:
+				continue
+			cached = old_snapshot['files'].get(os.path.join(folder, file_))
+			phrase = None
+			if cached is not None and cached[0] == signature:
+				try:
+					phrase = Phrase.from_dict(cached[1])
+				except ValueError:
+					pass
+			entries.append([folder, file_, signature, phrase])
+		for name in folders:
+			self.__scan_folder(
+				library, os.path.normpath(os.path.join(folder, name)),
+				old_snapshot, new_snapshot, entries)
+
+	def __fix_phrase(self, folder, file_, phrase):
+		"""Fix name and path of phrase parsed from file_ in folder.
+
+			Return True if name was wrong. Phrase file isn't rewritten.
+			Location of file is authoritative, so a wrong path, as left by
+			renaming it's folder, isn't worth rewriting it.
+		"""
+
+		update = False
+		if not phrase.name == file_:
+			phrase.name = file_
+			update = True
+		if not phrase.path == folder:
+			phrase.path = sys.intern(folder)
+		return update
+
+	def __fix_files(self, library, stale):
+		"""Rewrite phrase files of library listed in stale with their
+		name fixed, in a low priority thread.
+
+			Files are rewritten one at a time, so the manager isn't blocked
+			for long. Phrases changed since load are skipped, the manager
+			writes them itself. Files served from the snapshot are never
+			listed, it already holds their fixed phrases.
+		"""
+
+		try:
+			os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+		except (AttributeError, OSError):
+			pass
+		Logger.info('Updating {} phrase files.'.format(len(stale)))
+		for p_uuid, folder, file_ in stale:
+			if library != self.app.phrases_dir:
+				break
+			with self.__write_lock:
+				phrase = self.app._phrases.get(p_uuid)
+				if (phrase is None or p_uuid in self.__pending_writes or
+					phrase.path != folder or phrase.name != file_):
+					continue
+				file_path = os.path.join(library, folder, file_)
+				phrase = build_phrase(read_phrase(file_path), file_path)
+				if phrase is None or phrase.uuid != p_uuid:
+					continue
+				self.__fix_phrase(folder, file_, phrase)
+				Logger.debug('Updating phrase file {}.'.format(file_path))
+				try:
+					write_phrase(library, phrase)
+				except OSError:
+					Logger.exception(
+						'Cannot update phrase file {}.'.format(file_path))
+				else:
+					self.__record_write(phrase)
+
+	def watch(self, library):
+		"""Watch library for phrase files changed outside of the manager.
+
+			Libraries on network filesystems, or any library if inotify is
+			not available, are polled every app.phrases_poll_interval
+			seconds instead. Changes are applied to phrases dict in Gtk
+			main loop. Phrases stored in a database aren't watched,
+			bundles are polled for replacement. Layers are polled too.
+		"""
+
+		if self.__layers and self.app.phrases_poll_interval:
+			threading.Thread(
+				target=self.__layer_poller,
+				name='Layer Poller', daemon=True).start()
+		if self.__bundle is not None:
+			if self.app.phrases_poll_interval:
+				threading.Thread(
+					target=self.__bundle_poller, args=(self.__bundle.path,),
+					name='Bundle Poller', daemon=True).start()
+			return
+		if self.__store is not None:
+			return
+		self.__watch_library(library)
+
+	def __watch_library(self, library):
+		"""Watch or poll library for changed phrase files, see self.watch.
+		"""
+
+		fs_type = filesystem_type(library)
+		if fs_type not in NETWORK_FILESYSTEMS:
+			try:
+				notifier = inotify.Inotify()
+			except OSError:
+				Logger.exception('Cannot watch phrase directory.')
+			else:
+				stop, self.__stop_watcher = os.pipe()
+				threading.Thread(
+					target=self.__watcher, args=(notifier, library, stop),
+					name='Phrase Watcher', daemon=True).start()
+				return
+		if self.app.phrases_poll_interval:
+			Logger.info('Polling phrase directory on {} filesystem.'.format(
+				fs_type or 'unknown'))
+			threading.Thread(
+				target=self.__poller, args=(library,),
+				name='Phrase Poller', daemon=True).start()
+
+	def __bundle_poller(self, path):
+		"""Check bundle at path every app.phrases_poll_interval seconds and
+		switch to it once it's replaced with a different bundle.
+
+			Bundles with unchanged digest aren't reloaded. Phrase events
+			of the switch are found here, off the Gtk main loop.
+		"""
+
+		current = self.__bundle
+		try:
+			signature = file_signature(os.stat(path))
+		except OSError:
+			signature = None
+		while self.app.phrases_poll_interval:
+			time.sleep(self.app.phrases_poll_interval)
+			try:
+				new_signature = file_signature(os.stat(path))
+			except OSError:
+				continue
+			if new_signature == signature:
+				continue
+			signature = new_signature
+			try:
+				phrase_bundle = bundle.Bundle(path)
+			except (OSError, ValueError):
+				Logger.exception('Cannot load phrase bundle.')
+				continue
+			if phrase_bundle.digest == current.digest:
+				Logger.debug('Phrase bundle unchanged.')
+				continue
+			events = bundle_events(current, phrase_bundle)
+			current = phrase_bundle
+			GLib.idle_add(self.__switch_bundle, phrase_bundle, events)
+		Logger.info('Disabling bundle poller.')
+
+	def __layer_poller(self):
+		"""Scan layers every app.phrases_poll_interval seconds and apply
+		their updates with self.__apply_layer.
+		"""
+
+		polls = 0
+		while self.app.phrases_poll_interval:
+			time.sleep(self.app.phrases_poll_interval)
+			polls += 1
+			for number, layer in enumerate(self.__layers):
+				update = layer.scan(full=not polls % FULL_POLL)
+				if update is not None:
+					GLib.idle_add(self.__apply_layer, number, layer, update)
+		Logger.info('Disabling layer poller.')
+
+	def __apply_layer(self, number, layer, update):
+		"""Apply update of layer with given number to it and matcher index.
+		"""
+
+		Logger.info('Reloading phrase layer {}.'.format(layer.path))
+		changes = layer.apply(update)
+		for p_uuid in changes:
+			self.__uncache_body((layer.path, p_uuid))
+		self.__reindex(changes, number)
+		return False
+
+	def __index_events(self, events):
+		"""Apply list of phrase events of app.phrases_dir to matcher index.
+		"""
+
+		self.__reindex({event.uuid: event.new for event in events})
+
+	def __reindex(self, changes, layer=None):
+		"""Apply changes dict, mapping uuids to new phrases, None for removed
+		ones, of layer with given number to matcher index and grab and
+		ungrab hotkeys whose use changed.
+
+			Layer defaults to app.phrases_dir.
+		"""
+
+		if layer is None:
+			layer = len(self.__layers)
+		lost, gained = self.__index.update(layer, changes)
+		for hotkey in lost:
+			ungrab_hotkey(hotkey)
+		for hotkey in gained:
+			grab_hotkey(hotkey)
+
+	def __switch_bundle(self, phrase_bundle, events):
+		"""Replace phrases with those of given bundle and emit list of
+		phrase events of the switch.
+		"""
+
+		Logger.info('Reloading phrase bundle {}.'.format(phrase_bundle.digest))
+		# Old bundle is unmapped once nothing refers to it.
+		self.__bundle = phrase_bundle
+		self.app._phrases = BundlePhrases(phrase_bundle)
+		self.app._folders = set(phrase_bundle.folders())
+		self.__emit(events)
+		return False
+
+	def __poller(self, library):
+		"""Rescan library every app.phrases_poll_interval seconds and apply
+		files whose signature changed with self.__apply_changes.
+
+			See rescan_library for what each rescan checks.
+		"""
+
+		manifest = self.__manifest
+		polls = 0
+		while self.app.phrases_poll_interval:
+			time.sleep(self.app.phrases_poll_interval)
+			if library != self.app.phrases_dir:
+				break
+			polls += 1
+			old_folders = set(manifest)
+			files = rescan_library(
+				library, manifest, full=not polls % FULL_POLL)
+			folders = old_folders ^ set(manifest)
+			if files or folders:
+				GLib.idle_add(self.__apply_changes, library, files, folders)
+		Logger.info('Disabling phrase poller.')
+
+	def __watcher(self, notifier, library, stop):
+		"""Wait for changes in library and apply them with
+		self.__apply_changes once they settle down.
+
+			Watcher stops once write end of stop pipe is closed.
+		"""
+
+		Logger.debug('Initializing phrase watcher.')
+		# Maps watch descriptors to folders relative to library.
+		watches = {}
+
+		def watch_folder(folder):
+			for dirpath, dirnames, filenames in os.walk(
+				os.path.join(library, folder)):
+				try:
+					wd = notifier.add_watch(dirpath, WATCH_MASK)
+				except OSError:
+					continue
+				watches[wd] = os.path.relpath(dirpath, start=library)
+
+		def unwatch_folder(folder):
+			prefix = os.path.join(folder, '')
+			for wd, path in list(watches.items()):
+				if path == folder or path.startswith(prefix):
+					del watches[wd]
+					try:
+						notifier.rm_watch(wd)
+					except OSError:
+						pass
+
+		watch_folder('.')
+		files, folders = set(), set()
+		while True:
+			try:
+				readable = select.select(
+					[notifier, stop], [], [],
+					WATCH_DELAY if files or folders else None)[0]
+			except (OSError, ValueError):
+				Logger.info('Disabling phrase watcher.')
+				break
+			if stop in readable:
+				Logger.info('Disabling phrase watcher of {}.'.format(library))
+				notifier.close()
+				os.close(stop)
+				break
+			if not readable:
+				GLib.idle_add(self.__apply_changes, library, files, folders)
+				files, folders = set(), set()
+				continue
+			for wd, mask, cookie, name in notifier.read_events():
+				if mask & inotify.IN_Q_OVERFLOW:
+					Logger.info('Phrase watcher overflow, rescanning.')
+					folders.add('.')
+					continue
+				if mask & inotify.IN_IGNORED:
+					watches.pop(wd, None)
+					continue
+				folder = watches.get(wd)
+				if folder is None or not name:
+					continue
+				path = os.path.normpath(os.path.join(folder, name))
+				if mask & inotify.IN_ISDIR:
+					if mask & (inotify.IN_CREATE | inotify.IN_MOVED_TO):
+						watch_folder(path)
+					else:
+						unwatch_folder(path)
+					folders.add(path)
+				elif not mask & inotify.IN_CREATE and is_phrase_file(name):
+					files.add(path)
+
+	def __apply_changes(self, library, files, folders):
+		"""Apply changes of given sets of files and folders, relative to
+		library, to phrases dict.
+		"""
+
+		if library != self.app.phrases_dir:
+			return False
+		if self.__moved_folders:
+			# Echo of folders renamed by the manager, phrases and folders
+			# were updated by it already.
+			moved = folders & self.__moved_folders
+			self.__moved_folders -= moved
+			folders -= moved
+		index = {}
+		for p_uuid, phrase in self.app._phrases.items():
+			index[os.path.normpath(
+				os.path.join(phrase.path, phrase.name))] = p_uuid
+		for folder in folders:
+			prefix = os.path.join(folder, '') if folder != '.' else ''
+			present = set()
+			self.app._folders.difference_update([
+				path for path in self.app._folders
+				if path == folder or path.startswith(prefix)])
+			for dirpath, dirnames, filenames in os.walk(
+				os.path.join(library, folder)):
+				path = os.path.normpath(os.path.relpath(dirpath, start=library))
+				if path != '.':
+					self.app._folders.add(path)
+				for file_ in filenames:
+					if is_phrase_file(file_):
+						present.add(os.path.normpath(os.path.relpath(
+							os.path.join(dirpath, file_), start=library)))
+			for path in list(index):
+				if path.startswith(prefix) and path not in present:
+					files.add(path)
+			files |= present
+		events = []
+		with self.__write_lock:
+			for path in files:
+				events.extend(self.__apply_change(library, path, index))
+		self.__emit(merge_events(events))
+		return False
+
+	def __apply_change(self, library, path, index):
+		"""Apply change of file at path, relative to library, to phrases
+		dict and return list of it's phrase events.
+
+			index maps paths of loaded phrases to their uuid and is kept
+			up to date.
+		"""
+
+		try:
+			signature = file_signature(os.stat(os.path.join(library, path)))
+		except OSError:
+			signature = None
+		if signature is not None and self.__written.get(path) == signature:
+			# Echo of the manager's own write, it's phrase is up to date.
+			return []
+		self.__written.pop(path, None)
+		old_uuid = index.pop(path, None)
+		phrase = None
+		if os.path.isfile(os.path.join(library, path)):
+			phrase = build_phrase(
+				read_phrase(os.path.join(library, path)), path)
+		if phrase is not None:
+			folder, file_ = os.path.split(path)
+			# Location is authoritative, file isn't rewritten for it.
+			self.__fix_phrase(folder or '.', file_, phrase)
+			phrase.body = None
+		events = []
+		if old_uuid is not None and (
+			phrase is None or phrase.uuid != old_uuid):
+			Logger.info('Removing phrase {}'.format(path))
+			old_phrase = self.app._phrases.pop(old_uuid, None)
+			if old_phrase is not None:
+				events.append(PhraseEvent(
+					REMOVED, old_uuid, old_phrase, None, True))
+		if phrase is None:
+			return events
+		if phrase.uuid in self.__pending_writes:
+			# Manager's own changes, not written yet, take precedence.
+			return events
+		self.__uncache_body(phrase.uuid)
+
+		current = self.app._phrases.get(phrase.uuid)
+		if current is not None:
+			index.pop(os.path.normpath(
+				os.path.join(current.path, current.name)), None)
+		index[path] = phrase.uuid
+		event = phrase_event(phrase.uuid, current, phrase, external=True)
+		# Bodies aren't kept in phrases, a file changed outside of the
+		# manager with same fields may differ in it's body only.
+		if event is None and current is not None:
+			event = PhraseEvent(CHANGED, phrase.uuid, current, phrase, True)
+		if event is None:
+			return events
+		Logger.info('Reloading phrase {}'.format(path))
+		self.app._phrases[phrase.uuid] = phrase
+		events.append(event)
+		return events
+
+	def set_library(self, library):
+		"""Switch app.phrases_dir to library and load it's phrases without
+		restart, emitting phrase events of differences.
+
+			Pending changes are written to the previous library first.
+			Phrases stored in a database or bundle are kept, they don't
+			depend on app.phrases_dir once loaded.
+		"""
+
+		self.flush()
+		with self.__write_lock:
+			if library == self.app.phrases_dir:
+				return
+			Logger.info('Switching phrase directory to {}.'.format(library))
+			self.app.phrases_dir = library
+			if self.__store is not None or self.__bundle is not None:
+				return
+			if self.__stop_watcher is not None:
+				os.close(self.__stop_watcher)
+				self.__stop_watcher = None
+			old_phrases = self.app._phrases
+			self.app._phrases = {}
+			self.app._folders = set()
+			self.__written.clear()
+			self.__moved_folders.clear()
+			with self.__body_lock:
+				self.__bodies.clear()
+				self.__bodies_size = 0
+			os.makedirs(library, exist_ok=True)
+			self.load(library)
+			events = [
+				PhraseEvent(REMOVED, p_uuid, phrase, None, True)
+				for p_uuid, phrase in old_phrases.items()
+				if p_uuid not in self.app._phrases]
+			for p_uuid, phrase in self.app._phrases.items():
+				event = phrase_event(
+					p_uuid, old_phrases.get(p_uuid), phrase, True)
+				if event is not None:
+					events.append(event)
+		self.__emit(events)
+		if self.__watching:
+			self.__watch_library(library)
 
 	def new(
 		self, name, body='', path='.', script=False, send=(1, 0), hotstring=None,
 		trigger=0, hotkey=None, window_class=None, window_title=None):
-		"""Construct new phrase, add it to phrase dict and save to file.
+		"""Construct new phrase, add it to phrase dict and schedule it's
+		file write, once transaction ends.
 
 			name is a string file name;
 			path is a string path relative to app.phrases_dir;
@@ -216,101 +1895,489 @@ class Phrases(object):
 				second member is boolean wether match is case-sensitive.
 		"""
 
-		if hotkey is not None:
-			grab_hotkey(hotkey)
-
-		file_path = os.path.join(app.phrases_dir, path, name)
 		p_uuid = str(uuid.uuid1())
-		phrase = {
-			'uuid': p_uuid,
-			'name': name,
-			'body': body,
-			'path': path,
-			'script': script,
-			'send': send,
-			'hotstring': hotstring,
-			'trigger': trigger,
-			'hotkey': hotkey,
-			'window_class': window_class,
-			'window_title': window_title,
-			'timestamp': int(time.time())}
-		app._phrases[p_uuid] = phrase
-		if not os.path.isdir(os.path.dirname(file_path)):
-			os.makedirs(os.path.dirname(file_path), exist_ok=True)
-		with open(file_path, 'w') as p_file:
-			p_file.write(json.dumps(phrase, indent='\t', sort_keys=True))
+		phrase = Phrase(
+			uuid=p_uuid,
+			name=name,
+			body=body,
+			path=path,
+			script=script,
+			send=send,
+			hotstring=hotstring,
+			trigger=trigger,
+			hotkey=hotkey,
+			window_class=window_class,
+			window_title=window_title,
+			timestamp=int(time.time()))
+		with self.transaction():
+			self.__transaction[p_uuid] = None
+			app._phrases[p_uuid] = phrase
 
 		return p_uuid
 
+	def add(self, phrase):
+		"""Add phrase, replacing phrase with the same uuid, and schedule
+		it's file write, once transaction ends.
+		"""
+
+		with self.transaction():
+			self.__transaction.setdefault(
+				phrase.uuid, app._phrases.get(phrase.uuid))
+			app._phrases[phrase.uuid] = phrase
+
 	def edit(
 		self, p_uuid, name='KEEP', body='KEEP', path='KEEP', script='KEEP',
 		send='KEEP', hotstring='KEEP', trigger='KEEP', hotkey='KEEP',
 		window_class='KEEP', window_title='KEEP'):
-		"""Edit phrase, update phrase dict and replace phrase file."""
+		"""Edit phrase, update phrase dict and move phrase file and schedule
+		it's write, once transaction ends.
+		"""
 
-		if hotkey != 'KEEP' and hotkey is not None:
-			if app._phrases[p_uuid]['hotkey'] is not None:
-				ungrab_hotkey(app._phrases[p_uuid]['hotkey'])
-			grab_hotkey(hotkey)
+		phrase = Phrase(
+			uuid=p_uuid,
+			name=name if name != 'KEEP' else app._phrases[p_uuid].name,
+			body=body if body != 'KEEP' else self.body(p_uuid),
+			path=path if path != 'KEEP' else app._phrases[p_uuid].path,
+			script=(script if script != 'KEEP'
+				else app._phrases[p_uuid].script),
+			send=send if send != 'KEEP' else app._phrases[p_uuid].send,
+			hotstring=(hotstring if hotstring != 'KEEP'
+				else app._phrases[p_uuid].hotstring),
+			trigger=(trigger if trigger != 'KEEP'
+				else app._phrases[p_uuid].trigger),
+			hotkey=(hotkey if hotkey != 'KEEP'
+				else app._phrases[p_uuid].hotkey),
+			window_class=(window_class if window_class != 'KEEP'
+				else app._phrases[p_uuid].window_class),
+			window_title=(window_title if window_title != 'KEEP'
+				else app._phrases[p_uuid].window_title),
+			timestamp=int(time.time()))
 
-		phrase = {
-			'uuid': p_uuid,
-			'name': name if name != 'KEEP' else app._phrases[p_uuid]['name'],
-			'body': body if body != 'KEEP' else app._phrases[p_uuid]['body'],
-			'path': path if path != 'KEEP' else app._phrases[p_uuid]['path'],
-			'script': (script if script != 'KEEP'
-				else app._phrases[p_uuid]['script']),
-			'send': send if send != 'KEEP' else app._phrases[p_uuid]['send'],
-			'hotstring': (hotstring if hotstring != 'KEEP'
-				else app._phrases[p_uuid]['hotstring']),
-			'trigger': (trigger if trigger != 'KEEP'
-				else app._phrases[p_uuid]['trigger']),
-			'hotkey': (hotkey if hotkey != 'KEEP'
-				else app._phrases[p_uuid]['hotkey']),
-			'window_class': (window_class if window_class != 'KEEP'
-				else app._phrases[p_uuid]['window_class']),
-			'window_title': (window_title if window_title != 'KEEP'
-				else app._phrases[p_uuid]['window_title']),
-			'timestamp': int(time.time())}
-
-		move = False
-		if (phrase['path'] != app._phrases[p_uuid]['path'] or
-			phrase['name'] != app._phrases[p_uuid]['name']):
-			move = True
-			old_path = os.path.abspath(os.path.join(
-				app.phrases_dir,
-				app._phrases[p_uuid]['path'],
-				app._phrases[p_uuid]['name']))
-			new_path = os.path.abspath(os.path.join(
-				app.phrases_dir,
-				phrase['path'],
-				phrase['name']))
-
-		app._phrases[p_uuid] = phrase
-		if move:
-			os.renames(old_path, new_path)
-
-		with open(os.path.abspath(os.path.join(app.phrases_dir,
-			app._phrases[p_uuid]['path'],
-			app._phrases[p_uuid]['name'])), 'w') as p_file:
-			p_file.write(json.dumps(phrase, indent='\t', sort_keys=True))
+		with self.transaction():
+			self.__transaction.setdefault(p_uuid, app._phrases[p_uuid])
+			app._phrases[p_uuid] = phrase
 
 	def remove(self, p_uuid):
-		"""Remove phrase from phrases dict and delete phrase file."""
+		"""Remove phrase from phrases dict and delete phrase file, once
+		transaction ends.
+		"""
+
+		with self.transaction():
+			self.__transaction.setdefault(p_uuid, app._phrases[p_uuid])
+			del app._phrases[p_uuid]
+		self.__uncache_body(p_uuid)
+
+	def new_folder(self, path):
+		"""Create folder at path, relative to app.phrases_dir."""
+
+		self.__check_writable()
+		path = os.path.normpath(path)
+		if self.__store is not None:
+			self.__store.apply(folders=self.__add_folder(path))
+		else:
+			os.makedirs(os.path.join(app.phrases_dir, path), exist_ok=True)
+			self.__add_folder(path)
+
+	def __add_folder(self, path):
+		"""Add folder at path and it's parents to folders set and return
+		list of them.
+		"""
+
+		folders = []
+		while path and path != '.':
+			self.app._folders.add(path)
+			folders.append(path)
+			path = os.path.dirname(path)
+		return folders
+
+	def rename_folder(self, path, new_path):
+		"""Rename or move folder at path to new_path, both relative to
+		app.phrases_dir.
+
+			Folder is moved with a single rename and paths of it's phrases
+			are updated in memory only, their files aren't rewritten.
+			If new_path already exists, folders are merged by moving each
+			phrase instead.
+		"""
+
+		self.__check_writable()
+		path, new_path = os.path.normpath(path), os.path.normpath(new_path)
+		if path == new_path:
+			return
+		old_dir = os.path.join(app.phrases_dir, path)
+		new_dir = os.path.join(app.phrases_dir, new_path)
+		prefix = os.path.join(path, '')
+
+		def moved(p_path):
+			if p_path == path:
+				return new_path
+			return os.path.join(new_path, p_path[len(prefix):])
+
+		with self.__write_lock:
+			if self.__store is not None:
+				exists = new_path in self.app._folders
+			else:
+				exists = os.path.lexists(new_dir)
+			if exists:
+				with self.transaction():
+					for p_uuid, phrase in list(app._phrases.items()):
+						if phrase.path == path or phrase.path.startswith(
+							prefix):
+							self.edit(p_uuid, path=moved(phrase.path))
+			else:
+				if self.__store is not None:
+					self.__store.rename_folder(path, new_path)
+				elif os.path.isdir(old_dir):
+					os.makedirs(os.path.dirname(new_dir), exist_ok=True)
+					if self.__stop_watcher is not None:
+						self.__moved_folders.update((path, new_path))
+					os.rename(old_dir, new_dir)
+				events = []
+				for p_uuid, phrase in list(app._phrases.items()):
+					if phrase.path == path or phrase.path.startswith(prefix):
+						app._phrases[p_uuid] = phrase.replace(
+							path=moved(phrase.path))
+						if self.__store is None:
+							self.__written.pop(os.path.normpath(os.path.join(
+								phrase.path, phrase.name)), None)
+							self.__record_write(app._phrases[p_uuid])
+						events.append(PhraseEvent(
+							MOVED, p_uuid, phrase, app._phrases[p_uuid], False))
+				self.__emit(events)
+			folders = [
+				folder for folder in self.app._folders
+				if folder == path or folder.startswith(prefix)]
+			self.app._folders.difference_update(folders)
+			self.app._folders.update(moved(folder) for folder in folders)
+			self.new_folder(new_path)
+		self.__prune_folder(path)
+
+	def remove_folder(self, path):
+		"""Remove folder at path, relative to app.phrases_dir, with it's
+		phrases.
+
+			Folders are only deleted if they're left empty.
+		"""
+
+		path = os.path.normpath(path)
+		prefix = os.path.join(path, '')
+		with self.transaction():
+			for p_uuid, phrase in list(app._phrases.items()):
+				if phrase.path == path or phrase.path.startswith(prefix):
+					self.remove(p_uuid)
+		self.__prune_folder(path)
+
+	def __prune_folder(self, path):
+		"""Delete folder at path, relative to app.phrases_dir, and it's
+		subfolders if they're empty and forget those that don't exist.
+
+			In a database, folder and subfolders are deleted unconditionally.
+		"""
+
+		prefix = os.path.join(path, '')
+		if self.__store is not None:
+			folders = [
+				folder for folder in self.app._folders
+				if folder == path or folder.startswith(prefix)]
+			self.app._folders.difference_update(folders)
+			self.__store.apply(removed_folders=folders)
+			return
+		for dirpath, dirnames, filenames in os.walk(
+			os.path.join(app.phrases_dir, path), topdown=False):
+			try:
+				os.rmdir(dirpath)
+			except OSError:
+				pass
+		self.app._folders.difference_update([
+			folder for folder in self.app._folders
+			if (folder == path or folder.startswith(prefix)) and
+			not os.path.isdir(os.path.join(app.phrases_dir, folder))])
+
+	def subscribe(self, callback):
+		"""Call callback with list of phrase events of each batch of
+		changes of phrases dict.
+
+			Each event is a PhraseEvent of type ADDED, CHANGED, REMOVED or
+			MOVED, for phrases whose path or name changed, with uuid and
+			old and new phrase, None if there's none. external is True
+			for changes not made by editing phrases, in phrase files, by
+			replacing the bundle or switching app.phrases_dir, those are
+			emitted in Gtk main loop. Layers below app.phrases_dir don't
+			emit events.
+		"""
 
-		if app._phrases[p_uuid]['hotkey'] is not None:
-			ungrab_hotkey(app._phrases[p_uuid]['hotkey'])
+		if callback not in self.__subscribers:
+			self.__subscribers.append(callback)
 
-		p_file = os.path.abspath(os.path.join(
-			app.phrases_dir, app._phrases[p_uuid]['path'],
-			app._phrases[p_uuid]['name']))
-		p_dir = os.path.abspath(os.path.join(
-			app.phrases_dir, app._phrases[p_uuid]['path']))
+	def unsubscribe(self, callback):
+		"""Stop calling callback with phrase events."""
 
-		del app._phrases[p_uuid]
+		if callback in self.__subscribers:
+			self.__subscribers.remove(callback)
 
+	def __emit(self, events):
+		"""Call every subscriber with list of phrase events, if any."""
+
+		if not events:
+			return
+		for callback in list(self.__subscribers):
+			try:
+				callback(events)
+			except Exception:
+				Logger.exception('Phrase event subscriber failed.')
+
+	@contextlib.contextmanager
+	def transaction(self):
+		"""Return context manager batching new, edit and remove calls.
+
+			Phrases dict is updated immediately. When the outermost
+			transaction ends, phrase files are moved, removed and scheduled
+			for writing together and hotkeys are grabbed and ungrabbed
+			in one pass.
+		"""
+
+		self.__check_writable()
+		with self.__write_lock:
+			if self.__transaction is not None:
+				yield self
+				return
+			self.__transaction = {}
+			try:
+				yield self
+			finally:
+				changes, self.__transaction = self.__transaction, None
+				self.__commit(changes)
+
+	def __check_writable(self):
+		"""Raise PermissionError if phrases are mapped from a bundle."""
+
+		if self.__bundle is not None:
+			raise PermissionError('Phrase bundle {} is read-only.'.format(
+				self.__bundle.path))
+
+	def __commit(self, changes):
+		"""Apply changes dict of a transaction to phrase files, or database,
+		and emit it's phrase events.
+		"""
+
+		events = []
+		stored, removed, folders = [], [], []
+		for p_uuid, original in changes.items():
+			phrase = app._phrases.get(p_uuid)
+			event = phrase_event(p_uuid, original, phrase)
+			if event is not None:
+				events.append(event)
+
+			if self.__store is not None:
+				if phrase is None:
+					removed.append(p_uuid)
+				else:
+					stored.append(phrase.to_dict())
+					folders.extend(
+						self.__add_folder(os.path.normpath(phrase.path)))
+				continue
+			if original is not None:
+				old_path = os.path.abspath(os.path.join(
+					app.phrases_dir, original.path, original.name))
+				if phrase is None:
+					self.__pending_writes.pop(p_uuid, None)
+					self.__written.pop(os.path.normpath(os.path.join(
+						original.path, original.name)), None)
+					# Emptied folders are kept, like in app._folders, they're
+					# only deleted by self.remove_folder.
+					try:
+						os.remove(old_path)
+					except OSError:
+						pass
+					continue
+				new_path = os.path.abspath(os.path.join(
+					app.phrases_dir, phrase.path, phrase.name))
+				# File of a new phrase may not be written yet.
+				if old_path != new_path and os.path.exists(old_path):
+					os.makedirs(os.path.dirname(new_path), exist_ok=True)
+					os.rename(old_path, new_path)
+					self.__written.pop(os.path.normpath(os.path.join(
+						original.path, original.name)), None)
+					self.__record_write(phrase)
+			if phrase is not None:
+				self.__add_folder(os.path.normpath(phrase.path))
+				self.__schedule_write(p_uuid)
+
+		if self.__store is not None:
+			self.__store.apply(phrases=stored, removed=removed, folders=folders)
+			for data in stored:
+				self.__release_body(app._phrases[data['uuid']])
+		self.__emit(events)
+
+	def hotstring_candidates(self, text, window_class):
+		"""Return list of phrases whose hotstring is a suffix of text.
+
+			Phrases are looked up in matcher index. Without layers, phrases
+			stored in a database are looked up by it's index instead and
+			only those whose window class filter matches window_class
+			returned, phrases of a bundle in it's hotstring trie.
+		"""
+
+		if self.__index is not None:
+			return self.__index.hotstring_phrases(text)
+		if self.__bundle is not None:
+			return self.app._phrases.hotstring_phrases(text)
+		phrases = []
+		for p_uuid in self.__store.hotstring_candidates(text, window_class):
+			phrase = self.app._phrases.get(p_uuid)
+			if phrase is not None:
+				phrases.append(phrase)
+		return phrases
+
+	def hotkey_candidates(self, keys, window_class):
+		"""Return list of phrases whose hotkey key is one of given keys.
+
+			Phrases are looked up in matcher index. Without layers, phrases
+			stored in a database are looked up by it's index instead and
+			only those whose window class filter matches window_class
+			returned.
+		"""
+
+		if self.__index is not None:
+			return self.__index.hotkey_phrases(keys)
+		if self.__bundle is not None:
+			return [
+				phrase for phrase in self.app._phrases.hotkey_phrases()
+				if phrase.hotkey[0] in keys]
+		phrases = []
+		for p_uuid in self.__store.hotkey_candidates(keys, window_class):
+			phrase = self.app._phrases.get(p_uuid)
+			if phrase is not None:
+				phrases.append(phrase)
+		return phrases
+
+	def __schedule_write(self, p_uuid):
+		"""Write phrase with given uuid to it's file after WRITE_DELAY.
+
+			Repeated changes of the same phrase are written once.
+		"""
+
+		with self.__write_lock:
+			self.__pending_writes[p_uuid] = None
+			if self.__write_timer is None:
+				self.__write_timer = threading.Timer(WRITE_DELAY, self.flush)
+				self.__write_timer.daemon = True
+				self.__write_timer.start()
+
+	def flush(self):
+		"""Write every phrase with changes pending to it's file.
+
+			Must be called before application exits.
+		"""
+
+		with self.__write_lock:
+			if self.__write_timer is not None:
+				self.__write_timer.cancel()
+				self.__write_timer = None
+			pending = self.__pending_writes
+			self.__pending_writes = collections.OrderedDict()
+			phrases = [
+				app._phrases[p_uuid] for p_uuid in pending
+				if p_uuid in app._phrases]
+			# Folders of bulk changes, like imports, are synced once.
+			if len(phrases) > 1:
+				Logger.debug('Writing {} phrases.'.format(len(phrases)))
+				for phrase in write_phrases(app.phrases_dir, phrases):
+					self.__record_write(phrase)
+					self.__release_body(phrase)
+				return
+			for phrase in phrases:
+				Logger.debug('Writing phrase {}.'.format(phrase.uuid))
+				try:
+					write_phrase(app.phrases_dir, phrase)
+				except OSError:
+					Logger.exception('Cannot write phrase {}.'.format(
+						os.path.join(phrase.path, phrase.name)))
+				else:
+					self.__record_write(phrase)
+					self.__release_body(phrase)
+
+	def __record_write(self, phrase):
+		"""Remember signature of phrase file the manager just wrote, or
+		moved, so the watcher skips it's echo.
+		"""
+
+		path = os.path.normpath(os.path.join(phrase.path, phrase.name))
 		try:
-			os.remove(p_file)
-			os.removedirs(p_dir)
+			self.__written[path] = file_signature(
+				os.stat(os.path.join(self.app.phrases_dir, path)))
 		except OSError:
-			pass
+			self.__written.pop(path, None)
+
+	def body(self, p_uuid):
+		"""Return body of phrase with given uuid.
+
+			Bodies of loaded phrases are read from their files, or database,
+			when needed and the most recently used are kept in memory,
+			up to app.phrases_cache_size characters. Phrases not in
+			app.phrases_dir are looked up in layers, highest first. Return
+			empty string if there's no such phrase.
+		"""
+
+		key, layer = p_uuid, None
+		phrase = self.app._phrases.get(p_uuid)
+		if phrase is None:
+			for layer in reversed(self.__layers):
+				if p_uuid in layer.phrases:
+					key = (layer.path, p_uuid)
+					break
+			else:
+				return ''
+		# Bodies of phrases with changes not yet written are kept in them.
+		elif phrase.body is not None:
+			return phrase.body
+		with self.__body_lock:
+			body = self.__bodies.get(key)
+			if body is not None:
+				self.__bodies.move_to_end(key)
+				return body
+		if layer is not None:
+			body = layer.body(p_uuid)
+		elif self.__store is not None:
+			body = self.__store.body(p_uuid)
+		else:
+			data = read_phrase(os.path.join(
+				self.app.phrases_dir, phrase.path, phrase.name))
+			if isinstance(data, dict):
+				body = data.get('body')
+		if not isinstance(body, str):
+			body = ''
+		self.__cache_body(key, body)
+		return body
+
+	def __cache_body(self, p_uuid, body):
+		"""Keep body of phrase with given uuid in memory, dropping least
+		recently used bodies over app.phrases_cache_size characters.
+		"""
+
+		with self.__body_lock:
+			self.__uncache_body(p_uuid)
+			if len(body) > self.app.phrases_cache_size:
+				return
+			self.__bodies[p_uuid] = body
+			self.__bodies_size += len(body)
+			while self.__bodies_size > self.app.phrases_cache_size:
+				self.__bodies_size -= len(self.__bodies.popitem(last=False)[1])
+
+	def __uncache_body(self, p_uuid):
+		"""Drop body of phrase with given uuid from memory, return it or
+		None if it wasn't cached.
+		"""
+
+		with self.__body_lock:
+			body = self.__bodies.pop(p_uuid, None)
+			if body is not None:
+				self.__bodies_size -= len(body)
+			return body
+
+	def __release_body(self, phrase):
+		"""Move body of written phrase from it to the cache of bodies."""
+
+		if phrase.body is not None:
+			self.__cache_body(phrase.uuid, phrase.body)
+			phrase.body = None
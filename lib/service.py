@@ -9,7 +9,7 @@ import shlex
 import time
 import logging
 from gi.repository import GLib
-from . import app, CONSTANTS, gtkui
+from . import app, CONSTANTS, gtkui, XInterface
 
 MainLogger = logging.getLogger('Xpander')
 Logger = MainLogger.getChild(__name__)
@@ -22,7 +22,6 @@ class Service(threading.Thread):
 		threading.Thread.__init__(self)
 		self.daemon = True
 		self.name = 'Listener service'
-		self.phrases = app._phrases
 		app._run_service = True
 		self.__queue = queue.Queue()
 		self.input_stack = collections.deque(maxlen=128)
@@ -38,6 +37,11 @@ class Service(threading.Thread):
 		self.TRIGGER = {0: lambda char: not char.isalnum(),
 						1: lambda char: char in {' ', '\n'},
 						2: lambda char: char == '\t'}
+		MODIFIER_BIT = XInterface.Interface.MODIFIER_BIT
+		self.COMMAND_MODIFIERS = (
+			MODIFIER_BIT['<Super>'] |
+			MODIFIER_BIT['<Control>'] |
+			MODIFIER_BIT['<Alt>'])
 		self.__caret_pos = None
 		self.__last_expanded = None
 
@@ -76,10 +80,7 @@ class Service(threading.Thread):
 	def handle_event(self, keysym, keypress, modifiers):
 
 		if keypress:
-			modifier_state = (
-				modifiers['<Super>'] or
-				modifiers['<Control>'] or
-				modifiers['<Alt>'])
+			modifier_state = modifiers & self.COMMAND_MODIFIERS
 			char = app._interface.lookup_string(keysym)
 			if not modifier_state:
 				if len(char) == 1:
@@ -164,16 +165,16 @@ class Service(threading.Thread):
 	def match_window_filter(self, phrase):
 
 		filter_match = True
-		if phrase['window_class']:
-			if not app._interface.active_window_class in phrase['window_class']:
+		if phrase.window_class:
+			if not app._interface.active_window_class in phrase.window_class:
 				filter_match = False
-		if phrase['window_title']:
-			if phrase['window_title'][1]:
-				if not (phrase['window_title'][0] in
+		if phrase.window_title:
+			if phrase.window_title[1]:
+				if not (phrase.window_title[0] in
 					app._interface.active_window_title):
 					filter_match = False
 			else:
-				if not (phrase['window_title'][0].casefold() in
+				if not (phrase.window_title[0].casefold() in
 					app._interface.active_window_title.casefold()):
 					filter_match = False
 		return filter_match
@@ -181,79 +182,68 @@ class Service(threading.Thread):
 	def match_hotstring(self, char):
 
 		if app._run_service:
-			for p_uuid in app._phrases:
-				phrase = app._phrases[p_uuid]
-				if phrase['hotstring'] is not None:
-					if self.match_window_filter(phrase):
-						if self.TRIGGER[phrase['trigger']](char):
-							if ''.join(self.input_stack)[:-1].endswith(
-								phrase['hotstring']):
-								return phrase
+			for phrase in app._phrases_manager.hotstring_candidates(
+				''.join(self.input_stack)[:-1],
+				app._interface.active_window_class):
+				if self.match_window_filter(phrase):
+					if self.TRIGGER[phrase.trigger](char):
+						return phrase
 			else:
 				return None
 
+	def match_modifiers(self, hotkey, modifiers):
+
+		required = app._interface.modifier_bits(hotkey[1])
+		return modifiers & required == required
+
 	def match_hotkey(self, char, modifiers):
 
 		if app._run_service:
-			for p_uuid in self.phrases:
-				phrase = self.phrases[p_uuid]
-				if phrase['hotkey'] is not None:
-					if self.match_window_filter(phrase):
-						modifier_match = 0
-						if (phrase['hotkey'][0] == char or
-							phrase['hotkey'][0] == char.casefold()):
-							for modifier in phrase['hotkey'][1]:
-								if modifiers[modifier]:
-									modifier_match += 1
-							if len(phrase['hotkey'][1]) == modifier_match:
-								return phrase
+			for phrase in app._phrases_manager.hotkey_candidates(
+				{char, char.casefold()}, app._interface.active_window_class):
+				if self.match_window_filter(phrase):
+					if self.match_modifiers(phrase.hotkey, modifiers):
+						return phrase
 		# Special handling for app's global hotkeys
 		if app.pause_service:
-			if (char == app.pause_service[0] or
-				char.casefold() == app.pause_service[0]):
-				modifier_match = 0
-				for modifier in app.pause_service[1]:
-					if modifiers[modifier]:
-						modifier_match += 1
-				if len(app.pause_service[1]) == modifier_match:
-					return '__pause_service'
+			if ((char == app.pause_service[0] or
+				char.casefold() == app.pause_service[0]) and
+				self.match_modifiers(app.pause_service, modifiers)):
+				return '__pause_service'
 		if app.show_manager:
-			if (char == app.show_manager[0] or
-				char.casefold() == app.show_manager[0]):
-				modifier_match = 0
-				for modifier in app.show_manager[1]:
-					if modifiers[modifier]:
-						modifier_match += 1
-				if len(app.show_manager[1]) == modifier_match:
-					return '__show_manager'
+			if ((char == app.show_manager[0] or
+				char.casefold() == app.show_manager[0]) and
+				self.match_modifiers(app.show_manager, modifiers)):
+				return '__show_manager'
 
 	def trigger_phrase(self, phrase, include_char='', remove=True):
 
-		if phrase['script']:
-			args = shlex.split(self.expand(phrase['body']))
+		if phrase.script:
+			args = shlex.split(self.expand(
+				app._phrases_manager.body(phrase.uuid)))
 			try:
 				output = subprocess.check_output(
 					args, universal_newlines=True, timeout=1)
 			except subprocess.TimeoutExpired:
 				Logger.exception('Script {} took too long to complete.'.format(
-					os.path.join(phrase['path'], phrase['name'])))
+					os.path.join(phrase.path, phrase.name)))
 				output = ''
 			except FileNotFoundError:
 				Logger.exception('Script {} contains invalid executable.'.format(
-					os.path.join(phrase['path'], phrase['name'])))
+					os.path.join(phrase.path, phrase.name)))
 				output = ''
 			if remove:
 				app._interface.send_backspace(
-					len(phrase['hotstring']) + len(include_char))
+					len(phrase.hotstring) + len(include_char))
 			self.__last_expanded = output.strip() + include_char
-			self.send_string(output.strip() + include_char, phrase['send'])
+			self.send_string(output.strip() + include_char, phrase.send)
 		else:
 			if remove:
 				app._interface.send_backspace(
-					len(phrase['hotstring']) + (len(include_char)))
-			string = self.expand(phrase['body'])
+					len(phrase.hotstring) + (len(include_char)))
+			string = self.expand(app._phrases_manager.body(phrase.uuid))
 			self.__last_expanded = string +include_char
-			self.send_string(string + include_char, phrase['send'])
+			self.send_string(string + include_char, phrase.send)
 			if self.__caret_pos:
 				time.sleep(0.05)  # Events may get lost without a pause.
 				app._interface.caret_left(next(self.__caret_pos))
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Provides SQLite phrase store.
+
+	Phrases are stored in a single database in WAL mode, indexed by
+	hotstring, hotkey, window class and path, so the service can look up
+	matching phrases without scanning the whole library.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import logging
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+SCHEMA_VERSION = 1
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS phrases (
+	uuid TEXT PRIMARY KEY,
+	name TEXT NOT NULL,
+	path TEXT NOT NULL,
+	body TEXT NOT NULL,
+	script INTEGER NOT NULL,
+	send TEXT NOT NULL,
+	hotstring TEXT,
+	trigger INTEGER NOT NULL,
+	hotkey TEXT,
+	hotkey_key TEXT,
+	window_class TEXT,
+	window_title TEXT,
+	timestamp INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS phrases_hotstring ON phrases (hotstring);
+CREATE INDEX IF NOT EXISTS phrases_hotkey ON phrases (hotkey_key);
+CREATE INDEX IF NOT EXISTS phrases_path ON phrases (path);
+CREATE TABLE IF NOT EXISTS window_classes (
+	uuid TEXT NOT NULL REFERENCES phrases (uuid) ON DELETE CASCADE,
+	window_class TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS window_classes_class
+	ON window_classes (window_class);
+CREATE INDEX IF NOT EXISTS window_classes_uuid ON window_classes (uuid);
+CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY);
+'''
+COLUMNS = (
+	'uuid', 'name', 'path', 'body', 'script', 'send', 'hotstring', 'trigger',
+	'hotkey', 'window_class', 'window_title', 'timestamp')
+# Values stored for phrases missing NOT NULL columns other than their
+# uuid, name and path, as phrase files may have them null or leave them out.
+DEFAULTS = {'body': '', 'script': False, 'send': [1, 0], 'trigger': 0,
+	'timestamp': 0}
+# Columns stored as JSON text.
+JSON_COLUMNS = ('send', 'hotkey', 'window_class', 'window_title')
+# Stores a phrase row, updating existing rows in place to keep their order.
+UPSERT = 'INSERT INTO phrases ({0}, hotkey_key) VALUES ({1}) ' \
+	'ON CONFLICT (uuid) DO UPDATE SET {2}'.format(
+		', '.join(COLUMNS),
+		', '.join('?' * (len(COLUMNS) + 1)),
+		', '.join('{0} = excluded.{0}'.format(column)
+			for column in COLUMNS[1:] + ('hotkey_key',)))
+# Phrases without window class filter or with a filter matching given class.
+CLASS_FILTER = '''(
+	NOT EXISTS (SELECT 1 FROM window_classes WHERE uuid = phrases.uuid) OR
+	EXISTS (SELECT 1 FROM window_classes
+		WHERE uuid = phrases.uuid AND window_class = ?))'''
+
+
+class PhraseStore(object):
+	"""SQLite phrase store.
+
+		Each thread gets it's own connection. Writes are serialized,
+		WAL mode lets the service read while the manager writes.
+
+		Methods:
+		is_empty - return True if store holds no phrases and folders;
+		phrases - return list of every phrase dict, without body;
+		body - return body of phrase with given uuid;
+		folders - return set of every folder path;
+		apply - store and delete phrases and folders in one transaction;
+		rename_folder - rename folder and it's phrases' paths;
+		hotstring_candidates - return uuids of phrases with hotstring that
+			is a suffix of given text;
+		hotkey_candidates - return uuids of phrases with given hotkey key.
+	"""
+
+	def __init__(self, path):
+		"""Open or create store database at path."""
+
+		self.path = path
+		self.__local = threading.local()
+		self.__write_lock = threading.Lock()
+		os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+		connection = self.__connection()
+		connection.executescript(SCHEMA)
+		connection.execute('PRAGMA user_version = {}'.format(SCHEMA_VERSION))
+		connection.commit()
+
+	def __connection(self):
+		"""Return connection of current thread."""
+
+		connection = getattr(self.__local, 'connection', None)
+		if connection is None:
+			connection = sqlite3.connect(self.path, timeout=10)
+			connection.execute('PRAGMA journal_mode = WAL')
+			connection.execute('PRAGMA synchronous = NORMAL')
+			connection.execute('PRAGMA foreign_keys = ON')
+			self.__local.connection = connection
+		return connection
+
+	def is_empty(self):
+		"""Return True if store holds no phrases and folders."""
+
+		connection = self.__connection()
+		return not (
+			connection.execute('SELECT 1 FROM phrases LIMIT 1').fetchone() or
+			connection.execute('SELECT 1 FROM folders LIMIT 1').fetchone())
+
+	def phrases(self):
+		"""Return list of every phrase dict, in insertion order.
+
+			Bodies are left out, they're None.
+		"""
+
+		rows = self.__connection().execute(
+			'SELECT {} FROM phrases ORDER BY rowid'.format(', '.join(
+				'NULL' if column == 'body' else column for column in COLUMNS)))
+		return [self.__phrase(row) for row in rows]
+
+	def body(self, p_uuid):
+		"""Return body of phrase with given uuid or None if there's none."""
+
+		row = self.__connection().execute(
+			'SELECT body FROM phrases WHERE uuid = ?', (p_uuid,)).fetchone()
+		return row[0] if row is not None else None
+
+	def folders(self):
+		"""Return set of every folder path."""
+
+		return {row[0] for row in self.__connection().execute(
+			'SELECT path FROM folders')}
+
+	def __phrase(self, row):
+		"""Return phrase dict of given row."""
+
+		phrase = dict(zip(COLUMNS, row))
+		for column in JSON_COLUMNS:
+			if phrase[column] is not None:
+				phrase[column] = json.loads(phrase[column])
+		phrase['script'] = bool(phrase['script'])
+		return phrase
+
+	def apply(self, phrases=(), removed=(), folders=(), removed_folders=()):
+		"""Store phrases, delete phrases with removed uuids, add folders and
+		delete removed_folders in one transaction.
+
+			Columns phrases miss or have None in get their DEFAULTS, phrases
+			without uuid, name or path are skipped.
+		"""
+
+		rows, classes = [], []
+		for phrase in phrases:
+			row = [phrase.get(column) for column in COLUMNS]
+			if None in row[:3]:
+				Logger.warning('Skipping phrase {!r} without name or '
+					'path.'.format(phrase.get('uuid')))
+				continue
+			for column, default in DEFAULTS.items():
+				index = COLUMNS.index(column)
+				if row[index] is None:
+					row[index] = default
+			for column in JSON_COLUMNS:
+				index = COLUMNS.index(column)
+				if row[index] is not None:
+					row[index] = json.dumps(row[index])
+			row.append(phrase['hotkey'][0] if phrase.get('hotkey') else None)
+			rows.append(row)
+			for window_class in phrase.get('window_class') or ():
+				classes.append((phrase['uuid'], window_class))
+		uuids = [(row[0],) for row in rows] + [(p_uuid,) for p_uuid in removed]
+
+		with self.__write_lock:
+			connection = self.__connection()
+			with connection:
+				connection.executemany(
+					'DELETE FROM window_classes WHERE uuid = ?', uuids)
+				connection.executemany(
+					'DELETE FROM phrases WHERE uuid = ?',
+					[(p_uuid,) for p_uuid in removed])
+				connection.executemany(UPSERT, rows)
+				connection.executemany(
+					'INSERT INTO window_classes (uuid, window_class) '
+					'VALUES (?, ?)', classes)
+				connection.executemany(
+					'INSERT OR IGNORE INTO folders (path) VALUES (?)',
+					[(path,) for path in folders])
+				connection.executemany(
+					'DELETE FROM folders WHERE path = ?',
+					[(path,) for path in removed_folders])
+
+	def rename_folder(self, path, new_path):
+		"""Rename folder at path and it's subfolders to new_path, updating
+		paths of their phrases.
+		"""
+
+		prefix_length = len(path) + 1
+		with self.__write_lock:
+			connection = self.__connection()
+			with connection:
+				for table in ('phrases', 'folders'):
+					connection.execute(
+						'UPDATE {} SET path = ? WHERE path = ?'.format(table),
+						(new_path, path))
+					connection.execute(
+						'UPDATE {} SET path = ? || substr(path, ?) '
+						'WHERE substr(path, 1, ?) = ?'.format(table),
+						(os.path.join(new_path, ''), prefix_length + 1,
+						prefix_length, os.path.join(path, '')))
+
+	def hotstring_candidates(self, text, window_class):
+		"""Return list of uuids of phrases, in insertion order, whose
+		hotstring is a suffix of text and whose window class filter
+		matches window_class.
+		"""
+
+		suffixes = [text[index:] for index in range(len(text) + 1)]
+		uuids = []
+		# Stay well below SQLite's host parameter limit.
+		for start in range(0, len(suffixes), 500):
+			chunk = suffixes[start:start + 500]
+			uuids.extend(self.__connection().execute(
+				'SELECT uuid, rowid FROM phrases WHERE hotstring IN ({}) '
+				'AND {}'.format(', '.join('?' * len(chunk)), CLASS_FILTER),
+				chunk + [window_class]).fetchall())
+		return [row[0] for row in sorted(uuids, key=lambda row: row[1])]
+
+	def hotkey_candidates(self, keys, window_class):
+		"""Return list of uuids of phrases, in insertion order, whose
+		hotkey key is one of given keys and whose window class filter
+		matches window_class.
+		"""
+
+		keys = list(keys)
+		return [row[0] for row in self.__connection().execute(
+			'SELECT uuid FROM phrases WHERE hotkey_key IN ({}) AND {} '
+			'ORDER BY rowid'.format(', '.join('?' * len(keys)), CLASS_FILTER),
+			keys + [window_class])]
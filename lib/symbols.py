@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Provides keysym sets parsed from xkb symbols files.
+
+	Parsed sets are cached on disk per layout, along with the cache format
+	version and paths, modification times and sizes of every symbols file
+	they were parsed from.
+"""
+
+import os
+import re
+import json
+import logging
+from . import CONSTANTS
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+SYMBOLS_DIR = '/usr/share/X11/xkb/symbols'
+CACHE_VERSION = 2
+MATCH_INCLUDE = re.compile(r'include\s*\"(\w*)(?:\((\w*)\))*\"')
+MATCH_KEYS = re.compile(r'.*[\[|<].*[\]|>].*\[\s*([\w|\d]*)'
+	r'(?:,\s*([\w|\d]*)(?:,\s*([\w|\d]*))?(?:,\s*([\w|\d]*))?)?')
+
+
+def lookup_keysym(name, _cache={}):
+	"""Return int keysym for given xkb symbols name or None if there's none.
+
+		name is either a keysym name without XK_ prefix or a hex keysym value.
+	"""
+
+	if name in _cache:
+		return _cache[name]
+
+	keysym = None
+	if name:
+		keysym = CONSTANTS.KEYSYMS.get('XK_' + name)
+		if keysym is None:
+			try:
+				keysym = int(name, 16)
+			except ValueError:
+				pass
+	_cache[name] = keysym
+	return keysym
+
+
+def parse_symbols(layout, _cache={}):
+	"""Parse xkb symbols file for given layout, following includes.
+
+		layout must be a tuple where first member is layout group string
+		and second member is layout variant string.
+
+		Return tuple of keysym sets and dict of parsed file paths mapped to
+		their signatures, see file_signature. First set contains keysyms for unmodified
+		keys, second for shifted, third contains keysyms for alt grid,
+		forth for shifted alt grid.
+
+		Results are memoized, so shared includes are parsed once per run.
+	"""
+
+	# Variant is a group withing file.
+	# If variant is an empty string, default group should be parsed.
+	if layout[1] == '' or layout[1] is None:
+		layout = (layout[0], 'default')
+
+	if layout in _cache:
+		return _cache[layout]
+
+	keysym_sets = (set(), set(), set(), set())
+	includes = []
+	path = os.path.join(SYMBOLS_DIR, layout[0])
+	files = {path: file_signature(os.stat(path))}
+	parse = False
+	with open(path) as definition:
+		for line in definition:
+			if not parse:
+				if (line.startswith('xkb_symbols "{}"'.format(layout[1])) or
+					line.startswith(layout[1])):
+					parse = True
+			if parse:
+				if line.startswith('};'):
+					break
+				include = MATCH_INCLUDE.search(line)
+				if include:
+					includes.append((include.group(1), include.group(2)))
+				key = MATCH_KEYS.search(line)
+				if key:
+					for keysym_set, name in zip(keysym_sets, key.groups()):
+						keysym = lookup_keysym(name)
+						if keysym is not None:
+							keysym_set.add(keysym)
+
+	for include in includes:
+		include_sets, include_files = parse_symbols(include)
+		for keysym_set, include_set in zip(keysym_sets, include_sets):
+			keysym_set |= include_set
+		files.update(include_files)
+
+	result = tuple(frozenset(keysym_set) for keysym_set in keysym_sets), files
+	_cache[layout] = result
+	return result
+
+
+def read_cache(cache_path):
+	"""Return dict of cached layouts read from cache_path.
+
+		Return empty dict if cache is missing, invalid or outdated.
+	"""
+
+	try:
+		with open(cache_path) as cache_file:
+			cache = json.loads(cache_file.read())
+		if cache['version'] == CACHE_VERSION:
+			return cache['layouts']
+	except FileNotFoundError:
+		pass
+	except Exception:
+		Logger.exception('Invalid keysym cache.')
+	return {}
+
+
+def write_cache(cache_path, layouts):
+	"""Atomically write dict of cached layouts to cache_path."""
+
+	temp_path = cache_path + '.tmp'
+	try:
+		os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+		with open(temp_path, 'w') as cache_file:
+			cache_file.write(json.dumps(
+				{'version': CACHE_VERSION, 'layouts': layouts}))
+		os.replace(temp_path, cache_path)
+	except OSError:
+		Logger.exception('Cannot write keysym cache.')
+
+
+def file_signature(stat_result):
+	"""Return list of modification time and size of given os.stat_result,
+	used to tell if a symbols file changed.
+	"""
+
+	return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def files_unchanged(files):
+	"""Return True if every path in files dict still has it's recorded
+	signature.
+	"""
+
+	try:
+		for path, signature in files.items():
+			if file_signature(os.stat(path)) != signature:
+				return False
+	except OSError:
+		return False
+	return True
+
+
+def get_keysym_sets(layouts, cache_path):
+	"""Return dict mapping each of given layouts to tuple of 4 keysym sets.
+
+		See parse_symbols for layout format and set order. Sets are read from
+		cache_path unless their symbols files changed, the rest are parsed
+		and written back to cache. Parsing is serial, it's done off the main
+		thread by the keysym loader and shares includes memoized by
+		parse_symbols.
+	"""
+
+	cache = read_cache(cache_path)
+	keysym_sets = {}
+	missing = []
+	for layout in layouts:
+		entry = cache.get('{0}({1})'.format(*layout))
+		if entry is not None and files_unchanged(entry['files']):
+			keysym_sets[layout] = tuple(
+				frozenset(keysym_set) for keysym_set in entry['sets'])
+		elif layout not in missing:
+			missing.append(layout)
+
+	if not missing:
+		return keysym_sets
+
+	Logger.debug('Parsing symbols for layouts {}.'.format(missing))
+	for layout in missing:
+		layout_sets, files = parse_symbols(layout)
+		keysym_sets[layout] = layout_sets
+		cache['{0}({1})'.format(*layout)] = {
+			'files': files,
+			'sets': [sorted(keysym_set) for keysym_set in layout_sets]}
+	write_cache(cache_path, cache)
+	return keysym_sets
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Provides streaming import and export of phrases as JSON Lines or CSV.
+
+	Files are read and written one phrase at a time, phrases are imported
+	in batches, each in a single transaction followed by a flush.
+"""
+
+import os
+import csv
+import json
+import uuid
+import time
+import logging
+from . import manager
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+FORMATS = ('jsonl', 'csv')
+BATCH_SIZE = 1000
+# Phrase attributes stored as JSON text in CSV cells.
+JSON_COLUMNS = ('send', 'hotkey', 'window_class', 'window_title')
+
+
+def guess_format(path):
+	"""Return format of file at path, judging by it's extension."""
+
+	if path.lower().endswith('.csv'):
+		return 'csv'
+	return 'jsonl'
+
+
+def read_jsonl(stream):
+	"""Yield phrase dicts read from JSON Lines stream.
+
+		Invalid lines are logged and skipped.
+	"""
+
+	for number, line in enumerate(stream, 1):
+		if not line.strip():
+			continue
+		try:
+			yield json.loads(line)
+		except ValueError:
+			Logger.error('Invalid JSON on line {}.'.format(number))
+
+
+def read_csv(stream):
+	"""Yield phrase dicts read from CSV stream with a header row.
+
+		Empty cells are None, see write_csv for other values. Invalid rows
+		are logged and skipped.
+	"""
+
+	for number, row in enumerate(csv.DictReader(stream), 2):
+		data = {}
+		try:
+			for field, value in row.items():
+				if field not in manager.FIELDS or value is None:
+					continue
+				if value == '':
+					continue
+				if field in JSON_COLUMNS:
+					value = json.loads(value)
+				elif field == 'script':
+					value = value.lower() in ('1', 'true')
+				elif field in ('trigger', 'timestamp'):
+					value = int(value)
+				data[field] = value
+		except ValueError:
+			Logger.error('Invalid CSV row {}.'.format(number))
+			continue
+		yield data
+
+
+def write_jsonl(stream, phrases):
+	"""Write phrase dicts from phrases iterable to stream as JSON Lines."""
+
+	for data in phrases:
+		stream.write(json.dumps(data, ensure_ascii=False, sort_keys=True))
+		stream.write('\n')
+
+
+def write_csv(stream, phrases):
+	"""Write phrase dicts from phrases iterable to stream as CSV.
+
+		None is written as empty cell, booleans as 1 or 0, send, hotkey and
+		window filters as JSON.
+	"""
+
+	writer = csv.DictWriter(stream, fieldnames=manager.FIELDS)
+	writer.writeheader()
+	for data in phrases:
+		row = {}
+		for field in manager.FIELDS:
+			value = data.get(field)
+			if value is None:
+				value = ''
+			elif field in JSON_COLUMNS:
+				value = json.dumps(value, ensure_ascii=False)
+			elif field == 'script':
+				value = int(value)
+			row[field] = value
+		writer.writerow(row)
+
+
+READERS = {'jsonl': read_jsonl, 'csv': read_csv}
+WRITERS = {'jsonl': write_jsonl, 'csv': write_csv}
+
+
+def build_phrase(data):
+	"""Return phrase built from imported dict.
+
+		Missing uuid and timestamp are generated. Raise ValueError if data
+		is not a valid phrase or it's path leaves the phrase directory.
+	"""
+
+	if not isinstance(data, dict):
+		raise ValueError('Phrase is not an object.')
+	data = dict(data)
+	name = data.get('name')
+	if (not isinstance(name, str) or name in ('', os.curdir, os.pardir) or
+		os.sep in name or not manager.is_phrase_file(name)):
+		raise ValueError('Invalid phrase name {!r}.'.format(name))
+	path = os.path.normpath(data.get('path') or '.')
+	if os.path.isabs(path) or path.split(os.sep)[0] == '..':
+		raise ValueError('Invalid phrase path {!r}.'.format(path))
+	data['path'] = path
+	data.setdefault('uuid', str(uuid.uuid1()))
+	data.setdefault('timestamp', int(time.time()))
+	if not isinstance(data.get('body', ''), str):
+		raise ValueError('Invalid phrase body.')
+	return manager.Phrase.from_dict(data)
+
+
+def import_phrases(phrases_manager, phrases, progress=None):
+	"""Import phrase dicts from phrases iterable with phrases_manager.
+
+		Phrases with uuid of an existing phrase replace it. Invalid phrases
+		and phrases whose file would overwrite another phrase are logged
+		and skipped. Every BATCH_SIZE phrases are added in a transaction
+		and written, then progress, if given, is called with int count of
+		phrases imported so far.
+
+		Return tuple of int count of imported and skipped phrases.
+	"""
+
+	# Maps phrase file locations to uuids of phrases in them.
+	locations = {
+		(phrase.path, phrase.name): phrase.uuid
+		for phrase in phrases_manager.app._phrases.values()}
+	imported, skipped = 0, 0
+	batch = []
+
+	def commit():
+		with phrases_manager.transaction():
+			for phrase in batch:
+				phrases_manager.add(phrase)
+		phrases_manager.flush()
+		batch.clear()
+		if progress is not None:
+			progress(imported)
+
+	for data in phrases:
+		try:
+			phrase = build_phrase(data)
+		except ValueError as error:
+			Logger.error('Skipping phrase: {}'.format(error))
+			skipped += 1
+			continue
+		location = (phrase.path, phrase.name)
+		if locations.get(location, phrase.uuid) != phrase.uuid:
+			Logger.error('Skipping phrase {}, file exists.'.format(
+				os.path.join(*location)))
+			skipped += 1
+			continue
+		current = phrases_manager.app._phrases.get(phrase.uuid)
+		if current is not None:
+			locations.pop((current.path, current.name), None)
+		locations[location] = phrase.uuid
+		batch.append(phrase)
+		imported += 1
+		if len(batch) >= BATCH_SIZE:
+			commit()
+	if batch:
+		commit()
+	return imported, skipped
+
+
+def export_phrases(phrases_manager, progress=None):
+	"""Yield phrase dicts, with bodies, of every phrase of phrases_manager.
+
+		After every BATCH_SIZE phrases progress, if given, is called with
+		int count of phrases exported so far.
+	"""
+
+	count = 0
+	for p_uuid in list(phrases_manager.app._phrases):
+		phrase = phrases_manager.app._phrases.get(p_uuid)
+		if phrase is None:
+			continue
+		data = phrase.to_dict()
+		data['body'] = phrases_manager.body(p_uuid)
+		yield data
+		count += 1
+		if progress is not None and not count % BATCH_SIZE:
+			progress(count)
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Provides minimal XKEYBOARD extension support for python Xlib.
+
+	python Xlib doesn't implement XKB, so only the requests and events
+	needed to track and change the active layout group are defined here.
+"""
+
+import struct
+import logging
+from Xlib.protocol import rq
+
+MainLogger = logging.getLogger('Xpander')
+Logger = MainLogger.getChild(__name__)
+
+EXTENSION_NAME = 'XKEYBOARD'
+MAJOR_VERSION = 1
+MINOR_VERSION = 0
+
+USE_CORE_KBD = 0x0100
+
+# Event types, sent as the second byte of XKB events.
+STATE_NOTIFY = 2
+# Event masks.
+STATE_NOTIFY_MASK = 1 << 2
+# StateNotify details.
+GROUP_STATE_MASK = 1 << 4
+# GetMap components.
+KEY_TYPES_MASK = 1 << 0
+KEY_SYMS_MASK = 1 << 1
+
+
+class RawData(rq.ValueField):
+	"""Field holding the rest of a reply as unparsed bytes."""
+
+	structcode = None
+
+	def parse_binary_value(self, data, display, length, format):
+
+		return bytes(data), b''
+
+
+class UseExtension(rq.ReplyRequest):
+
+	_request = rq.Struct(
+		rq.Card8('opcode'),
+		rq.Opcode(0),
+		rq.RequestLength(),
+		rq.Card16('wanted_major'),
+		rq.Card16('wanted_minor'))
+
+	_reply = rq.Struct(
+		rq.ReplyCode(),
+		rq.Bool('supported'),
+		rq.Card16('sequence_number'),
+		rq.ReplyLength(),
+		rq.Card16('server_major'),
+		rq.Card16('server_minor'),
+		rq.Pad(20))
+
+
+class SelectStateEvents(rq.Request):
+	"""SelectEvents request, affecting StateNotify only.
+
+		Details for other event types are omitted from the request,
+		so affect_which must always be STATE_NOTIFY_MASK.
+	"""
+
+	_request = rq.Struct(
+		rq.Card8('opcode'),
+		rq.Opcode(1),
+		rq.RequestLength(),
+		rq.Card16('device_spec'),
+		rq.Card16('affect_which'),
+		rq.Card16('clear'),
+		rq.Card16('select_all'),
+		rq.Card16('affect_map'),
+		rq.Card16('map'),
+		rq.Card16('affect_state'),
+		rq.Card16('state_details'))
+
+
+class GetState(rq.ReplyRequest):
+
+	_request = rq.Struct(
+		rq.Card8('opcode'),
+		rq.Opcode(4),
+		rq.RequestLength(),
+		rq.Card16('device_spec'),
+		rq.Pad(2))
+
+	_reply = rq.Struct(
+		rq.ReplyCode(),
+		rq.Card8('device_id'),
+		rq.Card16('sequence_number'),
+		rq.ReplyLength(),
+		rq.Card8('mods'),
+		rq.Card8('base_mods'),
+		rq.Card8('latched_mods'),
+		rq.Card8('locked_mods'),
+		rq.Card8('group'),
+		rq.Card8('locked_group'),
+		rq.Int16('base_group'),
+		rq.Int16('latched_group'),
+		rq.Card8('compat_state'),
+		rq.Card8('grab_mods'),
+		rq.Card8('compat_grab_mods'),
+		rq.Card8('lookup_mods'),
+		rq.Card8('compat_lookup_mods'),
+		rq.Pad(1),
+		rq.Card16('ptr_btn_state'),
+		rq.Pad(6))
+
+
+class GetMap(rq.ReplyRequest):
+
+	_request = rq.Struct(
+		rq.Card8('opcode'),
+		rq.Opcode(8),
+		rq.RequestLength(),
+		rq.Card16('device_spec'),
+		rq.Card16('full'),
+		rq.Card16('partial'),
+		rq.Card8('first_type'),
+		rq.Card8('n_types'),
+		rq.Card8('first_key_sym'),
+		rq.Card8('n_key_syms'),
+		rq.Card8('first_key_act'),
+		rq.Card8('n_key_acts'),
+		rq.Card8('first_key_behavior'),
+		rq.Card8('n_key_behaviors'),
+		rq.Card16('virtual_mods'),
+		rq.Card8('first_key_explicit'),
+		rq.Card8('n_key_explicit'),
+		rq.Card8('first_mod_map_key'),
+		rq.Card8('n_mod_map_keys'),
+		rq.Card8('first_vmod_map_key'),
+		rq.Card8('n_vmod_map_keys'),
+		rq.Pad(2))
+
+	_reply = rq.Struct(
+		rq.ReplyCode(),
+		rq.Card8('device_id'),
+		rq.Card16('sequence_number'),
+		rq.ReplyLength(),
+		rq.Pad(2),
+		rq.Card8('min_key_code'),
+		rq.Card8('max_key_code'),
+		rq.Card16('present'),
+		rq.Card8('first_type'),
+		rq.Card8('n_types'),
+		rq.Card8('total_types'),
+		rq.Card8('first_key_sym'),
+		rq.Card16('total_syms'),
+		rq.Card8('n_key_syms'),
+		rq.Card8('first_key_act'),
+		rq.Card16('total_acts'),
+		rq.Card8('n_key_acts'),
+		rq.Card8('first_key_behavior'),
+		rq.Card8('n_key_behaviors'),
+		rq.Card8('total_key_behaviors'),
+		rq.Card8('first_key_explicit'),
+		rq.Card8('n_key_explicit'),
+		rq.Card8('total_key_explicit'),
+		rq.Card8('first_mod_map_key'),
+		rq.Card8('n_mod_map_keys'),
+		rq.Card8('total_mod_map_keys'),
+		rq.Card8('first_vmod_map_key'),
+		rq.Card8('n_vmod_map_keys'),
+		rq.Card8('total_vmod_map_keys'),
+		rq.Pad(1),
+		rq.Card16('virtual_mods'),
+		RawData('data'))
+
+
+class StateNotify(rq.Event):
+
+	_code = None
+	_fields = rq.Struct(
+		rq.Card8('type'),
+		rq.Card8('xkb_type'),
+		rq.Card16('sequence_number'),
+		rq.Card32('time'),
+		rq.Card8('device_id'),
+		rq.Card8('mods'),
+		rq.Card8('base_mods'),
+		rq.Card8('latched_mods'),
+		rq.Card8('locked_mods'),
+		rq.Card8('group'),
+		rq.Int16('base_group'),
+		rq.Int16('latched_group'),
+		rq.Card8('locked_group'),
+		rq.Card8('compat_state'),
+		rq.Card8('grab_mods'),
+		rq.Card8('compat_grab_mods'),
+		rq.Card8('lookup_mods'),
+		rq.Card8('compat_lookup_mods'),
+		rq.Card16('ptr_btn_state'),
+		rq.Card16('changed'),
+		rq.Card8('keycode'),
+		rq.Card8('event_type'),
+		rq.Card8('request_major'),
+		rq.Card8('request_minor'))
+
+
+class Keymap(object):
+	"""Keyboard mapping of every layout group.
+
+		Methods:
+		keycode - return int keycode bound to given keysym in given group;
+		keysym - return int keysym bound to given keycode in given group
+			with given modifier state.
+	"""
+
+	def __init__(self, reply):
+		"""Parse key types and key symbol maps from GetMap reply."""
+
+		data = reply.data
+		offset = 0
+		# Each type is a tuple of modifier mask and dict of masked
+		# modifier state to shift level.
+		self.__types = []
+		for index in range(reply.n_types):
+			mask, real_mods, virtual_mods, num_levels, n_entries, preserve = (
+				struct.unpack_from('=BBHBBBx', data, offset))
+			offset += 8
+			levels = {}
+			for entry in range(n_entries):
+				active, entry_mask, level = struct.unpack_from(
+					'=BBB', data, offset)
+				offset += 8
+				if active and entry_mask not in levels:
+					levels[entry_mask] = level
+			if preserve:
+				offset += 4 * n_entries
+			self.__types.append((mask, levels))
+		# Keys map keycode to tuple of type indexes, group count, width and
+		# keysyms, codes map keysym to dict of group to (level, keycode).
+		self.__keys = {}
+		self.__codes = {}
+		for index in range(reply.n_key_syms):
+			keycode = reply.first_key_sym + index
+			type_0, type_1, type_2, type_3, group_info, width, n_syms = (
+				struct.unpack_from('=BBBBBBH', data, offset))
+			offset += 8
+			keysyms = struct.unpack_from('={}I'.format(n_syms), data, offset)
+			offset += 4 * n_syms
+			n_groups = group_info & 0x0F
+			self.__keys[keycode] = (
+				(type_0, type_1, type_2, type_3), n_groups, width, keysyms)
+			for sym_index, keysym in enumerate(keysyms):
+				if not keysym:
+					continue
+				group, level = divmod(sym_index, width)
+				groups = self.__codes.setdefault(keysym, {})
+				if group not in groups or groups[group][0] > level:
+					groups[group] = (level, keycode)
+
+	def keysym(self, keycode, group, state):
+		"""Return int keysym bound to given keycode in given group with
+		given modifier state. Return 0 if there's none.
+		"""
+
+		try:
+			types, n_groups, width, keysyms = self.__keys[keycode]
+		except KeyError:
+			return 0
+		if not n_groups:
+			return 0
+		group %= n_groups
+		mask, levels = self.__types[types[group]]
+		level = levels.get(state & mask, 0)
+		if level >= width:
+			return 0
+		return keysyms[group * width + level]
+
+	def keycode(self, keysym, group):
+		"""Return int keycode bound to given keysym in given group.
+
+			If keysym isn't bound in that group, return keycode from the lowest
+			group it's bound in. Return 0 if there's none.
+		"""
+
+		try:
+			groups = self.__codes[keysym]
+		except KeyError:
+			return 0
+		if group in groups:
+			return groups[group][1]
+		return groups[min(groups)][1]
+
+
+class XKB(object):
+	"""XKB extension bound to an Xlib display object.
+
+		Properties:
+		first_event - int, event code of XKB events on this display.
+
+		Methods:
+		get_group - return int index of currently active layout group;
+		get_keymap - return Keymap of every layout group;
+		is_state_notify - return True if given event is a StateNotify event;
+		select_group_events - receive StateNotify events on group changes.
+	"""
+
+	def __init__(self, display):
+		"""Initialize XKB extension on given Xlib display object.
+
+			Raise LookupError if extension is not available.
+		"""
+
+		self.display = display
+		extension = display.query_extension(EXTENSION_NAME)
+		if extension is None:
+			raise LookupError('X server has no XKEYBOARD extension.')
+		self.__opcode = extension.major_opcode
+		self.first_event = extension.first_event
+		reply = UseExtension(
+			display=display.display,
+			opcode=self.__opcode,
+			wanted_major=MAJOR_VERSION,
+			wanted_minor=MINOR_VERSION)
+		if not reply.supported:
+			raise LookupError('Unsupported XKEYBOARD extension version.')
+		Logger.info('XKB extension version {0}.{1}'.format(
+			reply.server_major, reply.server_minor))
+		display.extension_add_subevent(
+			self.first_event, STATE_NOTIFY, StateNotify)
+
+	def get_group(self):
+		"""Return int index of currently active layout group."""
+
+		return GetState(
+			display=self.display.display,
+			opcode=self.__opcode,
+			device_spec=USE_CORE_KBD).group
+
+	def get_keymap(self):
+		"""Return Keymap of every layout group."""
+
+		return Keymap(GetMap(
+			display=self.display.display,
+			opcode=self.__opcode,
+			device_spec=USE_CORE_KBD,
+			full=KEY_TYPES_MASK | KEY_SYMS_MASK,
+			partial=0,
+			first_type=0,
+			n_types=0,
+			first_key_sym=0,
+			n_key_syms=0,
+			first_key_act=0,
+			n_key_acts=0,
+			first_key_behavior=0,
+			n_key_behaviors=0,
+			virtual_mods=0,
+			first_key_explicit=0,
+			n_key_explicit=0,
+			first_mod_map_key=0,
+			n_mod_map_keys=0,
+			first_vmod_map_key=0,
+			n_vmod_map_keys=0))
+
+	def select_group_events(self):
+		"""Receive StateNotify events when active layout group changes."""
+
+		SelectStateEvents(
+			display=self.display.display,
+			opcode=self.__opcode,
+			device_spec=USE_CORE_KBD,
+			affect_which=STATE_NOTIFY_MASK,
+			clear=0,
+			select_all=0,
+			affect_map=0,
+			map=0,
+			affect_state=GROUP_STATE_MASK,
+			state_details=GROUP_STATE_MASK)
+		self.display.flush()
+
+	def is_state_notify(self, event):
+		"""Return True if given event is a StateNotify event."""
+
+		return (event.type == self.first_event and
+			getattr(event, 'xkb_type', None) == STATE_NOTIFY)
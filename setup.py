@@ -46,7 +46,7 @@ setup(
 	packages=['Xpander'],
 	package_data={'Xpander': ['data/Examples/*.json']},
 	data_files=data_files,
-	scripts=['xpander-indicator'],
+	scripts=['xpander-indicator', 'xpander-compile', 'xpander-phrases'],
 	# Causes unsatisfiable dependencies in the deb
 	# install_requires=['python3-xlib'],
 )
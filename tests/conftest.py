@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the lib package from the source tree, like running from source.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import app
+
+
+def phrase_data(p_uuid, **values):
+	"""Return dict of phrase with given uuid, also used as it's name,
+	and values.
+	"""
+
+	data = {
+		'uuid': p_uuid, 'name': p_uuid, 'path': '.', 'body': 'Body',
+		'script': False, 'send': [0, 0], 'hotstring': None, 'trigger': 0,
+		'hotkey': None, 'window_class': None, 'window_title': None,
+		'timestamp': 1}
+	data.update(values)
+	return data
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+	"""Point app at an empty phrases directory and cache in tmp_path,
+	return path of phrases directory.
+	"""
+
+	settings = {
+		'phrases_dir': str(tmp_path / 'phrases'),
+		'_cache_dir': str(tmp_path / 'cache'),
+		'_config_dir': str(tmp_path / 'config'),
+		'phrases_database': '',
+		'phrases_bundle': '',
+		'phrases_layers': [],
+		'phrases_poll_interval': 0,
+		'_hotkeys': [],
+		'_phrases': {},
+		'_folders': set()}
+	for name, value in settings.items():
+		monkeypatch.setattr(app, name, value, raising=False)
+	os.makedirs(app.phrases_dir)
+	return app.phrases_dir
@@ -0,0 +1,116 @@
+import os
+import json
+
+import pytest
+
+from lib import bundle
+
+
+def write_phrase(library, path, name, **values):
+
+	data = {
+		'uuid': name, 'name': 'stale', 'path': 'stale', 'body': 'Body',
+		'script': False, 'send': [0, 0], 'hotstring': None, 'trigger': 0,
+		'hotkey': None, 'window_class': None, 'window_title': None,
+		'timestamp': 1}
+	data.update(values)
+	folder = os.path.join(str(library), path)
+	os.makedirs(folder, exist_ok=True)
+	with open(os.path.join(folder, name), 'w') as p_file:
+		p_file.write(json.dumps(data))
+
+
+@pytest.fixture
+def library(tmp_path):
+
+	library = tmp_path / 'phrases'
+	write_phrase(library, '.', 'b', hotstring='lo', hotkey=['k', ['<Alt>']])
+	write_phrase(library, '.', 'a', hotstring='hello', body='Hëllo',
+		window_class=['Gedit'], window_title=['Doc', False])
+	write_phrase(library, 'f', 'c', hotstring='xyz', script=True, trigger=2)
+	write_phrase(library, 'f/s', 'd')
+	os.makedirs(str(library / 'empty'))
+	return library
+
+
+@pytest.fixture
+def compiled(library, tmp_path):
+
+	path = str(tmp_path / 'out' / 'phrases.xpb')
+	digest = bundle.compile_library(str(library), path)
+	return path, digest
+
+
+def test_read_library_takes_locations_and_skips_invalid(library):
+
+	write_phrase(library, '.', 'temp' + bundle.TEMP_SUFFIX)
+	(library / 'broken').write_text('{')
+	(library / 'list').write_text('[]')
+	phrases, folders = bundle.read_library(str(library))
+	assert [(data['path'], data['name']) for data in phrases] == [
+		('.', 'a'), ('.', 'b'), ('f', 'c'), ('f/s', 'd')]
+	assert folders == ['empty', 'f', 'f/s']
+
+
+def test_bundle_holds_library(compiled):
+
+	path, digest = compiled
+	phrase_bundle = bundle.Bundle(path)
+	assert phrase_bundle.digest == digest == bundle.read_digest(path)
+	assert len(phrase_bundle) == 4
+	assert phrase_bundle.uuids() == ['a', 'b', 'c', 'd']
+	assert phrase_bundle.folders() == ['empty', 'f', 'f/s']
+	assert phrase_bundle.phrase(phrase_bundle.index('a')) == {
+		'uuid': 'a', 'name': 'a', 'path': '.', 'body': 'Hëllo',
+		'hotstring': 'hello', 'send': [0, 0], 'hotkey': None,
+		'window_class': ['Gedit'], 'window_title': ['Doc', False],
+		'script': False, 'trigger': 0, 'timestamp': 1}
+	phrase = phrase_bundle.phrase(phrase_bundle.index('c'))
+	assert (phrase['script'], phrase['trigger']) == (True, 2)
+	assert phrase_bundle.index('missing') is None
+
+
+def test_hotkey_and_hotstring_indexes(compiled):
+
+	phrase_bundle = bundle.Bundle(compiled[0])
+	assert phrase_bundle.hotkey_indexes() == [phrase_bundle.index('b')]
+	assert phrase_bundle.hotstring_indexes('say hello') == sorted(
+		[phrase_bundle.index('a'), phrase_bundle.index('b')])
+	assert phrase_bundle.hotstring_indexes('yo') == []
+	assert phrase_bundle.hotstring_indexes('') == []
+
+
+def test_records_are_sorted_by_uuid_and_comparable(compiled, library):
+
+	path = compiled[0]
+	old = list(bundle.Bundle(path).records())
+	assert [record[0] for record in old] == ['a', 'b', 'c', 'd']
+	write_phrase(library, 'f', 'c', hotstring='xyz', body='Changed')
+	bundle.compile_library(str(library), path)
+	new = list(bundle.Bundle(path).records())
+	changed = [
+		old_record[0] for old_record, new_record in zip(old, new)
+		if old_record[2] != new_record[2]]
+	assert changed == ['c']
+
+
+def test_unchanged_library_is_not_rewritten(compiled, library):
+
+	path, digest = compiled
+	os.utime(path, (0, 0))
+	assert bundle.compile_library(str(library), path) == digest
+	assert os.stat(path).st_mtime == 0
+
+
+def test_invalid_bundles_are_rejected(tmp_path):
+
+	empty = tmp_path / 'empty.xpb'
+	empty.write_bytes(b'')
+	other = tmp_path / 'other.xpb'
+	other.write_bytes(b'NOTABUNDLE' * 100)
+	for path in (empty, other):
+		with pytest.raises(ValueError):
+			bundle.Bundle(str(path))
+		assert bundle.read_digest(str(path)) is None
+	with pytest.raises(OSError):
+		bundle.Bundle(str(tmp_path / 'missing.xpb'))
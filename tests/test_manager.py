@@ -0,0 +1,360 @@
+import os
+import json
+
+import pytest
+
+pytest.importorskip('gi.repository')
+
+from conftest import phrase_data
+from lib import manager
+
+
+def phrase(p_uuid, **values):
+
+	return manager.Phrase.from_dict(phrase_data(p_uuid, **values))
+
+
+def uuids(phrases):
+
+	return [phrase.uuid for phrase in phrases]
+
+
+def test_index_looks_up_suffixes_in_load_order():
+
+	index = manager.PhraseIndex(1)
+	index.update(0, {
+		'b': phrase('b', hotstring='llo'), 'a': phrase('a', hotstring='hello'),
+		'c': phrase('c', hotstring='x'), 'd': phrase('d')})
+	assert uuids(index.hotstring_phrases('say hello')) == ['b', 'a']
+	assert uuids(index.hotstring_phrases('lo')) == []
+	index.update(0, {'b': phrase('b', hotstring='o')})
+	assert uuids(index.hotstring_phrases('hello')) == ['b', 'a']
+
+
+def test_higher_layers_shadow_same_uuid_and_conflicts():
+
+	index = manager.PhraseIndex(2)
+	index.update(0, {
+		'a': phrase('a', hotstring='hs'),
+		'b': phrase('b', hotstring='hs'),
+		'c': phrase('c', hotstring='hs', window_class=('Gedit',)),
+		'd': phrase('d', hotstring='other')})
+	index.update(1, {
+		'x': phrase('x', hotstring='hs'), 'd': phrase('d', hotstring='new')})
+	assert uuids(index.hotstring_phrases('hs')) == ['x', 'c']
+	assert uuids(index.hotstring_phrases('other')) == []
+	assert uuids(index.hotstring_phrases('new')) == ['d']
+	assert index.uuids(1) == {'x', 'd'}
+
+
+def test_removing_shadowing_phrase_reveals_lower_ones():
+
+	index = manager.PhraseIndex(2)
+	index.update(0, {
+		'a': phrase('a', hotstring='hs'), 'b': phrase('b', hotstring='old')})
+	index.update(1, {
+		'x': phrase('x', hotstring='hs'), 'b': phrase('b', hotstring='new')})
+	index.update(1, {'x': None, 'b': None})
+	assert uuids(index.hotstring_phrases('hs')) == ['a']
+	assert uuids(index.hotstring_phrases('old')) == ['b']
+	assert uuids(index.hotstring_phrases('new')) == []
+
+
+def test_index_reports_lost_and_gained_hotkeys():
+
+	ctrl_k = ('k', ('<Control>',))
+	index = manager.PhraseIndex(2)
+	assert index.update(0, {
+		'a': phrase('a', hotkey=ctrl_k), 'b': phrase('b', hotkey=ctrl_k)}) == (
+		set(), {ctrl_k})
+	assert index.update(1, {'c': phrase('c', hotkey=('j', ()))}) == (
+		set(), {('j', ())})
+	assert index.update(0, {'a': None}) == (set(), set())
+	assert index.update(0, {'b': phrase('b')}) == ({ctrl_k}, set())
+	assert uuids(index.hotkey_phrases({'j', 'k'})) == ['c']
+
+
+@pytest.mark.parametrize('values', [
+	{},
+	{'body': 'Ünïcode "quotes"\n\ttabs  ', 'path': 'f/s'},
+	{'hotkey': ('k', ('<Control>', '<Shift>')), 'window_class': ('A', 'B'),
+		'window_title': ('Title', True), 'hotstring': 'hs', 'script': True},
+	{'hotkey': ('k', ()), 'window_class': (), 'send': (0, 2)}])
+def test_dump_phrase_matches_json_dumps(values):
+
+	p_phrase = phrase('a', **values)
+	assert manager.dump_phrase(p_phrase) == json.dumps(
+		p_phrase.to_dict(), indent='\t', sort_keys=True)
+
+
+def event(event_type, p_uuid, old, new, external=True):
+
+	return manager.PhraseEvent(event_type, p_uuid, old, new, external)
+
+
+def test_hotkey_registry_grabs_each_hotkey_once(monkeypatch):
+
+	grabs = []
+	monkeypatch.setattr(
+		manager, 'grab_hotkey', lambda hotkey: grabs.append(('grab', hotkey)))
+	monkeypatch.setattr(
+		manager, 'ungrab_hotkey',
+		lambda hotkey: grabs.append(('ungrab', hotkey)))
+	ctrl_k, j = ('k', ('<Control>',)), ('j', ())
+	a = phrase('a', hotkey=ctrl_k)
+	b = phrase('b', hotkey=ctrl_k)
+	registry = manager.HotkeyRegistry([a, phrase('c')])
+	assert registry.hotkeys() == [ctrl_k]
+	registry.update([event(manager.ADDED, 'b', None, b)])
+	registry.update([event(manager.REMOVED, 'a', a, None)])
+	assert grabs == []
+	registry.update([
+		event(manager.CHANGED, 'b', b, b.replace(hotkey=j)),
+		event(manager.MOVED, 'c', phrase('c'), phrase('c', path='f'))])
+	assert grabs == [('ungrab', ctrl_k), ('grab', j)]
+	assert registry.hotkeys() == [j]
+
+
+def test_merge_events_of_same_phrase():
+
+	a, moved_a = phrase('a'), phrase('a', path='f')
+	b, changed_b = phrase('b'), phrase('b', hotstring='b')
+	c = phrase('c')
+	merged = manager.merge_events([
+		event(manager.REMOVED, 'a', a, None),
+		event(manager.CHANGED, 'b', b, b.replace(body='x')),
+		event(manager.ADDED, 'c', None, c),
+		event(manager.ADDED, 'a', None, moved_a),
+		event(manager.CHANGED, 'b', b.replace(body='x'), changed_b),
+		event(manager.REMOVED, 'c', c, None)])
+	assert merged == [
+		event(manager.MOVED, 'a', a, moved_a),
+		event(manager.CHANGED, 'b', b, changed_b)]
+	single = [event(manager.ADDED, 'd', None, phrase('d'), False)]
+	assert manager.merge_events(single) == single
+
+
+@pytest.fixture
+def phrases_manager(library):
+
+	phrases_manager = manager.Phrases(manager.app, watch=False)
+	yield phrases_manager
+	phrases_manager.flush()
+
+
+def external_events(phrases_manager):
+
+	events = []
+	phrases_manager.subscribe(lambda batch: events.extend(
+		batch_event for batch_event in batch if batch_event.external))
+	return events
+
+
+def apply_changes(phrases_manager, library, files=(), folders=()):
+	"""Apply changes like the phrase watcher does once they settle down."""
+
+	phrases_manager._Phrases__apply_changes(library, set(files), set(folders))
+
+
+def test_watcher_skips_echoes_of_own_writes(
+	phrases_manager, library, monkeypatch):
+
+	p_uuid = phrases_manager.new('a', 'A', path='f')
+	phrases_manager.new('b', 'B', path='f')
+	phrases_manager.flush()
+	phrases_manager.edit(p_uuid, body='Edited')
+	phrases_manager.flush()
+	phrases_manager.rename_folder('f', 'g')
+	assert phrases_manager.body(p_uuid) == 'Edited'
+	events = external_events(phrases_manager)
+
+	def read_phrase(file_path):
+		raise AssertionError('Echo of {} was read.'.format(file_path))
+
+	monkeypatch.setattr(manager, 'read_phrase', read_phrase)
+	apply_changes(phrases_manager, library,
+		[os.path.join('g', 'a'), os.path.join('g', 'b')], ['f', 'g'])
+	assert events == []
+	# Cached body survives the echo.
+	assert phrases_manager.body(p_uuid) == 'Edited'
+
+
+def test_watcher_reports_external_changes(phrases_manager, library):
+
+	p_uuid = phrases_manager.new('a', 'A')
+	phrases_manager.flush()
+	assert phrases_manager.body(p_uuid) == 'A'
+	events = external_events(phrases_manager)
+	file_path = os.path.join(library, 'a')
+	with open(file_path) as p_file:
+		data = json.loads(p_file.read())
+	data['body'] = 'Changed outside'
+	with open(file_path, 'w') as p_file:
+		p_file.write(json.dumps(data))
+	apply_changes(phrases_manager, library, ['a'])
+	assert [(item.type, item.uuid) for item in events] == [
+		(manager.CHANGED, p_uuid)]
+	assert phrases_manager.body(p_uuid) == 'Changed outside'
+
+	os.rename(file_path, os.path.join(library, 'b'))
+	apply_changes(phrases_manager, library, ['a', 'b'])
+	assert [(item.type, item.new and item.new.name) for item in events[1:]] == [
+		(manager.MOVED, 'b')]
+
+
+def test_pending_changes_win_over_external_ones(phrases_manager, library):
+
+	p_uuid = phrases_manager.new('a', 'A')
+	phrases_manager.flush()
+	events = external_events(phrases_manager)
+	phrases_manager.edit(p_uuid, hotstring='mine')
+	with open(os.path.join(library, 'a'), 'w') as p_file:
+		p_file.write(json.dumps(dict(
+			manager.app._phrases[p_uuid].to_dict(), hotstring='theirs')))
+	apply_changes(phrases_manager, library, ['a'])
+	assert events == []
+	assert manager.app._phrases[p_uuid].hotstring == 'mine'
+
+
+def test_import_into_database_accepts_null_bodies(library, monkeypatch):
+
+	monkeypatch.setattr(manager.app, 'phrases_database',
+		os.path.join(os.path.dirname(library), 'phrases.sqlite'))
+	with open(os.path.join(library, 'a'), 'w') as p_file:
+		p_file.write(json.dumps({'uuid': 'a', 'name': 'a', 'body': None}))
+	phrases_manager = manager.Phrases(manager.app, watch=False)
+	assert list(manager.app._phrases) == ['a']
+	assert phrases_manager.body('a') == ''
+
+
+def test_watcher_applies_only_changed_files(
+	phrases_manager, library, monkeypatch):
+
+	grabs = []
+	monkeypatch.setattr(
+		manager, 'grab_hotkey', lambda hotkey: grabs.append(('grab', hotkey)))
+	monkeypatch.setattr(
+		manager, 'ungrab_hotkey',
+		lambda hotkey: grabs.append(('ungrab', hotkey)))
+	kept = phrases_manager.new('kept', 'Kept', hotstring='kept')
+	phrases_manager.flush()
+	kept_phrase = manager.app._phrases[kept]
+	events = external_events(phrases_manager)
+	with open(os.path.join(library, 'x'), 'w') as p_file:
+		p_file.write(json.dumps(phrase_data(
+			'x', hotstring='ext', hotkey=['k', ['<Control>']])))
+	apply_changes(phrases_manager, library, ['x'])
+	assert [(item.type, item.uuid) for item in events] == [
+		(manager.ADDED, 'x')]
+	hotkey = manager.app._phrases['x'].hotkey
+	assert grabs == [('grab', hotkey)]
+	assert uuids(phrases_manager.hotstring_candidates('my ext', '')) == ['x']
+	# Phrases of unchanged files aren't rebuilt.
+	assert manager.app._phrases[kept] is kept_phrase
+
+	os.remove(os.path.join(library, 'x'))
+	apply_changes(phrases_manager, library, ['x'])
+	assert [(item.type, item.uuid) for item in events[1:]] == [
+		(manager.REMOVED, 'x')]
+	assert grabs[1:] == [('ungrab', hotkey)]
+	assert phrases_manager.hotstring_candidates('my ext', '') == []
+	assert set(manager.app._phrases) == {kept}
+	assert manager.app._phrases[kept] is kept_phrase
+
+
+def write_phrase_file(library, *path, **values):
+
+	with open(os.path.join(library, *path), 'w') as p_file:
+		p_file.write(json.dumps(phrase_data(path[-1], **values)))
+
+
+def test_snapshot_entries_of_changed_files_are_read_again(
+	library, monkeypatch):
+
+	write_phrase_file(library, 'a')
+	write_phrase_file(library, 'b')
+	manager.Phrases(manager.app, watch=False)
+	assert os.path.exists(manager.snapshot_path(library))
+	write_phrase_file(library, 'a', body='Changed body')
+	read = []
+	read_phrase = manager.read_phrase
+	monkeypatch.setattr(manager, 'read_phrase',
+		lambda file_path: read.append(file_path) or read_phrase(file_path))
+	manager.app._phrases, manager.app._folders = {}, set()
+	phrases_manager = manager.Phrases(manager.app, watch=False)
+	assert [os.path.normpath(path) for path in read] == [
+		os.path.join(library, 'a')]
+	assert set(manager.app._phrases) == {'a', 'b'}
+	assert phrases_manager.body('a') == 'Changed body'
+
+
+def test_rescan_lists_changed_folders_and_checks_files_on_full_rescans(
+	library):
+
+	os.makedirs(os.path.join(library, 'f'))
+	write_phrase_file(library, 'a')
+	write_phrase_file(library, 'f', 'b')
+	manifest = {}
+	assert manager.rescan_library(library, manifest) == {
+		'a', os.path.join('f', 'b')}
+	assert manager.rescan_library(library, manifest) == set()
+
+	write_phrase_file(library, 'a', body='Changed in place')
+	assert manager.rescan_library(library, manifest) == set()
+	assert manager.rescan_library(library, manifest, full=True) == {'a'}
+
+	folder = os.path.join(library, 'f')
+	mtime = os.stat(folder).st_mtime_ns
+	write_phrase_file(library, 'f', 'c')
+	# Folder modification time may not tick between quick writes.
+	os.utime(folder, ns=(mtime, mtime + 10 ** 9))
+	assert manager.rescan_library(library, manifest) == {
+		os.path.join('f', 'c')}
+	os.remove(os.path.join(folder, 'b'))
+	os.remove(os.path.join(folder, 'c'))
+	os.rmdir(folder)
+	assert manager.rescan_library(library, manifest) == {
+		os.path.join('f', 'b'), os.path.join('f', 'c')}
+
+
+def read_file(library, *path):
+
+	with open(os.path.join(library, *path)) as p_file:
+		return json.loads(p_file.read())
+
+
+def test_transaction_writes_final_state_once_flushed(phrases_manager, library):
+
+	with phrases_manager.transaction():
+		p_uuid = phrases_manager.new('a', 'A')
+		phrases_manager.edit(p_uuid, name='b', body='B')
+		gone = phrases_manager.new('c', 'C')
+		phrases_manager.remove(gone)
+	assert os.listdir(library) == []
+	phrases_manager.flush()
+	assert os.listdir(library) == ['b']
+	assert read_file(library, 'b')['body'] == 'B'
+
+	with phrases_manager.transaction():
+		phrases_manager.edit(p_uuid, path='f', body='Moved')
+	# File is moved on commit, it's new contents are written on flush.
+	assert read_file(library, 'f', 'b')['body'] == 'B'
+	phrases_manager.flush()
+	assert sorted(os.listdir(library)) == ['f']
+	assert read_file(library, 'f', 'b')['body'] == 'Moved'
+
+
+def test_pending_writes_follow_renamed_folder(phrases_manager, library):
+
+	edited = phrases_manager.new('a', 'A', path='f')
+	phrases_manager.flush()
+	phrases_manager.edit(edited, body='Edited')
+	added = phrases_manager.new('b', 'B', path=os.path.join('f', 'sub'))
+	phrases_manager.rename_folder('f', 'g')
+	assert not os.path.exists(os.path.join(library, 'f'))
+	phrases_manager.flush()
+	assert not os.path.exists(os.path.join(library, 'f'))
+	assert read_file(library, 'g', 'a')['body'] == 'Edited'
+	assert read_file(library, 'g', 'sub', 'b')['path'] == os.path.join(
+		'g', 'sub')
+	assert manager.app._phrases[added].path == os.path.join('g', 'sub')
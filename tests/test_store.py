@@ -0,0 +1,101 @@
+import pytest
+
+from conftest import phrase_data as phrase
+from lib import store
+
+
+@pytest.fixture
+def phrase_store(tmp_path):
+
+	return store.PhraseStore(str(tmp_path / 'db' / 'phrases.sqlite'))
+
+
+def test_new_store_is_empty(phrase_store):
+
+	assert phrase_store.is_empty()
+	phrase_store.apply(folders=['f'])
+	assert not phrase_store.is_empty()
+
+
+def test_phrases_round_trip_without_body(phrase_store):
+
+	data = phrase(
+		'a', script=True, hotkey=['k', ['<Control>']], window_class=['Gedit'],
+		window_title=['Doc', True])
+	phrase_store.apply(phrases=[data])
+	expected = dict(data, body=None)
+	assert phrase_store.phrases() == [expected]
+	assert phrase_store.body('a') == 'Body'
+	assert phrase_store.body('missing') is None
+
+
+def test_update_keeps_insertion_order(phrase_store):
+
+	phrase_store.apply(phrases=[phrase('a'), phrase('b')])
+	phrase_store.apply(phrases=[phrase('a', body='New', hotstring='x')])
+	assert [data['uuid'] for data in phrase_store.phrases()] == ['a', 'b']
+	assert phrase_store.body('a') == 'New'
+
+
+def test_remove_phrases_and_folders(phrase_store):
+
+	phrase_store.apply(
+		phrases=[phrase('a', window_class=['Gedit']), phrase('b')],
+		folders=['f', 'g'])
+	phrase_store.apply(removed=['a'], removed_folders=['g'])
+	assert [data['uuid'] for data in phrase_store.phrases()] == ['b']
+	assert phrase_store.folders() == {'f'}
+	assert phrase_store.hotkey_candidates(['k'], 'Gedit') == []
+
+
+def test_rename_folder_moves_subfolders_and_phrases(phrase_store):
+
+	phrase_store.apply(
+		phrases=[phrase('a', path='f'), phrase('b', path='f/s'),
+			phrase('c', path='fg')],
+		folders=['f', 'f/s', 'fg'])
+	phrase_store.rename_folder('f', 'n/f')
+	paths = {data['uuid']: data['path'] for data in phrase_store.phrases()}
+	assert paths == {'a': 'n/f', 'b': 'n/f/s', 'c': 'fg'}
+	assert phrase_store.folders() == {'n/f', 'n/f/s', 'fg'}
+
+
+def test_hotstring_candidates_match_suffixes_and_window_class(phrase_store):
+
+	phrase_store.apply(phrases=[
+		phrase('a', hotstring='lo'),
+		phrase('b', hotstring='hello', window_class=['Gedit']),
+		phrase('c', hotstring='xyz')])
+	assert phrase_store.hotstring_candidates('say hello', 'Gedit') == [
+		'a', 'b']
+	assert phrase_store.hotstring_candidates('say hello', 'Term') == ['a']
+	assert phrase_store.hotstring_candidates('', 'Term') == []
+
+
+def test_hotkey_candidates_match_keys_and_window_class(phrase_store):
+
+	phrase_store.apply(phrases=[
+		phrase('a', hotkey=['k', ['<Control>']]),
+		phrase('b', hotkey=['K', []], window_class=['Gedit']),
+		phrase('c', hotkey=['j', []])])
+	assert phrase_store.hotkey_candidates({'k', 'K'}, 'Gedit') == ['a', 'b']
+	assert phrase_store.hotkey_candidates({'k', 'K'}, 'Term') == ['a']
+
+
+def test_store_is_shared_between_instances(tmp_path):
+
+	path = str(tmp_path / 'phrases.sqlite')
+	store.PhraseStore(path).apply(phrases=[phrase('a')], folders=['f'])
+	reopened = store.PhraseStore(path)
+	assert [data['uuid'] for data in reopened.phrases()] == ['a']
+	assert reopened.folders() == {'f'}
+
+
+def test_missing_and_null_columns_get_defaults(phrase_store):
+
+	data = phrase('a', body=None, script=None, send=None)
+	del data['trigger'], data['timestamp']
+	phrase_store.apply(phrases=[data, phrase('b', name=None)])
+	assert phrase_store.phrases() == [phrase(
+		'a', body=None, send=[1, 0], trigger=0, timestamp=0)]
+	assert phrase_store.body('a') == ''
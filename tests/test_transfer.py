@@ -0,0 +1,106 @@
+import io
+import os
+import json
+
+import pytest
+
+pytest.importorskip('gi.repository')
+
+from lib import app, manager, transfer
+
+
+def read_file(library, *path):
+
+	with open(os.path.join(library, *path)) as p_file:
+		return json.loads(p_file.read())
+
+
+def test_guess_format():
+
+	assert transfer.guess_format('out.CSV') == 'csv'
+	assert transfer.guess_format('out.jsonl') == 'jsonl'
+	assert transfer.guess_format('-') == 'jsonl'
+
+
+def test_read_jsonl_skips_blank_and_invalid_lines():
+
+	stream = io.StringIO('{"name": "a"}\n\nnot json\n{"name": "b"}\n')
+	assert list(transfer.read_jsonl(stream)) == [{'name': 'a'}, {'name': 'b'}]
+
+
+def test_csv_round_trip():
+
+	phrases = [
+		{'uuid': 'a', 'name': 'a', 'body': 'Line\n"quoted", ë', 'path': 'f',
+			'script': True, 'send': [1, 2], 'hotstring': 'hs', 'trigger': 2,
+			'hotkey': ['k', ['<Control>']], 'window_class': ['Gedit'],
+			'window_title': ['Doc', True], 'timestamp': 5},
+		{'uuid': 'b', 'name': 'b', 'body': '', 'path': '.', 'script': False,
+			'send': [0, 0], 'hotstring': None, 'trigger': 0, 'hotkey': None,
+			'window_class': None, 'window_title': None, 'timestamp': 0}]
+	stream = io.StringIO()
+	transfer.write_csv(stream, phrases)
+	stream.seek(0)
+	read = list(transfer.read_csv(stream))
+	assert read[0] == phrases[0]
+	# Empty cells are left out, so defaults apply on import.
+	assert read[1] == {
+		'uuid': 'b', 'name': 'b', 'path': '.', 'script': False,
+		'send': [0, 0], 'trigger': 0, 'timestamp': 0}
+
+
+@pytest.mark.parametrize('data', [
+	'not a dict', {'name': ''}, {'name': 'a/b'}, {'name': '.'},
+	{'name': '..'}, {'name': 'a' + manager.TEMP_SUFFIX},
+	{'name': 'a', 'path': '..'},
+	{'name': 'a', 'path': 'f/../..'}, {'name': 'a', 'path': '/etc'},
+	{'name': 'a', 'body': 1}])
+def test_build_phrase_rejects_invalid_phrases(data):
+
+	with pytest.raises(ValueError):
+		transfer.build_phrase(data)
+
+
+def test_build_phrase_fills_in_uuid_and_timestamp():
+
+	phrase = transfer.build_phrase({'name': 'a', 'path': 'f/./g'})
+	assert phrase.uuid and phrase.timestamp
+	assert phrase.path == os.path.join('f', 'g')
+
+
+def test_import_writes_phrases_and_skips_conflicts(library, monkeypatch):
+
+	monkeypatch.setattr(transfer, 'BATCH_SIZE', 2)
+	phrases_manager = manager.Phrases(app, watch=False)
+	progress = []
+	imported, skipped = transfer.import_phrases(phrases_manager, [
+		{'uuid': 'a', 'name': 'a', 'body': 'A', 'hotstring': 'aa'},
+		{'uuid': 'b', 'name': 'b', 'path': 'f', 'body': 'B'},
+		{'uuid': 'c', 'name': 'a', 'body': 'Conflict'},
+		{'name': 'bad/name'},
+		{'uuid': 'a', 'name': 'moved', 'path': 'g', 'body': 'A2'},
+		{'uuid': 'd', 'name': 'a', 'body': 'D'}], progress.append)
+	assert (imported, skipped) == (4, 2)
+	assert progress == [2, 4]
+	assert sorted(app._phrases) == ['a', 'b', 'd']
+	assert read_file(library, 'g', 'moved')['body'] == 'A2'
+	assert read_file(library, 'f', 'b')['body'] == 'B'
+	assert read_file(library, 'a')['uuid'] == 'd'
+
+
+def test_export_yields_phrases_with_bodies(library):
+
+	phrases_manager = manager.Phrases(app, watch=False)
+	transfer.import_phrases(phrases_manager, [
+		{'uuid': 'a', 'name': 'a', 'body': 'A'},
+		{'uuid': 'b', 'name': 'b', 'path': 'f', 'body': 'B'}])
+	phrases_manager = manager.Phrases(app, watch=False)
+	exported = sorted(
+		transfer.export_phrases(phrases_manager), key=lambda data: data['uuid'])
+	assert [(data['uuid'], data['path'], data['body']) for data in exported] == [
+		('a', '.', 'A'), ('b', 'f', 'B')]
+	stream = io.StringIO()
+	transfer.write_jsonl(stream, exported)
+	stream.seek(0)
+	assert [json.loads(line) for line in stream] == [
+		json.loads(json.dumps(data)) for data in exported]
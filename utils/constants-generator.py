@@ -4,6 +4,8 @@ import re
 
 print_matcher = re.compile(r'#define (XK_[\w|\d]*).*U\+([\w|\d]*)')
 printable = []
+keysym_matcher = re.compile(r'#define (XK_[\w|\d]*)\s*(0x[\w|\d]*)')
+keysyms = {}
 composed_matcher = re.compile(
 	r'<(\w*)>\s*<([\w|\d]*)>(?:\s*<([\w|\d]*)>)?(?:\s*<([\w|\d]*)>)?\s*:\s*\"(.*)\"')
 composed = []
@@ -18,49 +20,28 @@ groups = ['XK_LATIN1', 'XK_LATIN2', 'XK_LATIN3', 'XK_LATIN4', 'XK_LATIN8',
 warning = "# This file is autogenerated by utils/constants-generator.py\n"\
 			"# You shouldn't edit this file directly.\n\n"
 
-imports = '''from Xlib import XK
-from . import KEYSYMDEF
-_keysyms = [name for name in dir(KEYSYMDEF)]
-for keysym in _keysyms:
-	XK.__dict__[keysym] = KEYSYMDEF.__dict__[keysym]
-del KEYSYMDEF
-
-XK.load_keysym_group('miscellany')
-XK.load_keysym_group('latin1')
-XK.load_keysym_group('latin2')
-XK.load_keysym_group('latin3')
-XK.load_keysym_group('latin4')
-XK.load_keysym_group('arabic')
-XK.load_keysym_group('cyrillic')
-XK.load_keysym_group('greek')
-XK.load_keysym_group('hebrew')
-XK.load_keysym_group('katakana')
-XK.load_keysym_group('korean')
-XK.load_keysym_group('publishing')
-XK.load_keysym_group('thai')
-XK.load_keysym_group('xkb')
-XK.load_keysym_group('technical')
+imports = '''import types
 
 '''
 
-keypad = '''	'XK_KP_Space' : '\u0020',
-	XK.XK_KP_0 : '\u0030',
-	XK.XK_KP_1 : '\u0031',
-	XK.XK_KP_2 : '\u0032',
-	XK.XK_KP_3 : '\u0033',
-	XK.XK_KP_4 : '\u0034',
-	XK.XK_KP_5 : '\u0035',
-	XK.XK_KP_6 : '\u0036',
-	XK.XK_KP_7 : '\u0037',
-	XK.XK_KP_8 : '\u0038',
-	XK.XK_KP_9 : '\u0039',
-	XK.XK_KP_Divide : '\u002F',
-	XK.XK_KP_Multiply : '\u002A',
-	XK.XK_KP_Add : '\u002B',
-	XK.XK_KP_Subtract : '\u002D',
-	XK.XK_KP_Decimal : '\u002E',
-	XK.XK_KP_Separator : '\u002C'}
-'''
+keypad = [
+	('XK_KP_Space', 0x0020),
+	('XK_KP_0', 0x0030),
+	('XK_KP_1', 0x0031),
+	('XK_KP_2', 0x0032),
+	('XK_KP_3', 0x0033),
+	('XK_KP_4', 0x0034),
+	('XK_KP_5', 0x0035),
+	('XK_KP_6', 0x0036),
+	('XK_KP_7', 0x0037),
+	('XK_KP_8', 0x0038),
+	('XK_KP_9', 0x0039),
+	('XK_KP_Divide', 0x002F),
+	('XK_KP_Multiply', 0x002A),
+	('XK_KP_Add', 0x002B),
+	('XK_KP_Subtract', 0x002D),
+	('XK_KP_Decimal', 0x002E),
+	('XK_KP_Separator', 0x002C)]
 
 modifiers = '''
 MODIFIERS = {
@@ -128,6 +109,11 @@ NO_INDEX = {
 	XK.XK_Right}
 '''
 
+def escape(char):
+	if char > 0xFFFF:
+		return '\\U{0:08X}'.format(char)
+	return '\\u{0:04X}'.format(char)
+
 def dedup(seq):
 	seen = set()
 	seen_add = seen.add
@@ -135,6 +121,9 @@ def dedup(seq):
 
 with open('/usr/include/X11/keysymdef.h') as keysymdef:
 	for line in keysymdef:
+		keysym_match = keysym_matcher.search(line)
+		if keysym_match:
+			keysyms.setdefault(keysym_match.group(1), keysym_match.group(2))
 		for group in groups:
 			if line.startswith('#ifdef {0}'.format(group)):
 				parse = True
@@ -145,16 +134,46 @@ with open('/usr/include/X11/keysymdef.h') as keysymdef:
 				print_match = print_matcher.search(line)
 				if print_match:
 					printable.append(
-						"\tXK.{0} : '\\u{1}',".format(
-						print_match.group(1), print_match.group(2)))
+						(print_match.group(1), int(print_match.group(2), 16)))
+
+printable = dedup(printable) + keypad
 
-printable = dedup(printable)
+# Reverse lookups. Keysyms with several names use the alphabetically first
+# name, characters with several keysyms use the first printable keysym.
+names = {}
+for name in sorted(keysyms):
+	names.setdefault(int(keysyms[name], 16), name)
+chars = {}
+for name, char in printable:
+	chars.setdefault(char, name)
 
 with open('../lib/CONSTANTS.py', 'w') as constants:
 	constants.write(warning)
 	constants.write(imports)
+	constants.write('KEYSYMS = {\n')
+	constants.write('\n'.join(
+		"\t'{0}' : {1},".format(name, keysyms[name])
+		for name in sorted(keysyms)))
+	constants.write('}\n\nXK = types.SimpleNamespace(**KEYSYMS)\n')
+	constants.write('\nKEYSYM_NAMES = {\n')
+	constants.write('\n'.join(
+		"\t0x{0:04x} : '{1}',".format(keysym, names[keysym])
+		for keysym in sorted(names)))
+	constants.write('}\n')
 	constants.write('\nPRINTABLE = {\n')
-	constants.write('\n'.join(printable))
-	constants.write(keypad)
+	constants.write('\n'.join(
+		"\tXK.{0} : '{1}',".format(name, escape(char))
+		for name, char in printable))
+	constants.write('}\n')
+	constants.write('\nCHARS = {\n')
+	constants.write('\n'.join(
+		"\t'{0}' : XK.{1},".format(escape(char), name)
+		for char, name in sorted(chars.items())))
+	constants.write('}\n')
+	constants.write('\nKEYPAD = {\n')
+	constants.write('\n'.join(
+		'\tXK.{0},'.format(name) for name in sorted(keysyms)
+		if name.startswith('XK_KP')))
+	constants.write('}\n')
 	constants.write(modifiers)
 	constants.write(no_index)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Time cold and warm loads of phrase libraries with 1 to N load workers.
+
+	Cold loads have no library snapshot, so every phrase file is parsed,
+	warm loads reuse the snapshot written by the previous load. Without a
+	directory, generated libraries of given sizes are timed, by default one
+	below and one above manager.PARALLEL_LOAD. Run from the repository
+	root.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib import app, manager
+
+
+def generate(library, count, per_folder=100):
+
+	for index in range(count):
+		folder = 'folder{}'.format(index // per_folder)
+		os.makedirs(os.path.join(library, folder), exist_ok=True)
+		name = 'phrase{}'.format(index)
+		phrase = {
+			'uuid': str(uuid.uuid1()), 'name': name, 'path': folder,
+			'body': 'Body of phrase {}.'.format(index), 'script': False,
+			'send': [0, 0], 'hotstring': 'hs{}'.format(index), 'trigger': 0,
+			'hotkey': None, 'window_class': None, 'window_title': None,
+			'timestamp': time.time()}
+		with open(os.path.join(library, folder, name), 'w') as p_file:
+			p_file.write(json.dumps(phrase, indent='\t', sort_keys=True))
+
+
+def load():
+
+	app._phrases, app._folders = {}, set()
+	start = time.perf_counter()
+	manager.Phrases(app, watch=False)
+	return time.perf_counter() - start
+
+
+def benchmark(library, workers, runs):
+	"""Return lists of cold and warm load times of library with given
+	number of load workers.
+	"""
+
+	app.phrases_dir = os.path.abspath(library)
+	snapshot = manager.snapshot_path(app.phrases_dir)
+	manager.LOAD_WORKERS = workers
+	cold, warm = [], []
+	for run in range(runs):
+		if os.path.exists(snapshot):
+			os.remove(snapshot)
+		cold.append(load())
+		warm.append(load())
+	return cold, warm
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(
+		description='Time cold and warm loads of phrase libraries.')
+	parser.add_argument('library', nargs='*', help='phrases directories')
+	parser.add_argument('-n', '--count', type=int, action='append',
+		help='number of phrases to generate without library, repeatable')
+	parser.add_argument('-w', '--workers', type=int,
+		default=os.cpu_count() or 1,
+		help='time loads with 1 to this many load workers')
+	parser.add_argument('-r', '--runs', type=int, default=3)
+	args = parser.parse_args()
+
+	work_dir = tempfile.mkdtemp(prefix='xpander-benchmark-')
+	try:
+		app.phrases_database = ''
+		app.phrases_bundle = ''
+		app.phrases_layers = []
+		app._cache_dir = os.path.join(work_dir, 'cache')
+		libraries = args.library
+		if not libraries:
+			for count in args.count or [
+				manager.PARALLEL_LOAD // 2, manager.PARALLEL_LOAD * 40]:
+				library = os.path.join(work_dir, 'phrases{}'.format(count))
+				print('Generating {} phrases.'.format(count))
+				generate(library, count)
+				libraries.append(library)
+		print('{} CPUs, parallel load from {} phrases.'.format(
+			os.cpu_count(), manager.PARALLEL_LOAD))
+		for library in libraries:
+			for workers in range(1, args.workers + 1):
+				cold, warm = benchmark(library, workers, args.runs)
+				print('{0} phrases, {1} workers: cold median {2:.3f}s, '
+					'warm median {3:.3f}s over {4} runs'.format(
+						len(app._phrases), workers, statistics.median(cold),
+						statistics.median(warm), args.runs))
+	finally:
+		shutil.rmtree(work_dir, ignore_errors=True)